@@ -34,8 +34,11 @@ from .trait_errors import (
 )
 
 from .trait_notifiers import (
+    get_pool_executor,
     get_ui_handler,
+    set_pool_executor,
     set_ui_handler,
+    wait_for_pool_dispatch,
     push_exception_handler,
     pop_exception_handler,
     TraitChangeNotifyWrapper,
@@ -89,6 +92,7 @@ from .trait_types import (
     Tuple,
     List,
     CList,
+    ArrayList,
     PrefixList,
     Set,
     CSet,
@@ -153,7 +157,9 @@ from .has_traits import (
     cached_property,
     property_depends_on,
     provides,
+    hold_trait_notifications,
     isinterface,
+    trusted_state_restore,
 )
 
 from .base_trait_handler import BaseTraitHandler
@@ -171,6 +177,7 @@ from .trait_handlers import (
 
 
 from .trait_dict_object import TraitDictEvent, TraitDictObject
+from .trait_array_list_object import TraitArrayListObject
 from .trait_list_object import TraitListEvent, TraitListObject
 from .trait_set_object import TraitSetEvent, TraitSetObject
 
@@ -183,7 +190,7 @@ from .adaptation.adaptation_manager import (
     register_provides,
 )
 
-from .trait_numeric import Array, ArrayOrNone, CArray
+from .trait_numeric import Array, ArrayOrNone, CArray, trait_columns
 
 # Deprecated TraitType subclasses and instances.
 
@@ -50,7 +50,9 @@ from .has_traits import (
     cached_property as cached_property,
     property_depends_on as property_depends_on,
     provides as provides,
+    hold_trait_notifications as hold_trait_notifications,
     isinterface as isinterface,
+    trusted_state_restore as trusted_state_restore,
 )
 
 from .trait_types import (
@@ -93,6 +95,7 @@ from .trait_types import (
     Tuple as Tuple,
     List as List,
     CList as CList,
+    ArrayList as ArrayList,
     PrefixList as PrefixList,
     Set as Set,
     CSet as CSet,
@@ -171,9 +174,13 @@ from .trait_numeric import (
     Array as Array,
     ArrayOrNone as ArrayOrNone,
     CArray as CArray,
+    trait_columns as trait_columns,
 )
 
 from .trait_notifiers import (
+    get_pool_executor as get_pool_executor,
     get_ui_handler as get_ui_handler,
+    set_pool_executor as set_pool_executor,
     set_ui_handler as set_ui_handler,
+    wait_for_pool_dispatch as wait_for_pool_dispatch,
 )
@@ -0,0 +1,22 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Performance benchmarks for the Traits core, part of the Traits project.
+
+The benchmarks are run from the command line::
+
+    python -m traits.benchmarks run --output results.json
+    python -m traits.benchmarks compare baseline.json results.json
+
+The first command times every benchmark and writes the results as JSON.
+The second compares two result files, and exits with a non-zero status
+if any benchmark got slower by more than a given threshold.
+"""
@@ -0,0 +1,160 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Command line interface for the benchmarks, run as
+``python -m traits.benchmarks``.
+"""
+
+import argparse
+
+from traits.benchmarks.compare import (
+    compare_results,
+    format_comparisons,
+    REGRESSION,
+    UNCHANGED,
+)
+from traits.benchmarks.runner import (
+    format_time,
+    load_results,
+    run_benchmarks,
+    save_results,
+    select_benchmarks,
+)
+from traits.benchmarks.suite import BENCHMARKS
+
+
+def main(args=None):
+    """ Run the benchmarks command line interface.
+
+    Parameters
+    ----------
+    args : list of str, optional
+        The command line arguments. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    status : int
+        The exit status: 0 on success, 1 if ``compare`` found regressions.
+    """
+    parser = _parser()
+    options = parser.parse_args(args)
+    if options.command is None:
+        parser.print_help()
+        return 2
+    return options.command(options)
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m traits.benchmarks",
+        description="Benchmarks for the Traits core.",
+    )
+    parser.set_defaults(command=None)
+    subparsers = parser.add_subparsers(title="commands")
+
+    run_parser = subparsers.add_parser(
+        "run", help="Run benchmarks and write their results as JSON."
+    )
+    run_parser.set_defaults(command=_run)
+    run_parser.add_argument(
+        "-o", "--output", help="File to write the results to."
+    )
+    _add_filter_argument(run_parser)
+    run_parser.add_argument(
+        "-r", "--repeat", type=int, default=5,
+        help="Number of measurements per benchmark (default: %(default)s).",
+    )
+    run_parser.add_argument(
+        "--min-time", type=float, default=0.02,
+        help="Minimum duration of a measurement, in seconds "
+        "(default: %(default)s).",
+    )
+
+    list_parser = subparsers.add_parser(
+        "list", help="List the available benchmarks."
+    )
+    list_parser.set_defaults(command=_list)
+    _add_filter_argument(list_parser)
+
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="Compare two result files, exiting with status 1 if any "
+        "benchmark regressed.",
+    )
+    compare_parser.set_defaults(command=_compare)
+    compare_parser.add_argument("baseline", help="The baseline results.")
+    compare_parser.add_argument("current", help="The results to check.")
+    compare_parser.add_argument(
+        "-t", "--threshold", type=float, default=0.1,
+        help="Relative slowdown above which a benchmark is reported as a "
+        "regression (default: %(default)s).",
+    )
+    compare_parser.add_argument(
+        "-a", "--all", action="store_true",
+        help="Show unchanged benchmarks as well.",
+    )
+    return parser
+
+
+def _add_filter_argument(parser):
+    parser.add_argument(
+        "-f", "--filter", action="append", dest="patterns", metavar="PATTERN",
+        help="Only select the benchmarks whose name matches the shell-style "
+        "pattern, such as 'getset.*'. May be given more than once.",
+    )
+
+
+def _run(options):
+    def report(name, result):
+        if result is None:
+            print("{:<40} skipped".format(name))
+        else:
+            print("{:<40} {:>10}".format(name, format_time(result["best"])))
+
+    results = run_benchmarks(
+        BENCHMARKS,
+        patterns=options.patterns,
+        repeat=options.repeat,
+        min_time=options.min_time,
+        report=report,
+    )
+    if options.output is not None:
+        save_results(results, options.output)
+    return 0
+
+
+def _list(options):
+    for name in select_benchmarks(BENCHMARKS, options.patterns):
+        print(name)
+    return 0
+
+
+def _compare(options):
+    comparisons = compare_results(
+        load_results(options.baseline),
+        load_results(options.current),
+        threshold=options.threshold,
+    )
+    shown = [
+        comparison
+        for comparison in comparisons
+        if options.all or comparison.status != UNCHANGED
+    ]
+    for line in format_comparisons(shown):
+        print(line)
+
+    regressions = [c for c in comparisons if c.status == REGRESSION]
+    print(
+        "{} benchmarks compared, {} regressions.".format(
+            len(comparisons), len(regressions)
+        )
+    )
+    return 1 if regressions else 0
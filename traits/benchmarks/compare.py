@@ -0,0 +1,125 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Comparison of two sets of benchmark results.
+"""
+
+import collections
+
+from traits.benchmarks.runner import format_time
+
+#: Status of a benchmark that got slower by more than the threshold.
+REGRESSION = "regression"
+
+#: Status of a benchmark that got faster by more than the threshold.
+IMPROVEMENT = "improvement"
+
+#: Status of a benchmark whose time changed by less than the threshold.
+UNCHANGED = "unchanged"
+
+#: Status of a benchmark only present in the current results.
+ADDED = "added"
+
+#: Status of a benchmark only present in the baseline results.
+REMOVED = "removed"
+
+#: The comparison of the best times of a benchmark in two sets of results.
+#: The *baseline* and *current* times are None for benchmarks that are
+#: only in one of the sets, and so is the *ratio* of the current time to
+#: the baseline time.
+BenchmarkComparison = collections.namedtuple(
+    "BenchmarkComparison", ["name", "baseline", "current", "ratio", "status"]
+)
+
+
+def compare_results(baseline, current, threshold=0.1):
+    """ Compare the best times of benchmarks in two sets of results.
+
+    Parameters
+    ----------
+    baseline : dict
+        The results to compare against.
+    current : dict
+        The new results.
+    threshold : float, optional
+        The relative change in time above which a benchmark is reported
+        as a regression or an improvement. The default of 0.1 flags
+        benchmarks that got more than 10% slower.
+
+    Returns
+    -------
+    comparisons : list of BenchmarkComparison
+        The comparisons, sorted by benchmark name.
+    """
+    baseline_benchmarks = baseline["benchmarks"]
+    current_benchmarks = current["benchmarks"]
+    comparisons = []
+    for name in sorted(baseline_benchmarks.keys() | current_benchmarks.keys()):
+        if name not in current_benchmarks:
+            comparison = BenchmarkComparison(
+                name, baseline_benchmarks[name]["best"], None, None, REMOVED
+            )
+        elif name not in baseline_benchmarks:
+            comparison = BenchmarkComparison(
+                name, None, current_benchmarks[name]["best"], None, ADDED
+            )
+        else:
+            old = baseline_benchmarks[name]["best"]
+            new = current_benchmarks[name]["best"]
+            ratio = new / old if old > 0 else float("inf")
+            if ratio > 1.0 + threshold:
+                status = REGRESSION
+            elif ratio < 1.0 / (1.0 + threshold):
+                status = IMPROVEMENT
+            else:
+                status = UNCHANGED
+            comparison = BenchmarkComparison(name, old, new, ratio, status)
+        comparisons.append(comparison)
+    return comparisons
+
+
+def format_comparisons(comparisons):
+    """ Format comparisons as a table, one line per benchmark.
+
+    Parameters
+    ----------
+    comparisons : list of BenchmarkComparison
+        The comparisons, as returned by ``compare_results``.
+
+    Returns
+    -------
+    lines : list of str
+    """
+    width = max([len("benchmark")] + [len(c.name) for c in comparisons])
+    template = "{:<{width}}  {:>10}  {:>10}  {:>7}  {}"
+    lines = [
+        template.format(
+            "benchmark", "baseline", "current", "ratio", "status",
+            width=width,
+        )
+    ]
+    for comparison in comparisons:
+        lines.append(
+            template.format(
+                comparison.name,
+                _format_optional(comparison.baseline, format_time),
+                _format_optional(comparison.current, format_time),
+                _format_optional(comparison.ratio, "{:.2f}".format),
+                comparison.status,
+                width=width,
+            )
+        )
+    return lines
+
+
+def _format_optional(value, format):
+    """ Format a value that may be None. """
+    return "-" if value is None else format(value)
@@ -0,0 +1,225 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Timing of benchmarks, and reading and writing of result files.
+"""
+
+import datetime
+import fnmatch
+import json
+import platform
+import statistics
+import timeit
+
+import traits
+
+#: Version of the format of result files.
+RESULTS_VERSION = 1
+
+
+class BenchmarkSkipped(Exception):
+    """ Raised by the setup of a benchmark that can't be run, for example
+    because an optional dependency is missing.
+    """
+
+
+def time_function(function, repeat=5, min_time=0.02):
+    """ Time calls to a function taking no arguments.
+
+    The number of calls per measurement is doubled until a measurement
+    takes at least *min_time* seconds, and that measurement is then
+    repeated.
+
+    Parameters
+    ----------
+    function : callable
+        The function to time.
+    repeat : int, optional
+        The number of measurements to make.
+    min_time : float, optional
+        The minimum duration of a measurement, in seconds.
+
+    Returns
+    -------
+    number : int
+        The number of calls made in each measurement.
+    times : list of float
+        The time per call, in seconds, for each measurement.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    elapsed = [elapsed] + [timer.timeit(number) for _ in range(repeat - 1)]
+    return number, [time / number for time in elapsed]
+
+
+def select_benchmarks(benchmarks, patterns=None):
+    """ Return the names of the benchmarks matching any of the given
+    shell-style patterns, in sorted order.
+
+    Parameters
+    ----------
+    benchmarks : dict
+        Mapping from names to benchmark setup functions.
+    patterns : list of str, optional
+        Patterns, such as "getset.*", for the names of the benchmarks to
+        select. If not given, all benchmarks are selected.
+
+    Returns
+    -------
+    names : list of str
+    """
+    return sorted(
+        name
+        for name in benchmarks
+        if patterns is None
+        or any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    )
+
+
+def run_benchmarks(
+    benchmarks, patterns=None, repeat=5, min_time=0.02, report=None
+):
+    """ Run benchmarks, and return their results.
+
+    Parameters
+    ----------
+    benchmarks : dict
+        Mapping from names to benchmark setup functions. A setup function
+        takes no arguments, and returns the function taking no arguments
+        to be timed. It raises BenchmarkSkipped if the benchmark can't be
+        run.
+    patterns : list of str, optional
+        Patterns for the names of the benchmarks to run.
+    repeat : int, optional
+        The number of measurements to make for each benchmark.
+    min_time : float, optional
+        The minimum duration of a measurement, in seconds.
+    report : callable, optional
+        Called with the name and the result of each benchmark as it
+        completes. The result is None for skipped benchmarks.
+
+    Returns
+    -------
+    results : dict
+        The results, in the format written by ``save_results``.
+    """
+    results = {
+        "version": RESULTS_VERSION,
+        "metadata": environment_metadata(),
+        "benchmarks": {},
+        "skipped": {},
+    }
+    for name in select_benchmarks(benchmarks, patterns):
+        try:
+            function = benchmarks[name]()
+        except BenchmarkSkipped as exception:
+            results["skipped"][name] = str(exception)
+            result = None
+        else:
+            number, times = time_function(
+                function, repeat=repeat, min_time=min_time
+            )
+            result = {
+                "number": number,
+                "times": times,
+                "best": min(times),
+                "median": statistics.median(times),
+            }
+            results["benchmarks"][name] = result
+
+        if report is not None:
+            report(name, result)
+
+    return results
+
+
+def environment_metadata():
+    """ Return a description of the environment benchmarks are run in. """
+    return {
+        "traits_version": traits.__version__,
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def save_results(results, filename):
+    """ Write benchmark results to a JSON file.
+
+    Parameters
+    ----------
+    results : dict
+        Results, as returned by ``run_benchmarks``.
+    filename : str
+        The name of the file to write.
+    """
+    with open(filename, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def load_results(filename):
+    """ Read benchmark results from a JSON file.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file to read.
+
+    Returns
+    -------
+    results : dict
+
+    Raises
+    ------
+    ValueError
+        If the file doesn't contain benchmark results in a supported format.
+    """
+    with open(filename, "r", encoding="utf-8") as file:
+        results = json.load(file)
+
+    if not isinstance(results, dict) or "benchmarks" not in results:
+        raise ValueError(
+            "{!r} doesn't contain benchmark results".format(filename)
+        )
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(
+            "Unsupported version of benchmark results in {!r}: {!r}".format(
+                filename, results.get("version")
+            )
+        )
+    return results
+
+
+def format_time(seconds):
+    """ Format a duration with a unit suited to its magnitude.
+
+    Parameters
+    ----------
+    seconds : float
+        The duration, in seconds.
+
+    Returns
+    -------
+    text : str
+    """
+    for unit, scale in [("s", 1.0), ("ms", 1e-3), ("us", 1e-6)]:
+        if seconds >= scale:
+            return "{:.3g} {}".format(seconds / scale, unit)
+    return "{:.3g} ns".format(seconds / 1e-9)
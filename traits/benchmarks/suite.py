@@ -0,0 +1,606 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+The benchmarks of the Traits core.
+
+Each benchmark is registered in ``BENCHMARKS`` under a dotted name, with a
+setup function. The setup function takes no arguments, builds the objects
+the benchmark needs, and returns a function taking no arguments whose
+calls are timed.
+"""
+
+import pickle
+
+from traits.adaptation.api import AdaptationManager
+from traits.api import (
+    Any,
+    Array,
+    Callable,
+    CInt,
+    Complex,
+    Dict,
+    Either,
+    Enum,
+    Float,
+    HasTraits,
+    Instance,
+    Int,
+    Interface,
+    List,
+    Map,
+    observe,
+    on_trait_change,
+    provides,
+    Range,
+    Set,
+    Str,
+    Supports,
+    This,
+    Trait,
+    Tuple,
+    Union,
+)
+from traits.benchmarks.runner import BenchmarkSkipped
+from traits.constants import ValidateTrait
+from traits.has_traits import MetaHasTraits
+
+#: Mapping from benchmark names to setup functions.
+BENCHMARKS = {}
+
+#: Numbers of observers for the instance creation benchmarks.
+OBSERVER_COUNTS = [0, 1, 10, 100]
+
+#: Sizes of arrays for the array validation benchmarks.
+ARRAY_SIZES = [10, 10000]
+
+#: Total size, in bytes, of the arrays of the array pickling benchmarks.
+PICKLE_ARRAY_BYTES = 100 * 2**20
+
+
+def benchmark(name):
+    """ Decorator registering a benchmark setup function under a name. """
+    def decorator(setup):
+        if name in BENCHMARKS:
+            raise ValueError("Duplicate benchmark name {!r}".format(name))
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+# -- Trait get/set -----------------------------------------------------------
+
+class IBenchmark(Interface):
+    """ An interface used by the adaptation benchmarks. """
+
+
+class IAdapted(Interface):
+    """ An interface objects providing IBenchmark are adapted to. """
+
+
+class IChained(Interface):
+    """ An interface only reached by adapting through IAdapted. """
+
+
+@provides(IBenchmark)
+class Provider(HasTraits):
+    """ A class providing IBenchmark. """
+
+
+@provides(IAdapted)
+class Adapter(HasTraits):
+    """ An adapter from IBenchmark to IAdapted. """
+
+    adaptee = Any()
+
+    def __init__(self, adaptee):
+        super().__init__(adaptee=adaptee)
+
+
+@provides(IChained)
+class ChainedAdapter(Adapter):
+    """ An adapter from IAdapted to IChained. """
+
+
+def _identity_validator(object, name, value):
+    return value
+
+
+#: Marker for the benchmarks setting a trait to the object having it.
+_SELF = object()
+
+#: The trait and the value to set for each validate kind of CTrait, except
+#: for the slow kind, only used within complex validators, and the unused
+#: kinds.
+GETSET_TRAITS = [
+    (ValidateTrait.type, lambda: Instance(int, allow_none=False), 1),
+    (ValidateTrait.instance, lambda: Instance(Provider), Provider()),
+    (ValidateTrait.self_type, This, _SELF),
+    (ValidateTrait.float_range, lambda: Range(0.0, 10.0), 5.0),
+    (ValidateTrait.enum, lambda: Enum("red", "green", "blue"), "green"),
+    (ValidateTrait.map, lambda: Map({"yes": True, "no": False}), "no"),
+    (ValidateTrait.complex, lambda: Either(Int, Str), "text"),
+    (ValidateTrait.tuple, lambda: Tuple(Int, Str), (1, "text")),
+    (ValidateTrait.coerce, Str, "text"),
+    (ValidateTrait.cast, CInt, "1"),
+    (ValidateTrait.function, lambda: Trait(0, _identity_validator), 1),
+    (ValidateTrait.python, lambda: Range(0, 10), 5),
+    (ValidateTrait.adapt, lambda: Supports(IBenchmark), Provider()),
+    (ValidateTrait.int, Int, 1),
+    (ValidateTrait.float, Float, 1.5),
+    (ValidateTrait.callable, Callable, len),
+    (ValidateTrait.complex_number, Complex, 1.5j),
+    (ValidateTrait.union, lambda: Union(Int, Str), "text"),
+]
+
+
+def _getset_class(trait):
+    """ Return a new HasTraits subclass with a single trait, "value". """
+    return MetaHasTraits("GetSet", (HasTraits,), {"value": trait})
+
+
+def _register_getset(kind, trait_factory, value):
+    @benchmark("getset." + kind.name)
+    def setup():
+        obj = _getset_class(trait_factory())()
+        new_value = obj if value is _SELF else value
+
+        def set_and_get():
+            obj.value = new_value
+            return obj.value
+
+        return set_and_get
+
+
+for kind, trait_factory, value in GETSET_TRAITS:
+    _register_getset(kind, trait_factory, value)
+
+
+@benchmark("getset.any")
+def _getset_any():
+    obj = _getset_class(Any())()
+
+    def set_and_get():
+        obj.value = 1
+        return obj.value
+
+    return set_and_get
+
+
+# -- Instance creation -------------------------------------------------------
+
+def _observed_class(count):
+    """ Return a class with the given number of traits, each observed by a
+    method decorated with ``observe``.
+    """
+    class_dict = {}
+    for i in range(count):
+        class_dict["value_{}".format(i)] = Int()
+        class_dict["_value_{}_updated".format(i)] = observe(
+            "value_{}".format(i)
+        )(lambda self, event: None)
+    return MetaHasTraits("Observed", (HasTraits,), class_dict)
+
+
+def _listened_class(count):
+    """ Return a class with the given number of traits, each listened to by
+    a method decorated with ``on_trait_change``.
+    """
+    class_dict = {}
+    for i in range(count):
+        class_dict["value_{}".format(i)] = Int()
+        class_dict["_value_{}_updated".format(i)] = on_trait_change(
+            "value_{}".format(i)
+        )(lambda self: None)
+    return MetaHasTraits("Listened", (HasTraits,), class_dict)
+
+
+def _register_creation(count):
+    @benchmark("create.observers_{}".format(count))
+    def setup_observers():
+        return _observed_class(count)
+
+    @benchmark("create.listeners_{}".format(count))
+    def setup_listeners():
+        return _listened_class(count)
+
+
+for count in OBSERVER_COUNTS:
+    _register_creation(count)
+
+
+# -- observe and on_trait_change ---------------------------------------------
+
+class Node(HasTraits):
+    """ A node of a graph of objects, for the notification benchmarks. """
+
+    value = Int()
+
+    child = Instance("Node")
+
+
+def _handler(*args):
+    pass
+
+
+def _toggle(node):
+    """ Return a function changing the value of a node twice. """
+    def toggle():
+        node.value = 1
+        node.value = 0
+
+    return toggle
+
+
+def _toggle_child(node):
+    """ Return a function changing the value of the child of a node twice.
+
+    The function refers to the node itself, so that it isn't garbage
+    collected along with the observers registered on it.
+    """
+    def toggle():
+        child = node.child
+        child.value = 1
+        child.value = 0
+
+    return toggle
+
+
+@benchmark("observe.register")
+def _observe_register():
+    node = Node()
+
+    def register():
+        node.observe(_handler, "value")
+        node.observe(_handler, "value", remove=True)
+
+    return register
+
+
+@benchmark("observe.register_extended")
+def _observe_register_extended():
+    node = Node(child=Node())
+
+    def register():
+        node.observe(_handler, "child.value")
+        node.observe(_handler, "child.value", remove=True)
+
+    return register
+
+
+@benchmark("observe.dispatch")
+def _observe_dispatch():
+    node = Node()
+    node.observe(_handler, "value")
+    return _toggle(node)
+
+
+@benchmark("observe.dispatch_extended")
+def _observe_dispatch_extended():
+    node = Node(child=Node())
+    node.observe(_handler, "child.value")
+    return _toggle_child(node)
+
+
+@benchmark("on_trait_change.register")
+def _on_trait_change_register():
+    node = Node()
+
+    def register():
+        node.on_trait_change(_handler, "value")
+        node.on_trait_change(_handler, "value", remove=True)
+
+    return register
+
+
+@benchmark("on_trait_change.register_extended")
+def _on_trait_change_register_extended():
+    node = Node(child=Node())
+
+    def register():
+        node.on_trait_change(_handler, "child.value")
+        node.on_trait_change(_handler, "child.value", remove=True)
+
+    return register
+
+
+@benchmark("on_trait_change.dispatch")
+def _on_trait_change_dispatch():
+    node = Node()
+    node.on_trait_change(_handler, "value")
+    return _toggle(node)
+
+
+@benchmark("on_trait_change.dispatch_extended")
+def _on_trait_change_dispatch_extended():
+    node = Node(child=Node())
+    node.on_trait_change(_handler, "child.value")
+    return _toggle_child(node)
+
+
+# -- Containers --------------------------------------------------------------
+
+class Containers(HasTraits):
+    """ A class with container traits, for the container benchmarks. """
+
+    list_ = List(Int)
+
+    dict_ = Dict(Str, Int)
+
+    set_ = Set(Int)
+
+
+#: Values added in bulk by the container benchmarks.
+_VALUES = list(range(100))
+
+
+@benchmark("list.append_pop")
+def _list_append_pop():
+    values = Containers().list_
+
+    def append_pop():
+        values.append(1)
+        values.pop()
+
+    return append_pop
+
+
+@benchmark("list.setitem")
+def _list_setitem():
+    values = Containers(list_=[0]).list_
+
+    def setitem():
+        values[0] = 1
+
+    return setitem
+
+
+@benchmark("list.extend_clear")
+def _list_extend_clear():
+    values = Containers().list_
+
+    def extend_clear():
+        values.extend(_VALUES)
+        values.clear()
+
+    return extend_clear
+
+
+@benchmark("list.observed_append_pop")
+def _list_observed_append_pop():
+    containers = Containers()
+    containers.observe(_handler, "list_:items")
+    values = containers.list_
+
+    def append_pop():
+        values.append(1)
+        values.pop()
+
+    return append_pop
+
+
+@benchmark("dict.setitem_pop")
+def _dict_setitem_pop():
+    values = Containers().dict_
+
+    def setitem_pop():
+        values["key"] = 1
+        values.pop("key")
+
+    return setitem_pop
+
+
+@benchmark("dict.update_clear")
+def _dict_update_clear():
+    values = Containers().dict_
+    items = {str(value): value for value in _VALUES}
+
+    def update_clear():
+        values.update(items)
+        values.clear()
+
+    return update_clear
+
+
+@benchmark("set.add_discard")
+def _set_add_discard():
+    values = Containers().set_
+
+    def add_discard():
+        values.add(1)
+        values.discard(1)
+
+    return add_discard
+
+
+@benchmark("set.update_clear")
+def _set_update_clear():
+    values = Containers().set_
+
+    def update_clear():
+        values.update(_VALUES)
+        values.clear()
+
+    return update_clear
+
+
+# -- Arrays ------------------------------------------------------------------
+
+def _register_array(size):
+    @benchmark("array.validate_{}".format(size))
+    def setup():
+        try:
+            import numpy
+        except ImportError:
+            raise BenchmarkSkipped("NumPy is not available") from None
+
+        class Arrays(HasTraits):
+            values = Array(dtype=float, shape=(None,))
+
+        obj = Arrays()
+        array = numpy.zeros(size)
+
+        def validate():
+            obj.values = array
+
+        return validate
+
+
+for size in ARRAY_SIZES:
+    _register_array(size)
+
+
+class ArrayModel(HasTraits):
+    """ A class with array traits, for the array pickling benchmarks. """
+
+    positions = Array(dtype=float)
+
+    velocities = Array(dtype=float)
+
+    masses = Array(dtype=float)
+
+    # Holds a strided view, as a slice of a larger array would be.
+    charges = Array(dtype=float)
+
+
+def _array_model():
+    """ Return an ArrayModel holding PICKLE_ARRAY_BYTES of array data. """
+    try:
+        import numpy
+    except ImportError:
+        raise BenchmarkSkipped("NumPy is not available") from None
+
+    size = PICKLE_ARRAY_BYTES // 4 // 8
+    return ArrayModel(
+        positions=numpy.zeros(size),
+        velocities=numpy.ones(size),
+        masses=numpy.full(size, 2.0),
+        charges=numpy.zeros(2 * size)[::2],
+    )
+
+
+@benchmark("array.pickle_in_band")
+def _array_pickle_in_band():
+    model = _array_model()
+
+    def dumps():
+        return pickle.dumps(model, protocol=4)
+
+    return dumps
+
+
+@benchmark("array.pickle_out_of_band")
+def _array_pickle_out_of_band():
+    model = _array_model()
+
+    def dumps():
+        buffers = []
+        data = pickle.dumps(model, protocol=5, buffer_callback=buffers.append)
+        return data, buffers
+
+    return dumps
+
+
+@benchmark("array.unpickle_out_of_band")
+def _array_unpickle_out_of_band():
+    buffers = []
+    data = pickle.dumps(
+        _array_model(), protocol=5, buffer_callback=buffers.append
+    )
+
+    def loads():
+        return pickle.loads(data, buffers=buffers)
+
+    return loads
+
+
+# -- Adaptation --------------------------------------------------------------
+
+def _adaptation_manager():
+    """ Return an adaptation manager with offers for the benchmark
+    interfaces, distinct from the global one.
+    """
+    manager = AdaptationManager()
+    manager.register_factory(Adapter, IBenchmark, IAdapted)
+    manager.register_factory(ChainedAdapter, IAdapted, IChained)
+    return manager
+
+
+def _register_adaptation(name, protocol, default):
+    @benchmark("adapt." + name)
+    def setup():
+        manager = _adaptation_manager()
+        provider = Provider()
+
+        def adapt():
+            return manager.adapt(provider, protocol, default)
+
+        return adapt
+
+
+_register_adaptation("provided", IBenchmark, None)
+_register_adaptation("single", IAdapted, None)
+_register_adaptation("chained", IChained, None)
+_register_adaptation("unavailable", Interface, None)
+
+
+@benchmark("adapt.supports_protocol")
+def _adapt_supports_protocol():
+    manager = _adaptation_manager()
+    provider = Provider()
+
+    def supports_protocol():
+        return manager.supports_protocol(provider, IChained)
+
+    return supports_protocol
+
+
+# -- Pickling ----------------------------------------------------------------
+
+class Record(HasTraits):
+    """ A class with a variety of traits, for the pickling benchmarks. """
+
+    name = Str("record")
+
+    count = Int(10)
+
+    ratio = Float(0.5)
+
+    state = Enum("new", "old")
+
+    tags = List(Str, ["a", "b", "c"])
+
+    attributes = Dict(Str, Int, {"x": 1, "y": 2})
+
+    child = Instance("Record")
+
+
+def _record():
+    return Record(child=Record())
+
+
+@benchmark("pickle.dumps")
+def _pickle_dumps():
+    record = _record()
+
+    def dumps():
+        return pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return dumps
+
+
+@benchmark("pickle.loads")
+def _pickle_loads():
+    data = pickle.dumps(_record(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads():
+        return pickle.loads(data)
+
+    return loads
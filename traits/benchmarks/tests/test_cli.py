@@ -0,0 +1,113 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import contextlib
+import io
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from traits.benchmarks.cli import main
+from traits.benchmarks.runner import load_results, save_results
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def run_main(self, *args):
+        """ Run the command line interface, returning the exit status and
+        the output.
+        """
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            status = main(list(args))
+        return status, stdout.getvalue()
+
+    def write_results(self, filename, **best_times):
+        filename = os.path.join(self.directory, filename)
+        save_results(
+            {
+                "version": 1,
+                "benchmarks": {
+                    name: {"best": time} for name, time in best_times.items()
+                },
+            },
+            filename,
+        )
+        return filename
+
+    def test_run(self):
+        filename = os.path.join(self.directory, "results.json")
+
+        status, output = self.run_main(
+            "run", "--filter", "getset.int", "--filter", "getset.float",
+            "--repeat", "2", "--min-time", "0", "--output", filename,
+        )
+
+        self.assertEqual(status, 0)
+        self.assertIn("getset.int", output)
+        results = load_results(filename)
+        self.assertEqual(
+            sorted(results["benchmarks"]), ["getset.float", "getset.int"]
+        )
+        self.assertEqual(
+            len(results["benchmarks"]["getset.int"]["times"]), 2
+        )
+
+    def test_list(self):
+        status, output = self.run_main("list", "--filter", "pickle.*")
+
+        self.assertEqual(status, 0)
+        self.assertEqual(output.split(), ["pickle.dumps", "pickle.loads"])
+
+    def test_compare(self):
+        baseline = self.write_results("baseline.json", a=1.0, b=1.0)
+        unchanged = self.write_results("unchanged.json", a=1.0, b=0.5)
+        regressed = self.write_results("regressed.json", a=1.0, b=2.0)
+
+        status, output = self.run_main("compare", baseline, unchanged)
+        self.assertEqual(status, 0)
+        lines = output.splitlines()
+        self.assertEqual([line.split()[0] for line in lines[1:-1]], ["b"])
+        self.assertIn("improvement", lines[1])
+
+        status, output = self.run_main("compare", baseline, regressed)
+        self.assertEqual(status, 1)
+        self.assertIn("regression", output)
+
+        status, output = self.run_main(
+            "compare", "--threshold", "1.5", "--all", baseline, regressed
+        )
+        self.assertEqual(status, 0)
+        self.assertEqual(len(output.splitlines()), 4)
+
+    def test_no_command(self):
+        status, output = self.run_main()
+
+        self.assertEqual(status, 2)
+        self.assertIn("compare", output)
+
+    def test_module_entry_point(self):
+        stdout = io.StringIO()
+        argv = ["traits.benchmarks", "list", "--filter", "getset.int"]
+        with mock.patch.object(sys, "argv", argv):
+            with contextlib.redirect_stdout(stdout):
+                with self.assertRaises(SystemExit) as exception_context:
+                    runpy.run_module("traits.benchmarks", run_name="__main__")
+
+        self.assertEqual(exception_context.exception.code, 0)
+        self.assertEqual(stdout.getvalue().split(), ["getset.int"])
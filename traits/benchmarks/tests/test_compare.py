@@ -0,0 +1,78 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+from traits.benchmarks.compare import (
+    ADDED,
+    BenchmarkComparison,
+    compare_results,
+    format_comparisons,
+    IMPROVEMENT,
+    REGRESSION,
+    REMOVED,
+    UNCHANGED,
+)
+
+
+def results(**best_times):
+    """ Return results with the given best times. """
+    return {
+        "version": 1,
+        "benchmarks": {
+            name: {"best": time} for name, time in best_times.items()
+        },
+    }
+
+
+class TestCompare(unittest.TestCase):
+
+    def test_compare_results(self):
+        baseline = results(slower=1.0, faster=1.0, same=1.0, removed=1.0)
+        current = results(slower=1.5, faster=0.5, same=1.05, added=1.0)
+
+        comparisons = compare_results(baseline, current, threshold=0.1)
+
+        self.assertEqual(
+            comparisons,
+            [
+                BenchmarkComparison("added", None, 1.0, None, ADDED),
+                BenchmarkComparison("faster", 1.0, 0.5, 0.5, IMPROVEMENT),
+                BenchmarkComparison("removed", 1.0, None, None, REMOVED),
+                BenchmarkComparison("same", 1.0, 1.05, 1.05, UNCHANGED),
+                BenchmarkComparison("slower", 1.0, 1.5, 1.5, REGRESSION),
+            ],
+        )
+
+    def test_threshold(self):
+        baseline = results(benchmark=1.0)
+        current = results(benchmark=1.5)
+
+        comparison, = compare_results(baseline, current, threshold=0.6)
+        self.assertEqual(comparison.status, UNCHANGED)
+        comparison, = compare_results(current, baseline, threshold=0.6)
+        self.assertEqual(comparison.status, UNCHANGED)
+        comparison, = compare_results(current, baseline, threshold=0.4)
+        self.assertEqual(comparison.status, IMPROVEMENT)
+
+    def test_format_comparisons(self):
+        comparisons = compare_results(
+            results(a_long_benchmark_name=1e-6, removed=1.0),
+            results(a_long_benchmark_name=2e-6),
+        )
+
+        lines = format_comparisons(comparisons)
+
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("benchmark"))
+        self.assertIn("1 us", lines[1])
+        self.assertIn("2.00", lines[1])
+        self.assertIn(REGRESSION, lines[1])
+        self.assertIn(REMOVED, lines[2])
@@ -0,0 +1,124 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from traits.benchmarks.runner import (
+    BenchmarkSkipped,
+    format_time,
+    load_results,
+    run_benchmarks,
+    save_results,
+    select_benchmarks,
+    time_function,
+)
+
+
+def _skipped():
+    raise BenchmarkSkipped("not available")
+
+
+BENCHMARKS = {
+    "group.first": lambda: (lambda: None),
+    "group.second": lambda: (lambda: None),
+    "other.skipped": _skipped,
+}
+
+
+class TestRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_time_function(self):
+        calls = []
+
+        number, times = time_function(
+            lambda: calls.append(1), repeat=3, min_time=0.0
+        )
+
+        self.assertEqual(number, 1)
+        self.assertEqual(len(times), 3)
+        self.assertEqual(len(calls), 3)
+
+    def test_time_function_reaches_min_time(self):
+        number, times = time_function(lambda: None, repeat=1, min_time=1e-4)
+
+        self.assertGreater(number, 1)
+        self.assertGreaterEqual(times[0] * number, 1e-4)
+
+    def test_select_benchmarks(self):
+        self.assertEqual(
+            select_benchmarks(BENCHMARKS),
+            ["group.first", "group.second", "other.skipped"],
+        )
+        self.assertEqual(
+            select_benchmarks(BENCHMARKS, ["group.*"]),
+            ["group.first", "group.second"],
+        )
+        self.assertEqual(
+            select_benchmarks(BENCHMARKS, ["*.first", "other.*"]),
+            ["group.first", "other.skipped"],
+        )
+        self.assertEqual(select_benchmarks(BENCHMARKS, ["missing"]), [])
+
+    def test_run_benchmarks(self):
+        reported = []
+
+        results = run_benchmarks(
+            BENCHMARKS,
+            repeat=2,
+            min_time=0.0,
+            report=lambda name, result: reported.append(name),
+        )
+
+        self.assertEqual(
+            reported, ["group.first", "group.second", "other.skipped"]
+        )
+        self.assertEqual(
+            sorted(results["benchmarks"]), ["group.first", "group.second"]
+        )
+        self.assertEqual(
+            results["skipped"], {"other.skipped": "not available"}
+        )
+        result = results["benchmarks"]["group.first"]
+        self.assertEqual(len(result["times"]), 2)
+        self.assertEqual(result["best"], min(result["times"]))
+        self.assertIn("python_version", results["metadata"])
+
+    def test_save_and_load_results(self):
+        filename = os.path.join(self.directory, "results.json")
+        results = run_benchmarks(
+            BENCHMARKS, patterns=["group.*"], repeat=1, min_time=0.0
+        )
+
+        save_results(results, filename)
+
+        self.assertEqual(load_results(filename), results)
+
+    def test_load_invalid_results(self):
+        filename = os.path.join(self.directory, "results.json")
+        for content in [[], {"version": 1}, {"version": 0, "benchmarks": {}}]:
+            with self.subTest(content=content):
+                with open(filename, "w", encoding="utf-8") as file:
+                    json.dump(content, file)
+                with self.assertRaises(ValueError):
+                    load_results(filename)
+
+    def test_format_time(self):
+        self.assertEqual(format_time(2.5), "2.5 s")
+        self.assertEqual(format_time(0.0125), "12.5 ms")
+        self.assertEqual(format_time(3e-6), "3 us")
+        self.assertEqual(format_time(1.5e-7), "150 ns")
@@ -0,0 +1,81 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import gc
+import unittest
+from unittest import mock
+
+from traits.benchmarks import suite
+from traits.benchmarks.runner import BenchmarkSkipped
+from traits.benchmarks.suite import (
+    _getset_class,
+    BENCHMARKS,
+    GETSET_TRAITS,
+)
+from traits.constants import ValidateTrait
+from traits.testing.optional_dependencies import numpy, requires_numpy
+
+
+class TestSuite(unittest.TestCase):
+
+    def test_benchmarks_run(self):
+        for name, setup in BENCHMARKS.items():
+            with self.subTest(name=name):
+                try:
+                    function = setup()
+                except BenchmarkSkipped:
+                    self.assertIsNone(numpy)
+                    self.assertTrue(name.startswith("array."))
+                else:
+                    function()
+                    function()
+
+    def test_getset_validate_kinds(self):
+        # Every kind used by top-level validators has a benchmark.
+        unused = {
+            ValidateTrait.int_range,
+            ValidateTrait.slow,
+            ValidateTrait.prefix_map,
+        }
+        covered = set()
+        for kind, trait_factory, _ in GETSET_TRAITS:
+            trait = _getset_class(trait_factory()).class_traits()["value"]
+            validate = trait.get_validate()
+            actual = (
+                ValidateTrait.python if callable(validate) else validate[0]
+            )
+            self.assertEqual(actual, kind)
+            covered.add(kind)
+
+        self.assertEqual(covered, set(ValidateTrait) - unused)
+
+    def test_dispatch_notifies(self):
+        # The objects observed must be kept alive by the timed function.
+        for name in [
+            "observe.dispatch",
+            "observe.dispatch_extended",
+            "on_trait_change.dispatch",
+            "on_trait_change.dispatch_extended",
+        ]:
+            with self.subTest(name=name):
+                events = []
+                handler = lambda *args: events.append(args)  # noqa: E731
+                with mock.patch.object(suite, "_handler", handler):
+                    function = BENCHMARKS[name]()
+                gc.collect()
+
+                function()
+
+                self.assertEqual(len(events), 2)
+
+    @requires_numpy
+    def test_array_benchmarks_available(self):
+        self.assertIn("array.validate_10", BENCHMARKS)
+        BENCHMARKS["array.validate_10"]()()
@@ -112,6 +112,9 @@ class ValidateTrait(IntEnum):
     #: A complex number check.
     complex_number = 23
 
+    #: A check against each of the member traits of a Union.
+    union = 24
+
 
 class ComparisonMode(IntEnum):
     """ Comparison mode.
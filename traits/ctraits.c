@@ -14,6 +14,14 @@
 
 #include "Python.h"
 
+#if PY_VERSION_HEX < 0x030D0000
+#ifdef MS_WINDOWS
+#include <windows.h>
+#else
+#include <time.h>
+#endif
+#endif
+
 /*-----------------------------------------------------------------------------
 |  Constants:
 +----------------------------------------------------------------------------*/
@@ -23,6 +31,8 @@ static PyObject *listener_traits; /* == "__listener_traits__" */
 static PyObject *editor_property; /* == "editor" */
 static PyObject *class_prefix;    /* == "__prefix__" */
 static PyObject *trait_added;     /* == "trait_added" */
+static PyObject *trait_slots;     /* == "__trait_slots__" */
+static PyObject *zero_version;    /* == 0, version of unassigned traits */
 static PyObject *Undefined;       /* Global 'Undefined' value */
 static PyObject *Uninitialized;   /* Global 'Uninitialized' value */
 static PyObject *TraitError;      /* TraitError exception */
@@ -32,6 +42,9 @@ static PyObject *TraitSetObject;  /* TraitSetObject class */
 static PyObject *TraitDictObject; /* TraitDictObject class */
 static PyObject *adapt;           /* 'adapt' function */
 static PyTypeObject *ctrait_type; /* Python-level CTrait type reference */
+static unsigned int instrumentation_flags = 0; /* See 'Instrumentation' */
+static PyObject *instrumented_traits = NULL;   /* Traits with statistics */
+static unsigned long long trait_version_counter = 0; /* Last version stamp */
 
 /*-----------------------------------------------------------------------------
 |  Macro definitions:
@@ -46,6 +59,18 @@ static PyTypeObject *ctrait_type; /* Python-level CTrait type reference */
     ((((tnotifiers) != NULL) && (PyList_GET_SIZE((tnotifiers)) > 0)) \
      || (((onotifiers) != NULL) && (PyList_GET_SIZE((onotifiers)) > 0)))
 
+/* Number of notifiers that call_notifiers can snapshot without allocating: */
+#define NOTIFIER_STACK_SIZE 8
+
+/* PyObject_Vectorcall is only public from Python 3.9 onwards: */
+#if PY_VERSION_HEX < 0x03090000
+#define PyObject_Vectorcall _PyObject_Vectorcall
+#endif
+
+/* Instrumentation flags: */
+#define INSTRUMENT_COUNTS 0x00000001U
+#define INSTRUMENT_TIMES 0x00000002U
+
 /*-----------------------------------------------------------------------------
 |  Forward declarations:
 +----------------------------------------------------------------------------*/
@@ -82,6 +107,10 @@ PyDoc_STRVAR(
    a trait: */
 #define HASTRAITS_VETO_NOTIFY 0x00000004U
 
+/* Queue trait change notifications for later delivery instead of sending them
+   immediately (see 'hold_trait_notifications'): */
+#define HASTRAITS_HOLD_NOTIFY 0x00000008U
+
 /*-----------------------------------------------------------------------------
 |  'CHasTraits' instance definition:
 |
@@ -91,6 +120,11 @@ PyDoc_STRVAR(
 |
 |  All 'anytrait_changed' notification handlers are stored in the instance's
 |  'notifiers' list.
+|
+|  Instances of classes created with 'trait_slots=True' keep the values of
+|  the statically declared traits of the class in the 'slot_values' array
+|  rather than in the instance's '__dict__'. 'slot_names' is the class's
+|  '__trait_slots__' tuple, giving the name of the trait for each slot.
 +----------------------------------------------------------------------------*/
 
 typedef struct {
@@ -100,14 +134,20 @@ typedef struct {
     PyListObject *notifiers;   /* List of 'any trait changed' notification
                                   handlers */
     unsigned int flags;        /* Behavior modification flags */
+    PyObject *slot_names;      /* Trait names for the value slots, or NULL */
+    PyObject **slot_values;    /* Trait value slots, or NULL */
+    PyObject *trait_versions;  /* Version stamps of the versioned traits,
+                                  or NULL */
     PyObject *obj_dict;        /* Object attribute dictionary ('__dict__') */
                                /* NOTE: 'obj_dict' field MUST be last field */
 } has_traits_object;
 
+typedef struct _trait_object a_trait_object;
+
 static int
 call_notifiers(
-    PyListObject *, PyListObject *, has_traits_object *, PyObject *,
-    PyObject *, PyObject *new_value);
+    a_trait_object *, PyListObject *, PyListObject *, has_traits_object *,
+    PyObject *, PyObject *, PyObject *new_value);
 
 /*-----------------------------------------------------------------------------
 |  'CTrait' flag values:
@@ -125,6 +165,10 @@ call_notifiers(
 /* Send the 'post_setattr' method the original unvalidated value */
 #define TRAIT_POST_SETATTR_ORIGINAL_VALUE 0x00000010U
 
+/* Record a new version stamp in the object each time the trait is assigned
+   or deleted (see '_trait_versions'): */
+#define TRAIT_VERSIONED 0x00000020U
+
 /* Does this trait have an associated 'mapped' trait? */
 #define TRAIT_IS_MAPPED 0x00000080U
 
@@ -201,7 +245,6 @@ call_notifiers(
 |  'CTrait' instance definition:
 +----------------------------------------------------------------------------*/
 
-typedef struct _trait_object a_trait_object;
 typedef PyObject *(*trait_getattr)(
     a_trait_object *, has_traits_object *, PyObject *);
 typedef int (*trait_setattr)(
@@ -214,6 +257,24 @@ typedef PyObject *(*trait_validate)(
 typedef PyObject *(*delegate_attr_name_func)(
     a_trait_object *, has_traits_object *, PyObject *);
 
+/*-----------------------------------------------------------------------------
+|  Usage statistics of a 'CTrait', gathered while instrumentation is enabled.
+|  Times are in nanoseconds, and are only gathered if timing is enabled:
++----------------------------------------------------------------------------*/
+
+typedef struct {
+    PyObject *name;                   /* Name of the trait when first used */
+    PyObject *owner;                  /* Class of the object first used on */
+    unsigned long long gets;          /* Number of reads of the value */
+    unsigned long long sets;          /* Number of assignments and deletions */
+    unsigned long long validations;   /* Number of values validated */
+    unsigned long long notifications; /* Number of notifier calls */
+    long long get_time;               /* Total time spent reading */
+    long long set_time;               /* Total time spent assigning */
+    long long validate_time;          /* Total time spent validating */
+    long long notify_time;            /* Total time spent in notifiers */
+} trait_stats;
+
 typedef struct _trait_object {
     PyObject_HEAD                    /* Standard Python object header */
     unsigned int flags;              /* Flag bits */
@@ -233,6 +294,9 @@ typedef struct _trait_object {
     delegate_attr_name_func delegate_attr_name; /* Optional routine to return*/
     /* the computed delegate attribute name */
     PyListObject *notifiers; /* Optional list of notification handlers */
+    Py_ssize_t slot_index;   /* Index of the value slot used for this trait
+                                by compact objects, or -1 if none */
+    trait_stats *stats;      /* Usage statistics, or NULL if none */
     PyObject *handler;       /* Associated trait handler object */
                              /* NOTE: The 'obj_dict' field MUST be last */
     PyObject *obj_dict;      /* Standard Python object dictionary */
@@ -607,6 +671,281 @@ dict_getitem(PyDictObject *dict, PyObject *key)
     return PyDict_GetItem((PyObject *)dict, key);
 }
 
+/*-----------------------------------------------------------------------------
+|  Instrumentation:
+|
+|  While 'instrumentation_flags' is non-zero, each trait counts the reads,
+|  assignments and validations of its values, and the notifier calls made
+|  for changes to it. If the INSTRUMENT_TIMES flag is set, the time spent
+|  in each operation is added up too. Times are inclusive: the time spent
+|  assigning a value includes the time spent validating it and notifying of
+|  the change.
+|
+|  The statistics of a trait are allocated when it is first used, and the
+|  trait is then kept alive by the 'instrumented_traits' list until the
+|  statistics are reset. When instrumentation is disabled, the only cost is
+|  the test of 'instrumentation_flags' in each instrumented operation.
++----------------------------------------------------------------------------*/
+
+/*-----------------------------------------------------------------------------
+|  Returns the value of a monotonic clock in nanoseconds, using the public
+|  C API where there is one (Python 3.13 and later), and the platform's
+|  clock otherwise:
++----------------------------------------------------------------------------*/
+
+static long long
+perf_counter_ns(void)
+{
+#if PY_VERSION_HEX >= 0x030D0000
+    PyTime_t now;
+
+    (void)PyTime_PerfCounterRaw(&now);
+    return (long long)now;
+#elif defined(MS_WINDOWS)
+    static LONGLONG frequency = 0;
+    LARGE_INTEGER now;
+
+    if (frequency == 0) {
+        LARGE_INTEGER value;
+
+        QueryPerformanceFrequency(&value);
+        frequency = value.QuadPart;
+    }
+    QueryPerformanceCounter(&now);
+    /* Split the conversion to avoid overflowing. */
+    return (long long)((now.QuadPart / frequency) * 1000000000
+                       + (now.QuadPart % frequency) * 1000000000
+                             / frequency);
+#else
+    struct timespec now;
+
+    if (clock_gettime(CLOCK_MONOTONIC, &now) != 0) {
+        return 0;
+    }
+    return (long long)now.tv_sec * 1000000000 + now.tv_nsec;
+#endif
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the statistics of a trait, allocating them if needed, or NULL if
+|  they can't be allocated. Instrumentation never makes the instrumented
+|  operation fail, so errors are cleared rather than reported:
++----------------------------------------------------------------------------*/
+
+static trait_stats *
+get_trait_stats(trait_object *trait, PyObject *obj, PyObject *name)
+{
+    trait_stats *stats = trait->stats;
+
+    if (stats != NULL) {
+        return stats;
+    }
+
+    if (instrumented_traits == NULL) {
+        instrumented_traits = PyList_New(0);
+        if (instrumented_traits == NULL) {
+            goto error;
+        }
+    }
+
+    stats = (trait_stats *)PyMem_Calloc(1, sizeof(trait_stats));
+    if (stats == NULL) {
+        goto error;
+    }
+    if (PyList_Append(instrumented_traits, (PyObject *)trait) < 0) {
+        PyMem_Free(stats);
+        goto error;
+    }
+
+    Py_INCREF(name);
+    stats->name = name;
+    stats->owner = (PyObject *)Py_TYPE(obj);
+    Py_INCREF(stats->owner);
+    trait->stats = stats;
+    return stats;
+
+  error:
+    PyErr_Clear();
+    return NULL;
+}
+
+/*-----------------------------------------------------------------------------
+|  Releases the statistics of a trait:
++----------------------------------------------------------------------------*/
+
+static void
+free_trait_stats(trait_object *trait)
+{
+    trait_stats *stats = trait->stats;
+
+    if (stats != NULL) {
+        trait->stats = NULL;
+        Py_XDECREF(stats->name);
+        Py_XDECREF(stats->owner);
+        PyMem_Free(stats);
+    }
+}
+
+/*-----------------------------------------------------------------------------
+|  Validates a value for a trait, counting the validation if instrumentation
+|  is enabled:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+validate_instrumented(
+    trait_object *trait, has_traits_object *obj, PyObject *name,
+    PyObject *value)
+{
+    trait_stats *stats;
+    PyObject *result;
+    long long start;
+
+    stats = get_trait_stats(trait, (PyObject *)obj, name);
+    if (stats == NULL) {
+        return trait->validate(trait, obj, name, value);
+    }
+    stats->validations++;
+    if (!(instrumentation_flags & INSTRUMENT_TIMES)) {
+        return trait->validate(trait, obj, name, value);
+    }
+
+    /* The statistics may be reset while validating, so they are looked up
+       again afterwards: */
+    Py_INCREF(trait);
+    start = perf_counter_ns();
+    result = trait->validate(trait, obj, name, value);
+    if (trait->stats != NULL) {
+        trait->stats->validate_time += perf_counter_ns() - start;
+    }
+    Py_DECREF(trait);
+    return result;
+}
+
+static PyObject *
+validate_value(
+    trait_object *trait, has_traits_object *obj, PyObject *name,
+    PyObject *value)
+{
+    if (instrumentation_flags) {
+        return validate_instrumented(trait, obj, name, value);
+    }
+    return trait->validate(trait, obj, name, value);
+}
+
+/*-----------------------------------------------------------------------------
+|  Calls a notifier for a change to a trait, counting the call:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+call_notifier_instrumented(
+    trait_object *trait, has_traits_object *obj, PyObject *name,
+    PyObject *notifier, PyObject **args)
+{
+    trait_stats *stats;
+    PyObject *result;
+    long long start;
+
+    stats = get_trait_stats(trait, (PyObject *)obj, name);
+    if (stats == NULL) {
+        return PyObject_Vectorcall(notifier, args, 4, NULL);
+    }
+    stats->notifications++;
+    if (!(instrumentation_flags & INSTRUMENT_TIMES)) {
+        return PyObject_Vectorcall(notifier, args, 4, NULL);
+    }
+
+    Py_INCREF(trait);
+    start = perf_counter_ns();
+    result = PyObject_Vectorcall(notifier, args, 4, NULL);
+    if (trait->stats != NULL) {
+        trait->stats->notify_time += perf_counter_ns() - start;
+    }
+    Py_DECREF(trait);
+    return result;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the value slot used to store the value of a trait on an object, or
+|  NULL if the value is stored in the object's dictionary:
+|
+|  A slot is only used if the object has slot storage and the slot with the
+|  trait's index is assigned to the trait's name. This guards against a trait
+|  being used on objects of another class than the one it was laid out for.
++----------------------------------------------------------------------------*/
+
+static PyObject **
+get_value_slot(trait_object *trait, has_traits_object *obj, PyObject *name)
+{
+    PyObject *slot_name;
+    Py_ssize_t index = trait->slot_index;
+
+    if ((index < 0) || (obj->slot_names == NULL)
+        || (index >= PyTuple_GET_SIZE(obj->slot_names))) {
+        return NULL;
+    }
+
+    slot_name = PyTuple_GET_ITEM(obj->slot_names, index);
+    if ((slot_name != name)
+        && (!PyUnicode_Check(name)
+            || (PyUnicode_Compare(slot_name, name) != 0))) {
+        return NULL;
+    }
+
+    return &obj->slot_values[index];
+}
+
+/*-----------------------------------------------------------------------------
+|  Gets the stored value of a trait on an object, or NULL if no value has been
+|  stored yet:
+|
+| Note: returns a *borrowed* reference.
++----------------------------------------------------------------------------*/
+
+static PyObject *
+get_trait_value(trait_object *trait, has_traits_object *obj, PyObject *name)
+{
+    PyObject **slot = get_value_slot(trait, obj, name);
+
+    if (slot != NULL) {
+        return *slot;
+    }
+    if (obj->obj_dict == NULL) {
+        return NULL;
+    }
+
+    return PyDict_GetItem(obj->obj_dict, name);
+}
+
+/*-----------------------------------------------------------------------------
+|  Stores the value of a trait on an object:
++----------------------------------------------------------------------------*/
+
+static int
+set_trait_value(
+    trait_object *trait, has_traits_object *obj, PyObject *name,
+    PyObject *value)
+{
+    PyObject *old_value;
+    PyObject **slot = get_value_slot(trait, obj, name);
+
+    if (slot != NULL) {
+        old_value = *slot;
+        Py_INCREF(value);
+        *slot = value;
+        Py_XDECREF(old_value);
+        return 0;
+    }
+
+    if (obj->obj_dict == NULL) {
+        obj->obj_dict = PyDict_New();
+        if (obj->obj_dict == NULL) {
+            return -1;
+        }
+    }
+
+    return PyDict_SetItem(obj->obj_dict, name, value);
+}
+
 /*-----------------------------------------------------------------------------
 |  Gets the definition of the matching prefix based trait for a specified name:
 |
@@ -646,6 +985,34 @@ get_prefix_trait(has_traits_object *obj, PyObject *name, int is_set)
 |  Handles the 'setattr' operation on a 'CHasTraits' instance:
 +----------------------------------------------------------------------------*/
 
+static int
+has_traits_setattro_instrumented(
+    trait_object *trait, has_traits_object *obj, PyObject *name,
+    PyObject *value)
+{
+    trait_stats *stats;
+    long long start;
+    int rc;
+
+    stats = get_trait_stats(trait, (PyObject *)obj, name);
+    if (stats == NULL) {
+        return trait->setattr(trait, trait, obj, name, value);
+    }
+    stats->sets++;
+    if (!(instrumentation_flags & INSTRUMENT_TIMES)) {
+        return trait->setattr(trait, trait, obj, name, value);
+    }
+
+    Py_INCREF(trait);
+    start = perf_counter_ns();
+    rc = trait->setattr(trait, trait, obj, name, value);
+    if (trait->stats != NULL) {
+        trait->stats->set_time += perf_counter_ns() - start;
+    }
+    Py_DECREF(trait);
+    return rc;
+}
+
 static int
 has_traits_setattro(has_traits_object *obj, PyObject *name, PyObject *value)
 {
@@ -661,6 +1028,9 @@ has_traits_setattro(has_traits_object *obj, PyObject *name, PyObject *value)
         }
     }
 
+    if (instrumentation_flags) {
+        return has_traits_setattro_instrumented(trait, obj, name, value);
+    }
     return trait->setattr(trait, trait, obj, name, value);
 }
 
@@ -674,8 +1044,9 @@ has_traits_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     // Call PyBaseObject_Type.tp_new to do the actual construction.
     // This allows things like ABCMeta machinery to work correctly
     // which is implemented at the C level.
-    PyObject *new_args, *new_kwds;
+    PyObject *new_args, *new_kwds, *slot_names;
     has_traits_object *obj;
+    Py_ssize_t n_slots;
 
     new_args = PyTuple_New(0);
     if (new_args == NULL) {
@@ -707,6 +1078,28 @@ has_traits_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
             return NULL;
         }
         Py_INCREF(obj->ctrait_dict);
+
+        /* Allocate the value slots for compact classes: */
+        slot_names = PyDict_GetItem(type->tp_dict, trait_slots);
+        if (slot_names != NULL) {
+            if (!PyTuple_Check(slot_names)) {
+                PyErr_SetString(
+                    PyExc_RuntimeError, "__trait_slots__ not a tuple");
+                Py_DECREF(obj);
+                return NULL;
+            }
+            n_slots = PyTuple_GET_SIZE(slot_names);
+            if (n_slots > 0) {
+                obj->slot_values =
+                    (PyObject **)PyMem_Calloc(n_slots, sizeof(PyObject *));
+                if (obj->slot_values == NULL) {
+                    Py_DECREF(obj);
+                    return PyErr_NoMemory();
+                }
+                Py_INCREF(slot_names);
+                obj->slot_names = slot_names;
+            }
+        }
     }
 
     return (PyObject *)obj;
@@ -792,11 +1185,27 @@ has_traits_init(PyObject *obj, PyObject *args, PyObject *kwds)
 static int
 has_traits_clear(has_traits_object *obj)
 {
+    Py_ssize_t i, n_slots;
+    PyObject **slot_values = obj->slot_values;
+
     Py_CLEAR(obj->ctrait_dict);
     Py_CLEAR(obj->itrait_dict);
     Py_CLEAR(obj->notifiers);
+    Py_CLEAR(obj->trait_versions);
     Py_CLEAR(obj->obj_dict);
 
+    /* Detach the value slots before releasing the values, since releasing a
+       value can run arbitrary code: */
+    if (slot_values != NULL) {
+        n_slots = PyTuple_GET_SIZE(obj->slot_names);
+        obj->slot_values = NULL;
+        for (i = 0; i < n_slots; i++) {
+            Py_CLEAR(slot_values[i]);
+        }
+        PyMem_Free(slot_values);
+    }
+    Py_CLEAR(obj->slot_names);
+
     return 0;
 }
 
@@ -824,8 +1233,16 @@ has_traits_traverse(has_traits_object *obj, visitproc visit, void *arg)
     Py_VISIT(obj->ctrait_dict);
     Py_VISIT(obj->itrait_dict);
     Py_VISIT(obj->notifiers);
+    Py_VISIT(obj->trait_versions);
     Py_VISIT(obj->obj_dict);
 
+    if (obj->slot_values != NULL) {
+        Py_ssize_t i, n_slots = PyTuple_GET_SIZE(obj->slot_names);
+        for (i = 0; i < n_slots; i++) {
+            Py_VISIT(obj->slot_values[i]);
+        }
+    }
+
     return 0;
 }
 
@@ -834,7 +1251,7 @@ has_traits_traverse(has_traits_object *obj, visitproc visit, void *arg)
 +----------------------------------------------------------------------------*/
 
 static PyObject *
-has_traits_getattro(has_traits_object *obj, PyObject *name)
+has_traits_getattro_impl(has_traits_object *obj, PyObject *name)
 {
     trait_object *trait;
     PyObject *value;
@@ -857,8 +1274,11 @@ has_traits_getattro(has_traits_object *obj, PyObject *name)
             return value;
         }
     }
+
     /* End of performance hack */
 
+    /* Values kept in slots are read by the trait's getattr handler, through
+       the trait's slot index. */
     if (((obj->itrait_dict != NULL)
          && ((trait = (trait_object *)dict_getitem(obj->itrait_dict, name))
              != NULL))
@@ -883,6 +1303,56 @@ has_traits_getattro(has_traits_object *obj, PyObject *name)
     return NULL;
 }
 
+/*-----------------------------------------------------------------------------
+|  Handles the 'getattr' operation on a 'CHasTraits' instance, counting the
+|  read if the attribute is a trait:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+has_traits_getattro_instrumented(has_traits_object *obj, PyObject *name)
+{
+    trait_object *trait = NULL;
+    trait_stats *stats;
+    PyObject *result;
+    long long start;
+
+    if (PyUnicode_Check(name)) {
+        if (obj->itrait_dict != NULL) {
+            trait = (trait_object *)dict_getitem(obj->itrait_dict, name);
+        }
+        if ((trait == NULL) && (obj->ctrait_dict != NULL)) {
+            trait = (trait_object *)dict_getitem(obj->ctrait_dict, name);
+        }
+    }
+    if ((trait == NULL)
+        || ((stats = get_trait_stats(trait, (PyObject *)obj, name))
+            == NULL)) {
+        return has_traits_getattro_impl(obj, name);
+    }
+    stats->gets++;
+    if (!(instrumentation_flags & INSTRUMENT_TIMES)) {
+        return has_traits_getattro_impl(obj, name);
+    }
+
+    Py_INCREF(trait);
+    start = perf_counter_ns();
+    result = has_traits_getattro_impl(obj, name);
+    if (trait->stats != NULL) {
+        trait->stats->get_time += perf_counter_ns() - start;
+    }
+    Py_DECREF(trait);
+    return result;
+}
+
+static PyObject *
+has_traits_getattro(has_traits_object *obj, PyObject *name)
+{
+    if (instrumentation_flags) {
+        return has_traits_getattro_instrumented(obj, name);
+    }
+    return has_traits_getattro_impl(obj, name);
+}
+
 /*-----------------------------------------------------------------------------
 |  Returns (and optionally creates) a specified instance or class trait:
 +----------------------------------------------------------------------------*/
@@ -1107,25 +1577,26 @@ trait_property_changed(
 
     tnotifiers = trait->notifiers;
     onotifiers = obj->notifiers;
-    Py_DECREF(trait);
 
     if (has_notifiers(tnotifiers, onotifiers)) {
         null_new_value = (new_value == NULL);
         if (null_new_value) {
             new_value = has_traits_getattro(obj, name);
             if (new_value == NULL) {
+                Py_DECREF(trait);
                 return -1;
             }
         }
 
         rc = call_notifiers(
-            tnotifiers, onotifiers, obj, name, old_value, new_value);
+            trait, tnotifiers, onotifiers, obj, name, old_value, new_value);
 
         if (null_new_value) {
             Py_DECREF(new_value);
         }
     }
 
+    Py_DECREF(trait);
     return rc;
 }
 
@@ -1301,6 +1772,48 @@ _has_traits_veto_notify(has_traits_object *obj, PyObject *args)
     return Py_None;
 }
 
+/*-----------------------------------------------------------------------------
+| Reports whether trait change notifications are being held for this object:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_notifications_held(
+    has_traits_object *obj, PyObject *Py_UNUSED(ignored))
+{
+    if (obj->flags & HASTRAITS_HOLD_NOTIFY) {
+        Py_RETURN_TRUE;
+    }
+    else {
+        Py_RETURN_FALSE;
+    }
+}
+
+/*-----------------------------------------------------------------------------
+|  Starts/Stops holding trait change notifications for the object:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_has_traits_hold_notify(has_traits_object *obj, PyObject *args)
+{
+    int held;
+
+    /* Parse arguments, which specify the new trait notification held
+       state: */
+    if (!PyArg_ParseTuple(args, "p", &held)) {
+        return NULL;
+    }
+
+    if (held) {
+        obj->flags |= HASTRAITS_HOLD_NOTIFY;
+    }
+    else {
+        obj->flags &= ~HASTRAITS_HOLD_NOTIFY;
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
 /*-----------------------------------------------------------------------------
 |  This method is called at the end of a HasTraits constructor and the
 |  __setstate__ method to perform any final object initialization needed.
@@ -1405,21 +1918,64 @@ _has_traits_notifiers(has_traits_object *obj, PyObject *args)
 }
 
 /*-----------------------------------------------------------------------------
-|  Returns the object's instance dictionary:
+|  Returns the version stamps of the specified traits of the object:
 +----------------------------------------------------------------------------*/
 
 static PyObject *
-get_has_traits_dict(has_traits_object *obj, void *closure)
+_has_traits_trait_versions(has_traits_object *obj, PyObject *names)
 {
-    PyObject *obj_dict = obj->obj_dict;
-    if (obj_dict == NULL) {
-        obj->obj_dict = obj_dict = PyDict_New();
-        if (obj_dict == NULL) {
-            return NULL;
-        }
-    }
-    Py_INCREF(obj_dict);
-
+    PyObject *result;
+    PyObject *version;
+    Py_ssize_t i, n;
+
+    if (!PyTuple_Check(names)) {
+        PyErr_SetString(
+            PyExc_TypeError, "_trait_versions argument must be a tuple");
+        return NULL;
+    }
+
+    n = PyTuple_GET_SIZE(names);
+    result = PyTuple_New(n);
+    if (result == NULL) {
+        return NULL;
+    }
+
+    for (i = 0; i < n; i++) {
+        version = NULL;
+        if (obj->trait_versions != NULL) {
+            version = PyDict_GetItemWithError(
+                obj->trait_versions, PyTuple_GET_ITEM(names, i));
+            if ((version == NULL) && PyErr_Occurred()) {
+                Py_DECREF(result);
+                return NULL;
+            }
+        }
+        if (version == NULL) {
+            version = zero_version;
+        }
+        Py_INCREF(version);
+        PyTuple_SET_ITEM(result, i, version);
+    }
+
+    return result;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the object's instance dictionary:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+get_has_traits_dict(has_traits_object *obj, void *closure)
+{
+    PyObject *obj_dict = obj->obj_dict;
+    if (obj_dict == NULL) {
+        obj->obj_dict = obj_dict = PyDict_New();
+        if (obj_dict == NULL) {
+            return NULL;
+        }
+    }
+    Py_INCREF(obj_dict);
+
     return obj_dict;
 }
 
@@ -1536,6 +2092,38 @@ PyDoc_STRVAR(
     "    True if notifications are currently vetoed for this object, else "
     "False.\n");
 
+PyDoc_STRVAR(
+    has_traits__trait_hold_notify_doc,
+    "_trait_hold_notify(held)\n"
+    "\n"
+    "Start or stop holding trait change notifications for this object.\n"
+    "\n"
+    "While notifications are held, each trait change is passed to the\n"
+    "object's ``_trait_notification_held`` method instead of being sent\n"
+    "to the change handlers.\n"
+    "\n"
+    "Parameters\n"
+    "----------\n"
+    "held : bool\n"
+    "    If true, hold trait change notifications for this object.\n"
+    "    If false, send trait change notifications as usual.\n");
+
+PyDoc_STRVAR(
+    _trait_notifications_held_doc,
+    "_trait_notifications_held()\n"
+    "\n"
+    "Report whether trait notifications are held for this object.\n"
+    "\n"
+    "This setting can be enabled or disabled using the "
+    "``_trait_hold_notify``\n"
+    "method. By default, notifications are not held.\n"
+    "\n"
+    "Returns\n"
+    "-------\n"
+    "held : bool\n"
+    "    True if notifications are currently held for this object, else "
+    "False.\n");
+
 PyDoc_STRVAR(
     has_traits_traits_init_doc,
     "traits_init()\n"
@@ -1633,6 +2221,28 @@ PyDoc_STRVAR(
     "    creating it first if necessary. Each notifier is a callable\n"
     "    accepting four arguments (object, trait_name, old, new).\n");
 
+PyDoc_STRVAR(
+    has_traits__trait_versions_doc,
+    "_trait_versions(names)\n"
+    "\n"
+    "Return the version stamps of traits of this object.\n"
+    "\n"
+    "Each time a trait whose ``versioned`` flag is set is assigned or\n"
+    "deleted, it gets a new version stamp, greater than all the stamps\n"
+    "given before. The value of a versioned trait therefore hasn't been\n"
+    "changed through the trait as long as its stamp stays the same.\n"
+    "\n"
+    "Parameters\n"
+    "----------\n"
+    "names : tuple of str\n"
+    "    The names of the traits.\n"
+    "\n"
+    "Returns\n"
+    "-------\n"
+    "versions : tuple of int\n"
+    "    The version stamp of each trait, or 0 for a trait that was never\n"
+    "    assigned or deleted while versioned.\n");
+
 static PyMethodDef has_traits_methods[] = {
     {
         "trait_property_changed",
@@ -1670,6 +2280,18 @@ static PyMethodDef has_traits_methods[] = {
         METH_NOARGS,
         _trait_notifications_vetoed_doc,
     },
+    {
+        "_trait_hold_notify",
+        (PyCFunction)_has_traits_hold_notify,
+        METH_VARARGS,
+        has_traits__trait_hold_notify_doc
+    },
+    {
+        "_trait_notifications_held",
+        (PyCFunction)_has_traits_notifications_held,
+        METH_NOARGS,
+        _trait_notifications_held_doc,
+    },
     {
         "traits_init",
         (PyCFunction)_has_traits_init,
@@ -1712,6 +2334,12 @@ static PyMethodDef has_traits_methods[] = {
         METH_VARARGS,
         has_traits__notifiers_doc
     },
+    {
+        "_trait_versions",
+        (PyCFunction)_has_traits_trait_versions,
+        METH_O,
+        has_traits__trait_versions_doc
+    },
     {NULL, NULL},
 };
 
@@ -1883,7 +2511,7 @@ default_value_for(trait_object *trait, has_traits_object *obj, PyObject *name)
             result = PyObject_Call(trait->default_value, tuple, NULL);
             Py_DECREF(tuple);
             if ((result != NULL) && (trait->validate != NULL)) {
-                value = trait->validate(trait, obj, name, result);
+                value = validate_value(trait, obj, name, result);
                 if (trait->flags & TRAIT_SETATTR_ORIGINAL_VALUE) {
                     if (value == NULL) {
                         Py_DECREF(result);
@@ -1957,7 +2585,7 @@ getattr_trait(trait_object *trait, has_traits_object *obj, PyObject *name)
     PyListObject *tnotifiers;
     PyListObject *onotifiers;
     PyObject *result;
-    PyObject *dict;
+    PyObject **slot;
 
     /* This shouldn't ever happen. */
     if (!PyUnicode_Check(name)) {
@@ -1965,22 +2593,21 @@ getattr_trait(trait_object *trait, has_traits_object *obj, PyObject *name)
         return NULL;
     }
 
-    /* Create the object's __dict__ if it's not already present. */
-    dict = obj->obj_dict;
-    if (dict == NULL) {
-        dict = PyDict_New();
-        if (dict == NULL) {
-            return NULL;
-        }
-        obj->obj_dict = dict;
+    /* Values kept in a slot are not found by the dictionary look-up in
+       'has_traits_getattro', so return the slot value if there is one. */
+    slot = get_value_slot(trait, obj, name);
+    if ((slot != NULL) && (*slot != NULL)) {
+        result = *slot;
+        Py_INCREF(result);
+        return result;
     }
 
-    /* Retrieve the default value, and set it in the dict. */
+    /* Retrieve the default value, and store it. */
     result = default_value_for(trait, obj, name);
     if (result == NULL) {
         return NULL;
     }
-    rc = PyDict_SetItem(dict, name, result);
+    rc = set_trait_value(trait, obj, name, result);
     if (rc < 0) {
         goto error;
     }
@@ -1998,7 +2625,7 @@ getattr_trait(trait_object *trait, has_traits_object *obj, PyObject *name)
     onotifiers = obj->notifiers;
     if (has_notifiers(tnotifiers, onotifiers)) {
         rc = call_notifiers(
-            tnotifiers, onotifiers, obj, name, Uninitialized, result);
+            trait, tnotifiers, onotifiers, obj, name, Uninitialized, result);
         if (rc < 0) {
             goto error;
         }
@@ -2258,12 +2885,16 @@ setattr_generic(
 
 static int
 call_notifiers(
-    PyListObject *tnotifiers, PyListObject *onotifiers, has_traits_object *obj,
-    PyObject *name, PyObject *old_value, PyObject *new_value)
+    trait_object *trait, PyListObject *tnotifiers, PyListObject *onotifiers,
+    has_traits_object *obj, PyObject *name, PyObject *old_value,
+    PyObject *new_value)
 {
-    Py_ssize_t i, t_len, o_len;
+    Py_ssize_t i, n, t_len, o_len;
     int new_value_has_traits;
-    PyObject *result, *item, *all_notifiers, *args;
+    PyObject *result;
+    PyObject *args[4];
+    PyObject *stack_notifiers[NOTIFIER_STACK_SIZE];
+    PyObject **notifiers;
     int rc = 0;
 
     // Do nothing if the user has explicitly requested no traits notifications
@@ -2272,59 +2903,99 @@ call_notifiers(
         return rc;
     }
 
-    args = PyTuple_Pack(4, (PyObject *)obj, name, old_value, new_value);
-    if (args == NULL) {
-        return -1;
+    // If notifications are being held, hand the change over to the object so
+    // that it can be queued and delivered later.
+    if (obj->flags & HASTRAITS_HOLD_NOTIFY) {
+        result = PyObject_CallMethod(
+            (PyObject *)obj, "_trait_notification_held", "(OOO)", name,
+            old_value, new_value);
+        if (result == NULL) {
+            return -1;
+        }
+        Py_DECREF(result);
+        return rc;
     }
 
-    new_value_has_traits = PyHasTraits_Check(new_value);
-
     if (tnotifiers != NULL) {
         t_len = PyList_GET_SIZE(tnotifiers);
-    } else {
+    }
+    else {
         t_len = 0;
     }
     if (onotifiers != NULL) {
         o_len = PyList_GET_SIZE(onotifiers);
-    } else {
+    }
+    else {
         o_len = 0;
     }
+    n = t_len + o_len;
+    if (n == 0) {
+        return rc;
+    }
 
-    // Concatenating trait notifiers and object notifiers.
-    // Notifier lists are copied in order to prevent run-time modifications.
-    all_notifiers = PyList_New(t_len + o_len);
-    if (all_notifiers == NULL) {
-        rc = -1;
-        goto exit;
+    // Take a snapshot of the trait notifiers and object notifiers, so that
+    // notifiers added or removed by a notifier do not affect this dispatch.
+    // The snapshot lives on the C stack unless there are a lot of notifiers.
+    if (n <= NOTIFIER_STACK_SIZE) {
+        notifiers = stack_notifiers;
+    }
+    else {
+        notifiers = PyMem_New(PyObject *, n);
+        if (notifiers == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
     }
     for (i = 0; i < t_len; i++) {
-        item = PyList_GET_ITEM(tnotifiers, i);
-        PyList_SET_ITEM(all_notifiers, i, item);
-        Py_INCREF(item);
+        notifiers[i] = PyList_GET_ITEM(tnotifiers, i);
+        Py_INCREF(notifiers[i]);
     }
     for (i = 0; i < o_len; i++) {
-        item = PyList_GET_ITEM(onotifiers, i);
-        PyList_SET_ITEM(all_notifiers, i + t_len, item);
-        Py_INCREF(item);
+        notifiers[t_len + i] = PyList_GET_ITEM(onotifiers, i);
+        Py_INCREF(notifiers[t_len + i]);
+    }
+
+    // The arguments are owned for the duration of the dispatch, since a
+    // notifier may drop the last other reference to the old value.
+    args[0] = (PyObject *)obj;
+    args[1] = name;
+    args[2] = old_value;
+    args[3] = new_value;
+    for (i = 0; i < 4; i++) {
+        Py_INCREF(args[i]);
     }
 
-    for (i = 0; i < t_len + o_len; i++) {
+    new_value_has_traits = PyHasTraits_Check(new_value);
+
+    for (i = 0; i < n; i++) {
         if (new_value_has_traits
             && ((has_traits_object *)new_value)->flags
                 & HASTRAITS_VETO_NOTIFY) {
             break;
         }
-        result = PyObject_Call(PyList_GET_ITEM(all_notifiers, i), args, NULL);
+        if (instrumentation_flags) {
+            result = call_notifier_instrumented(
+                trait, obj, name, notifiers[i], args);
+        }
+        else {
+            result = PyObject_Vectorcall(notifiers[i], args, 4, NULL);
+        }
         if (result == NULL) {
             rc = -1;
             break;
         }
         Py_DECREF(result);
     }
-    Py_DECREF(all_notifiers);
 
-exit:
-    Py_DECREF(args);
+    for (i = 0; i < 4; i++) {
+        Py_DECREF(args[i]);
+    }
+    for (i = 0; i < n; i++) {
+        Py_DECREF(notifiers[i]);
+    }
+    if (notifiers != stack_notifiers) {
+        PyMem_Free(notifiers);
+    }
     return rc;
 }
 
@@ -2343,7 +3014,7 @@ setattr_event(
 
     if (value != NULL) {
         if (traitd->validate != NULL) {
-            value = traitd->validate(traitd, obj, name, value);
+            value = validate_value(traitd, obj, name, value);
             if (value == NULL) {
                 return -1;
             }
@@ -2357,7 +3028,7 @@ setattr_event(
 
         if (has_notifiers(tnotifiers, onotifiers)) {
             rc = call_notifiers(
-                tnotifiers, onotifiers, obj, name, Undefined, value);
+                traito, tnotifiers, onotifiers, obj, name, Undefined, value);
         }
 
         Py_DECREF(value);
@@ -2370,6 +3041,32 @@ setattr_event(
 |  Assigns a value to a specified normal trait attribute:
 +----------------------------------------------------------------------------*/
 
+static int
+new_trait_version(has_traits_object *obj, PyObject *name)
+{
+    int rc;
+    PyObject *version;
+
+    if (obj->trait_versions == NULL) {
+        obj->trait_versions = PyDict_New();
+        if (obj->trait_versions == NULL) {
+            return -1;
+        }
+    }
+
+    version = PyLong_FromUnsignedLongLong(++trait_version_counter);
+    if (version == NULL) {
+        return -1;
+    }
+    rc = PyDict_SetItem(obj->trait_versions, name, version);
+    Py_DECREF(version);
+    return rc;
+}
+
+/*-----------------------------------------------------------------------------
+|  Assigns a value to a specified normal trait attribute:
++----------------------------------------------------------------------------*/
+
 static int
 setattr_trait(
     trait_object *traito, trait_object *traitd, has_traits_object *obj,
@@ -2384,27 +3081,45 @@ setattr_trait(
     PyObject *old_value = NULL;
     PyObject *original_value;
     PyObject *new_value;
+    PyObject **slot;
 
     PyObject *dict = obj->obj_dict;
 
     changed = (traitd->flags & TRAIT_COMPARISON_MODE_NONE);
 
     if (value == NULL) {
-        if (dict == NULL) {
-            return 0;
+        slot = get_value_slot(traitd, obj, name);
+        if (slot != NULL) {
+            /* Take over the slot's reference to the old value: */
+            old_value = *slot;
+            if (old_value == NULL) {
+                return 0;
+            }
+            *slot = NULL;
         }
+        else {
+            if (dict == NULL) {
+                return 0;
+            }
 
-        if (!PyUnicode_Check(name)) {
-            return invalid_attribute_error(name);
-        }
+            if (!PyUnicode_Check(name)) {
+                return invalid_attribute_error(name);
+            }
 
-        old_value = PyDict_GetItem(dict, name);
-        if (old_value == NULL) {
-            return 0;
+            old_value = PyDict_GetItem(dict, name);
+            if (old_value == NULL) {
+                return 0;
+            }
+
+            Py_INCREF(old_value);
+            if (PyDict_DelItem(dict, name) < 0) {
+                Py_DECREF(old_value);
+                return -1;
+            }
         }
 
-        Py_INCREF(old_value);
-        if (PyDict_DelItem(dict, name) < 0) {
+        if ((traitd->flags & TRAIT_VERSIONED)
+            && (new_trait_version(obj, name) < 0)) {
             Py_DECREF(old_value);
             return -1;
         }
@@ -2430,8 +3145,8 @@ setattr_trait(
                     }
                     if ((rc == 0) && has_notifiers(tnotifiers, onotifiers)) {
                         rc = call_notifiers(
-                            tnotifiers, onotifiers, obj, name, old_value,
-                            value);
+                            traito, tnotifiers, onotifiers, obj, name,
+                            old_value, value);
                     }
                 }
 
@@ -2446,7 +3161,7 @@ setattr_trait(
     // If the object's value is Undefined, then do not call the validate
     // method (as the object's value has not yet been set).
     if ((traitd->validate != NULL) && (value != Undefined)) {
-        value = traitd->validate(traitd, obj, name, value);
+        value = validate_value(traitd, obj, name, value);
         if (value == NULL) {
             return -1;
         }
@@ -2455,14 +3170,6 @@ setattr_trait(
         Py_INCREF(value);
     }
 
-    if (dict == NULL) {
-        obj->obj_dict = dict = PyDict_New();
-        if (dict == NULL) {
-            Py_DECREF(value);
-            return -1;
-        }
-    }
-
     if (!PyUnicode_Check(name)) {
         Py_DECREF(value);
         return invalid_attribute_error(name);
@@ -2478,7 +3185,7 @@ setattr_trait(
 
     post_setattr = traitd->post_setattr;
     if ((post_setattr != NULL) || do_notifiers) {
-        old_value = PyDict_GetItem(dict, name);
+        old_value = get_trait_value(traitd, obj, name);
         if (old_value == NULL) {
             if (traitd != traito) {
                 old_value = traito->getattr(traito, obj, name);
@@ -2493,7 +3200,7 @@ setattr_trait(
                     Py_DECREF(value);
                     return -1;
                 }
-                rc = PyDict_SetItem(dict, name, old_value);
+                rc = set_trait_value(traitd, obj, name, old_value);
                 if (rc < 0) {
                     Py_DECREF(old_value);
                     Py_DECREF(value);
@@ -2518,7 +3225,7 @@ setattr_trait(
         }
     }
 
-    if (PyDict_SetItem(dict, name, new_value) < 0) {
+    if (set_trait_value(traitd, obj, name, new_value) < 0) {
         if (PyErr_ExceptionMatches(PyExc_KeyError)) {
             PyErr_SetObject(PyExc_AttributeError, name);
         }
@@ -2529,6 +3236,13 @@ setattr_trait(
         return -1;
     }
 
+    if ((traitd->flags & TRAIT_VERSIONED)
+        && (new_trait_version(obj, name) < 0)) {
+        Py_XDECREF(old_value);
+        Py_DECREF(value);
+        return -1;
+    }
+
     rc = 0;
 
     if (changed) {
@@ -2542,7 +3256,8 @@ setattr_trait(
 
         if ((rc == 0) && do_notifiers) {
             rc = call_notifiers(
-                tnotifiers, onotifiers, obj, name, old_value, new_value);
+                traito, tnotifiers, onotifiers, obj, name, old_value,
+                new_value);
         }
     }
 
@@ -2775,7 +3490,7 @@ setattr_validate_property(
         return set_delete_property_error(obj, name);
     }
 
-    validated = traitd->validate(traitd, obj, name, value);
+    validated = validate_value(traitd, obj, name, value);
     if (validated == NULL) {
         return -1;
     }
@@ -2968,6 +3683,7 @@ trait_new(PyTypeObject *trait_type, PyObject *args, PyObject *kw)
         trait = (trait_object *)PyType_GenericNew(trait_type, args, kw);
         trait->getattr = getattr_handlers[kind];
         trait->setattr = setattr_handlers[kind];
+        trait->slot_index = -1;
         return (PyObject *)trait;
     }
 
@@ -2993,6 +3709,7 @@ trait_clear(trait_object *trait)
     Py_CLEAR(trait->notifiers);
     Py_CLEAR(trait->handler);
     Py_CLEAR(trait->obj_dict);
+    free_trait_stats(trait);
 
     return 0;
 }
@@ -3034,6 +3751,10 @@ trait_traverse(trait_object *trait, visitproc visit, void *arg)
     Py_VISIT((PyObject *)trait->notifiers);
     Py_VISIT(trait->handler);
     Py_VISIT(trait->obj_dict);
+    if (trait->stats != NULL) {
+        Py_VISIT(trait->stats->name);
+        Py_VISIT(trait->stats->owner);
+    }
 
     return 0;
 }
@@ -3611,6 +4332,37 @@ validate_trait_float_range(
     }
 }
 
+/*-----------------------------------------------------------------------------
+|  Checks whether a Python value is an item of an enumeration:
+|
+|  The enumeration type info is either (5, values) or (5, values, index),
+|  where *values* is a tuple of the enumeration items and *index* is a set of
+|  the hashable items. A value found in the index is accepted without scanning
+|  the tuple. Otherwise (for example, when the value or some of the items are
+|  unhashable), the tuple is scanned, so that the result is always the same
+|  as that of 'value in values'.
+|
+|  Returns 1 if the value is an item, 0 if it is not and -1 on error.
++----------------------------------------------------------------------------*/
+
+static int
+contains_enum_item(PyObject *type_info, PyObject *value)
+{
+    int rc;
+
+    if (PyTuple_GET_SIZE(type_info) > 2) {
+        rc = PySet_Contains(PyTuple_GET_ITEM(type_info, 2), value);
+        if (rc > 0) {
+            return rc;
+        }
+        if (rc < 0) {
+            /* The value is unhashable: fall back to a scan. */
+            PyErr_Clear();
+        }
+    }
+    return PySequence_Contains(PyTuple_GET_ITEM(type_info, 1), value);
+}
+
 /*-----------------------------------------------------------------------------
 |  Verifies a Python value is in a specified enumeration:
 +----------------------------------------------------------------------------*/
@@ -3621,7 +4373,7 @@ validate_trait_enum(
     PyObject *value)
 {
     PyObject *type_info = trait->py_validate;
-    if (PySequence_Contains(PyTuple_GET_ITEM(type_info, 1), value) > 0) {
+    if (contains_enum_item(type_info, value) > 0) {
         Py_INCREF(value);
         return value;
     }
@@ -3981,224 +4733,206 @@ validate_trait_adapt(
 }
 
 /*-----------------------------------------------------------------------------
-|  Verifies a Python value satisifies a complex trait definition:
+|  Verifies a Python value satisfies one item of a complex trait definition:
 +----------------------------------------------------------------------------*/
 
+/* Note: this function does not follow standard CPython error-handling rules.
+   There are three possible types of outcome for this function.
+
+   If validation fails, NULL is returned and no Python exception is set
+     (contrary to usual Python C-API conventions).
+   If an unexpected exception occurs, NULL is returned and a Python exception
+     is set.
+   If validation succeeds, a new reference to the validated value is
+     returned.
+*/
+
 static PyObject *
-validate_trait_complex(
+validate_trait_union_members(
     trait_object *trait, has_traits_object *obj, PyObject *name,
-    PyObject *value)
+    PyObject *value, PyObject *members);
+
+static PyObject *
+validate_complex_item(
+    trait_object *trait, has_traits_object *obj, PyObject *name,
+    PyObject *value, PyObject *type_info)
 {
     int in_range;
     long mode, rc;
-    PyObject *result, *type_info, *type, *type2, *args;
-
-    PyObject *list_type_info = PyTuple_GET_ITEM(trait->py_validate, 1);
-    Py_ssize_t n = PyTuple_GET_SIZE(list_type_info);
-    for (Py_ssize_t i = 0; i < n; i++) {
-        type_info = PyTuple_GET_ITEM(list_type_info, i);
-
-        switch (PyLong_AsLong(PyTuple_GET_ITEM(type_info, 0))) {
-            case 0: { /* Type check: */
-                Py_ssize_t kind = PyTuple_GET_SIZE(type_info);
-                if (((kind == 3) && (value == Py_None))
-                    || PyObject_TypeCheck(
-                        value, (PyTypeObject *)PyTuple_GET_ITEM(
-                                   type_info, kind - 1))) {
-                    goto done;
-                }
-                break;
+    PyObject *result, *type, *type2, *args;
+
+    switch (PyLong_AsLong(PyTuple_GET_ITEM(type_info, 0))) {
+        case 0: { /* Type check: */
+            Py_ssize_t kind = PyTuple_GET_SIZE(type_info);
+            if (((kind == 3) && (value == Py_None))
+                || PyObject_TypeCheck(
+                    value, (PyTypeObject *)PyTuple_GET_ITEM(
+                               type_info, kind - 1))) {
+                goto done;
             }
-            case 1: { /* Instance check: */
-                Py_ssize_t kind = PyTuple_GET_SIZE(type_info);
-                if (((kind == 3) && (value == Py_None))
-                    || (PyObject_IsInstance(
-                            value, PyTuple_GET_ITEM(type_info, kind - 1))
-                        > 0)) {
-                    goto done;
-                }
-                break;
+            break;
+        }
+        case 1: { /* Instance check: */
+            Py_ssize_t kind = PyTuple_GET_SIZE(type_info);
+            if (((kind == 3) && (value == Py_None))
+                || (PyObject_IsInstance(
+                        value, PyTuple_GET_ITEM(type_info, kind - 1))
+                    > 0)) {
+                goto done;
             }
-            case 2: /* Self type check: */
-                if (((PyTuple_GET_SIZE(type_info) == 2) && (value == Py_None))
-                    || PyObject_TypeCheck(value, Py_TYPE(obj))) {
-                    goto done;
-                }
-                break;
-
-            case 4: /* Floating point range check: */
-                result = validate_float(value);
-                if (result == NULL) {
-                    if (PyErr_ExceptionMatches(PyExc_TypeError)) {
-                        /* A TypeError should ultimately get re-raised
-                           as a TraitError. */
-                        PyErr_Clear();
-                        break;
-                    }
-                    /* Non-TypeErrors should be propagated. */
-                    return NULL;
-                }
+            break;
+        }
+        case 2: /* Self type check: */
+            if (((PyTuple_GET_SIZE(type_info) == 2) && (value == Py_None))
+                || PyObject_TypeCheck(value, Py_TYPE(obj))) {
+                goto done;
+            }
+            break;
 
-                in_range = in_float_range(result, type_info);
-                if (in_range == 1) {
-                    return result;
-                }
-                else if (in_range == 0) {
-                    Py_DECREF(result);
+        case 4: /* Floating point range check: */
+            result = validate_float(value);
+            if (result == NULL) {
+                if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+                    /* A TypeError should ultimately get re-raised
+                       as a TraitError. */
+                    PyErr_Clear();
                     break;
                 }
-                else {
-                    /* in_range must be -1, indicating an error;
-                       propagate it */
-                    Py_DECREF(result);
-                    return NULL;
-                }
+                /* Non-TypeErrors should be propagated. */
+                return NULL;
+            }
 
-            case 5: /* Enumerated item check: */
-                if (PySequence_Contains(PyTuple_GET_ITEM(type_info, 1), value)
-                    > 0) {
-                    goto done;
-                }
-                /* If the containment check failed (for example as a result of
-                   checking whether an array is in a sequence), clear the
-                   exception. See enthought/traits#376. */
-                PyErr_Clear();
-                break;
-            case 6: /* Mapped item check: */
-                if (PyDict_GetItemWithError(PyTuple_GET_ITEM(type_info, 1), value)
-                    != NULL) {
-                    goto done;
-                }
-                PyErr_Clear();
+            in_range = in_float_range(result, type_info);
+            if (in_range == 1) {
+                return result;
+            }
+            else if (in_range == 0) {
+                Py_DECREF(result);
                 break;
+            }
+            else {
+                /* in_range must be -1, indicating an error;
+                   propagate it */
+                Py_DECREF(result);
+                return NULL;
+            }
 
-            case 8: /* Perform 'slow' validate check: */
-                result = PyObject_CallMethod(
-                    PyTuple_GET_ITEM(type_info, 1), "slow_validate", "(OOO)",
-                    obj, name, value);
-
-                if (result == NULL && PyErr_ExceptionMatches(TraitError)) {
-                    PyErr_Clear();
-                    break;
-                }
-                return result;
+        case 5: /* Enumerated item check: */
+            if (contains_enum_item(type_info, value) > 0) {
+                goto done;
+            }
+            /* If the containment check failed (for example as a result of
+               checking whether an array is in a sequence), clear the
+               exception. See enthought/traits#376. */
+            PyErr_Clear();
+            break;
+        case 6: /* Mapped item check: */
+            if (PyDict_GetItemWithError(PyTuple_GET_ITEM(type_info, 1), value)
+                != NULL) {
+                goto done;
+            }
+            PyErr_Clear();
+            break;
 
-            case 9: /* Tuple item check: */
-                result = validate_trait_tuple_check(
-                    PyTuple_GET_ITEM(type_info, 1), obj, name, value);
-                if (result != NULL || PyErr_Occurred()) {
-                    return result;
-                }
+        case 8: /* Perform 'slow' validate check: */
+            result = PyObject_CallMethod(
+                PyTuple_GET_ITEM(type_info, 1), "slow_validate", "(OOO)",
+                obj, name, value);
 
+            if (result == NULL && PyErr_ExceptionMatches(TraitError)) {
                 PyErr_Clear();
                 break;
+            }
+            return result;
 
-            case 11: /* Coercable type check: */
-                type = PyTuple_GET_ITEM(type_info, 1);
-                if (PyObject_TypeCheck(value, (PyTypeObject *)type)) {
-                    goto done;
-                }
+        case 9: /* Tuple item check: */
+            result = validate_trait_tuple_check(
+                PyTuple_GET_ITEM(type_info, 1), obj, name, value);
+            if (result != NULL || PyErr_Occurred()) {
+                return result;
+            }
 
-                Py_ssize_t k = PyTuple_GET_SIZE(type_info);
-                Py_ssize_t j = 2;
-                for (; j < k; j++) {
-                    type2 = PyTuple_GET_ITEM(type_info, j);
-                    if (type2 == Py_None) {
-                        break;
-                    }
-                    if (PyObject_TypeCheck(value, (PyTypeObject *)type2)) {
-                        goto done;
-                    }
-                }
+            PyErr_Clear();
+            break;
 
-                for (j++; j < k; j++) {
-                    type2 = PyTuple_GET_ITEM(type_info, j);
-                    if (PyObject_TypeCheck(value, (PyTypeObject *)type2)) {
-                        return type_converter(type, value);
-                    }
-                }
-                break;
+        case 11: /* Coercable type check: */
+            type = PyTuple_GET_ITEM(type_info, 1);
+            if (PyObject_TypeCheck(value, (PyTypeObject *)type)) {
+                goto done;
+            }
 
-            case 12: /* Castable type check */
-                type = PyTuple_GET_ITEM(type_info, 1);
-                if (Py_TYPE(value) == (PyTypeObject *)type) {
+            Py_ssize_t k = PyTuple_GET_SIZE(type_info);
+            Py_ssize_t j = 2;
+            for (; j < k; j++) {
+                type2 = PyTuple_GET_ITEM(type_info, j);
+                if (type2 == Py_None) {
+                    break;
+                }
+                if (PyObject_TypeCheck(value, (PyTypeObject *)type2)) {
                     goto done;
                 }
+            }
 
-                if ((result = type_converter(type, value)) != NULL) {
-                    return result;
+            for (j++; j < k; j++) {
+                type2 = PyTuple_GET_ITEM(type_info, j);
+                if (PyObject_TypeCheck(value, (PyTypeObject *)type2)) {
+                    return type_converter(type, value);
                 }
+            }
+            break;
 
-                PyErr_Clear();
-                break;
-
-            case 13: /* Function validator check: */
-                result = call_validator(
-                    PyTuple_GET_ITEM(type_info, 1), obj, name, value);
-                if (result != NULL) {
-                    return result;
-                }
+        case 12: /* Castable type check */
+            type = PyTuple_GET_ITEM(type_info, 1);
+            if (Py_TYPE(value) == (PyTypeObject *)type) {
+                goto done;
+            }
 
-                PyErr_Clear();
-                break;
+            if ((result = type_converter(type, value)) != NULL) {
+                return result;
+            }
 
-                /* case 14: Python-based validator check: */
+            PyErr_Clear();
+            break;
 
-                /* case 15..18: Property 'setattr' validate checks: */
+        case 13: /* Function validator check: */
+            result = call_validator(
+                PyTuple_GET_ITEM(type_info, 1), obj, name, value);
+            if (result != NULL) {
+                return result;
+            }
 
-            case 19: /* Adaptable object check: */
-                /* If value is None and allow_none, return value; else fail
-                 * validation */
-                if (value == Py_None) {
-                    int allow_none =
-                        PyObject_IsTrue(PyTuple_GET_ITEM(type_info, 3));
-                    if (allow_none == -1) {
-                        return NULL;
-                    }
-                    if (allow_none) {
-                        goto done;
-                    }
-                    else {
-                        break;
-                    }
-                }
+            PyErr_Clear();
+            break;
 
-                type = PyTuple_GET_ITEM(type_info, 1);
-                mode = PyLong_AsLong(PyTuple_GET_ITEM(type_info, 2));
-                if (mode == -1 && PyErr_Occurred()) {
-                    return NULL;
-                }
+            /* case 14: Python-based validator check: */
 
-                /* Adaptation mode 0: do a simple isinstance check. */
-                if (mode == 0) {
-                    rc = PyObject_IsInstance(value, type);
-                    if (rc == -1 && PyErr_Occurred()) {
-                        return NULL;
-                    }
-                    if (rc) {
-                        goto done;
-                    }
-                    else {
-                        break;
-                    }
-                }
+            /* case 15..18: Property 'setattr' validate checks: */
 
-                /* Try adaptation; return adapted value on success. */
-                args = PyTuple_Pack(3, value, type, Py_None);
-                if (args == NULL) {
+        case 19: /* Adaptable object check: */
+            /* If value is None and allow_none, return value; else fail
+             * validation */
+            if (value == Py_None) {
+                int allow_none =
+                    PyObject_IsTrue(PyTuple_GET_ITEM(type_info, 3));
+                if (allow_none == -1) {
                     return NULL;
                 }
-                result = PyObject_Call(adapt, args, NULL);
-                Py_DECREF(args);
-                if (result == NULL) {
-                    return NULL;
+                if (allow_none) {
+                    goto done;
                 }
-                if (result != Py_None) {
-                    return result;
+                else {
+                    break;
                 }
-                Py_DECREF(result);
+            }
 
-                /* Adaptation failed. Move on to an isinstance check. */
+            type = PyTuple_GET_ITEM(type_info, 1);
+            mode = PyLong_AsLong(PyTuple_GET_ITEM(type_info, 2));
+            if (mode == -1 && PyErr_Occurred()) {
+                return NULL;
+            }
+
+            /* Adaptation mode 0: do a simple isinstance check. */
+            if (mode == 0) {
                 rc = PyObject_IsInstance(value, type);
                 if (rc == -1 && PyErr_Occurred()) {
                     return NULL;
@@ -4206,75 +4940,205 @@ validate_trait_complex(
                 if (rc) {
                     goto done;
                 }
-
-                /* Adaptation and isinstance both failed. In mode 1, fail.
-                   Otherwise, return the default. */
-                if (mode == 1) {
-                    break;
-                }
                 else {
-                    return default_value_for(trait, obj, name);
-                }
-
-            case 20: /* Integer check: */
-                result = as_integer(value);
-                /* A TypeError indicates that we don't have a match. Clear
-                   the error and continue with the next item in the complex
-                   sequence. Other errors are propagated. */
-                if (result == NULL
-                    && PyErr_ExceptionMatches(PyExc_TypeError)) {
-                    PyErr_Clear();
                     break;
                 }
-                return result;
+            }
 
-            case 21: /* Float check */
-                /* A TypeError indicates that we don't have a match.
-                   Clear the error and continue with the next item
-                   in the complex sequence. */
-                result = validate_float(value);
-                if (result == NULL
-                    && PyErr_ExceptionMatches(PyExc_TypeError)) {
-                    PyErr_Clear();
-                    break;
-                }
+            /* Try adaptation; return adapted value on success. */
+            args = PyTuple_Pack(3, value, type, Py_None);
+            if (args == NULL) {
+                return NULL;
+            }
+            result = PyObject_Call(adapt, args, NULL);
+            Py_DECREF(args);
+            if (result == NULL) {
+                return NULL;
+            }
+            if (result != Py_None) {
                 return result;
+            }
+            Py_DECREF(result);
 
-            case 22: /* Callable check: */
-                {
-                    int valid = _validate_trait_callable(type_info, value);
+            /* Adaptation failed. Move on to an isinstance check. */
+            rc = PyObject_IsInstance(value, type);
+            if (rc == -1 && PyErr_Occurred()) {
+                return NULL;
+            }
+            if (rc) {
+                goto done;
+            }
 
-                    if (valid == -1) {
-                        return NULL;
-                    }
-                    if (valid == 1) {
-                        goto done;
-                    }
-                    break;
+            /* Adaptation and isinstance both failed. In mode 1, fail.
+               Otherwise, return the default. */
+            if (mode == 1) {
+                break;
+            }
+            else {
+                return default_value_for(trait, obj, name);
+            }
+
+        case 20: /* Integer check: */
+            result = as_integer(value);
+            /* A TypeError indicates that we don't have a match. Clear
+               the error and continue with the next item in the complex
+               sequence. Other errors are propagated. */
+            if (result == NULL
+                && PyErr_ExceptionMatches(PyExc_TypeError)) {
+                PyErr_Clear();
+                break;
+            }
+            return result;
+
+        case 21: /* Float check */
+            /* A TypeError indicates that we don't have a match.
+               Clear the error and continue with the next item
+               in the complex sequence. */
+            result = validate_float(value);
+            if (result == NULL
+                && PyErr_ExceptionMatches(PyExc_TypeError)) {
+                PyErr_Clear();
+                break;
+            }
+            return result;
+
+        case 22: /* Callable check: */
+            {
+                int valid = _validate_trait_callable(type_info, value);
+
+                if (valid == -1) {
+                    return NULL;
+                }
+                if (valid == 1) {
+                    goto done;
                 }
+                break;
+            }
 
-            case 23: /* Complex number check */
-                /* A TypeError indicates that we don't have a match.
-                   Clear the error and continue with the next item
-                   in the complex sequence. */
-                result = validate_complex_number(value);
-                if (result == NULL
-                    && PyErr_ExceptionMatches(PyExc_TypeError)) {
-                    PyErr_Clear();
+        case 23: /* Complex number check */
+            /* A TypeError indicates that we don't have a match.
+               Clear the error and continue with the next item
+               in the complex sequence. */
+            result = validate_complex_number(value);
+            if (result == NULL
+                && PyErr_ExceptionMatches(PyExc_TypeError)) {
+                PyErr_Clear();
+                break;
+            }
+            return result;
+
+        case 24: /* Union check: */
+            return validate_trait_union_members(
+                trait, obj, name, value, PyTuple_GET_ITEM(type_info, 1));
+
+        default: /* Should never happen...indicates an internal error: */
+            assert(0);  /* invalid validation type */
+            return raise_trait_error(trait, obj, name, value);
+    }
+    return NULL;
+done:
+    Py_INCREF(value);
+    return value;
+}
+
+/*-----------------------------------------------------------------------------
+|  Verifies a Python value satisifies a complex trait definition:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+validate_trait_complex(
+    trait_object *trait, has_traits_object *obj, PyObject *name,
+    PyObject *value)
+{
+    PyObject *result;
+
+    PyObject *list_type_info = PyTuple_GET_ITEM(trait->py_validate, 1);
+    Py_ssize_t n = PyTuple_GET_SIZE(list_type_info);
+    for (Py_ssize_t i = 0; i < n; i++) {
+        result = validate_complex_item(
+            trait, obj, name, value, PyTuple_GET_ITEM(list_type_info, i));
+        if (result != NULL || PyErr_Occurred()) {
+            return result;
+        }
+    }
+    return raise_trait_error(trait, obj, name, value);
+}
+
+/*-----------------------------------------------------------------------------
+|  Verifies a Python value is valid for at least one of a sequence of traits:
++----------------------------------------------------------------------------*/
+
+/* Note: this function follows the same error-handling conventions as
+   validate_complex_item.
+
+   Each member trait is tried in order. Members with C-level validators are
+   checked without raising (and then discarding) a TraitError for each
+   member that rejects the value. Members with Python validators are called,
+   and a TraitError raised by them is treated as a validation failure.
+*/
+
+static PyObject *
+validate_trait_union_members(
+    trait_object *trait, has_traits_object *obj, PyObject *name,
+    PyObject *value, PyObject *members)
+{
+    Py_ssize_t i, j, n;
+    trait_object *member;
+    PyObject *result, *list_type_info;
+
+    n = PyTuple_GET_SIZE(members);
+    for (i = 0; i < n; i++) {
+        member = (trait_object *)PyTuple_GET_ITEM(members, i);
+
+        if (member->validate == NULL) {
+            Py_INCREF(value);
+            return value;
+        }
+        else if (member->validate == validate_trait_complex) {
+            list_type_info = PyTuple_GET_ITEM(member->py_validate, 1);
+            result = NULL;
+            for (j = 0; j < PyTuple_GET_SIZE(list_type_info); j++) {
+                result = validate_complex_item(
+                    member, obj, name, value,
+                    PyTuple_GET_ITEM(list_type_info, j));
+                if (result != NULL || PyErr_Occurred()) {
                     break;
                 }
-                return result;
+            }
+        }
+        else if (PyTuple_Check(member->py_validate)) {
+            result = validate_complex_item(
+                member, obj, name, value, member->py_validate);
+        }
+        else {
+            result = member->validate(member, obj, name, value);
+            if (result == NULL && PyErr_ExceptionMatches(TraitError)) {
+                PyErr_Clear();
+            }
+        }
 
-            default: /* Should never happen...indicates an internal error: */
-                assert(0);  /* invalid validation type */
-                goto error;
+        if (result != NULL || PyErr_Occurred()) {
+            return result;
         }
     }
-error:
+    return NULL;
+}
+
+/*-----------------------------------------------------------------------------
+|  Verifies a Python value satisfies at least one of the traits of a Union:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+validate_trait_union(
+    trait_object *trait, has_traits_object *obj, PyObject *name,
+    PyObject *value)
+{
+    PyObject *result = validate_trait_union_members(
+        trait, obj, name, value, PyTuple_GET_ITEM(trait->py_validate, 1));
+    if (result != NULL || PyErr_Occurred()) {
+        return result;
+    }
     return raise_trait_error(trait, obj, name, value);
-done:
-    Py_INCREF(value);
-    return value;
 }
 
 /*-----------------------------------------------------------------------------
@@ -4305,6 +5169,7 @@ static trait_validate validate_handlers[] = {
     validate_trait_float,   /* case 21: Float check */
     validate_trait_callable,   /* case 22: Callable check */
     validate_trait_complex_number,  /* case 23: Complex number check */
+    validate_trait_union,   /* case 24: Union check */
 };
 
 static PyObject *
@@ -4312,7 +5177,7 @@ _trait_set_validate(trait_object *trait, PyObject *args)
 {
     PyObject *validate;
     PyObject *v1, *v2, *v3;
-    Py_ssize_t kind;
+    Py_ssize_t i, kind;
 
     if (!PyArg_ParseTuple(args, "O", &validate)) {
         return NULL;
@@ -4368,9 +5233,12 @@ _trait_set_validate(trait_object *trait, PyObject *args)
                     break;
 
                 case 5: /* Enumerated item check: */
-                    if (n == 2) {
+                    if ((n == 2) || (n == 3)) {
                         v1 = PyTuple_GET_ITEM(validate, 1);
-                        if (PyTuple_CheckExact(v1)) {
+                        if (PyTuple_CheckExact(v1)
+                            && ((n == 2)
+                                || PyAnySet_Check(
+                                    PyTuple_GET_ITEM(validate, 2)))) {
                             goto done;
                         }
                     }
@@ -4461,6 +5329,24 @@ _trait_set_validate(trait_object *trait, PyObject *args)
                         goto done;
                     }
                     break;
+
+                case 24: /* Union check: */
+                    if (n == 2) {
+                        v1 = PyTuple_GET_ITEM(validate, 1);
+                        if (!PyTuple_CheckExact(v1)) {
+                            break;
+                        }
+                        for (i = 0; i < PyTuple_GET_SIZE(v1); i++) {
+                            if (!PyObject_TypeCheck(
+                                    PyTuple_GET_ITEM(v1, i), &trait_type)) {
+                                break;
+                            }
+                        }
+                        if (i == PyTuple_GET_SIZE(v1)) {
+                            goto done;
+                        }
+                    }
+                    break;
             }
         }
     }
@@ -4514,7 +5400,46 @@ _trait_validate(trait_object *trait, PyObject *args)
         return value;
     }
 
-    return trait->validate(trait, (has_traits_object *)object, name, value);
+    return validate_value(trait, (has_traits_object *)object, name, value);
+}
+
+/*-----------------------------------------------------------------------------
+|  Validates each of the items of an iterable for this trait, returning a new
+|  list of the validated items:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_trait_validate_items(trait_object *trait, PyObject *args)
+{
+    Py_ssize_t i, n;
+    PyObject *object, *name, *iterable, *items, *item, *result;
+
+    if (!PyArg_ParseTuple(args, "OOO", &object, &name, &iterable)) {
+        return NULL;
+    }
+
+    items = PySequence_List(iterable);
+    if (items == NULL) {
+        return NULL;
+    }
+
+    if (trait->validate == NULL) {
+        return items;
+    }
+
+    n = PyList_GET_SIZE(items);
+    for (i = 0; i < n; i++) {
+        item = PyList_GET_ITEM(items, i);
+        result = validate_value(
+            trait, (has_traits_object *)object, name, item);
+        if (result == NULL) {
+            Py_DECREF(items);
+            return NULL;
+        }
+        PyList_SET_ITEM(items, i, result);
+        Py_DECREF(item);
+    }
+    return items;
 }
 
 /*-----------------------------------------------------------------------------
@@ -4784,6 +5709,7 @@ trait_clone(trait_object *trait, trait_object *source)
     trait->delegate_name = source->delegate_name;
     trait->delegate_prefix = source->delegate_prefix;
     trait->delegate_attr_name = source->delegate_attr_name;
+    trait->slot_index = source->slot_index;
     trait->handler = source->handler;
     Py_XINCREF(trait->py_post_setattr);
     Py_XINCREF(trait->py_validate);
@@ -5138,6 +6064,78 @@ set_trait_is_mapped_flag(trait_object *trait, PyObject *value, void *closure)
     return set_trait_flag(trait, TRAIT_IS_MAPPED, value);
 }
 
+/*-----------------------------------------------------------------------------
+|  Returns the current versioned flag value:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+get_trait_versioned_flag(trait_object *trait, void *closure)
+{
+    return get_trait_flag(trait, TRAIT_VERSIONED);
+}
+
+/*-----------------------------------------------------------------------------
+|  Sets the current versioned flag value:
++----------------------------------------------------------------------------*/
+
+static int
+set_trait_versioned_flag(trait_object *trait, PyObject *value, void *closure)
+{
+    return set_trait_flag(trait, TRAIT_VERSIONED, value);
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the index of the trait's value slot:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+get_trait_slot_index(trait_object *trait, void *closure)
+{
+    return PyLong_FromSsize_t(trait->slot_index);
+}
+
+/*-----------------------------------------------------------------------------
+|  Sets the index of the trait's value slot:
++----------------------------------------------------------------------------*/
+
+static int
+set_trait_slot_index(trait_object *trait, PyObject *value, void *closure)
+{
+    Py_ssize_t index;
+
+    if (value == NULL) {
+        PyErr_SetString(
+            PyExc_AttributeError, "Cannot delete the slot_index attribute.");
+        return -1;
+    }
+
+    index = PyLong_AsSsize_t(value);
+    if (index == -1 && PyErr_Occurred()) {
+        return -1;
+    }
+
+    if (index < -1) {
+        PyErr_Format(
+            PyExc_ValueError,
+            "The slot index must be -1 or a non-negative integer, "
+            "but %zd was specified.",
+            index);
+        return -1;
+    }
+
+    if ((index >= 0)
+        && ((trait->getattr != getattr_trait)
+            || (trait->setattr != setattr_trait))) {
+        PyErr_SetString(
+            TraitError,
+            "Only traits of kind 'trait' can store their value in a slot.");
+        return -1;
+    }
+
+    trait->slot_index = index;
+    return 0;
+}
+
 /*-----------------------------------------------------------------------------
 |  'CTrait' instance methods:
 +----------------------------------------------------------------------------*/
@@ -5253,6 +6251,36 @@ PyDoc_STRVAR(
     "TraitError\n"
     "    If the given value is invalid for this trait.\n");
 
+PyDoc_STRVAR(
+    validate_items_doc,
+    "validate_items(object, name, iterable)\n"
+    "\n"
+    "Validate each of the items of an iterable for this trait.\n"
+    "\n"
+    "This is equivalent to calling *validate* for each item in turn, but\n"
+    "without the overhead of a Python-level call per item. It's used by\n"
+    "the trait containers to validate the items added to a container\n"
+    "whose item trait is this trait.\n"
+    "\n"
+    "Parameters\n"
+    "----------\n"
+    "object : HasTraits\n"
+    "    The HasTraits object that validation is being performed for.\n"
+    "name : str\n"
+    "    The name of the trait.\n"
+    "iterable : iterable\n"
+    "    The values to be validated.\n"
+    "\n"
+    "Returns\n"
+    "-------\n"
+    "items : list\n"
+    "    A new list of the validated, converted values.\n"
+    "\n"
+    "Raises\n"
+    "------\n"
+    "TraitError\n"
+    "    If any of the given values is invalid for this trait.\n");
+
 PyDoc_STRVAR(
     delegate_doc,
     "delegate(delegate_name, prefix, prefix_type, modify_delegate)\n"
@@ -5406,6 +6434,8 @@ static PyMethodDef trait_methods[] = {
     {"get_validate", (PyCFunction)_trait_get_validate, METH_NOARGS,
      get_validate_doc},
     {"validate", (PyCFunction)_trait_validate, METH_VARARGS, validate_doc},
+    {"validate_items", (PyCFunction)_trait_validate_items, METH_VARARGS,
+     validate_items_doc},
     {"delegate", (PyCFunction)_trait_delegate, METH_VARARGS,
      delegate_doc},
     {"_get_property", (PyCFunction)_trait_get_property, METH_NOARGS,
@@ -5480,6 +6510,25 @@ PyDoc_STRVAR(
     "True if this is a mapped trait, else False.\n"
 );
 
+PyDoc_STRVAR(
+    ctrait_versioned_doc,
+    "Whether assignments to this trait are recorded in version stamps.\n"
+    "\n"
+    "If true, each assignment or deletion of this trait gives it a new\n"
+    "version stamp in the object, as returned by\n"
+    "CHasTraits._trait_versions.\n"
+);
+
+PyDoc_STRVAR(
+    ctrait_slot_index_doc,
+    "Index of the value slot used for this trait, or -1.\n"
+    "\n"
+    "Instances of classes created with ``trait_slots=True`` store the\n"
+    "values of their class traits in a fixed-size array of slots instead\n"
+    "of the instance dictionary. This is the index of the slot used for\n"
+    "this trait, or -1 if its value is stored in the instance dictionary.\n"
+);
+
 PyDoc_STRVAR(
     ctrait_comparison_mode_doc,
     "Integer constant indicating when notifiers are executed.\n"
@@ -5529,11 +6578,21 @@ static PyGetSetDef trait_properties[] = {
      (setter)set_trait_is_mapped_flag,
      ctrait_is_mapped_doc,
      NULL},
+    {"versioned",
+     (getter)get_trait_versioned_flag,
+     (setter)set_trait_versioned_flag,
+     ctrait_versioned_doc,
+     NULL},
     {"comparison_mode",
      (getter)_get_trait_comparison_mode_int,
      (setter)_set_trait_comparison_mode,
      ctrait_comparison_mode_doc,
      NULL},
+    {"slot_index",
+     (getter)get_trait_slot_index,
+     (setter)set_trait_slot_index,
+     ctrait_slot_index_doc,
+     NULL},
     {NULL}};
 
 /*-----------------------------------------------------------------------------
@@ -5653,6 +6712,270 @@ _ctraits_ctrait(PyObject *self, PyObject *args)
     return Py_None;
 }
 
+/*-----------------------------------------------------------------------------
+|  Enables or disables instrumentation, and the timing of operations:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_ctraits_set_instrumentation(PyObject *self, PyObject *args)
+{
+    int enabled, timing;
+
+    if (!PyArg_ParseTuple(args, "pp", &enabled, &timing)) {
+        return NULL;
+    }
+
+    if (enabled) {
+        instrumentation_flags =
+            INSTRUMENT_COUNTS | (timing ? INSTRUMENT_TIMES : 0);
+    }
+    else {
+        instrumentation_flags = 0;
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns whether instrumentation, and the timing of operations, are
+|  enabled:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_ctraits_get_instrumentation(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return Py_BuildValue(
+        "(OO)",
+        (instrumentation_flags & INSTRUMENT_COUNTS) ? Py_True : Py_False,
+        (instrumentation_flags & INSTRUMENT_TIMES) ? Py_True : Py_False);
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns a list of tuples giving the statistics of each instrumented
+|  trait:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_ctraits_instrumentation_snapshot(
+    PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    Py_ssize_t i, n;
+    PyObject *result, *item;
+    trait_object *trait;
+    trait_stats *stats;
+
+    result = PyList_New(0);
+    if ((result == NULL) || (instrumented_traits == NULL)) {
+        return result;
+    }
+
+    n = PyList_GET_SIZE(instrumented_traits);
+    for (i = 0; i < n; i++) {
+        trait = (trait_object *)PyList_GET_ITEM(instrumented_traits, i);
+        stats = trait->stats;
+        if (stats == NULL) {
+            continue;
+        }
+        item = Py_BuildValue(
+            "(OOOKKKKLLLL)", trait, stats->name, stats->owner, stats->gets,
+            stats->sets, stats->validations, stats->notifications,
+            stats->get_time, stats->set_time, stats->validate_time,
+            stats->notify_time);
+        if ((item == NULL) || (PyList_Append(result, item) < 0)) {
+            Py_XDECREF(item);
+            Py_DECREF(result);
+            return NULL;
+        }
+        Py_DECREF(item);
+    }
+
+    return result;
+}
+
+/*-----------------------------------------------------------------------------
+|  Discards the statistics of all traits:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_ctraits_reset_instrumentation(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    Py_ssize_t i;
+    PyObject *traits = instrumented_traits;
+
+    if (traits != NULL) {
+        instrumented_traits = NULL;
+        for (i = 0; i < PyList_GET_SIZE(traits); i++) {
+            free_trait_stats((trait_object *)PyList_GET_ITEM(traits, i));
+        }
+        Py_DECREF(traits);
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the value of a trait of an object for '_trait_columns':
+|
+|  'trait' is the class trait of the object for the name, or NULL if the
+|  class has no such trait. The constant default value of a simple trait is
+|  returned without being stored when storing it would have no side effects.
++----------------------------------------------------------------------------*/
+
+static PyObject *
+get_column_value(has_traits_object *obj, PyObject *name, trait_object *trait)
+{
+    PyObject *value;
+    PyObject **slot;
+
+    if (obj->obj_dict != NULL) {
+        value = PyDict_GetItem(obj->obj_dict, name);
+        if (value != NULL) {
+            Py_INCREF(value);
+            return value;
+        }
+    }
+
+    if ((obj->itrait_dict != NULL)
+        && (dict_getitem(obj->itrait_dict, name) != NULL)) {
+        trait = NULL;
+    }
+    if (trait == NULL) {
+        return PyObject_GetAttr((PyObject *)obj, name);
+    }
+
+    if (trait->getattr != getattr_trait) {
+        return trait->getattr(trait, obj, name);
+    }
+
+    slot = get_value_slot(trait, obj, name);
+    if ((slot != NULL) && (*slot != NULL)) {
+        Py_INCREF(*slot);
+        return *slot;
+    }
+
+    if (((trait->default_value_type == CONSTANT_DEFAULT_VALUE)
+         || (trait->default_value_type == MISSING_DEFAULT_VALUE))
+        && (trait->post_setattr == NULL)
+        && !has_notifiers(trait->notifiers, obj->notifiers)) {
+        value = trait->default_value;
+        if (value == NULL) {
+            value = Py_None;
+        }
+        Py_INCREF(value);
+        return value;
+    }
+
+    return trait->getattr(trait, obj, name);
+}
+
+/*-----------------------------------------------------------------------------
+|  Returns the values of traits of a sequence of objects, as a list of
+|  lists with one list per trait:
++----------------------------------------------------------------------------*/
+
+static PyObject *
+_ctraits_trait_columns(PyObject *self, PyObject *args)
+{
+    PyObject *objects, *names, *items, *result, *obj, *name, *value;
+    PyDictObject *ctrait_dict = NULL;
+    trait_object **traits;
+    Py_ssize_t i, j, n_objects, n_names;
+
+    if (!PyArg_ParseTuple(
+            args, "OO!:_trait_columns", &objects, &PyTuple_Type, &names)) {
+        return NULL;
+    }
+
+    n_names = PyTuple_GET_SIZE(names);
+    for (j = 0; j < n_names; j++) {
+        if (!PyUnicode_Check(PyTuple_GET_ITEM(names, j))) {
+            PyErr_SetString(PyExc_TypeError, "trait names must be strings");
+            return NULL;
+        }
+    }
+
+    items = PySequence_Fast(objects, "objects must be a sequence");
+    if (items == NULL) {
+        return NULL;
+    }
+    n_objects = PySequence_Fast_GET_SIZE(items);
+
+    traits = PyMem_New(trait_object *, n_names > 0 ? n_names : 1);
+    if (traits == NULL) {
+        Py_DECREF(items);
+        return PyErr_NoMemory();
+    }
+
+    result = PyList_New(n_names);
+    if (result == NULL) {
+        goto error;
+    }
+    for (j = 0; j < n_names; j++) {
+        value = PyList_New(n_objects);
+        if (value == NULL) {
+            goto error;
+        }
+        PyList_SET_ITEM(result, j, value);
+    }
+
+    for (i = 0; i < n_objects; i++) {
+        obj = PySequence_Fast_GET_ITEM(items, i);
+
+        if (!PyHasTraits_Check(obj)) {
+            for (j = 0; j < n_names; j++) {
+                value = PyObject_GetAttr(obj, PyTuple_GET_ITEM(names, j));
+                if (value == NULL) {
+                    goto error;
+                }
+                PyList_SET_ITEM(PyList_GET_ITEM(result, j), i, value);
+            }
+            continue;
+        }
+
+        /* Objects of the same class share their class traits dictionary, so
+           the traits are only looked up again when the class changes: */
+        if (((has_traits_object *)obj)->ctrait_dict != ctrait_dict) {
+            ctrait_dict = ((has_traits_object *)obj)->ctrait_dict;
+            for (j = 0; j < n_names; j++) {
+                traits[j] = (ctrait_dict == NULL)
+                    ? NULL
+                    : (trait_object *)dict_getitem(
+                        ctrait_dict, PyTuple_GET_ITEM(names, j));
+            }
+        }
+
+        for (j = 0; j < n_names; j++) {
+            name = PyTuple_GET_ITEM(names, j);
+            value = get_column_value(
+                (has_traits_object *)obj, name, traits[j]);
+            if (value == NULL) {
+                goto error;
+            }
+            PyList_SET_ITEM(PyList_GET_ITEM(result, j), i, value);
+        }
+    }
+
+    PyMem_Free(traits);
+    Py_DECREF(items);
+    return result;
+
+  error:
+    PyMem_Free(traits);
+    Py_DECREF(items);
+    Py_XDECREF(result);
+    return NULL;
+}
+
+PyDoc_STRVAR(
+    _ctraits_trait_columns_doc,
+    "_trait_columns(objects, names)\n"
+    "\n"
+    "Return the values of the traits with the given names of a sequence\n"
+    "of objects, as a list with a list of values per name.\n"
+);
+
 /*-----------------------------------------------------------------------------
 |  'CTrait' instance methods:
 +----------------------------------------------------------------------------*/
@@ -5685,6 +7008,17 @@ static PyMethodDef ctraits_methods[] = {
      _ctraits_validate_float_doc},
     {"_validate_complex_number", (PyCFunction)_ctraits_validate_complex_number,
      METH_O, _ctraits_validate_complex_number_doc},
+    {"_set_instrumentation", (PyCFunction)_ctraits_set_instrumentation,
+     METH_VARARGS, PyDoc_STR("_set_instrumentation(enabled, timing)")},
+    {"_get_instrumentation", (PyCFunction)_ctraits_get_instrumentation,
+     METH_NOARGS, PyDoc_STR("_get_instrumentation()")},
+    {"_instrumentation_snapshot",
+     (PyCFunction)_ctraits_instrumentation_snapshot, METH_NOARGS,
+     PyDoc_STR("_instrumentation_snapshot()")},
+    {"_reset_instrumentation", (PyCFunction)_ctraits_reset_instrumentation,
+     METH_NOARGS, PyDoc_STR("_reset_instrumentation()")},
+    {"_trait_columns", (PyCFunction)_ctraits_trait_columns, METH_VARARGS,
+     _ctraits_trait_columns_doc},
     {NULL, NULL},
 };
 
@@ -5749,6 +7083,12 @@ PyInit_ctraits(void)
     /* Predefine a Python string == "trait_added": */
     trait_added = PyUnicode_FromString("trait_added");
 
+    /* Predefine a Python string == "__trait_slots__": */
+    trait_slots = PyUnicode_FromString("__trait_slots__");
+
+    /* Predefine the version of the traits never assigned: */
+    zero_version = PyLong_FromLong(0);
+
     /* Import Undefined and Uninitialized */
     trait_base = PyImport_ImportModule("traits.trait_base");
     if (trait_base == NULL) {
@@ -8,7 +8,7 @@
 #
 # Thanks for using Enthought open source!
 
-from typing import Any
+from typing import Any, List, Tuple
 
 # Constants used in DefaultValue enumeration.
 _CALLABLE_AND_ARGS_DEFAULT_VALUE: int
@@ -26,6 +26,11 @@ _TRAIT_SET_OBJECT_DEFAULT_VALUE: int
 
 def _validate_complex_number(value: Any) -> complex: ...
 def _validate_float(value: Any) -> float: ...
+def _set_instrumentation(enabled: bool, timing: bool) -> None: ...
+def _get_instrumentation() -> Tuple[bool, bool]: ...
+def _instrumentation_snapshot() -> List[Tuple[Any, ...]]: ...
+def _reset_instrumentation() -> None: ...
+def _trait_columns(objects: Any, names: Tuple[str, ...]) -> List[List[Any]]: ...
 
 class CHasTraits:
     def __init__(self, **traits: Any): ...
@@ -13,11 +13,14 @@
 """
 
 import abc
+import contextlib
 import copy as copy_module
 import inspect
 import os
 import pickle
 import re
+import sys
+import threading
 import types
 import warnings
 import weakref
@@ -25,10 +28,11 @@ import weakref
 from types import FunctionType
 
 from . import __version__ as TraitsVersion
-from .constants import DefaultValue, TraitKind
+from .constants import DefaultValue, TraitKind, ValidateTrait
 from .ctrait import CTrait, __newobj__
 from .ctraits import CHasTraits
 from .observation import api as observe_api
+from .observation.observe import compile_graphs
 from .traits import (
     ForwardProperty,
     Property,
@@ -40,9 +44,12 @@ from .trait_notifiers import (
     ExtendedTraitChangeNotifyWrapper,
     FastUITraitChangeNotifyWrapper,
     NewTraitChangeNotifyWrapper,
+    PoolTraitChangeNotifyWrapper,
     StaticAnytraitChangeNotifyWrapper,
     StaticTraitChangeNotifyWrapper,
     TraitChangeNotifyWrapper,
+    held_notifications,
+    pool_dispatch,
     ui_dispatch,
 )
 from .trait_base import (
@@ -53,8 +60,12 @@ from .trait_base import (
     not_event,
     not_false,
 )
+from .trait_array_list_object import TraitArrayListObject
+from .trait_dict_object import TraitDictObject
 from .trait_errors import TraitError
 from .trait_converters import check_trait, mapped_trait_for, trait_for
+from .trait_list_object import TraitListObject
+from .trait_set_object import TraitSetObject
 
 
 #  Set CHECK_INTERFACES to one of the following values:
@@ -98,8 +109,12 @@ ClassTraits = "__class_traits__"
 PrefixTraits = "__prefix_traits__"
 ListenerTraits = "__listener_traits__"
 ObserverTraits = "__observer_traits__"
+ListenerPlan = "__listener_plan__"
+ObserverPlan = "__observer_plan__"
 ViewTraits = "__view_traits__"
 InstanceTraits = "__instance_traits__"
+TraitSlots = "__trait_slots__"
+TranslateListeners = "__translate_listeners__"
 
 # The default Traits View name
 DefaultTraitsView = "traits_view"
@@ -120,9 +135,20 @@ any_trait = Any().as_ctrait()
 _ObserverDispatchers = {
     "same": observe_api.dispatch_same,
     "ui": ui_dispatch,
+    "pool": pool_dispatch,
+    "asyncio": observe_api.dispatch_asyncio,
 }
 
 
+def _observer_dispatcher(dispatch):
+    """ Return the dispatcher for the *dispatch* argument of observe, which
+    is either one of the keys of _ObserverDispatchers or a dispatcher.
+    """
+    if isinstance(dispatch, str):
+        return _ObserverDispatchers[dispatch]
+    return dispatch
+
+
 def _clone_trait(clone, metadata=None):
     """ Creates a clone of a specified trait.
     """
@@ -211,6 +237,50 @@ def _is_serializable(value):
     )
 
 
+def _out_of_band_state(state):
+    """ Return the pickled state of a HasTraits object, ready for pickle
+    protocol 5 out-of-band buffers.
+
+    Under protocol 5, NumPy hands the data of contiguous arrays to the
+    pickler as PickleBuffer objects, which a pickler with a buffer_callback
+    passes out-of-band, but copies the data of other arrays into the pickle
+    stream. So the non-contiguous arrays of the state are replaced by
+    contiguous copies, with a single copy of an array held by several
+    traits, so that it still unpickles as a single array.
+
+    Parameters
+    ----------
+    state : dict
+        The state, as returned by ``__getstate__``.
+
+    Returns
+    -------
+    state : dict
+        The given state, or a copy of it with contiguous arrays.
+    """
+    # Without NumPy imported, there can be no arrays in the state.
+    numpy = sys.modules.get("numpy")
+    if numpy is None or not isinstance(state, dict):
+        return state
+
+    result = state
+    copies = {}
+    for name, value in state.items():
+        if (
+            type(value) is numpy.ndarray
+            and not value.dtype.hasobject
+            and not value.flags.c_contiguous
+            and not value.flags.f_contiguous
+        ):
+            if result is state:
+                result = state.copy()
+            copy = copies.get(id(value))
+            if copy is None:
+                copy = copies[id(value)] = numpy.ascontiguousarray(value)
+            result[name] = copy
+    return result
+
+
 def _get_instance_handlers(class_dict, bases):
     """ Returns a dictionary of potential 'Instance' or 'List(Instance)'
         handlers.
@@ -339,6 +409,92 @@ def _create_property_observe_state(observe, property_name, cached):
     )
 
 
+def _versioned_property_dependencies(name, trait, class_traits):
+    """ Return the names of the traits a versioned property depends on.
+
+    Parameters
+    ----------
+    name : str
+        The name of the property trait.
+    trait : CTrait
+        The property trait.
+    class_traits : dict
+        The class traits of the class being defined.
+
+    Returns
+    -------
+    dependencies : tuple of str
+        The names of the traits given by the **depends_on** or **observe**
+        metadata of the property.
+
+    Raises
+    ------
+    TraitError
+        If the property isn't cached, or doesn't depend on simple traits of
+        the class only.
+    """
+    dependencies = trait.depends_on
+    if dependencies is None:
+        dependencies = trait.observe
+    if isinstance(dependencies, str):
+        dependencies = dependencies.split(",")
+    elif not isinstance(dependencies, SequenceTypes):
+        dependencies = [dependencies]
+
+    names = []
+    for dependency in dependencies:
+        if isinstance(dependency, str):
+            dependency = dependency.strip()
+        dependency_trait = class_traits.get(dependency)
+        if dependency_trait is None or dependency_trait.type != "trait":
+            raise TraitError(
+                "The versioned property '{}' can only depend on simple "
+                "traits of the class, not on {!r}".format(name, dependency)
+            )
+        names.append(dependency)
+
+    if not trait.cached or not names:
+        raise TraitError(
+            "The versioned property '{}' must be a cached property with "
+            "dependencies".format(name)
+        )
+    return tuple(names)
+
+
+def _versioned_property_getter(getter, cache_name, dependencies):
+    """ Return the getter of a versioned cached property.
+
+    The returned getter keeps the version stamps of the traits the property
+    depends on alongside the cached value, and discards the cached value
+    when the stamps have changed since.
+
+    Parameters
+    ----------
+    getter : callable(object)
+        The getter of the cached property.
+    cache_name : str
+        The name under which the getter caches its value.
+    dependencies : tuple of str
+        The names of the traits the property depends on.
+
+    Returns
+    -------
+    versioned_getter : callable(object)
+    """
+    versions_name = cache_name + ":versions"
+
+    def versioned_getter(self):
+        versions = self._trait_versions(dependencies)
+        dict = self.__dict__
+        if dict.get(versions_name) != versions:
+            dict.pop(cache_name, None)
+            dict[versions_name] = versions
+        return getter(self)
+
+    versioned_getter.versioned_property = True
+    return versioned_getter
+
+
 def _compile_expression(expression):
     """ Compile a user-supplied expression or list of expressions.
 
@@ -373,6 +529,78 @@ def _compile_expression(expression):
     return graphs
 
 
+def _listener_init_plan(listeners):
+    """ Compile the listener information of a HasTraits class into the plan
+    used to hook up the listeners of each new instance.
+
+    Parameters
+    ----------
+    listeners : dict
+        Mapping from names to listener data, as stored under
+        ``__listener_traits__``.
+
+    Returns
+    -------
+    pre_init : list of tuple
+        The listeners to hook up before the object's state is set, as
+        ``(method_name, name, data)`` tuples, where *method_name* is the
+        name of the ``_init_trait_*_listener`` method that hooks up the
+        listener, to be called with ``name, *data``.
+    post_init : list of tuple
+        The ``on_trait_change``-decorated methods to hook up after the
+        object's state is set, as ``(name, pattern, dispatch)`` tuples.
+    """
+    pre_init = []
+    post_init = []
+    for name, data in listeners.items():
+        if data[0] == "method" and data[1]["post_init"]:
+            config = data[1]
+            post_init.append((name, config["pattern"], config["dispatch"]))
+        else:
+            pre_init.append(("_init_trait_%s_listener" % data[0], name, data))
+    return pre_init, post_init
+
+
+def _observer_init_plan(observers):
+    """ Compile the observer states of a HasTraits class into the plan used
+    to hook up the observers of each new instance.
+
+    The graphs of each observer are compiled to NotifierTemplates, so that
+    hooking up the observers of a new instance only needs to bind each
+    template to the instance and its handler.
+
+    Parameters
+    ----------
+    observers : dict
+        Mapping from method or trait names to lists of observer states, as
+        stored under ``__observer_traits__``.
+
+    Returns
+    -------
+    pre_init : list of tuple
+        The observers to hook up before the object's state is set, as
+        ``(name, handler_getter, dispatch, templates)`` tuples.
+    post_init : list of tuple
+        The observers to hook up after the object's state is set, in the
+        same form.
+    """
+    pre_init = []
+    post_init = []
+    for name, states in observers.items():
+        for state in states:
+            entry = (
+                name,
+                state["handler_getter"],
+                state["dispatch"],
+                compile_graphs(state["graphs"]),
+            )
+            if state["post_init"]:
+                post_init.append(entry)
+            else:
+                pre_init.append(entry)
+    return pre_init, post_init
+
+
 # This really should be 'HasTraits', but it's not defined yet:
 _HasTraits = None
 
@@ -386,12 +614,43 @@ class MetaHasTraits(type):
     added back to the class dictionary and passed off to the __new__ method
     of the type superclass, to be added to the class.
 
+    The metaclass accepts a ``trait_slots`` class keyword. If true, instances
+    of the class store the values of its class traits in a fixed-size array
+    of value slots rather than in the instance ``__dict__``, which is then
+    only created when something other than a class trait value needs to be
+    stored. This reduces the memory used by each instance. If not given, the
+    setting is inherited from the base classes. For example::
+
+        class Point(HasTraits, trait_slots=True):
+            x = Float()
+            y = Float()
+
+    The metaclass also accepts a ``translate_listeners`` class keyword. If
+    true, the extended trait names given to ``on_trait_change`` for instances
+    of the class (including those of ``on_trait_change``-decorated methods)
+    are implemented with observers, as used by ``observe``, rather than with
+    the listeners of ``traits_listener``. Handlers are called with the same
+    arguments as before. Names that can't be translated without changing
+    their behaviour produce a warning and are handled as usual. If not
+    given, the setting is inherited from the base classes.
     """
 
-    def __new__(cls, class_name, bases, class_dict):
+    def __new__(
+        cls, class_name, bases, class_dict, trait_slots=None,
+        translate_listeners=None,
+    ):
         # Convert entries in the class dictionary into traits, as appropriate.
         update_traits_class_dict(class_name, bases, class_dict)
 
+        if translate_listeners is not None:
+            class_dict[TranslateListeners] = translate_listeners
+
+        # Lay out the value slots for compact classes.
+        if trait_slots is None:
+            trait_slots = any(TraitSlots in base.__dict__ for base in bases)
+        if trait_slots:
+            assign_trait_slots(bases, class_dict)
+
         # Finish building the class using the updated class dictionary.
         return type.__new__(cls, class_name, bases, class_dict)
 
@@ -676,6 +935,32 @@ def update_traits_class_dict(class_name, bases, class_dict):
             if default is not None:
                 trait.set_default_value(DefaultValue.callable, default)
 
+        # Versioned cached properties check the version stamps of the traits
+        # they depend on when they are read, and need no listeners:
+        if (trait.type == "property") and trait.versioned:
+            dependencies = _versioned_property_dependencies(
+                name, trait, class_traits
+            )
+            for dependency in dependencies:
+                if dependency not in cloned:
+                    cloned.add(dependency)
+                    class_traits[dependency] = _clone_trait(
+                        class_traits[dependency]
+                    )
+                class_traits[dependency].versioned = True
+
+            getter, setter, validate = trait.property_fields
+            if not getattr(getter, "versioned_property", False):
+                cached = trait.cached
+                if cached is True:
+                    cached = TraitsCache + name
+                trait.property_fields = (
+                    _versioned_property_getter(getter, cached, dependencies),
+                    setter,
+                    validate,
+                )
+            continue
+
         # Handle the case of properties whose value depends upon the value
         # of other traits:
         if (trait.type == "property") and (trait.depends_on is not None):
@@ -710,9 +995,72 @@ def update_traits_class_dict(class_name, bases, class_dict):
     class_dict[PrefixTraits] = prefix_traits
     class_dict[ListenerTraits] = listeners
     class_dict[ObserverTraits] = observers
+    class_dict[ListenerPlan] = _listener_init_plan(listeners)
+    class_dict[ObserverPlan] = _observer_init_plan(observers)
     class_dict[ViewTraits] = view_elements
 
 
+def assign_trait_slots(bases, class_dict):
+    """ Assigns value slots to the class traits of a compact HasTraits class.
+
+    This is called during the construction of a HasTraits class created with
+    ``trait_slots=True``, after ``update_traits_class_dict``. The slot layout
+    of the first base class with slots is extended with a slot for each new
+    class trait whose value can be stored in a slot. Traits are cloned before
+    their slot index is set, as they may be shared with other classes.
+    The resulting tuple of slot names is stored in the class dictionary under
+    ``__trait_slots__``. This function modifies ``class_dict`` in-place.
+
+    Parameters
+    ----------
+    bases : tuple
+        The base classes for the HasTraits class.
+    class_dict : dict
+        A dictionary of class members, as updated by
+        ``update_traits_class_dict``.
+    """
+    slot_names = []
+    for base in bases:
+        base_slot_names = base.__dict__.get(TraitSlots)
+        if base_slot_names is not None:
+            slot_names.extend(base_slot_names)
+            break
+    slot_indices = {name: index for index, name in enumerate(slot_names)}
+
+    class_traits = class_dict[ClassTraits]
+    for name, trait in list(class_traits.items()):
+        if trait.type != "trait":
+            continue
+
+        # The values of the shadow traits of mapped traits are set directly
+        # in the instance dictionary.
+        if name[-1:] == "_" and getattr(
+            class_traits.get(name[:-1]), "is_mapped", False
+        ):
+            continue
+
+        index = slot_indices.get(name, len(slot_names))
+        if trait.slot_index != index:
+            clone = _clone_trait(trait)
+            try:
+                clone.slot_index = index
+            except TraitError:
+                # The trait is not a plain stored value (e.g. it is an
+                # event or a read-only trait), so it can't use a slot.
+                continue
+
+            notifiers = trait._notifiers(False)
+            if notifiers:
+                clone._notifiers(True).extend(notifiers)
+            class_traits[name] = clone
+
+        if index == len(slot_names):
+            slot_names.append(name)
+            slot_indices[name] = index
+
+    class_dict[TraitSlots] = tuple(slot_names)
+
+
 def migrate_property(name, property, property_info, class_dict):
     """ Migrates an existing property to the class being defined
     (allowing for method overrides).
@@ -727,6 +1075,7 @@ def migrate_property(name, property, property_info, class_dict):
             set or old_set,
             val or old_val,
             True,
+            versioned=property.versioned,
             **property.__dict__
         )
 
@@ -762,10 +1111,13 @@ def observe(expression, *, post_init=False, dispatch="same"):
         values provided to the instance constructor will trigger the
         change handler to fire if the value is different from the
         default. Set to true to avoid this change event.
-    dispatch : str, optional
-        A string indicating how the handler should be run. Default is to run
+    dispatch : str or callable(handler, event), optional
+        A string indicating how the handler should be run, or a dispatcher
+        such as those returned by
+        :func:`~traits.observation.rate_limiting.debounce` and
+        :func:`~traits.observation.rate_limiting.throttle`. Default is to run
         it on the same thread where the change occurs.
-        Possible values are:
+        Possible string values are:
 
         =========== =======================================================
         value       dispatch
@@ -776,6 +1128,10 @@ def observe(expression, *, post_init=False, dispatch="same"):
                     thread is the UI thread, the notifications are executed
                     immediately; otherwise, they are placed on the UI
                     event queue.
+        ``pool``    Run notifications on the executor set with
+                    :func:`~.set_pool_executor`.
+        ``asyncio`` Run notifications on the event loop set with
+                    :func:`~traits.observation.api.set_asyncio_loop`.
         =========== =======================================================
 
     See Also
@@ -959,6 +1315,50 @@ def property_depends_on(dependency, settable=False, flushable=False):
     return decorator
 
 
+def _translated_listener(name, wrapper, dispatch, priority):
+    """ Return the listener implementing an extended trait name with
+    observers, or None if the name can't be translated.
+
+    Parameters
+    ----------
+    name : str
+        The extended trait name given to ``on_trait_change``.
+    wrapper : ListenerNotifyWrapper
+        The wrapper for the handler.
+    dispatch : str
+        The dispatch mechanism to use when invoking the handler.
+    priority : bool
+        True if the handler goes at the beginning of the notification
+        handlers list.
+
+    Returns
+    -------
+    listener : TranslatedListener or None
+    """
+    from .observation._listener_translation import (
+        ListenerTranslationError,
+        translate_listener,
+    )
+
+    try:
+        return translate_listener(
+            name,
+            wrapped_handler_ref=weakref.ref(wrapper),
+            dispatch=dispatch,
+            priority=priority,
+            handler_type=wrapper.type,
+        )
+    except ListenerTranslationError as error:
+        warnings.warn(
+            "on_trait_change name {!r} can't be translated to observers "
+            "({}); it is handled by on_trait_change listeners "
+            "instead.".format(name, error),
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return None
+
+
 def weak_arg(arg):
     """ Create a weak reference to arg and wrap the function so that the
     dereferenced weakref is passed as the first argument. If arg has been
@@ -1019,6 +1419,164 @@ def weak_arg(arg):
     return decorator
 
 
+@contextlib.contextmanager
+def hold_trait_notifications(*objects):
+    """ Context manager that holds back and merges trait change notifications.
+
+    While the context is active, trait change notifications for the given
+    objects are queued instead of being sent. When the context exits, the
+    queued changes are delivered, in the order in which the traits first
+    changed. All the changes of a given trait are merged into a single
+    notification carrying the value before the first change and the value
+    after the last change. If the trait ended up with the same value
+    according to its ``comparison_mode``, no notification is sent.
+
+    Firings of ``Event`` traits, including the ``_items`` events of ``List``,
+    ``Dict`` and ``Set`` traits, are never merged: each is delivered in
+    order when the context exits. Note that handlers observing the items of
+    a container directly (for example with ``"values:items"`` in an
+    ``observe`` expression) are notified by the container itself, and are
+    not held.
+
+    Holds can be nested, and may be shared by several contexts: the changes
+    of an object are delivered when the last hold on it is released. This
+    applies to handlers registered with both ``observe`` and
+    ``on_trait_change``.
+
+    Parameters
+    ----------
+    *objects : HasTraits
+        The objects for which to hold notifications.
+
+    Examples
+    --------
+    ::
+
+        with hold_trait_notifications(point, style):
+            point.x = 1.0
+            point.x = 2.0
+            style.color = "red"
+
+    Handlers observing ``point.x`` are notified once, of the change from its
+    original value to 2.0, after the ``with`` block.
+    """
+    held_notifications.hold(objects)
+    try:
+        yield
+    finally:
+        held_notifications.release(objects)
+
+
+#: Per-thread state of trusted_state_restore: the 'restored' attribute is
+#: the list of the objects whose initialization is pending, while the
+#: context is active.
+_trusted_restore = threading.local()
+
+#: The types of the trait values which lose the reference to their object
+#: when pickled, so need to be validated again to be restored.
+_object_bound_types = (
+    TraitArrayListObject,
+    TraitDictObject,
+    TraitListObject,
+    TraitSetObject,
+)
+
+
+@contextlib.contextmanager
+def trusted_state_restore():
+    """ Context manager restoring the state of HasTraits objects as is.
+
+    While the context is active in a thread, ``HasTraits.__setstate__``
+    trusts the state it is given, as when unpickling data that was pickled
+    by the application itself: the values of simple traits are stored in
+    the objects without being validated, and without change notifications.
+    The values of other traits, such as mapped traits and traits kept in
+    value slots, are assigned without notifications.
+
+    The listeners and observers of the restored objects are set up, and
+    their ``traits_init`` methods called, in a batch when the context exits,
+    so the objects shouldn't be used before then. If the ``with`` block
+    raises an exception, this is skipped. Nested contexts have no effect.
+
+    Examples
+    --------
+    ::
+
+        with trusted_state_restore():
+            models = pickle.load(cache_file)
+    """
+    if getattr(_trusted_restore, "restored", None) is not None:
+        yield
+        return
+
+    _trusted_restore.restored = restored = []
+    try:
+        yield
+    finally:
+        del _trusted_restore.restored
+
+    _finish_trusted_restore(restored)
+
+
+def _finish_trusted_restore(objects):
+    """ Finish the initialization of objects restored by
+    trusted_state_restore, looking up the initialization steps of each
+    class once.
+    """
+    class_steps = {}
+    for object in objects:
+        cls = type(object)
+        steps = class_steps.get(cls)
+        if steps is None:
+            _, observers_post_init = cls.__observer_plan__
+            steps = class_steps[cls] = (
+                len(cls.__listener_traits__) > 0,
+                cls.__observer_plan__[0] + observers_post_init,
+                cls.traits_init is not CHasTraits.traits_init,
+            )
+        has_listeners, observers, has_traits_init = steps
+
+        # No notifications were sent while the state was restored, so the
+        # observers to set up after the state can be set up with the others.
+        if has_listeners:
+            object._init_trait_listeners()
+            object._post_init_trait_listeners()
+        if observers:
+            object._apply_observer_plan(observers)
+        if has_traits_init:
+            object.traits_init()
+        object._trait_set_inited()
+
+
+#: The kinds of C validators that only use the object being validated in
+#: error messages.
+_object_independent_validators = frozenset([
+    ValidateTrait.type,
+    ValidateTrait.instance,
+    ValidateTrait.self_type,
+    ValidateTrait.float_range,
+    ValidateTrait.enum,
+    ValidateTrait.map,
+    ValidateTrait.coerce,
+    ValidateTrait.cast,
+    ValidateTrait.int,
+    ValidateTrait.float,
+    ValidateTrait.callable,
+    ValidateTrait.complex_number,
+])
+
+
+def _validates_without_object(trait):
+    """ Return true if the result of validating a value for the trait
+    doesn't depend on the object being validated.
+    """
+    validate = trait.get_validate()
+    return validate is None or (
+        isinstance(validate, tuple)
+        and validate[0] in _object_independent_validators
+    )
+
+
 class HasTraits(CHasTraits, metaclass=MetaHasTraits):
     """ Enables any Python class derived from it to have trait attributes.
 
@@ -1063,6 +1621,7 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
         "new": NewTraitChangeNotifyWrapper,
         "fast_ui": FastUITraitChangeNotifyWrapper,
         "ui": FastUITraitChangeNotifyWrapper,
+        "pool": PoolTraitChangeNotifyWrapper,
     }
 
     # -- Trait Definitions ----------------------------------------------------
@@ -1332,7 +1891,24 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
         return result
 
     def __reduce_ex__(self, protocol):
-        return (__newobj__, (self.__class__,), self.__getstate__())
+        """ Support pickling.
+
+        The state of the object is the dictionary returned by
+        ``__getstate__``. Under pickle protocol 5 or later, the data of the
+        NumPy arrays in the state can be passed out-of-band, e.g. with::
+
+            buffers = []
+            data = pickle.dumps(obj, 5, buffer_callback=buffers.append)
+            obj = pickle.loads(data, buffers=buffers)
+
+        so that transports like ``multiprocessing`` and shared memory can
+        move them without copies. Arrays which are not contiguous are made
+        contiguous for this.
+        """
+        state = self.__getstate__()
+        if protocol >= 5:
+            state = _out_of_band_state(state)
+        return (__newobj__, (self.__class__,), state)
 
     def __setstate__(self, state, trait_change_notify=True):
         """ Restores the previously pickled state of an object.
@@ -1348,6 +1924,10 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
             self.trait_set(
                 trait_change_notify=trait_change_notify, **dict(values)
             )
+        elif getattr(_trusted_restore, "restored", None) is not None:
+            self._restore_trusted_state(state)
+            _trusted_restore.restored.append(self)
+            return
         else:
             # Otherwise, apply the Traits 3.0 restore logic:
             self._init_trait_listeners()
@@ -1359,6 +1939,145 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
 
         self._trait_set_inited()
 
+    def _restore_trusted_state(self, state):
+        """ Restore a state trusted to be valid, for trusted_state_restore.
+
+        The values of the simple traits are stored directly, the others, and
+        the containers bound to the object, are assigned without
+        notifications.
+        """
+        class_traits = self.__class__.__class_traits__
+        dict = self.__dict__
+        assigned = {}
+        for name, value in state.items():
+            trait = class_traits.get(name)
+            if (
+                trait is None
+                or trait.type != "trait"
+                or trait.post_setattr is not None
+                or trait.slot_index >= 0
+                or isinstance(value, _object_bound_types)
+            ):
+                assigned[name] = value
+            else:
+                dict[name] = value
+
+        if assigned:
+            self.trait_setq(**assigned)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """ Create instances of the class from columns of trait values.
+
+        The result is the same as calling the class once per row, with
+        the values of the row as keyword arguments, e.g.::
+
+            points = Point.from_columns({"x": [0, 1, 2], "y": x_values})
+
+        but the work that doesn't depend on the row is done once per call:
+        the values of the simple traits without notifiers are validated and
+        stored directly in the new instances, column by column, and the
+        columns of traits with built-in validators, such as ``Int`` or
+        ``Str``, are validated in a single pass. The listeners and
+        observers of the class are still set up on each instance. Classes
+        defining their own ``__init__`` are called for each row.
+
+        As with keyword arguments, the columns are assigned in order, so
+        the validation of a value can depend on the values of the columns
+        before it in the same row.
+
+        Parameters
+        ----------
+        columns : dict
+            Mapping from trait names to sequences of values of the same
+            length, such as lists or NumPy arrays.
+
+        Returns
+        -------
+        instances : list
+            The new instances, one per row.
+
+        Raises
+        ------
+        ValueError
+            If the columns don't all have the same length.
+        TraitError
+            If a value isn't valid for its trait.
+        """
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(
+                "All the columns must have the same length, got lengths "
+                "{}".format(sorted(lengths))
+            )
+        if not lengths:
+            return []
+        (n_rows,) = lengths
+
+        names = list(columns)
+        if cls.__init__ is not CHasTraits.__init__:
+            return [
+                cls(**dict(zip(names, row)))
+                for row in zip(*columns.values())
+            ]
+
+        listeners_pre_init, _ = cls.__listener_plan__
+        observers_pre_init, observers_post_init = cls.__observer_plan__
+        has_listeners = len(cls.__listener_traits__) > 0
+
+        instances = [cls.__new__(cls) for _ in range(n_rows)]
+        if has_listeners or observers_pre_init:
+            for instance in instances:
+                if has_listeners:
+                    instance._init_trait_listeners()
+                instance._apply_observer_plan(observers_pre_init)
+
+        # Values of simple traits that nothing observes can be stored
+        # directly once validated; the others are assigned as usual. Each
+        # column is stored before the next one is validated.
+        class_traits = cls.__class_traits__
+        observed = bool(listeners_pre_init or observers_pre_init)
+        for name, column in columns.items():
+            trait = class_traits.get(name)
+            if (
+                observed
+                or trait is None
+                or trait.type != "trait"
+                or trait.post_setattr is not None
+                or trait.slot_index >= 0
+                or trait._notifiers(False)
+            ):
+                for instance, value in zip(instances, column):
+                    setattr(instance, name, value)
+                continue
+
+            if _validates_without_object(trait):
+                values = trait.validate_items(instances[0], name, column)
+            else:
+                # Validators such as List's create values bound to the
+                # object, or may read its other traits.
+                validate = trait.validate
+                values = [
+                    validate(instance, name, value)
+                    for instance, value in zip(instances, column)
+                ]
+            if trait.setattr_original_value:
+                values = column
+            for instance, value in zip(instances, values):
+                instance.__dict__[name] = value
+
+        has_traits_init = cls.traits_init is not CHasTraits.traits_init
+        for instance in instances:
+            if has_listeners:
+                instance._post_init_trait_listeners()
+            if observers_post_init:
+                instance._apply_observer_plan(observers_post_init)
+            if has_traits_init:
+                instance.traits_init()
+            instance._trait_set_inited()
+
+        return instances
+
     def trait_get(self, *names, **metadata):
         """ Retrieve trait values for one or more traits.
 
@@ -1489,6 +2208,34 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
         """
         return self.trait_set(trait_change_notify=False, **traits)
 
+    def hold_trait_notifications(self):
+        """ Context manager that holds back and merges trait change
+        notifications for this object.
+
+        While the context is active, trait change notifications for this
+        object are queued. They are delivered when the context exits, with
+        all the changes of a trait merged into a single notification. See
+        the module-level :func:`hold_trait_notifications` for details.
+
+        Examples
+        --------
+        ::
+
+            with person.hold_trait_notifications():
+                person.name = "Bill"
+                person.age = 27
+        """
+        return hold_trait_notifications(self)
+
+    def _trait_notification_held(self, name, old, new):
+        """ Queue a trait change that occurred while notifications for this
+        object were held.
+
+        This method is called by the C trait machinery; it should not be
+        called directly.
+        """
+        held_notifications.add(self, name, old, new)
+
     def reset_traits(self, traits=None, **metadata):
         """ Resets some or all of an object's trait attributes to their default
         values.
@@ -2264,7 +3011,10 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
             else:
                 notifiers.append(wrapper)
 
-    def observe(self, handler, expression, *, remove=False, dispatch="same"):
+    def observe(
+        self, handler, expression, *, remove=False, dispatch="same",
+        lazy=False,
+    ):
         """ Causes the object to invoke a handler whenever a trait attribute
         matching a specified pattern is modified, or removes the association.
 
@@ -2312,11 +3062,14 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
         remove : boolean, optional
             Whether to remove the event handler. Default is to add the event
             handler.
-        dispatch : str, optional
-            A string indicating how the handler should be run.
-            Default is to run on the same thread where the change occurs.
+        dispatch : str or callable(handler, event), optional
+            A string indicating how the handler should be run, or a
+            dispatcher such as those returned by
+            :func:`~traits.observation.rate_limiting.debounce` and
+            :func:`~traits.observation.rate_limiting.throttle`. Default is
+            to run on the same thread where the change occurs.
 
-            Possible values are:
+            Possible string values are:
 
             =========== =======================================================
             value       dispatch
@@ -2327,8 +3080,26 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
                         thread is the UI thread, the notifications are executed
                         immediately; otherwise, they are placed on the UI
                         event queue.
+            ``pool``    Run notifications on the executor set with
+                        :func:`~.set_pool_executor`.
+            ``asyncio`` Run notifications on the event loop set with
+                        :func:`~traits.observation.api.set_asyncio_loop`.
             =========== =======================================================
 
+        lazy : boolean, optional
+            If true, the notifiers are only added to the objects reached by
+            following the expression once the object they are reached from
+            changes: when the observer is added, the objects one level down
+            are each given a cheap placeholder, which adds the object's
+            notifiers and places placeholders one level further down the
+            first time the object changes. Objects added later to an object
+            whose notifiers were added are observed at once, as without lazy.
+            Changes of the objects further down are not notified until then,
+            while observing large object graphs, such as
+            ``"children:items:value"`` on a big tree, costs the same however
+            large the graph is. This has no effect when removing. Default is
+            False.
+
         Raises
         ------
         NotifierNotFound
@@ -2340,8 +3111,9 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
             object=self,
             graphs=graphs,
             handler=handler,
-            dispatcher=_ObserverDispatchers[dispatch],
+            dispatcher=_observer_dispatcher(dispatch),
             remove=remove,
+            lazy=lazy,
         )
 
     def on_trait_change(
@@ -2556,6 +3328,8 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
                         event queue.
             ``fast_ui`` Alias for ``ui``.
             ``new``     Run notifications in a new thread.
+            ``pool``    Run notifications on the executor set with
+                        :func:`~.set_pool_executor`.
             =========== =======================================================
 
         See Also
@@ -2576,9 +3350,9 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
 
         from .traits_listener import (
             TraitsListener,
-            ListenerParser,
             ListenerHandler,
             ListenerNotifyWrapper,
+            parse_listener,
         )
 
         if isinstance(name, list):
@@ -2627,15 +3401,21 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
                 # wrapper, then we replace the `None` listener with the correct
                 # one.
                 lnw = ListenerNotifyWrapper(handler, self, name, None, target)
-                listener = ListenerParser(
-                    name,
-                    handler=ListenerHandler(handler),
-                    wrapped_handler_ref=weakref.ref(lnw),
-                    dispatch=dispatch,
-                    priority=priority,
-                    deferred=deferred,
-                    handler_type=lnw.type,
-                ).listener
+                listener = None
+                if getattr(type(self), TranslateListeners, False):
+                    listener = _translated_listener(
+                        name, lnw, dispatch, priority
+                    )
+                if listener is None:
+                    listener = parse_listener(
+                        name,
+                        handler=ListenerHandler(handler),
+                        wrapped_handler_ref=weakref.ref(lnw),
+                        dispatch=dispatch,
+                        priority=priority,
+                        deferred=deferred,
+                        handler_type=lnw.type,
+                    )
                 lnw.listener = listener
                 listener.register(self)
                 listeners.append(lnw)
@@ -3282,24 +4062,23 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
             registered, traits listeners (called at object creation and
             unpickling times).
         """
-        for name, data in self.__class__.__listener_traits__.items():
-            if data[0] == "method":
-                config = data[1]
-                if config["post_init"]:
-                    self.on_trait_change(
-                        getattr(self, name),
-                        config["pattern"],
-                        deferred=True,
-                        dispatch=config["dispatch"],
-                    )
+        _, post_init = self.__class__.__listener_plan__
+        for name, pattern, dispatch in post_init:
+            self.on_trait_change(
+                getattr(self, name),
+                pattern,
+                deferred=True,
+                dispatch=dispatch,
+            )
 
     def _init_trait_listeners(self):
         """ Initializes the object's statically parsed, but dynamically
             registered, traits listeners (called at object creation and
             unpickling times).
         """
-        for name, data in self.__class__.__listener_traits__.items():
-            getattr(self, "_init_trait_%s_listener" % data[0])(name, *data)
+        pre_init, _ = self.__class__.__listener_plan__
+        for method_name, name, data in pre_init:
+            getattr(self, method_name)(name, *data)
 
     def _init_trait_method_listener(self, name, kind, config):
         """ Sets up the listener for a method with the @on_trait_change
@@ -3402,28 +4181,28 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
     def _init_trait_observers(self):
         """ Initialize observers prior to setting object state.
         """
-        for name, states in self.__class__.__observer_traits__.items():
-            for state in states:
-                if not state["post_init"]:
-                    observe_api.apply_observers(
-                        object=self,
-                        handler=state["handler_getter"](self, name),
-                        graphs=state["graphs"],
-                        dispatcher=_ObserverDispatchers[state["dispatch"]],
-                    )
+        pre_init, _ = self.__class__.__observer_plan__
+        self._apply_observer_plan(pre_init)
 
     def _post_init_trait_observers(self):
         """ Initialize observers after setting object state.
         """
-        for name, states in self.__class__.__observer_traits__.items():
-            for state in states:
-                if state["post_init"]:
-                    observe_api.apply_observers(
-                        object=self,
-                        handler=state["handler_getter"](self, name),
-                        graphs=state["graphs"],
-                        dispatcher=_ObserverDispatchers[state["dispatch"]],
-                    )
+        _, post_init = self.__class__.__observer_plan__
+        self._apply_observer_plan(post_init)
+
+    def _apply_observer_plan(self, plan):
+        """ Hook up the observers in part of the class's observer plan.
+        """
+        for name, handler_getter, dispatch, templates in plan:
+            handler = handler_getter(self, name)
+            dispatcher = _observer_dispatcher(dispatch)
+            for template in templates:
+                template.add_notifiers(
+                    object=self,
+                    handler=handler,
+                    target=self,
+                    dispatcher=dispatcher,
+                )
 
     def _trait_delegate_name(self, name, pattern):
         """ Returns the fully-formed 'on_trait_change' name for a specified
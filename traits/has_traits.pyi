@@ -20,7 +20,7 @@ from .trait_notifiers import ExtendedTraitChangeNotifyWrapper as ExtendedTraitCh
 from .trait_types import Any as Any, Bool as Bool, Disallow as Disallow, Event as Event, Python as Python
 from .traits import ForwardProperty as ForwardProperty, Property as Property, Trait as Trait, generic_trait as generic_trait
 from .util.deprecated import deprecated as deprecated
-from typing import Optional, Any as _Any
+from typing import List, Optional, Any as _Any
 
 CHECK_INTERFACES: int
 
@@ -48,15 +48,18 @@ class _SimpleTest:
     def __call__(self, test: _Any): ...
 
 class MetaHasTraits(type):
-    def __new__(cls, class_name: _Any, bases: _Any, class_dict: _Any): ...
+    def __new__(cls, class_name: _Any, bases: _Any, class_dict: _Any, trait_slots: Optional[bool] = ..., translate_listeners: Optional[bool] = ...): ...
 
 def update_traits_class_dict(class_name: _Any, bases: _Any, class_dict: _Any): ...
+def assign_trait_slots(bases: _Any, class_dict: _Any) -> None: ...
 def migrate_property(name: _Any, property: _Any, property_info: _Any, class_dict: _Any): ...
-def observe(expression: _Any, post_init: bool = ..., dispatch: str = ...): ...
+def observe(expression: _Any, post_init: bool = ..., dispatch: _Any = ...): ...
 def on_trait_change(name: _Any, post_init: bool = ..., dispatch: str = ...): ...
 def cached_property(function: _Any): ...
 def property_depends_on(dependency: _Any, settable: bool = ..., flushable: bool = ...): ...
 def weak_arg(arg: _Any): ...
+def hold_trait_notifications(*objects: _Any): ...
+def trusted_state_restore(): ...
 
 class HasTraits(CHasTraits, metaclass=MetaHasTraits):
     _traits_cache__: _Any = ...
@@ -71,9 +74,12 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
     def trait_subclasses(cls, all: bool = ...): ...
     def has_traits_interface(self, *interfaces: _Any): ...
     def __reduce_ex__(self, protocol: _Any): ...
+    @classmethod
+    def from_columns(cls, columns: _Any) -> List[_Any]: ...
     def trait_get(self, *names: _Any, **metadata: _Any): ...
     def trait_set(self, trait_change_notify: bool = ..., **traits: _Any): ...
     def trait_setq(self, **traits: _Any): ...
+    def hold_trait_notifications(self): ...
     def reset_traits(self, traits: Optional[_Any] = ..., **metadata: _Any): ...
     def copyable_trait_names(self, **metadata: _Any): ...
     def all_trait_names(self): ...
@@ -101,7 +107,7 @@ class HasTraits(CHasTraits, metaclass=MetaHasTraits):
     @classmethod
     def class_visible_traits(cls): ...
     def print_traits(self, show_help: bool = ..., **metadata: _Any) -> None: ...
-    def observe(self, handler: _Any, expression: _Any, remove: bool = ..., dispatch: str = ...) -> None: ...
+    def observe(self, handler: _Any, expression: _Any, remove: bool = ..., dispatch: _Any = ..., lazy: bool = ...) -> None: ...
     def on_trait_change(self, handler: _Any, name: Optional[_Any] = ..., remove: bool = ..., dispatch: str = ..., priority: bool = ..., deferred: bool = ..., target: Optional[_Any] = ...) -> None: ...
     on_trait_event: _Any = ...
     def sync_trait(self, trait_name: _Any, object: _Any, alias: Optional[_Any] = ..., mutual: bool = ..., remove: bool = ...): ...
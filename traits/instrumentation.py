@@ -0,0 +1,173 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Runtime instrumentation of trait attribute access.
+
+While instrumentation is enabled, each trait counts the reads, assignments
+and validations of its values, and the calls made to notifiers of changes
+to it. Optionally, the time spent in each of these operations is added up
+as well. The counting is done in the ``ctraits`` extension module, and
+costs close to nothing while instrumentation is disabled.
+
+Example::
+
+    from traits import instrumentation
+
+    with instrumentation.instrumented(timing=True):
+        run_application()
+
+    for stats in instrumentation.snapshot():
+        print(stats.owner.__name__, stats.name, stats.sets, stats.set_time)
+
+Note that a trait used while instrumentation is enabled is kept alive until
+``reset`` is called, even if it is disabled in the meantime.
+"""
+
+import collections
+import contextlib
+
+from traits.ctraits import (
+    _get_instrumentation,
+    _instrumentation_snapshot,
+    _reset_instrumentation,
+    _set_instrumentation,
+)
+
+#: Statistics of the use of a trait while instrumentation was enabled.
+#:
+#: *owner* is the class of the first object the trait was used on, and
+#: *name* is the name of the trait. The counts of reads, assignments,
+#: validations and notifier calls are *gets*, *sets*, *validations* and
+#: *notifications*. The ``*_time`` fields give the total time, in seconds,
+#: spent in each kind of operation, or 0.0 if timing wasn't enabled. Times
+#: are inclusive: for example, *set_time* includes the time spent
+#: validating the values assigned and notifying of the changes.
+TraitStatistics = collections.namedtuple(
+    "TraitStatistics",
+    [
+        "owner",
+        "name",
+        "gets",
+        "sets",
+        "validations",
+        "notifications",
+        "get_time",
+        "set_time",
+        "validate_time",
+        "notify_time",
+    ],
+)
+
+#: Number of nanoseconds in a second.
+_NS_PER_SECOND = 1e9
+
+
+def enable(timing=False):
+    """ Enable instrumentation.
+
+    Statistics gathered previously are kept; use ``reset`` to discard them.
+
+    Parameters
+    ----------
+    timing : bool, optional
+        Whether to time operations, as well as count them. Timing costs
+        more than counting, so is disabled by default.
+    """
+    _set_instrumentation(True, timing)
+
+
+def disable():
+    """ Disable instrumentation.
+
+    The statistics gathered so far are kept, and can still be retrieved
+    with ``snapshot``.
+    """
+    _set_instrumentation(False, False)
+
+
+def is_enabled():
+    """ Return whether instrumentation is enabled.
+
+    Returns
+    -------
+    enabled : bool
+    """
+    enabled, _ = _get_instrumentation()
+    return enabled
+
+
+def reset():
+    """ Discard all of the statistics gathered so far.
+
+    This also releases the traits kept alive by the instrumentation.
+    """
+    _reset_instrumentation()
+
+
+@contextlib.contextmanager
+def instrumented(timing=False):
+    """ Context manager enabling instrumentation for the duration of a
+    block, and restoring the previous state on exit.
+
+    Parameters
+    ----------
+    timing : bool, optional
+        Whether to time operations, as well as count them.
+    """
+    previous = _get_instrumentation()
+    _set_instrumentation(True, timing)
+    try:
+        yield
+    finally:
+        _set_instrumentation(*previous)
+
+
+def snapshot():
+    """ Return the statistics gathered so far.
+
+    The statistics of traits with the same name used on objects of the same
+    class are combined. That's the case for the instance copies of a class
+    trait created when an instance gets its own notifiers for the trait.
+
+    Returns
+    -------
+    statistics : list of TraitStatistics
+        The statistics, ordered by class and trait name.
+    """
+    totals = {}
+    for trait, name, owner, *counts in _instrumentation_snapshot():
+        key = (owner, name)
+        if key in totals:
+            counts = [a + b for a, b in zip(totals[key], counts)]
+        totals[key] = counts
+
+    statistics = []
+    for (owner, name), counts in totals.items():
+        gets, sets, validations, notifications, *times = counts
+        statistics.append(
+            TraitStatistics(
+                owner,
+                name,
+                gets,
+                sets,
+                validations,
+                notifications,
+                *[time / _NS_PER_SECOND for time in times],
+            )
+        )
+    statistics.sort(
+        key=lambda stats: (
+            stats.owner.__module__,
+            stats.owner.__qualname__,
+            str(stats.name),
+        )
+    )
+    return statistics
@@ -0,0 +1,216 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Recursive-descent parser for the observe mini-language.
+
+This parser accepts exactly the language described by ``_dsl_grammar.lark``,
+and produces the same trees as the standalone Lark parser generated from
+that grammar in ``_generated_parser.py``, up to the names of the rules
+for expressions in terminal positions (e.g. "series" for "series_terminal").
+It is much faster than the generated parser, and doesn't need its tables
+to be loaded.
+
+The parser doesn't try to explain what is wrong with an invalid expression:
+it raises ``ParseError``, and the Lark parser can then be used to produce a
+detailed error.
+"""
+
+import re
+
+# Tokens of the mini-language. Whitespace is as defined by common.WS in Lark.
+_TOKEN_PATTERN = re.compile(
+    r"(?P<WS>[ \t\f\r\n]+)|(?P<NAME>[a-zA-Z_]\w*)|(?P<PUNCT>[.:,\[\]+*])"
+)
+
+# Special tokens marking the end of the text and the keyword "items".
+_END = "$END"
+_ITEMS = "items"
+
+# Rule names for the series connectors.
+_CONNECTORS = {".": "notify", ":": "quiet"}
+
+
+class ParseError(Exception):
+    """ Raised when the text is not a valid expression. """
+
+
+class Tree:
+    """ A node in the parse tree, with the same interface as Lark trees.
+
+    Parameters
+    ----------
+    data : str
+        The name of the grammar rule.
+    children : list of Tree or Token
+        The children of the node.
+    """
+
+    __slots__ = ("data", "children")
+
+    def __init__(self, data, children):
+        self.data = data
+        self.children = children
+
+    def __repr__(self):
+        return "Tree({!r}, {!r})".format(self.data, self.children)
+
+
+class Token:
+    """ A NAME token in the parse tree, with the same interface as Lark
+    tokens.
+
+    Parameters
+    ----------
+    value : str
+        The matched text.
+    """
+
+    __slots__ = ("value",)
+
+    type = "NAME"
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return "Token({!r}, {!r})".format(self.type, self.value)
+
+
+def parse(text):
+    """ Parse an expression of the observe mini-language.
+
+    Parameters
+    ----------
+    text : str
+        Text to be parsed.
+
+    Returns
+    -------
+    tree : Tree
+
+    Raises
+    ------
+    ParseError
+        If the text is not a valid expression.
+    """
+    parser = _Parser(_tokenize(text))
+    tree = parser.parse_parallel(terminal=True)
+    parser.expect(_END)
+    return tree
+
+
+def _tokenize(text):
+    """ Split text into a list of tokens.
+
+    NAME tokens are returned as ``Token`` instances, apart from the keyword
+    "items". Punctuation is returned as single-character strings. The list
+    ends with ``_END``.
+    """
+    tokens = []
+    append = tokens.append
+    match = _TOKEN_PATTERN.match
+    position = 0
+    length = len(text)
+    while position < length:
+        token_match = match(text, position)
+        if token_match is None:
+            raise ParseError(
+                "Unexpected character at position {}".format(position)
+            )
+        kind = token_match.lastgroup
+        if kind == "NAME":
+            value = token_match.group()
+            append(_ITEMS if value == _ITEMS else Token(value))
+        elif kind == "PUNCT":
+            append(token_match.group())
+        position = token_match.end()
+    append(_END)
+    return tokens
+
+
+class _Parser:
+    """ Recursive-descent parser over a list of tokens.
+
+    Parameters
+    ----------
+    tokens : list
+        Tokens, as returned by ``_tokenize``.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        """ Return the next token, without consuming it. """
+        return self.tokens[self.position]
+
+    def next(self):
+        """ Consume and return the next token. """
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def expect(self, expected):
+        """ Consume the next token, which must be equal to *expected*. """
+        token = self.next()
+        if token != expected:
+            raise ParseError(
+                "Expected {!r}, got {!r}".format(expected, token)
+            )
+
+    def parse_parallel(self, terminal):
+        """ Parse the "parallel" rule, e.g. "a, b.c", or the
+        "parallel_terminal" rule if *terminal* is true.
+        """
+        tree = self.parse_series(terminal)
+        while self.peek() == ",":
+            self.next()
+            tree = Tree("parallel", [tree, self.parse_series(terminal)])
+        return tree
+
+    def parse_series(self, terminal):
+        """ Parse the "series" rule, e.g. "a.b:c", or the "series_terminal"
+        rule if *terminal* is true.
+
+        In a terminal position, the last element may be "*".
+        """
+        tree = element = self.parse_element(terminal)
+        while element.data != "anytrait" and self.peek() in _CONNECTORS:
+            connector = Tree(_CONNECTORS[self.next()], [])
+            element = self.parse_element(terminal)
+            tree = Tree("series", [tree, connector, element])
+        return tree
+
+    def parse_element(self, terminal):
+        """ Parse an element: a trait name, "items", a metadata name or a
+        bracketed "parallel" expression. If *terminal* is true, the element
+        may also be "*".
+        """
+        token = self.next()
+        if isinstance(token, Token):
+            return Tree("trait", [token])
+        if token == _ITEMS:
+            return Tree("items", [])
+        if token == "+":
+            name = self.next()
+            if name == _ITEMS:
+                # After "+", "items" is an ordinary name.
+                return Tree("metadata", [Token(_ITEMS)])
+            if isinstance(name, Token):
+                return Tree("metadata", [name])
+            raise ParseError("Expected a name, got {!r}".format(name))
+        if token == "*" and terminal:
+            return Tree("anytrait", [])
+        if token == "[":
+            tree = self.parse_parallel(terminal=False)
+            self.expect("]")
+            return tree
+        raise ParseError("Unexpected token {!r}".format(token))
@@ -0,0 +1,68 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Global tracers of the events dispatched by observers, the counterpart of
+the change event tracers of ``traits.trait_notifiers`` for ``observe``.
+
+The notifiers read ``pre_event_tracer`` and ``post_event_tracer`` from this
+module each time they dispatch an event, so that the tracers can be changed
+at any time with ``set_event_tracers``.
+"""
+
+#: Tracer called before an event is dispatched, or None.
+pre_event_tracer = None
+
+#: Tracer called after an event is dispatched, or None.
+post_event_tracer = None
+
+
+def set_event_tracers(pre_tracer=None, post_tracer=None):
+    """ Set the global tracers of the events dispatched by observers.
+
+    The tracers are called for events dispatched to the handlers given to
+    ``observe``, and for events dispatched to the internal handlers that
+    maintain observers when an object in an observed graph changes.
+
+    There are two tracers: ``pre_tracer`` is called before the event is
+    dispatched; ``post_tracer`` is called after the event is dispatched,
+    even if the handler failed with an exception (in which case the
+    ``post_tracer`` is called before the exception is handled). Their
+    signatures are::
+
+        pre_tracer(event, handler)
+        post_tracer(event, handler, exception=None)
+
+    Parameters
+    ----------
+    pre_tracer : callable or None
+        The tracer to call before dispatching an event.
+    post_tracer : callable or None
+        The tracer to call after dispatching an event.
+    """
+    global pre_event_tracer
+    global post_event_tracer
+    pre_event_tracer = pre_tracer
+    post_event_tracer = post_tracer
+
+
+def get_event_tracers():
+    """ Get the currently active global event tracers.
+
+    Returns
+    -------
+    tracers : tuple of (callable or None, callable or None)
+        The pre and post tracers.
+    """
+    return pre_event_tracer, post_event_tracer
+
+
+def clear_event_tracers():
+    """ Clear the global event tracers. """
+    set_event_tracers(None, None)
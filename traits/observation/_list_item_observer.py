@@ -13,6 +13,7 @@ from traits.observation._i_observer import IObserver
 from traits.observation._trait_event_notifier import TraitEventNotifier
 from traits.observation._observe import add_or_remove_notifiers
 from traits.observation._observer_change_notifier import ObserverChangeNotifier
+from traits.trait_array_list_object import TraitArrayList
 from traits.trait_list_object import TraitList
 
 
@@ -75,7 +76,7 @@ class ListItemObserver:
             If the given object is not an observable list and the observer is
             not optional.
         """
-        if not isinstance(object, TraitList):
+        if not isinstance(object, (TraitList, TraitArrayList)):
             if self.optional:
                 return
             raise ValueError(
@@ -105,7 +106,7 @@ class ListItemObserver:
             If the given object is not an observable list and the observer is
             not optional.
         """
-        if not isinstance(object, TraitList):
+        if not isinstance(object, (TraitList, TraitArrayList)):
             if self.optional:
                 return
             raise ValueError(
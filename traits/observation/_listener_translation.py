@@ -0,0 +1,720 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Translation of ``on_trait_change`` patterns into observers.
+
+HasTraits classes created with ``translate_listeners=True`` implement the
+extended trait names given to ``on_trait_change`` with ``ObserverGraph``
+objects rather than with the trees of ``ListenerItem`` objects built by
+``traits_listener``. The handler is still called with the arguments it would
+receive from ``on_trait_change``: ``TranslatedListener`` converts the change
+events emitted by the observers back into ``(object, name, old, new)``
+arguments, including the ``TraitListEvent``, ``TraitDictEvent`` and
+``TraitSetEvent`` values reported for the "*name*_items" traits.
+
+The translation is made from the parsed listener, so it follows the quirks of
+``on_trait_change``: for example, changes to list items in the middle of a
+pattern are only reported to handlers taking no arguments. Patterns whose
+behaviour can't be reproduced with observers raise
+``ListenerTranslationError``.
+"""
+
+from functools import lru_cache, reduce
+import operator
+
+from traits.ctraits import CHasTraits
+from traits.observation._dict_change_event import (
+    DictChangeEvent,
+    dict_event_factory,
+)
+from traits.observation._has_traits_helpers import UNOBSERVABLE_VALUES
+from traits.observation._i_observer import IObserver
+from traits.observation._list_change_event import (
+    ListChangeEvent,
+    list_event_factory,
+)
+from traits.observation._observe import add_or_remove_notifiers
+from traits.observation._observer_change_notifier import ObserverChangeNotifier
+from traits.observation._set_change_event import (
+    SetChangeEvent,
+    set_event_factory,
+)
+from traits.observation._trait_change_event import TraitChangeEvent
+from traits.observation._trait_event_notifier import TraitEventNotifier
+from traits.observation.expression import (
+    compile_expr,
+    match,
+    SingleObserverExpression,
+    trait,
+)
+from traits.observation.observe import apply_observers, dispatch_same
+from traits.trait_array_list_object import TraitArrayList
+from traits.trait_base import Undefined
+from traits.trait_dict_object import TraitDict, TraitDictEvent
+from traits.trait_errors import TraitError
+from traits.trait_list_object import TraitList, TraitListEvent
+from traits.trait_notifiers import (
+    handle_exception,
+    pool_dispatch,
+    ui_dispatch,
+)
+from traits.trait_set_object import TraitSet, TraitSetEvent
+from traits.traits_listener import (
+    _listener_template,
+    ANY_LISTENER,
+    DST_LISTENER,
+    ListenerGroup,
+)
+
+#: Maximum number of translated patterns to cache.
+_TRANSLATION_CACHE_MAXSIZE = 256
+
+# Mapping from on_trait_change dispatch values to observe dispatchers.
+_DISPATCHERS = {
+    "same": dispatch_same,
+    "ui": ui_dispatch,
+    "fast_ui": ui_dispatch,
+    "pool": pool_dispatch,
+}
+
+# Types of the containers whose items are reached by a pattern.
+_CONTAINER_TYPES = (TraitList, TraitArrayList, TraitDict, TraitSet)
+
+# Message of the error raised by on_trait_change when a handler that takes
+# the final value of a pattern can't be given a value.
+_INCOMPATIBLE_SIGNATURE = (
+    "on_trait_change handler signature is incompatible with a change to an "
+    "intermediate trait"
+)
+
+
+class ListenerTranslationError(Exception):
+    """ Raised when an ``on_trait_change`` pattern can't be implemented with
+    observers without changing its behaviour.
+    """
+
+
+def translate_listener(
+    text, *, wrapped_handler_ref, dispatch, priority, handler_type
+):
+    """ Return a listener implementing an extended trait name with observers.
+
+    Parameters
+    ----------
+    text : str
+        The extended trait name, as given to ``on_trait_change``.
+    wrapped_handler_ref : weakref.ref
+        Weak reference to the ListenerNotifyWrapper wrapping the handler.
+    dispatch : str
+        The dispatch mechanism to use when invoking the handler.
+    priority : bool
+        True if the handler must go at the beginning of the notification
+        handlers list.
+    handler_type : int
+        The type of handler being used; one of {ANY_LISTENER, SRC_LISTENER,
+        DST_LISTENER}.
+
+    Returns
+    -------
+    listener : TranslatedListener
+
+    Raises
+    ------
+    ListenerTranslationError
+        If the listener can't be implemented with observers.
+    TraitError
+        If the text is not a valid extended trait name.
+    """
+    if priority:
+        raise ListenerTranslationError(
+            "observers have no equivalent of priority notifications"
+        )
+    dispatcher = _DISPATCHERS.get(dispatch)
+    if dispatcher is None:
+        raise ListenerTranslationError(
+            "observers have no equivalent of dispatch={!r}".format(dispatch)
+        )
+
+    translation = _translate(text, handler_type)
+    if isinstance(translation, str):
+        raise ListenerTranslationError(translation)
+
+    graphs, dst_graphs, dst_paths = translation
+    if dst_graphs and dispatch != "same":
+        raise ListenerTranslationError(
+            "the handler signature requires dispatch='same'"
+        )
+    return TranslatedListener(
+        graphs=graphs,
+        dst_graphs=dst_graphs,
+        dst_paths=dst_paths,
+        wrapped_handler_ref=wrapped_handler_ref,
+        dispatcher=dispatcher,
+    )
+
+
+class TranslatedListener:
+    """ Listener for an extended trait name, implemented with observers.
+
+    This has the ``register`` and ``unregister`` methods of ``ListenerBase``,
+    so that it can be used as the listener of a ListenerNotifyWrapper.
+
+    Parameters
+    ----------
+    graphs : tuple of ObserverGraph
+        Graphs whose changes are reported to the handler as they are.
+    dst_graphs : tuple of ObserverGraph
+        Graphs observing the first trait of the patterns for which handlers
+        taking one or two arguments are given the final value instead.
+    dst_paths : dict
+        Mapping from the names of those traits to the names of the traits
+        between them and the final trait, as tuples.
+    wrapped_handler_ref : weakref.ref
+        Weak reference to the ListenerNotifyWrapper wrapping the handler.
+    dispatcher : callable(callable, event)
+        Callable for dispatching the handlers of the observers.
+    """
+
+    def __init__(
+        self, *, graphs, dst_graphs, dst_paths, wrapped_handler_ref, dispatcher
+    ):
+        self.graphs = graphs
+        self.dst_graphs = dst_graphs
+        self.dst_paths = dst_paths
+        self.wrapped_handler_ref = wrapped_handler_ref
+        self.dispatcher = dispatcher
+
+    def register(self, new):
+        """ Registers the observers on an object.
+        """
+        self._apply(new, remove=False)
+
+    def unregister(self, old):
+        """ Unregisters the observers from an object.
+        """
+        self._apply(old, remove=True)
+
+    def handle_event(self, event):
+        """ Calls the handler with the arguments equivalent to a change event.
+        """
+        arguments = _legacy_arguments(event)
+        wrapped_handler = self.wrapped_handler_ref()
+        if arguments is not None and wrapped_handler is not None:
+            wrapped_handler(*arguments)
+
+    def handle_dst_event(self, event):
+        """ Calls the handler with the final trait of the pattern when one of
+        the traits leading to it changes.
+        """
+        arguments = _legacy_arguments(event)
+        if arguments is None:
+            return
+
+        object, name, old, new = arguments
+        try:
+            if not isinstance(event, TraitChangeEvent):
+                raise TraitError(_INCOMPATIBLE_SIGNATURE)
+            *path, name = self.dst_paths[name]
+            object = new
+            for link in path:
+                object = getattr(_check_link(object, link), link)
+            object = _check_link(object, name)
+        except Exception:
+            handle_exception(*arguments)
+            return
+
+        wrapped_handler = self.wrapped_handler_ref()
+        if wrapped_handler is not None:
+            new = getattr(object, name, Undefined)
+            wrapped_handler(object, name, old, new)
+
+    def _apply(self, object, remove):
+        """ Adds or removes the observers on an object. """
+        apply_observers(
+            object,
+            graphs=self.graphs,
+            handler=self.handle_event,
+            dispatcher=self.dispatcher,
+            remove=remove,
+        )
+        if self.dst_graphs:
+            apply_observers(
+                object,
+                graphs=self.dst_graphs,
+                handler=self.handle_dst_event,
+                dispatcher=self.dispatcher,
+                remove=remove,
+            )
+
+
+@IObserver.register
+class LinkValueObserver:
+    """ Observer for the value of a trait in an ``on_trait_change`` pattern.
+
+    ``on_trait_change`` applies the rest of a pattern to the items of the
+    list, set or dict held by a trait, or else to the value of the trait
+    itself. If the value is one of those containers, this observer observes
+    its mutations and yields its items (or values for a dict). Other values
+    are yielded as they are.
+
+    Parameters
+    ----------
+    notify : boolean
+        Whether to notify for mutations of the containers.
+    """
+
+    __slots__ = ("notify",)
+
+    def __init__(self, *, notify):
+        self.notify = notify
+
+    def __hash__(self):
+        """ Return a hash of this object."""
+        return hash((type(self).__name__, self.notify))
+
+    def __eq__(self, other):
+        """ Return true if this observer is equal to the given one."""
+        return type(self) is type(other) and self.notify == other.notify
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(notify={self.notify!r})"
+
+    def iter_observables(self, object):
+        """ Yield the given object if it is an observable container.
+
+        Parameters
+        ----------
+        object: object
+            Object provided by another observers or by the user.
+
+        Yields
+        ------
+        IObservable
+        """
+        if isinstance(object, _CONTAINER_TYPES):
+            yield object
+
+    def iter_objects(self, object):
+        """ Yield the items of the given object if it is an observable
+        container, or else the object itself.
+
+        Parameters
+        ----------
+        object: object
+            Object provided by another observers or by the user.
+
+        Yields
+        ------
+        value : object
+        """
+        if isinstance(object, _CONTAINER_TYPES):
+            yield from _observable_items(_container_items(object))
+        else:
+            yield object
+
+    def get_notifier(self, handler, target, dispatcher):
+        """ Return a notifier for calling the user handler with the change
+        event.
+
+        Returns
+        -------
+        notifier : TraitEventNotifier
+        """
+        return TraitEventNotifier(
+            handler=handler,
+            target=target,
+            dispatcher=dispatcher,
+            event_factory=_container_event_factory,
+            prevent_event=lambda event: False,
+        )
+
+    def get_maintainer(self, graph, handler, target, dispatcher):
+        """ Return a notifier for maintaining downstream observers when
+        a container is mutated.
+
+        Parameters
+        ----------
+        graph : ObserverGraph
+            Description for the *downstream* observers, i.e. excluding self.
+        handler : callable
+            User handler.
+        target : object
+            Object seen by the user as the owner of the observer.
+        dispatcher : callable
+            Callable for dispatching the handler.
+
+        Returns
+        -------
+        notifier : ObserverChangeNotifier
+        """
+        return ObserverChangeNotifier(
+            observer_handler=_observer_change_handler,
+            event_factory=_container_event_factory,
+            prevent_event=lambda event: False,
+            graph=graph,
+            handler=handler,
+            target=target,
+            dispatcher=dispatcher,
+        )
+
+    def iter_extra_graphs(self, graph):
+        """ Yield new ObserverGraph to be contributed by this observer.
+
+        Parameters
+        ----------
+        graph : ObserverGraph
+            The graph this observer is part of.
+
+        Yields
+        ------
+        ObserverGraph
+        """
+        yield from ()
+
+
+class ListenerTraitFilter:
+    """ Filter for the traits matched by a wildcard item of an
+    ``on_trait_change`` pattern, such as "prefix+metadata_name".
+
+    Events are never matched, as with ``on_trait_change``.
+
+    Parameters
+    ----------
+    prefix : str
+        Prefix of the names of the traits to match.
+    metadata_name : str
+        Name of the metadata that the traits must have, or must not have,
+        or "" to match traits regardless of their metadata.
+    metadata_defined : bool
+        True if the traits must have the metadata, False if they must not.
+    """
+
+    __slots__ = ("prefix", "metadata_name", "metadata_defined")
+
+    def __init__(self, prefix, metadata_name, metadata_defined):
+        self.prefix = prefix
+        self.metadata_name = metadata_name
+        self.metadata_defined = metadata_defined
+
+    def __call__(self, name, trait):
+        if trait.type == "event" or not name.startswith(self.prefix):
+            return False
+        if self.metadata_name == "":
+            return True
+        # If the metadata is not defined, CTrait returns None.
+        defined = getattr(trait, self.metadata_name) is not None
+        return defined == self.metadata_defined
+
+    def __eq__(self, other):
+        return (
+            type(self) is type(other)
+            and self.prefix == other.prefix
+            and self.metadata_name == other.metadata_name
+            and self.metadata_defined == other.metadata_defined
+        )
+
+    def __hash__(self):
+        return hash((
+            type(self).__name__,
+            self.prefix,
+            self.metadata_name,
+            self.metadata_defined,
+        ))
+
+    def __repr__(self):
+        return (
+            "{self.__class__.__name__}(prefix={self.prefix!r}, "
+            "metadata_name={self.metadata_name!r}, "
+            "metadata_defined={self.metadata_defined!r})".format(self=self)
+        )
+
+
+@lru_cache(maxsize=_TRANSLATION_CACHE_MAXSIZE)
+def _translate(text, handler_type):
+    """ Translate an extended trait name into observer graphs.
+
+    Returns
+    -------
+    translation : tuple or str
+        A ``(graphs, dst_graphs, dst_paths)`` tuple, or the reason why the
+        name can't be translated.
+    """
+    listener = _listener_template(text, False, handler_type)
+    try:
+        expression = _translate_listener(listener, frozenset())
+        dst_expressions = []
+        dst_paths = {}
+        if handler_type == DST_LISTENER:
+            for item in _iter_items(listener):
+                if item.next is not None and item.notify:
+                    dst_expressions.append(_dst_expression(item, dst_paths))
+    except ListenerTranslationError as error:
+        return str(error)
+
+    graphs = tuple(compile_expr(expression))
+    dst_graphs = ()
+    if dst_expressions:
+        dst_graphs = tuple(compile_expr(reduce(operator.or_, dst_expressions)))
+    return graphs, dst_graphs, dst_paths
+
+
+def _translate_listener(listener, seen):
+    """ Return the ObserverExpression equivalent to a ListenerBase.
+
+    Parameters
+    ----------
+    listener : ListenerBase
+        The parsed listener.
+    seen : frozenset of int
+        Ids of the listeners leading to this one.
+    """
+    if id(listener) in seen:
+        raise ListenerTranslationError(
+            "observers have no equivalent of recursive patterns"
+        )
+    seen = seen | {id(listener)}
+
+    if isinstance(listener, ListenerGroup):
+        return reduce(
+            operator.or_,
+            (_translate_listener(item, seen) for item in listener.items),
+        )
+
+    if listener.is_anytrait:
+        raise ListenerTranslationError(
+            "observers have no equivalent of '-' items"
+        )
+    if listener.is_list_handler:
+        raise ListenerTranslationError(
+            "observers have no equivalent of '[]' items"
+        )
+
+    if listener.next is None:
+        expression = _item_expression(listener, notify=True)
+        if listener.type == ANY_LISTENER:
+            expression = expression.then(_link_value(notify=True))
+        return expression
+
+    # Handlers taking the final value are called from separate graphs.
+    notify = listener.notify and listener.type != DST_LISTENER
+    items_notify = listener.notify and listener.type == ANY_LISTENER
+    return (
+        _item_expression(listener, notify=notify)
+        .then(_link_value(notify=items_notify))
+        .then(_translate_listener(listener.next, seen))
+    )
+
+
+def _dst_expression(item, dst_paths):
+    """ Return the expression observing the first trait of a pattern for a
+    handler taking the final value of the pattern, recording the path to
+    the final trait in *dst_paths*.
+    """
+    if not _is_plain_name(item.name) or item.name in dst_paths:
+        raise ListenerTranslationError(
+            "the handler signature requires the pattern to be a chain of "
+            "trait names"
+        )
+
+    path = []
+    link = item.next
+    while link is not None:
+        if isinstance(link, ListenerGroup) or not _is_plain_name(link.name):
+            raise ListenerTranslationError(
+                "the handler signature requires the pattern to be a chain "
+                "of trait names"
+            )
+        path.append(link.name)
+        link = link.next
+    dst_paths[item.name] = tuple(path)
+
+    return trait(item.name).then(_link_value(notify=True))
+
+
+def _item_expression(item, notify):
+    """ Return the expression observing the traits matched by a ListenerItem.
+    """
+    name = item.name
+    if name.endswith("*"):
+        filter = ListenerTraitFilter(
+            name[:-1], item.metadata_name, item.metadata_defined
+        )
+        return match(filter, notify=notify)
+    if name.endswith("?"):
+        return trait(name[:-1], notify=notify, optional=True)
+    return trait(name, notify=notify)
+
+
+def _link_value(notify):
+    """ Return the expression for a LinkValueObserver. """
+    return SingleObserverExpression(LinkValueObserver(notify=notify))
+
+
+def _iter_items(listener):
+    """ Yield the ListenerItems at the top level of a listener. """
+    if isinstance(listener, ListenerGroup):
+        for item in listener.items:
+            yield from _iter_items(item)
+    else:
+        yield listener
+
+
+def _is_plain_name(name):
+    """ Return true if a ListenerItem name is a trait name. """
+    return not name.endswith(("*", "?"))
+
+
+def _check_link(object, name):
+    """ Check that an object has a trait on the way to the final trait of a
+    pattern, and return it.
+    """
+    if not isinstance(object, CHasTraits):
+        raise TraitError(_INCOMPATIBLE_SIGNATURE)
+    if object.base_trait(name) is None:
+        raise TraitError(
+            "'%s' object has no '%s' trait"
+            % (object.__class__.__name__, name)
+        )
+    return object
+
+
+def _legacy_arguments(event):
+    """ Return the arguments that ``on_trait_change`` would give a handler
+    for an event, or None if no handler would be called.
+
+    Parameters
+    ----------
+    event : TraitChangeEvent, ListChangeEvent, DictChangeEvent or
+            SetChangeEvent
+
+    Returns
+    -------
+    arguments : tuple or None
+        An ``(object, name, old, new)`` tuple.
+    """
+    if isinstance(event, TraitChangeEvent):
+        return event.object, event.name, event.old, event.new
+
+    # Mutations are reported by the "_items" trait of the object that holds
+    # the container.
+    container = event.object
+    name_items = getattr(container, "name_items", None)
+    if name_items is None:
+        return None
+    object = container.object()
+    if object is None or getattr(object, container.name) is not container:
+        return None
+
+    if isinstance(event, ListChangeEvent):
+        new = TraitListEvent(
+            index=event.index, removed=event.removed, added=event.added
+        )
+    elif isinstance(event, SetChangeEvent):
+        new = TraitSetEvent(removed=event.removed, added=event.added)
+    else:
+        # DictChangeEvent reports updated items as removed and added.
+        removed = event.removed
+        added = event.added
+        new = TraitDictEvent(
+            removed={
+                key: value for key, value in removed.items()
+                if key not in added
+            },
+            added={
+                key: value for key, value in added.items()
+                if key not in removed
+            },
+            changed={
+                key: value for key, value in removed.items()
+                if key in added
+            },
+        )
+    return object, name_items, Undefined, new
+
+
+def _container_items(container):
+    """ Return the items of a container reached by a pattern. """
+    if isinstance(container, TraitDict):
+        return container.values()
+    return container
+
+
+def _observable_items(items):
+    """ Yield the items that the rest of a pattern applies to. """
+    for item in items:
+        if all(item is not skipped for skipped in UNOBSERVABLE_VALUES):
+            yield item
+
+
+def _container_event_factory(container, *args):
+    """ Create the change event for a mutation of any container.
+
+    Parameters
+    ----------
+    container : TraitList, TraitArrayList, TraitDict or TraitSet
+        The container being mutated.
+    *args
+        The other arguments given to the notifiers by the container.
+
+    Returns
+    -------
+    event : ListChangeEvent, DictChangeEvent or SetChangeEvent
+    """
+    if isinstance(container, TraitDict):
+        return dict_event_factory(container, *args)
+    if isinstance(container, TraitSet):
+        return set_event_factory(container, *args)
+    return list_event_factory(container, *args)
+
+
+def _observer_change_handler(event, graph, handler, target, dispatcher):
+    """ Handler for maintaining observers. Used by ObserverChangeNotifier.
+
+    The downstream notifiers are removed from items removed from the
+    container. Likewise, downstream notifiers are added to items added to
+    the container.
+
+    Parameters
+    ----------
+    event : ListChangeEvent, DictChangeEvent or SetChangeEvent
+        Change event that triggers the maintainer.
+    graph : ObserverGraph
+        Description for the *downstream* observers, i.e. excluding self.
+    handler : callable
+        User handler.
+    target : object
+        Object seen by the user as the owner of the observer.
+    dispatcher : callable
+        Callable for dispatching the handler.
+    """
+    removed = event.removed
+    added = event.added
+    if isinstance(event, DictChangeEvent):
+        removed = removed.values()
+        added = added.values()
+
+    for removed_item in _observable_items(removed):
+        add_or_remove_notifiers(
+            object=removed_item,
+            graph=graph,
+            handler=handler,
+            target=target,
+            dispatcher=dispatcher,
+            remove=True,
+        )
+    for added_item in _observable_items(added):
+        add_or_remove_notifiers(
+            object=added_item,
+            graph=graph,
+            handler=handler,
+            target=target,
+            dispatcher=dispatcher,
+            remove=False,
+        )
@@ -0,0 +1,219 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Keyed index of the notifiers of an observable.
+
+Notifiers such as ``TraitEventNotifier`` find the notifier equivalent to
+themselves in an observable's list of notifiers when they are added or
+removed. When an observable has many notifiers, e.g. a trait observed by
+thousands of objects, scanning the list each time makes adding and removing
+notifiers quadratic. Once an observable has ``INDEX_THRESHOLD`` notifiers,
+the search uses an index of the notifiers, keyed on the identity of their
+handler, target and dispatcher, instead.
+
+Notifiers that can be indexed provide an ``_index_key`` method, returning
+a hashable key that is equal for equivalent notifiers, or None if the
+notifier can't be indexed.
+"""
+
+from functools import partial
+import types
+import weakref
+
+#: Number of notifiers an observable must have before an index is created
+#: for them.
+INDEX_THRESHOLD = 32
+
+# Mapping from id(observable) to a (weak reference to observable, index)
+# pair, for each observable that has an index.
+_indices = {}
+
+
+class NotifierIndex:
+    """ Index of the notifiers in an observable's list of notifiers.
+
+    The list of notifiers remains the source of truth: it is what the
+    observable iterates over when it emits notifications. The notifiers'
+    ``add_to`` and ``remove_from`` methods keep the index consistent with
+    the list, by calling ``add`` and ``discard`` whenever they modify it.
+
+    Parameters
+    ----------
+    notifiers : list of callable
+        The list of notifiers being indexed.
+    """
+
+    def __init__(self, notifiers):
+        self.notifiers = notifiers
+        self._notifiers_by_key = {}
+        for notifier in notifiers:
+            self.add(notifier)
+
+    def find(self, notifier):
+        """ Return the first notifier in the list that is equivalent to the
+        given one, or None if there isn't one.
+
+        Parameters
+        ----------
+        notifier : INotifier
+            A notifier with an ``_index_key`` method.
+
+        Returns
+        -------
+        other : INotifier or None
+        """
+        key = notifier._index_key()
+        if key is None:
+            return find_equivalent(notifier, self.notifiers)
+
+        for other in self._notifiers_by_key.get(key, ()):
+            # Keys include object ids, which can be reused once the objects
+            # have been garbage collected.
+            if notifier.equals(other):
+                return other
+        return None
+
+    def add(self, notifier):
+        """ Add a notifier that has been appended to the list.
+
+        Parameters
+        ----------
+        notifier : callable
+        """
+        key = _get_key(notifier)
+        if key is not None:
+            self._notifiers_by_key.setdefault(key, []).append(notifier)
+
+    def discard(self, notifier):
+        """ Discard a notifier that has been removed from the list.
+
+        Parameters
+        ----------
+        notifier : callable
+        """
+        key = _get_key(notifier)
+        others = self._notifiers_by_key.get(key)
+        if others is None:
+            return
+        for i, other in enumerate(others):
+            if other is notifier:
+                del others[i]
+                break
+        if not others:
+            del self._notifiers_by_key[key]
+
+
+def get_notifier_index(observable, notifiers):
+    """ Return the index of an observable's notifiers, creating it if the
+    observable has enough notifiers to make it worthwhile.
+
+    Parameters
+    ----------
+    observable : IObservable
+        The observable object.
+    notifiers : list of callable
+        The observable's list of notifiers.
+
+    Returns
+    -------
+    index : NotifierIndex or None
+        The index, or None if the observable doesn't have one. Observables
+        that can't be weakly referenced never have an index.
+    """
+    key = id(observable)
+    entry = _indices.get(key)
+    if entry is not None:
+        observable_ref, index = entry
+        if observable_ref() is observable and index.notifiers is notifiers:
+            return index
+        # The list of notifiers has been replaced since the index was built.
+        del _indices[key]
+
+    if len(notifiers) < INDEX_THRESHOLD:
+        return None
+
+    try:
+        observable_ref = weakref.ref(observable, partial(_discard_index, key))
+    except TypeError:
+        return None
+
+    index = NotifierIndex(notifiers)
+    _indices[key] = observable_ref, index
+    return index
+
+
+def find_equivalent(notifier, notifiers):
+    """ Return the first notifier in a list that is equivalent to the given
+    one, or None if there isn't one.
+
+    Parameters
+    ----------
+    notifier : INotifier
+    notifiers : list of callable
+
+    Returns
+    -------
+    other : INotifier or None
+    """
+    for other in notifiers:
+        if notifier.equals(other):
+            return other
+    return None
+
+
+def index_key(notifier_type, handler, target, *args):
+    """ Return an index key for a notifier, or None if the notifier can't be
+    indexed.
+
+    Parameters
+    ----------
+    notifier_type : type
+        The type of the notifier. Notifiers of different types are never
+        equivalent.
+    handler : callable or None
+        The user's handler, or None if it has been garbage collected.
+    target : object or None
+        The notifier's target, or None if it has been garbage collected.
+    *args : hashable
+        Any other values that have to be equal for notifiers to be
+        equivalent.
+
+    Returns
+    -------
+    key : tuple or None
+    """
+    if handler is None or target is None:
+        return None
+
+    if isinstance(handler, types.MethodType):
+        # Bound methods compare equal if they wrap the same function and
+        # are bound to the same object.
+        handler = (id(handler.__self__), handler.__func__)
+    key = (notifier_type, handler, id(target)) + args
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_key(notifier):
+    """ Return the index key of any item in a list of notifiers, or None. """
+    get_key = getattr(notifier, "_index_key", None)
+    if get_key is None:
+        return None
+    return get_key()
+
+
+def _discard_index(key, observable_ref):
+    """ Weakref callback discarding the index of a deleted observable. """
+    entry = _indices.get(key)
+    if entry is not None and entry[0] is observable_ref:
+        del _indices[key]
@@ -8,9 +8,21 @@
 #
 # Thanks for using Enthought open source!
 
+import types
+import weakref
+
+from traits.ctraits import CHasTraits, cTrait
+from traits.observation.exceptions import NotifierNotFound
+from traits.observation.i_observable import IObservable
+from traits.observation._notifier_index import (
+    find_equivalent,
+    get_notifier_index,
+    index_key,
+)
+
 
 def add_or_remove_notifiers(
-        *, object, graph, handler, target, dispatcher, remove):
+        *, object, graph, handler, target, dispatcher, remove, lazy=False):
     """ Add/Remove notifiers on objects following the description on an
     ObserverGraph.
 
@@ -37,6 +49,13 @@ def add_or_remove_notifiers(
         callback on a different thread.
     remove : boolean
         If true, notifiers are being removed.
+    lazy : boolean, optional
+        If true, and notifiers are being added, the notifiers are only added
+        to the object itself, and the objects reached from it by following
+        the graph are each given a ``LazyNotifier``, which adds their
+        notifiers the first time they change. Removing notifiers handles
+        objects in either state, so this has no effect when removing.
+        Default is false.
 
     Raises
     ------
@@ -50,6 +69,7 @@ def add_or_remove_notifiers(
         target=target,
         dispatcher=dispatcher,
         remove=remove,
+        lazy=lazy,
     )
     callable_()
 
@@ -60,34 +80,54 @@ class _AddOrRemoveNotifier:
     See ``add_or_remove_notifiers`` for the input parameters.
     """
 
-    def __init__(self, *, object, graph, handler, target, dispatcher, remove):
+    def __init__(
+            self, *, object, graph, handler, target, dispatcher, remove,
+            lazy=False):
         self.object = object
         self.graph = graph
         self.handler = handler
         self.target = target
         self.dispatcher = dispatcher
         self.remove = remove
+        self.lazy = lazy
 
         # list of (notifier, observable)
         self._processed = []
 
     def __call__(self):
         """ Main function for adding/removing notifiers.
+
+        Returns
+        -------
+        processed : list of (notifier, observable)
+            The notifiers added to or removed from the observables for the
+            root of the graph, in order.
         """
 
-        # The order of events does not matter as they are independent of each
-        # other.
-        steps = [
-            self._add_or_remove_notifiers,
-            self._add_or_remove_maintainers,
-            self._add_or_remove_children_notifiers,
-            self._add_or_remove_extra_graphs,
-        ]
+        if self.remove and self._is_armed():
+            # Neither the object nor its children were hooked up.
+            steps = [self._disarm_object]
+        elif self.lazy and not self.remove:
+            steps = [
+                self._add_or_remove_notifiers,
+                self._add_or_remove_maintainers,
+                self._arm_children,
+                self._add_or_remove_extra_graphs,
+            ]
+        else:
+            # The order of events does not matter as they are independent of
+            # each other.
+            steps = [
+                self._add_or_remove_notifiers,
+                self._add_or_remove_maintainers,
+                self._add_or_remove_children_notifiers,
+                self._add_or_remove_extra_graphs,
+            ]
 
-        # Not quite the complete reversal, as trees are still walked from
-        # root to leaves.
-        if self.remove:
-            steps = steps[::-1]
+            # Not quite the complete reversal, as trees are still walked from
+            # root to leaves.
+            if self.remove:
+                steps = steps[::-1]
 
         try:
             for step in steps:
@@ -102,7 +142,8 @@ class _AddOrRemoveNotifier:
                     notifier.remove_from(observable)
             raise
         else:
-            self._processed.clear()
+            processed, self._processed = self._processed, []
+            return processed
 
     def _add_or_remove_extra_graphs(self):
         """ Add or remove additional ObserverGraph contributed by the root
@@ -173,3 +214,385 @@ class _AddOrRemoveNotifier:
                 notifier.add_to(observable)
 
             self._processed.append((notifier, observable))
+
+    def _arm_children(self):
+        """ Add lazy notifiers to the objects reached from the object by
+        following the graph one level down, in place of their notifiers.
+        """
+        for child_graph in self.graph.children:
+            for next_object in self.graph.node.iter_objects(self.object):
+                if not _is_armable(next_object):
+                    # The object can't tell when it changes, so its
+                    # notifiers are added now, and the objects reached from
+                    # it are armed instead.
+                    self._processed.extend(
+                        _AddOrRemoveNotifier(
+                            object=next_object,
+                            graph=child_graph,
+                            handler=self.handler,
+                            target=self.target,
+                            dispatcher=self.dispatcher,
+                            remove=False,
+                            lazy=True,
+                        )()
+                    )
+                    continue
+
+                if not child_graph.children:
+                    # Raise any error that adding the notifiers would raise,
+                    # such as for a missing trait, without adding them.
+                    objects = child_graph.node.iter_objects(next_object)
+                    next(iter(objects), None)
+                notifier = self._get_lazy_notifier(child_graph)
+                notifier.add_to(next_object)
+                self._processed.append((notifier, next_object))
+
+    def _disarm_object(self):
+        """ Remove the lazy notifier of the object.
+        """
+        notifier = self._get_lazy_notifier(self.graph)
+        notifier.remove_from(self.object)
+        self._processed.append((notifier, self.object))
+
+    def _is_armed(self):
+        """ Return true if the object has a lazy notifier for the graph.
+        """
+        if not _is_armable(self.object):
+            return False
+        notifiers = self.object._notifiers(False)
+        if not notifiers:
+            return False
+        notifier = self._get_lazy_notifier(self.graph)
+        index = get_notifier_index(self.object, notifiers)
+        if index is None:
+            return find_equivalent(notifier, notifiers) is not None
+        return index.find(notifier) is not None
+
+    def _get_lazy_notifier(self, graph):
+        """ Return a lazy notifier for the given graph, and for the handler
+        and target.
+        """
+        return LazyNotifier(
+            graph=graph,
+            handler=self.handler,
+            target=self.target,
+            dispatcher=self.dispatcher,
+        )
+
+
+class LazyNotifier:
+    """ Placeholder for the notifiers of an object observed lazily.
+
+    When observers are added with ``lazy=True``, an instance of
+    ``LazyNotifier`` is added to each observable object reached from the
+    observed object by following the ObserverGraph one level down, i.e. to
+    the object's own list of notifiers, rather than the notifiers that the
+    root observer of the graph would add to the object's traits or items.
+    The objects further down are left alone, so adding the observer costs
+    the same however large the object graph is.
+
+    The first time the object changes, the notifier replaces itself with
+    the notifiers it stands for, gives a ``LazyNotifier`` to each of the
+    objects one level further down, and passes the change on to the
+    notifiers for the trait or items that changed. Since any change to the
+    object goes through the notifier first, the user's handler receives the
+    same events for the object as if its notifiers had been added in the
+    first place. The changes of the objects further down are only notified
+    once the object has changed.
+
+    Like ``TraitEventNotifier``, a ``LazyNotifier`` keeps a reference count
+    for the objects that are reached more than once.
+
+    Parameters
+    ----------
+    graph : ObserverGraph
+        The graph to follow for adding notifiers to the object.
+    handler : callable(event)
+        The user's handler. A weak reference is created for the handler if
+        it is an instance method.
+    target : object
+        An object for defining the context of the user's handler notifier.
+        A weak reference is created for the target.
+    dispatcher : callable(function, event)
+        Callable for dispatching the user's handler.
+    """
+
+    def __init__(self, *, graph, handler, target, dispatcher):
+        self.graph = graph
+        self.target = weakref.ref(target)
+        if isinstance(handler, types.MethodType):
+            self.handler = weakref.WeakMethod(handler)
+        else:
+            def _return_handler():
+                return handler
+            self.handler = _return_handler
+        self.dispatcher = dispatcher
+
+        # Number of times the object was reached.
+        self._ref_count = 0
+
+    def __call__(self, *args, **kwargs):
+        """ Called by the observable object. The first argument is always the
+        object itself, the others vary with the type of the object.
+        """
+        target = self.target()
+        handler = self.handler()
+        if target is None or handler is None or self._ref_count == 0:
+            return
+
+        object = args[0]
+        notifiers = object._notifiers(True)
+        index = get_notifier_index(object, notifiers)
+        notifiers.remove(self)
+        if index is not None:
+            index.discard(self)
+        count, self._ref_count = self._ref_count, 0
+
+        # The children are given lazy notifiers of their own.
+        processed = []
+        for _ in range(count):
+            processed.extend(
+                _AddOrRemoveNotifier(
+                    object=object,
+                    graph=self.graph,
+                    handler=handler,
+                    target=target,
+                    dispatcher=self.dispatcher,
+                    remove=False,
+                    lazy=True,
+                )()
+            )
+
+        # The new notifiers are not part of the current round of
+        # notifications, so pass the change on to those it is for. The
+        # objects reached from the object after the change were given lazy
+        # notifiers already, and those before it never had any, so the
+        # maintainers are left out.
+        maintainers = [
+            self.graph.node.get_maintainer(
+                graph=child_graph,
+                handler=handler,
+                target=target,
+                dispatcher=self.dispatcher,
+            )
+            for child_graph in self.graph.children
+        ]
+        changed = [object]
+        if isinstance(object, CHasTraits):
+            changed.append(object._trait(args[1], 0))
+        for notifier, observable in processed:
+            if (
+                any(observable is item for item in changed)
+                and any(
+                    other is notifier
+                    for other in observable._notifiers(True)
+                )
+                and not any(
+                    notifier.equals(maintainer) for maintainer in maintainers
+                )
+            ):
+                notifier(*args, **kwargs)
+
+    def add_to(self, observable):
+        """ Add this notifier to an observable object.
+
+        If an equivalent notifier exists, the existing notifier's reference
+        count is bumped.
+
+        Parameters
+        ----------
+        observable : IObservable
+            An object for adding this notifier to.
+        """
+        notifiers = observable._notifiers(True)
+        index = get_notifier_index(observable, notifiers)
+        if index is None:
+            other = find_equivalent(self, notifiers)
+        else:
+            other = index.find(self)
+        if other is not None:
+            other._ref_count += 1
+        else:
+            notifiers.append(self)
+            self._ref_count += 1
+            if index is not None:
+                index.add(self)
+
+    def remove_from(self, observable):
+        """ Remove this notifier from an observable object.
+
+        If an equivalent notifier exists, the existing notifier's reference
+        count is decremented and the notifier is only removed if the count
+        is reduced to zero.
+
+        Parameters
+        ----------
+        observable : IObservable
+            An object for removing this notifier from.
+
+        Raises
+        ------
+        NotifierNotFound
+            If the notifier is not found.
+        """
+        notifiers = observable._notifiers(True)
+        index = get_notifier_index(observable, notifiers)
+        if index is None:
+            other = find_equivalent(self, notifiers)
+        else:
+            other = index.find(self)
+        if other is None:
+            raise NotifierNotFound("Notifier not found.")
+
+        if other._ref_count == 1:
+            notifiers.remove(other)
+            if index is not None:
+                index.discard(other)
+        other._ref_count -= 1
+
+    def equals(self, other):
+        """ Return true if the other notifier is equivalent to this one.
+
+        Parameters
+        ----------
+        other : any
+
+        Returns
+        -------
+        boolean
+        """
+        if other is self:
+            return True
+        return (
+            type(other) is type(self)
+            and self.graph == other.graph
+            and self.handler() == other.handler()
+            and self.target() is other.target()
+            and self.dispatcher == other.dispatcher
+        )
+
+    def _index_key(self):
+        """ Return a key for finding this notifier in a NotifierIndex.
+
+        Returns
+        -------
+        key : tuple or None
+            A key that is equal for equivalent notifiers, or None if the
+            notifier can't be indexed.
+        """
+        return index_key(
+            type(self),
+            self.handler(),
+            self.target(),
+            self.graph,
+            self.dispatcher,
+        )
+
+
+def _is_armable(object):
+    """ Return true if a LazyNotifier can be added to the object, i.e. if it
+    notifies its own notifiers of any change.
+    """
+    return isinstance(object, (CHasTraits, IObservable)) and not isinstance(
+        object, cTrait)
+
+
+class NotifierTemplate:
+    """ A reusable plan for adding the notifiers described by an
+    ObserverGraph.
+
+    Applying the template to an object has the same effect as calling
+    ``add_or_remove_notifiers`` with ``remove=False``. However, the parts of
+    the walk that depend only on the graph, such as the graphs contributed by
+    ``IObserver.iter_extra_graphs``, are resolved once when the template is
+    created rather than every time notifiers are added. HasTraits classes use
+    templates to hook up the observers of each new instance.
+
+    Parameters
+    ----------
+    graph : ObserverGraph
+        A graph describing what and how extended traits are being observed.
+        All nodes must be ``IObserver``.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.extra_templates = [
+            NotifierTemplate(extra_graph)
+            for extra_graph in graph.node.iter_extra_graphs(graph)
+        ]
+        # Templates for the children are created on first use, as they are
+        # only needed once the root observer yields objects to observe.
+        self._children_templates = None
+
+    def add_notifiers(self, *, object, handler, target, dispatcher):
+        """ Add notifiers to an object, following the template's graph.
+
+        Parameters
+        ----------
+        object : object
+            An object to be observed.
+        handler : callable(event)
+            User-defined callable to handle change events.
+        target : Any
+            An object for defining the context of the user's handler
+            notifier. This is typically an instance of HasTraits seen by the
+            user as the "owner" of the observer.
+        dispatcher : callable(callable, event)
+            Callable for dispatching the user-defined handler.
+        """
+        # list of (notifier, observable)
+        processed = []
+        try:
+            self._add_notifiers(object, handler, target, dispatcher, processed)
+        except Exception:
+            # Undo and then reraise
+            while processed:
+                notifier, observable = processed.pop()
+                notifier.remove_from(observable)
+            raise
+
+    def _add_notifiers(self, object, handler, target, dispatcher, processed):
+        """ Add notifiers for this template and its children, recording each
+        (notifier, observable) pair added in *processed*.
+        """
+        node = self.graph.node
+        children = self.graph.children
+        observables = list(node.iter_observables(object))
+
+        if node.notify:
+            for observable in observables:
+                notifier = node.get_notifier(
+                    handler=handler,
+                    target=target,
+                    dispatcher=dispatcher,
+                )
+                notifier.add_to(observable)
+                processed.append((notifier, observable))
+
+        for observable in observables:
+            for child_graph in children:
+                change_notifier = node.get_maintainer(
+                    graph=child_graph,
+                    handler=handler,
+                    target=target,
+                    dispatcher=dispatcher,
+                )
+                change_notifier.add_to(observable)
+                processed.append((change_notifier, observable))
+
+        if children:
+            if self._children_templates is None:
+                self._children_templates = [
+                    NotifierTemplate(child_graph) for child_graph in children
+                ]
+            for child_template in self._children_templates:
+                for next_object in node.iter_objects(object):
+                    child_template._add_notifiers(
+                        next_object, handler, target, dispatcher, processed
+                    )
+
+        for extra_template in self.extra_templates:
+            extra_template._add_notifiers(
+                object, handler, target, dispatcher, processed
+            )
@@ -11,7 +11,13 @@
 import types
 import weakref
 
+from traits.observation import _event_tracers
 from traits.observation.exceptions import NotifierNotFound
+from traits.observation._notifier_index import (
+    find_equivalent,
+    get_notifier_index,
+    index_key,
+)
 
 
 class ObserverChangeNotifier:
@@ -100,7 +106,10 @@ class ObserverChangeNotifier:
         observable : IObservable
         """
         notifiers = observable._notifiers(True)
+        index = get_notifier_index(observable, notifiers)
         notifiers.append(self)
+        if index is not None:
+            index.add(self)
 
     def remove_from(self, observable):
         """ Remove a notifier equivalent to this one from the observable.
@@ -115,13 +124,19 @@ class ObserverChangeNotifier:
             If the notifier cannot be found.
         """
         notifiers = observable._notifiers(True)
-        for notifier in notifiers[:]:
-            if self.equals(notifier):
-                notifiers.remove(notifier)
-                break
+        index = get_notifier_index(observable, notifiers)
+        if index is None:
+            notifier = find_equivalent(self, notifiers)
         else:
+            notifier = index.find(self)
+
+        if notifier is None:
             raise NotifierNotFound("Notifier not found.")
 
+        notifiers.remove(notifier)
+        if index is not None:
+            index.discard(notifier)
+
     def __call__(self, *args, **kwargs):
         """ Called by the observable this notifier is attached to.
 
@@ -144,13 +159,27 @@ class ObserverChangeNotifier:
         if self.prevent_event(event):
             return
 
-        self.observer_handler(
-            event=event,
-            graph=self.graph,
-            target=target,
-            handler=handler,
-            dispatcher=self.dispatcher,
-        )
+        # Send a description of the event to the event tracer.
+        if _event_tracers.pre_event_tracer is not None:
+            _event_tracers.pre_event_tracer(event, self.observer_handler)
+
+        try:
+            self.observer_handler(
+                event=event,
+                graph=self.graph,
+                target=target,
+                handler=handler,
+                dispatcher=self.dispatcher,
+            )
+        except Exception as exception:
+            if _event_tracers.post_event_tracer is not None:
+                _event_tracers.post_event_tracer(
+                    event, self.observer_handler, exception=exception
+                )
+            raise
+        else:
+            if _event_tracers.post_event_tracer is not None:
+                _event_tracers.post_event_tracer(event, self.observer_handler)
 
     def equals(self, other):
         """ Return true if other is a notifier equivalent to this one.
@@ -181,3 +210,21 @@ class ObserverChangeNotifier:
             # different dispatchers should not interfere each other.
             and self.dispatcher == other.dispatcher
         )
+
+    def _index_key(self):
+        """ Return a key for finding this notifier in a NotifierIndex.
+
+        Returns
+        -------
+        key : tuple or None
+            A key that is equal for equivalent notifiers, or None if the
+            notifier can't be indexed.
+        """
+        return index_key(
+            type(self),
+            self.handler(),
+            self.target(),
+            self.observer_handler,
+            self.graph,
+            self.dispatcher,
+        )
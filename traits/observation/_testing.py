@@ -13,6 +13,7 @@ from unittest import mock
 from traits.observation._observe import add_or_remove_notifiers
 from traits.observation._observer_graph import ObserverGraph
 from traits.observation.exceptions import NotifierNotFound
+from traits.observation.i_observable import IObservable
 
 
 #: An object that does not get garbage collected until the very end
@@ -63,6 +64,7 @@ def call_add_or_remove_notifiers(**kwargs):
     add_or_remove_notifiers(**values)
 
 
+@IObservable.register
 class DummyObservable:
     """ A dummy implementation of IObservable for testing purposes."""
 
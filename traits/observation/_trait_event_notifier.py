@@ -12,8 +12,14 @@ from functools import partial
 import types
 import weakref
 
+from traits.observation import _event_tracers
 from traits.observation.exception_handling import handle_exception
 from traits.observation.exceptions import NotifierNotFound
+from traits.observation._notifier_index import (
+    find_equivalent,
+    get_notifier_index,
+    index_key,
+)
 
 
 class TraitEventNotifier:
@@ -118,10 +124,22 @@ class TraitEventNotifier:
         event = self.event_factory(*args, **kwargs)
         if self.prevent_event(event):
             return
+
+        # Send a description of the event to the event tracer.
+        if _event_tracers.pre_event_tracer is not None:
+            _event_tracers.pre_event_tracer(event, handler)
+
         try:
             self.dispatcher(handler, event)
-        except Exception:
+        except Exception as exception:
+            if _event_tracers.post_event_tracer is not None:
+                _event_tracers.post_event_tracer(
+                    event, handler, exception=exception
+                )
             handle_exception(event)
+        else:
+            if _event_tracers.post_event_tracer is not None:
+                _event_tracers.post_event_tracer(event, handler)
 
     def add_to(self, observable):
         """ Add this notifier to an observable object.
@@ -144,10 +162,14 @@ class TraitEventNotifier:
             notifier is not found in the observable.
         """
         notifiers = observable._notifiers(True)
-        for other in notifiers:
-            if self.equals(other):
-                other._ref_count += 1
-                break
+        index = get_notifier_index(observable, notifiers)
+        if index is None:
+            other = find_equivalent(self, notifiers)
+        else:
+            other = index.find(self)
+
+        if other is not None:
+            other._ref_count += 1
         else:
             # It is not a current use case to share a notifier with multiple
             # observables. Using a single reference count will tie the lifetime
@@ -158,6 +180,8 @@ class TraitEventNotifier:
                 )
             notifiers.append(self)
             self._ref_count += 1
+            if index is not None:
+                index.add(self)
 
     def remove_from(self, observable):
         """ Remove this notifier from an observable object.
@@ -179,20 +203,26 @@ class TraitEventNotifier:
             If the notifier is not found.
         """
         notifiers = observable._notifiers(True)
-        for other in notifiers[:]:
-            if self.equals(other):
-                if other._ref_count == 1:
-                    notifiers.remove(other)
-                other._ref_count -= 1
-                if other._ref_count < 0:
-                    raise RuntimeError(
-                        "Reference count is negative. "
-                        "Race condition?"
-                    )
-                break
+        index = get_notifier_index(observable, notifiers)
+        if index is None:
+            other = find_equivalent(self, notifiers)
         else:
+            other = index.find(self)
+
+        if other is None:
             raise NotifierNotFound("Notifier not found.")
 
+        if other._ref_count == 1:
+            notifiers.remove(other)
+            if index is not None:
+                index.discard(other)
+        other._ref_count -= 1
+        if other._ref_count < 0:
+            raise RuntimeError(
+                "Reference count is negative. "
+                "Race condition?"
+            )
+
     def equals(self, other):
         """ Return true if the other notifier is equivalent to this one.
 
@@ -214,6 +244,19 @@ class TraitEventNotifier:
             and self.dispatcher == other.dispatcher
         )
 
+    def _index_key(self):
+        """ Return a key for finding this notifier in a NotifierIndex.
+
+        Returns
+        -------
+        key : tuple or None
+            A key that is equal for equivalent notifiers, or None if the
+            notifier can't be indexed.
+        """
+        return index_key(
+            type(self), self.handler(), self.target(), self.dispatcher
+        )
+
 
 def _return(value):
     return value
@@ -35,8 +35,17 @@ from traits.observation.expression import (
 
 from traits.observation.observe import (
     apply_observers,
+    dispatch_asyncio,
     dispatch_same,
+    get_asyncio_loop,
     observe,
+    set_asyncio_loop,
+)
+
+from traits.observation.rate_limiting import (
+    debounce,
+    merge_trait_change_events,
+    throttle,
 )
 
 from traits.observation.parsing import (
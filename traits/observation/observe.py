@@ -9,14 +9,23 @@
 # Thanks for using Enthought open source!
 
 import asyncio
+import collections
 import inspect
+import threading
 
-from traits.observation._observe import add_or_remove_notifiers
+from traits.observation.exception_handling import handle_exception
+from traits.observation._observe import (
+    add_or_remove_notifiers,
+    NotifierTemplate,
+)
 from traits.observation.expression import compile_expr
 
 #: Set to hold references to active async traits handlers.
 _active_handler_tasks = set()
 
+#: The dispatcher used by dispatch_asyncio, or None if no event loop is set.
+_asyncio_dispatcher = None
+
 
 def dispatch_same(handler, event):
     """ Dispatch an event handler on the same thread.
@@ -43,9 +52,180 @@ def dispatch_same(handler, event):
         handler(event)
 
 
+class _AsyncioDispatcher:
+    """ Dispatches event handlers on an asyncio event loop, from any thread.
+
+    Events are handed to the loop with ``call_soon_threadsafe``. When
+    *coalesce* is true, an event for a handler and object that has an event
+    still waiting to be handled replaces that event. When *max_tasks* is not
+    None, the calls of async handlers wait while *max_tasks* handler tasks
+    are running.
+    """
+
+    def __init__(self, loop, coalesce, max_tasks):
+        self.loop = loop
+        self.coalesce = coalesce
+        self.max_tasks = max_tasks
+        # Latest event for each (handler, object id) key, when coalescing.
+        self._pending = {}
+        self._lock = threading.Lock()
+        # The following are only used in the event loop's thread.
+        self._waiting = collections.deque()
+        self._tasks = set()
+
+    def dispatch(self, handler, event):
+        key = (handler, id(event.object))
+        if self.coalesce:
+            with self._lock:
+                coalesced = key in self._pending
+                self._pending[key] = event
+            if coalesced:
+                return
+
+        try:
+            self.loop.call_soon_threadsafe(self._schedule, key, handler, event)
+        except RuntimeError:
+            # The loop is closed.
+            if self.coalesce:
+                with self._lock:
+                    del self._pending[key]
+            raise
+
+    def _schedule(self, key, handler, event):
+        self._waiting.append((key, handler, event))
+        self._start_waiting()
+
+    def _start_waiting(self):
+        """ Call the handlers waiting, up to the limit on running tasks. """
+        while self._waiting and (
+            self.max_tasks is None or len(self._tasks) < self.max_tasks
+        ):
+            key, handler, event = self._waiting.popleft()
+            if self.coalesce:
+                with self._lock:
+                    event = self._pending.pop(key)
+            try:
+                self._call(handler, event)
+            except Exception:
+                # Let the loop report the exception re-raised by the
+                # exception handler, and carry on with the other handlers.
+                self.loop.call_soon(self._start_waiting)
+                raise
+
+    def _call(self, handler, event):
+        if inspect.iscoroutinefunction(handler):
+            task = self.loop.create_task(_call_async_handler(handler, event))
+            self._tasks.add(task)
+            task.add_done_callback(self._task_done)
+        else:
+            try:
+                handler(event)
+            except Exception:
+                handle_exception(event)
+
+    def _task_done(self, task):
+        self._tasks.discard(task)
+        self._start_waiting()
+
+
+async def _call_async_handler(handler, event):
+    """ Await an async event handler, handling its exceptions the way the
+    observer notifiers do.
+    """
+    try:
+        await handler(event)
+    except Exception:
+        handle_exception(event)
+
+
+def set_asyncio_loop(loop, *, coalesce=False, max_tasks=None):
+    """ Set the event loop that event handlers are dispatched to with
+    ``dispatch="asyncio"``.
+
+    Events dispatched before the loop is changed are still handled on the
+    loop that was set when they were dispatched.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop or None
+        The loop to call the handlers on, or None to stop dispatching to a
+        loop.
+    coalesce : bool, optional
+        If true, an event for a handler and object that has an event still
+        waiting to be handled replaces that event, so that the handler is
+        only called once, with the most recent event. This suits handlers
+        that only look at the current state of the object. The default is
+        False.
+    max_tasks : int or None, optional
+        The maximum number of async handler tasks running at a time. Calls
+        of async handlers beyond that number wait, in order, for a task to
+        finish. The default is None, for no limit.
+
+    Raises
+    ------
+    ValueError
+        If *max_tasks* is less than 1.
+    """
+    global _asyncio_dispatcher
+
+    if max_tasks is not None and max_tasks < 1:
+        raise ValueError(
+            "max_tasks must be None or at least 1, got {!r}".format(max_tasks)
+        )
+    if loop is None:
+        _asyncio_dispatcher = None
+    else:
+        _asyncio_dispatcher = _AsyncioDispatcher(loop, coalesce, max_tasks)
+
+
+def get_asyncio_loop():
+    """ Return the event loop that event handlers are dispatched to with
+    ``dispatch="asyncio"``.
+
+    Returns
+    -------
+    loop : asyncio.AbstractEventLoop or None
+        The loop, or None if no loop has been set.
+    """
+    if _asyncio_dispatcher is None:
+        return None
+    return _asyncio_dispatcher.loop
+
+
+def dispatch_asyncio(handler, event):
+    """ Dispatch an event handler on the event loop set with
+    ``set_asyncio_loop``.
+
+    The handler is called on the loop even if the event comes from another
+    thread. Async handlers are run in a Task, and their exceptions are
+    handled by the observer exception handler, like those of other handlers.
+
+    Parameters
+    ----------
+    handler : callable(event) or async callable(event)
+        User-defined callable to handle change events.
+        ``event`` is an object representing the change.
+        Its type and content depends on the change.
+    event : object
+        The event object to be given to handler.
+
+    Raises
+    ------
+    RuntimeError
+        If no event loop has been set, or the loop is closed.
+    """
+    dispatcher = _asyncio_dispatcher
+    if dispatcher is None:
+        raise RuntimeError(
+            "no event loop set for dispatch='asyncio'; "
+            "use set_asyncio_loop to set one"
+        )
+    dispatcher.dispatch(handler, event)
+
+
 def observe(
         object, expression, handler,
-        *, remove=False, dispatcher=dispatch_same):
+        *, remove=False, dispatcher=dispatch_same, lazy=False):
     """ Observer or unobserve traits on an object.
 
     Parameters
@@ -64,6 +244,17 @@ def observe(
         Callable for dispatching the user-defined handler, e.g. dispatching
         callback on a different thread. Default is to dispatch on the same
         thread.
+    lazy : boolean, optional
+        If true, the notifiers are only added to the objects reached by
+        following the expression once the object they are reached from
+        changes: when the observer is added, the objects one level down are
+        each given a cheap placeholder, which adds the object's notifiers
+        and places placeholders one level further down the first time the
+        object changes. Objects added later to an object whose notifiers
+        were added are observed at once, as without lazy. Changes of the
+        objects further down are not notified until then, while adding an
+        observer to a large object graph costs the same however large the
+        graph is. This has no effect when removing. The default is False.
     """
     apply_observers(
         object,
@@ -71,10 +262,12 @@ def observe(
         handler=handler,
         dispatcher=dispatcher,
         remove=remove,
+        lazy=lazy,
     )
 
 
-def apply_observers(object, graphs, handler, *, dispatcher, remove=False):
+def apply_observers(
+        object, graphs, handler, *, dispatcher, remove=False, lazy=False):
     """ Apply one or more ObserverGraphs to an object and handler.
 
     Parameters
@@ -93,6 +286,17 @@ def apply_observers(object, graphs, handler, *, dispatcher, remove=False):
     remove : boolean, optional
         If True, remove notifiers. i.e. unobserve the traits. The default
         is False.
+    lazy : boolean, optional
+        If true, the notifiers are only added to the objects reached by
+        following the expression once the object they are reached from
+        changes: when the observer is added, the objects one level down are
+        each given a cheap placeholder, which adds the object's notifiers
+        and places placeholders one level further down the first time the
+        object changes. Objects added later to an object whose notifiers
+        were added are observed at once, as without lazy. Changes of the
+        objects further down are not notified until then, while adding an
+        observer to a large object graph costs the same however large the
+        graph is. This has no effect when removing. The default is False.
     """
     for graph in graphs:
         add_or_remove_notifiers(
@@ -102,4 +306,27 @@ def apply_observers(object, graphs, handler, *, dispatcher, remove=False):
             target=object,
             dispatcher=dispatcher,
             remove=remove,
+            lazy=lazy,
         )
+
+
+def compile_graphs(graphs):
+    """ Compile ObserverGraphs into templates that can be applied to many
+    objects.
+
+    Calling ``add_notifiers`` on each of the returned templates has the same
+    effect as calling ``apply_observers`` with the original graphs, without
+    walking the parts of the graphs that don't depend on the object each
+    time.
+
+    Parameters
+    ----------
+    graphs : list of ObserverGraph
+        Graphs describing the observation patterns to apply.
+
+    Returns
+    -------
+    templates : list of NotifierTemplate
+        One template for each graph.
+    """
+    return [NotifierTemplate(graph) for graph in graphs]
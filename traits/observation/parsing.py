@@ -10,11 +10,13 @@
 
 from functools import lru_cache
 
-from traits.observation import _generated_parser
+from traits.observation import _dsl_parser
 import traits.observation.expression as expression_module
 
 
-_LARK_PARSER = _generated_parser.Lark_StandAlone()
+# Standalone Lark parser, created on first use. It is only needed for
+# reporting errors in invalid expressions.
+_LARK_PARSER = None
 
 
 def _handle_series(trees, notify):
@@ -22,7 +24,7 @@ def _handle_series(trees, notify):
 
     Parameters
     ----------
-    trees : list of lark.tree.Tree
+    trees : list of Tree
         The children tree for the "series" rule. It should always
         contain exactly three items.
     notify : bool
@@ -42,7 +44,7 @@ def _handle_parallel(trees, notify):
 
     Parameters
     ----------
-    trees : list of lark.tree.Tree
+    trees : list of Tree
         The children tree for the "parallel" rule. It should always
         contain exactly two items.
     notify : bool
@@ -61,7 +63,7 @@ def _handle_trait(trees, notify):
 
     Parameters
     ----------
-    trees : list of lark.tree.Tree
+    trees : list of Tree
         The children tree for the "trait" rule.
         It contains only one item.
     notify : bool
@@ -81,7 +83,7 @@ def _handle_anytrait(trees, notify):
 
     Parameters
     ----------
-    trees : list of lark.tree.Tree
+    trees : list of Tree
         The children tree for the "trait" rule. This should be empty.
     notify : bool
         True if the final target should notify, else False.
@@ -98,7 +100,7 @@ def _handle_metadata(trees, notify):
 
     Parameters
     ----------
-    trees : list of lark.tree.Tree
+    trees : list of Tree
         The children tree for the "metadata" rule.
         It contains only one item.
     notify : bool
@@ -118,7 +120,7 @@ def _handle_items(trees, notify):
 
     Parameters
     ----------
-    trees : list of lark.tree.Tree
+    trees : list of Tree
         The children tree for the "items" rule.
         It should be empty.
     notify : bool
@@ -145,7 +147,7 @@ def _handle_tree(tree, notify):
 
     Parameters
     ----------
-    tree : lark.tree.Tree
+    tree : Tree
         Tree to be converted to an ObserverExpression.
     notify : bool
         True if the final target should notify, else False.
@@ -188,14 +190,66 @@ def parse(text):
         If the text is not a valid observe expression.
     """
     try:
-        tree = _LARK_PARSER.parse(text)
-    except _generated_parser.LarkError as parser_exception:
-        raise ValueError(f"Invalid expression: {text!r}") from parser_exception
+        tree = _dsl_parser.parse(text)
+    except _dsl_parser.ParseError:
+        tree = _parse_with_lark(text)
 
     return _handle_tree(tree, notify=True)
 
 
+def _parse_with_lark(text):
+    """ Parse text using the standalone Lark parser generated from the
+    grammar.
+
+    This is used to report errors for text rejected by the faster
+    recursive-descent parser: the Lark exception, which describes what was
+    expected where, is chained to the ValueError raised.
+
+    Parameters
+    ----------
+    text : str
+        Text to be parsed.
+
+    Returns
+    -------
+    tree : lark.tree.Tree
+
+    Raises
+    ------
+    ValueError
+        If the text is not a valid observe expression.
+    """
+    global _LARK_PARSER
+
+    from traits.observation import _generated_parser
+
+    if _LARK_PARSER is None:
+        _LARK_PARSER = _generated_parser.Lark_StandAlone()
+
+    try:
+        return _LARK_PARSER.parse(text)
+    except _generated_parser.LarkError as parser_exception:
+        raise ValueError(f"Invalid expression: {text!r}") from parser_exception
+
+
 @lru_cache(maxsize=expression_module._OBSERVER_EXPRESSION_CACHE_MAXSIZE)
+def _compile_str(text):
+    """ Compile a mini-language string to a tuple of ObserverGraph objects.
+
+    Results are cached, so the tuple is shared between callers.
+
+    Parameters
+    ----------
+    text : str
+        Text to be parsed.
+
+    Returns
+    -------
+    tuple of ObserverGraph
+    """
+    return tuple(expression_module.compile_expr(parse(text)))
+
+
 def compile_str(text):
     """ Compile a mini-language string to a list of ObserverGraph objects.
 
@@ -208,4 +262,4 @@ def compile_str(text):
     -------
     list of ObserverGraph
     """
-    return expression_module.compile_expr(parse(text))
+    return list(_compile_str(text))
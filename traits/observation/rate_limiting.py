@@ -0,0 +1,446 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Dispatchers limiting the rate at which observers are called.
+
+The dispatchers returned by ``debounce`` and ``throttle`` can be given as
+the *dispatch* argument of ``HasTraits.observe`` and of the ``observe``
+decorator, in place of a string::
+
+    class Sensor(HasTraits):
+        reading = Float()
+
+        @observe("reading", dispatch=throttle(0.05))
+        def _update_display(self, event):
+            ...
+
+Delayed calls are scheduled with a timer source. By default, this is a
+``ThreadTimerSource``, which calls the handlers on a background thread.
+Tests can use a ``ManualTimerSource`` instead, to control the passing of
+time.
+"""
+
+import abc
+import functools
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from traits.observation.exception_handling import handle_exception
+from traits.observation.events import TraitChangeEvent
+from traits.observation.observe import dispatch_same
+
+logger = logging.getLogger(__name__)
+
+
+class ITimerSource(abc.ABC):
+    """ Interface for the sources of time and delayed calls used by rate
+    limiting dispatchers.
+    """
+
+    def monotonic(self):
+        """ Return the current time, in seconds, from a clock that never
+        goes backwards.
+
+        Returns
+        -------
+        time : float
+        """
+        raise NotImplementedError("Timer source must implement monotonic")
+
+    def call_later(self, delay, callback):
+        """ Call a callable without arguments after a delay.
+
+        This may be called from any thread.
+
+        Parameters
+        ----------
+        delay : float
+            The delay, in seconds.
+        callback : callable()
+            The callable to call.
+        """
+        raise NotImplementedError("Timer source must implement call_later")
+
+
+class ThreadTimerSource(ITimerSource):
+    """ Timer source making the delayed calls on a background thread.
+
+    A single daemon thread, started when the first call is scheduled, makes
+    all the calls, in order. Exceptions raised by the calls are logged.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._calls = []
+        self._counter = itertools.count()
+        self._thread = None
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def call_later(self, delay, callback):
+        with self._condition:
+            heapq.heappush(
+                self._calls,
+                (self.monotonic() + delay, next(self._counter), callback),
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="traits-timer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if not self._calls:
+                        self._condition.wait()
+                        continue
+                    delay = self._calls[0][0] - self.monotonic()
+                    if delay <= 0:
+                        _, _, callback = heapq.heappop(self._calls)
+                        break
+                    self._condition.wait(delay)
+            try:
+                callback()
+            except Exception:
+                logger.exception("Exception in delayed call %r", callback)
+
+
+class AsyncioTimerSource(ITimerSource):
+    """ Timer source making the delayed calls on an asyncio event loop.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The loop to make the calls on.
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+
+    def monotonic(self):
+        return self.loop.time()
+
+    def call_later(self, delay, callback):
+        self.loop.call_soon_threadsafe(self.loop.call_later, delay, callback)
+
+
+class ManualTimerSource(ITimerSource):
+    """ Timer source whose time only passes when ``advance`` is called.
+
+    This is meant for tests: the delayed calls are made by ``advance``, on
+    the thread calling it.
+
+    Parameters
+    ----------
+    time : float, optional
+        The initial time, in seconds.
+    """
+
+    def __init__(self, time=0.0):
+        self.time = time
+        self._calls = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def monotonic(self):
+        return self.time
+
+    def call_later(self, delay, callback):
+        with self._lock:
+            heapq.heappush(
+                self._calls, (self.time + delay, next(self._counter), callback)
+            )
+
+    def advance(self, seconds):
+        """ Let time pass, making the calls that become due, in order.
+
+        Calls scheduled by these calls are made too, if they become due.
+
+        Parameters
+        ----------
+        seconds : float
+            The time to let pass, in seconds.
+        """
+        end = self.time + seconds
+        while True:
+            with self._lock:
+                if not self._calls or self._calls[0][0] > end:
+                    break
+                due, _, callback = heapq.heappop(self._calls)
+            self.time = max(self.time, due)
+            callback()
+        self.time = end
+
+
+#: The timer source used by the dispatchers not given one, or None until the
+#: default ThreadTimerSource is created.
+_default_timer_source = None
+
+_default_timer_source_lock = threading.Lock()
+
+
+def get_default_timer_source():
+    """ Return the timer source used by the rate limiting dispatchers that
+    weren't given one.
+
+    Returns
+    -------
+    timer_source : ITimerSource
+        The timer source set with ``set_default_timer_source``, or else a
+        ``ThreadTimerSource`` created on first use.
+    """
+    global _default_timer_source
+
+    with _default_timer_source_lock:
+        if _default_timer_source is None:
+            _default_timer_source = ThreadTimerSource()
+        return _default_timer_source
+
+
+def set_default_timer_source(timer_source):
+    """ Set the timer source used by the rate limiting dispatchers that
+    weren't given one.
+
+    Parameters
+    ----------
+    timer_source : ITimerSource or None
+        The timer source, or None to use a ``ThreadTimerSource``.
+    """
+    global _default_timer_source
+
+    with _default_timer_source_lock:
+        _default_timer_source = timer_source
+
+
+def merge_trait_change_events(earlier, later):
+    """ Merge two successive TraitChangeEvent into one, going from the old
+    value of the earlier event to the new value of the later event.
+
+    This can be given as the *merge* argument of ``debounce`` and
+    ``throttle``.
+
+    Parameters
+    ----------
+    earlier, later : TraitChangeEvent
+        The events to merge.
+
+    Returns
+    -------
+    event : TraitChangeEvent
+    """
+    return TraitChangeEvent(
+        object=later.object,
+        name=later.name,
+        old=earlier.old,
+        new=later.new,
+    )
+
+
+class _RateLimitedDispatcher:
+    """ Base class for the dispatchers calling a handler at most once per
+    time window for the events on an object.
+    """
+
+    def __init__(self, interval, merge, timer_source, dispatcher):
+        if interval < 0:
+            raise ValueError(
+                "interval must be positive, got {!r}".format(interval)
+            )
+        self.interval = interval
+        self.merge = merge
+        self.timer_source = timer_source
+        self.dispatcher = dispatcher
+        self._lock = threading.Lock()
+
+    def _get_timer_source(self):
+        if self.timer_source is None:
+            return get_default_timer_source()
+        return self.timer_source
+
+    def _combine(self, pending, event):
+        """ Return the event to keep in place of a pending event. """
+        if self.merge is None or pending is None:
+            return event
+        return self.merge(pending, event)
+
+    def _dispatch_later(self, handler, event):
+        """ Dispatch an event from a delayed call, handling exceptions as
+        the notifiers would.
+        """
+        try:
+            self.dispatcher(handler, event)
+        except Exception:
+            handle_exception(event)
+
+
+class _Debouncer(_RateLimitedDispatcher):
+    """ Dispatcher calling a handler once the events stopped coming for
+    some time. See ``debounce``.
+    """
+
+    def __init__(self, interval, merge, timer_source, dispatcher):
+        super().__init__(interval, merge, timer_source, dispatcher)
+        # [deadline, handler, event] for each (handler, object id) key.
+        self._pending = {}
+
+    def __call__(self, handler, event):
+        timer_source = self._get_timer_source()
+        key = (handler, id(event.object))
+        deadline = timer_source.monotonic() + self.interval
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = [deadline, handler, event]
+            else:
+                pending[0] = deadline
+                pending[2] = self._combine(pending[2], event)
+                return
+
+        timer_source.call_later(
+            self.interval, functools.partial(self._expire, key, timer_source)
+        )
+
+    def _expire(self, key, timer_source):
+        with self._lock:
+            deadline, handler, event = self._pending[key]
+            remaining = deadline - timer_source.monotonic()
+            if remaining <= 0:
+                del self._pending[key]
+
+        if remaining > 0:
+            # Events came in since the call was scheduled.
+            timer_source.call_later(
+                remaining, functools.partial(self._expire, key, timer_source)
+            )
+        else:
+            self._dispatch_later(handler, event)
+
+
+class _Throttler(_RateLimitedDispatcher):
+    """ Dispatcher calling a handler at most once per time window. See
+    ``throttle``.
+    """
+
+    def __init__(self, interval, merge, timer_source, dispatcher):
+        super().__init__(interval, merge, timer_source, dispatcher)
+        # [handler, pending event or None] for each (handler, object id) key
+        # with an open window.
+        self._windows = {}
+
+    def __call__(self, handler, event):
+        timer_source = self._get_timer_source()
+        key = (handler, id(event.object))
+        with self._lock:
+            window = self._windows.get(key)
+            if window is not None:
+                window[1] = self._combine(window[1], event)
+                return
+            self._windows[key] = [handler, None]
+
+        timer_source.call_later(
+            self.interval,
+            functools.partial(self._end_window, key, timer_source),
+        )
+        self.dispatcher(handler, event)
+
+    def _end_window(self, key, timer_source):
+        with self._lock:
+            window = self._windows[key]
+            handler, event = window
+            if event is None:
+                del self._windows[key]
+            else:
+                window[1] = None
+
+        if event is not None:
+            # Open a new window for the events to come.
+            timer_source.call_later(
+                self.interval,
+                functools.partial(self._end_window, key, timer_source),
+            )
+            self._dispatch_later(handler, event)
+
+
+def debounce(
+        interval, *, merge=None, timer_source=None, dispatcher=dispatch_same):
+    """ Return a dispatcher calling an observer once the events for an
+    object have stopped coming for some time.
+
+    Each event for the same handler and object postpones the call by
+    *interval*. The handler is then called with the last event, or with the
+    events merged by *merge*, from a delayed call of the timer source.
+
+    Parameters
+    ----------
+    interval : float
+        The time, in seconds, without events after which the handler is
+        called.
+    merge : callable(earlier, later) or None, optional
+        Callable returning the event to keep in place of two successive
+        events, e.g. ``merge_trait_change_events``. The default, None,
+        keeps the later event.
+    timer_source : ITimerSource or None, optional
+        The timer source to schedule the calls with. The default, None,
+        means the timer source returned by ``get_default_timer_source``
+        when an event comes.
+    dispatcher : callable(handler, event), optional
+        The dispatcher making the delayed calls, e.g. ``dispatch_same`` (the
+        default) to call the handler on the timer source's thread.
+
+    Returns
+    -------
+    dispatcher : callable(handler, event)
+        The dispatcher, to give as the *dispatch* argument of ``observe``.
+        The same dispatcher must be given to remove the observer.
+    """
+    return _Debouncer(interval, merge, timer_source, dispatcher)
+
+
+def throttle(
+        interval, *, merge=None, timer_source=None, dispatcher=dispatch_same):
+    """ Return a dispatcher calling an observer at most once per time window
+    for the events of an object.
+
+    The first event for a handler and object is dispatched immediately, and
+    opens a window of *interval* seconds. The events coming during the
+    window are held back; at the end of the window, the last of them, or the
+    events merged by *merge*, is dispatched from a delayed call of the timer
+    source and a new window opens.
+
+    Parameters
+    ----------
+    interval : float
+        The length of the windows, in seconds.
+    merge : callable(earlier, later) or None, optional
+        Callable returning the event to keep in place of two successive
+        events, e.g. ``merge_trait_change_events``. The default, None,
+        keeps the later event.
+    timer_source : ITimerSource or None, optional
+        The timer source to schedule the calls with. The default, None,
+        means the timer source returned by ``get_default_timer_source``
+        when an event comes.
+    dispatcher : callable(handler, event), optional
+        The dispatcher making the calls, e.g. ``dispatch_same`` (the
+        default) to make the delayed calls on the timer source's thread.
+
+    Returns
+    -------
+    dispatcher : callable(handler, event)
+        The dispatcher, to give as the *dispatch* argument of ``observe``.
+        The same dispatcher must be given to remove the observer.
+    """
+    return _Throttler(interval, merge, timer_source, dispatcher)
@@ -0,0 +1,121 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import itertools
+import unittest
+
+from traits.observation import _dsl_parser
+from traits.observation._generated_parser import (
+    Lark_StandAlone,
+    UnexpectedInput,
+)
+from traits.observation.parsing import _handle_tree
+
+LARK_PARSER = Lark_StandAlone()
+
+
+def parse_with_lark(text):
+    """ Return the ObserverExpression for text parsed with the generated
+    parser, or None if the text is invalid.
+    """
+    try:
+        tree = LARK_PARSER.parse(text)
+    except UnexpectedInput:
+        return None
+    return _handle_tree(tree, notify=True)
+
+
+def parse_with_dsl_parser(text):
+    """ Return the ObserverExpression for text parsed with the
+    recursive-descent parser, or None if the text is invalid.
+    """
+    try:
+        tree = _dsl_parser.parse(text)
+    except _dsl_parser.ParseError:
+        return None
+    return _handle_tree(tree, notify=True)
+
+
+class TestDslParser(unittest.TestCase):
+    """ Test the recursive-descent parser against the parser generated from
+    the grammar.
+    """
+
+    def test_tree(self):
+        tree = _dsl_parser.parse("a.[b, +c]:items,*")
+
+        self.assertEqual(
+            repr(tree),
+            "Tree('parallel', ["
+            "Tree('series', ["
+            "Tree('series', ["
+            "Tree('trait', [Token('NAME', 'a')]), "
+            "Tree('notify', []), "
+            "Tree('parallel', ["
+            "Tree('trait', [Token('NAME', 'b')]), "
+            "Tree('metadata', [Token('NAME', 'c')])])]), "
+            "Tree('quiet', []), "
+            "Tree('items', [])]), "
+            "Tree('anytrait', [])])",
+        )
+
+    def test_examples(self):
+        examples = [
+            "name",
+            "name123",
+            "_name",
+            "namé",
+            "items",
+            "items2",
+            "+items",
+            "+ name",
+            "foo  .  bar",
+            "foo\n:\tbar",
+            "[foo, [bar, baz]]:spam",
+            "foo:[bar.spam,baz].items",
+            "a.b:*, c, +d:*",
+            "[a].*",
+            "",
+            " ",
+            "1name",
+            "é",
+            "a\vb",
+            "a b",
+            "a.b.c^abc",
+            "[a.b]c",
+            "a*.c",
+            "a.*.b",
+            "[a,*]",
+            "[a.*]",
+            "*.a",
+            "a:[b,c]:",
+            "[]",
+            "[a",
+            "a]",
+            "+",
+            "+*",
+            "a()",
+        ]
+        for text in examples:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    parse_with_dsl_parser(text), parse_with_lark(text)
+                )
+
+    def test_all_short_expressions(self):
+        # Compare the parsers on every sequence of up to four tokens.
+        tokens = ["a", "items", "+", "*", ".", ":", ",", "[", "]", " "]
+        mismatches = []
+        for length in range(1, 5):
+            for sequence in itertools.product(tokens, repeat=length):
+                text = "".join(sequence)
+                if parse_with_dsl_parser(text) != parse_with_lark(text):
+                    mismatches.append(text)
+        self.assertEqual(mismatches, [])
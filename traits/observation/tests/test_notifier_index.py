@@ -0,0 +1,252 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+from unittest import mock
+
+from traits.observation._notifier_index import (
+    _indices,
+    get_notifier_index,
+    index_key,
+    INDEX_THRESHOLD,
+    NotifierIndex,
+)
+from traits.observation._trait_event_notifier import TraitEventNotifier
+
+
+def dispatch_here(function, event):
+    """ Dispatcher that let the function call through."""
+    function(event)
+
+
+# Dummy target object that is not garbage collected while the tests are run.
+_DUMMY_TARGET = mock.Mock()
+
+
+def create_notifier(**kwargs):
+    """ Convenient function for creating an instance of TraitEventNotifier
+    for testing purposes.
+    """
+    values = dict(
+        handler=mock.Mock(),
+        target=_DUMMY_TARGET,
+        event_factory=mock.Mock(),
+        prevent_event=lambda event: False,
+        dispatcher=dispatch_here,
+    )
+    values.update(kwargs)
+    return TraitEventNotifier(**values)
+
+
+class DummyObservable:
+    """ Dummy implementation of IObservable for testing purposes.
+    """
+
+    def __init__(self):
+        self.notifiers = []
+
+    def _notifiers(self, force_create):
+        return self.notifiers
+
+    def handler(self, event):
+        pass
+
+
+class SlottedObservable:
+    """ Implementation of IObservable that doesn't support weak references.
+    """
+
+    __slots__ = ("notifiers",)
+
+    def __init__(self):
+        self.notifiers = []
+
+    def _notifiers(self, force_create):
+        return self.notifiers
+
+
+class TestNotifierIndex(unittest.TestCase):
+    """ Test NotifierIndex."""
+
+    def test_find(self):
+        handler = mock.Mock()
+        notifier1 = create_notifier(handler=handler)
+        notifier2 = create_notifier(handler=handler)
+        notifier3 = create_notifier()
+
+        index = NotifierIndex([str, notifier1])
+
+        self.assertIs(index.find(notifier1), notifier1)
+        self.assertIs(index.find(notifier2), notifier1)
+        self.assertIsNone(index.find(notifier3))
+
+    def test_find_first_of_equivalent_notifiers(self):
+        handler = mock.Mock()
+        notifier1 = create_notifier(handler=handler)
+        notifier2 = create_notifier(handler=handler)
+        notifiers = [notifier1, notifier2]
+
+        index = NotifierIndex(notifiers)
+        self.assertIs(index.find(notifier2), notifier1)
+
+        notifiers.remove(notifier1)
+        index.discard(notifier1)
+        self.assertIs(index.find(notifier1), notifier2)
+
+    def test_add_and_discard(self):
+        notifier = create_notifier()
+        notifiers = []
+        index = NotifierIndex(notifiers)
+
+        notifiers.append(notifier)
+        index.add(notifier)
+        self.assertIs(index.find(notifier), notifier)
+
+        notifiers.remove(notifier)
+        index.discard(notifier)
+        self.assertIsNone(index.find(notifier))
+
+        # Discarding a notifier that isn't indexed does nothing.
+        index.discard(notifier)
+        index.discard(str)
+
+    def test_find_with_reused_key(self):
+        # Keys contain the ids of handlers and targets, which may be reused
+        # by new objects.
+        notifier1 = create_notifier()
+        notifier2 = create_notifier()
+        index = NotifierIndex([notifier1])
+
+        with mock.patch.object(
+            notifier2, "_index_key", return_value=notifier1._index_key()
+        ):
+            self.assertIsNone(index.find(notifier2))
+
+    def test_find_notifier_without_key(self):
+        notifier = create_notifier()
+        index = NotifierIndex([notifier])
+
+        with mock.patch.object(notifier, "_index_key", return_value=None):
+            self.assertIs(index.find(notifier), notifier)
+
+
+class TestGetNotifierIndex(unittest.TestCase):
+    """ Test creating and looking up the index for an observable."""
+
+    def add_notifiers(self, observable, count):
+        for _ in range(count):
+            create_notifier().add_to(observable)
+
+    def test_index_created_for_many_notifiers(self):
+        dummy = DummyObservable()
+
+        self.add_notifiers(dummy, INDEX_THRESHOLD - 1)
+        self.assertIsNone(get_notifier_index(dummy, dummy.notifiers))
+
+        self.add_notifiers(dummy, 1)
+        index = get_notifier_index(dummy, dummy.notifiers)
+        self.assertIsInstance(index, NotifierIndex)
+        self.assertIs(get_notifier_index(dummy, dummy.notifiers), index)
+
+    def test_index_kept_for_fewer_notifiers(self):
+        dummy = DummyObservable()
+        self.add_notifiers(dummy, INDEX_THRESHOLD)
+        index = get_notifier_index(dummy, dummy.notifiers)
+
+        dummy.notifiers.clear()
+
+        self.assertIs(get_notifier_index(dummy, dummy.notifiers), index)
+
+    def test_replaced_notifiers_list(self):
+        dummy = DummyObservable()
+        self.add_notifiers(dummy, INDEX_THRESHOLD)
+        index = get_notifier_index(dummy, dummy.notifiers)
+        notifier = create_notifier()
+
+        # when
+        dummy.notifiers = [notifier] * INDEX_THRESHOLD
+
+        # then
+        new_index = get_notifier_index(dummy, dummy.notifiers)
+        self.assertIsNot(new_index, index)
+        self.assertIs(new_index.find(notifier), notifier)
+
+        # when
+        dummy.notifiers = []
+
+        # then
+        self.assertIsNone(get_notifier_index(dummy, dummy.notifiers))
+
+    def test_index_discarded_with_observable(self):
+        dummy = DummyObservable()
+        self.add_notifiers(dummy, INDEX_THRESHOLD)
+        get_notifier_index(dummy, dummy.notifiers)
+        key = id(dummy)
+        self.assertIn(key, _indices)
+
+        # when
+        del dummy
+
+        # then
+        self.assertNotIn(key, _indices)
+
+    def test_observable_without_weakref_support(self):
+        observable = SlottedObservable()
+        self.add_notifiers(observable, INDEX_THRESHOLD)
+
+        self.assertIsNone(
+            get_notifier_index(observable, observable.notifiers)
+        )
+
+
+class TestIndexKey(unittest.TestCase):
+    """ Test index_key."""
+
+    def test_equal_for_equal_arguments(self):
+        handler = mock.Mock()
+        target = mock.Mock()
+
+        self.assertEqual(
+            index_key(TraitEventNotifier, handler, target, dispatch_here),
+            index_key(TraitEventNotifier, handler, target, dispatch_here),
+        )
+        self.assertNotEqual(
+            index_key(TraitEventNotifier, handler, target, dispatch_here),
+            index_key(TraitEventNotifier, handler, target, print),
+        )
+        self.assertNotEqual(
+            index_key(TraitEventNotifier, handler, target),
+            index_key(TraitEventNotifier, handler, mock.Mock()),
+        )
+        self.assertNotEqual(
+            index_key(TraitEventNotifier, handler, target),
+            index_key(object, handler, target),
+        )
+
+    def test_instance_methods(self):
+        dummy = DummyObservable()
+        target = mock.Mock()
+
+        self.assertEqual(
+            index_key(TraitEventNotifier, dummy.handler, target),
+            index_key(TraitEventNotifier, dummy.handler, target),
+        )
+        self.assertNotEqual(
+            index_key(TraitEventNotifier, dummy.handler, target),
+            index_key(TraitEventNotifier, DummyObservable().handler, target),
+        )
+
+    def test_no_key(self):
+        handler = mock.Mock()
+        target = mock.Mock()
+
+        self.assertIsNone(index_key(TraitEventNotifier, None, target))
+        self.assertIsNone(index_key(TraitEventNotifier, handler, None))
+        self.assertIsNone(index_key(TraitEventNotifier, handler, target, []))
@@ -10,6 +10,7 @@
 
 import asyncio
 from contextlib import contextmanager
+import threading
 import unittest
 from unittest import mock
 
@@ -23,9 +24,14 @@ from traits.observation.exceptions import NotifierNotFound
 from traits.observation.expression import compile_expr, trait
 from traits.observation.observe import (
     apply_observers,
+    compile_graphs,
+    dispatch_asyncio,
     dispatch_same,
+    get_asyncio_loop,
     observe,
+    set_asyncio_loop,
 )
+from traits.observation._observe import LazyNotifier
 from traits.observation._observer_graph import ObserverGraph
 from traits.observation._testing import (
     call_add_or_remove_notifiers,
@@ -217,6 +223,130 @@ class TestObserveAddNotifier(unittest.TestCase):
         self.assertEqual(observable.notifiers, [])
 
 
+class TestObserveLazy(unittest.TestCase):
+    """ Test add_or_remove_notifiers with lazy=True."""
+
+    def setUp(self):
+        self.object = DummyObservable()
+        self.observable = DummyObservable()
+        self.child_object = DummyObservable()
+        self.child_observable = DummyObservable()
+        self.grandchild_object = DummyObservable()
+        self.grandchild_observable = DummyObservable()
+        self.parent_observer = DummyObserver(
+            observables=[self.observable],
+            next_objects=[self.child_object],
+        )
+        self.child_observer = DummyObserver(
+            observables=[self.child_observable],
+            next_objects=[self.grandchild_object],
+        )
+        grandchild_observer = DummyObserver(
+            observables=[self.grandchild_observable],
+        )
+        self.graph = create_graph(
+            self.parent_observer, self.child_observer, grandchild_observer
+        )
+        self.handler = mock.Mock()
+
+    def add_or_remove(self, remove=False):
+        """ Lazily add, or remove, notifiers for the graph and handler. """
+        call_add_or_remove_notifiers(
+            object=self.object,
+            graph=self.graph,
+            handler=self.handler,
+            remove=remove,
+            lazy=not remove,
+        )
+
+    def test_add_arms_next_objects(self):
+        # when
+        self.add_or_remove()
+
+        # then
+        self.assertEqual(self.object.notifiers, [])
+        self.assertEqual(
+            self.observable.notifiers,
+            [self.parent_observer.notifier, self.parent_observer.maintainer],
+        )
+        self.assertEqual(
+            [type(notifier) for notifier in self.child_object.notifiers],
+            [LazyNotifier],
+        )
+        self.assertEqual(self.child_observable.notifiers, [])
+        self.assertEqual(self.grandchild_object.notifiers, [])
+        self.assertEqual(self.grandchild_observable.notifiers, [])
+
+    def test_lazy_notifier_adds_notifiers_on_change(self):
+        self.add_or_remove()
+        (lazy_notifier,) = self.child_object.notifiers
+
+        # when
+        lazy_notifier(self.child_object)
+
+        # then
+        self.assertEqual(self.child_object.notifiers, [])
+        self.assertEqual(
+            self.child_observable.notifiers,
+            [self.child_observer.notifier, self.child_observer.maintainer],
+        )
+        # The grandchild object is now waiting for a change of its own.
+        self.assertEqual(
+            [type(notifier) for notifier in self.grandchild_object.notifiers],
+            [LazyNotifier],
+        )
+        self.assertEqual(self.grandchild_observable.notifiers, [])
+
+    def test_remove_armed_objects(self):
+        self.add_or_remove()
+
+        # when
+        self.add_or_remove(remove=True)
+
+        # then
+        self.assertEqual(self.observable.notifiers, [])
+        self.assertEqual(self.child_object.notifiers, [])
+
+    def test_remove_after_change(self):
+        self.add_or_remove()
+        self.child_object.notifiers[0](self.child_object)
+
+        # when
+        self.add_or_remove(remove=True)
+
+        # then
+        self.assertEqual(self.observable.notifiers, [])
+        self.assertEqual(self.child_observable.notifiers, [])
+        self.assertEqual(self.grandchild_object.notifiers, [])
+
+    def test_reference_count(self):
+        for _ in range(2):
+            self.add_or_remove()
+        (lazy_notifier,) = self.child_object.notifiers
+
+        self.add_or_remove(remove=True)
+        self.assertEqual(self.child_object.notifiers, [lazy_notifier])
+
+        self.add_or_remove(remove=True)
+        self.assertEqual(self.child_object.notifiers, [])
+
+    def test_object_without_notifiers_is_not_armed(self):
+        self.parent_observer.next_objects = [mock.Mock()]
+
+        # when
+        self.add_or_remove()
+
+        # then
+        self.assertEqual(
+            self.child_observable.notifiers,
+            [self.child_observer.notifier, self.child_observer.maintainer],
+        )
+        self.assertEqual(
+            [type(notifier) for notifier in self.grandchild_object.notifiers],
+            [LazyNotifier],
+        )
+
+
 class TestObserveRemoveNotifier(unittest.TestCase):
     """ Test the remove action."""
 
@@ -657,6 +787,101 @@ class TestApplyObservers(unittest.TestCase):
         self.assertEqual(handler.call_count, 2)
 
 
+class TestCompileGraphs(unittest.TestCase):
+    """ Test the templates returned by compile_graphs."""
+
+    def setUp(self):
+        push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_exception_handler)
+
+    def add_notifiers(self, template, object, handler):
+        template.add_notifiers(
+            object=object,
+            handler=handler,
+            target=object,
+            dispatcher=dispatch_same,
+        )
+
+    def test_template_reused_for_many_objects(self):
+        graphs = compile_expr(trait("number"))
+        template, = compile_graphs(graphs)
+        handler = mock.Mock()
+        foos = [ClassWithNumber() for _ in range(3)]
+
+        for foo in foos:
+            self.add_notifiers(template, foo, handler)
+        for foo in foos:
+            foo.number += 1
+
+        self.assertEqual(handler.call_count, 3)
+
+    def test_template_matches_add_or_remove_notifiers(self):
+        # Notifiers added by a template can be removed by apply_observers,
+        # which requires them to be equivalent.
+        graphs = compile_expr(trait("instance").trait("number"))
+        parent = ClassWithInstance(instance=ClassWithNumber())
+        handler = mock.Mock()
+
+        for template in compile_graphs(graphs):
+            self.add_notifiers(template, parent, handler)
+        parent.instance.number += 1
+        parent.instance = ClassWithNumber()
+        parent.instance.number += 1
+        self.assertEqual(handler.call_count, 3)
+
+        apply_observers(
+            object=parent,
+            graphs=graphs,
+            handler=handler,
+            dispatcher=dispatch_same,
+            remove=True,
+        )
+        parent.instance.number += 1
+        parent.instance = ClassWithNumber()
+        self.assertEqual(handler.call_count, 3)
+
+    def test_template_for_added_trait(self):
+        graphs = compile_expr(trait("extra", optional=True))
+        template, = compile_graphs(graphs)
+        foo = ClassWithNumber()
+        handler = mock.Mock()
+
+        self.add_notifiers(template, foo, handler)
+        foo.add_trait("extra", Int())
+        foo.extra += 1
+
+        self.assertEqual(handler.call_count, 1)
+
+    def test_template_atomic(self):
+
+        class BadNotifier(DummyNotifier):
+            def add_to(self, observable):
+                raise ZeroDivisionError()
+
+        observable = DummyObservable()
+        good_observer = DummyObserver(
+            notify=True,
+            observables=[observable],
+            next_objects=[mock.Mock()],
+            notifier=DummyNotifier(),
+            maintainer=DummyNotifier(),
+        )
+        bad_observer = DummyObserver(
+            notify=True,
+            observables=[observable],
+            notifier=BadNotifier(),
+            maintainer=DummyNotifier(),
+        )
+        template, = compile_graphs(
+            [create_graph(good_observer, bad_observer)]
+        )
+
+        with self.assertRaises(ZeroDivisionError):
+            self.add_notifiers(template, mock.Mock(), mock.Mock())
+
+        self.assertEqual(observable.notifiers, [])
+
+
 # ---- Low-level tests for async dispatch_same ------------------------------
 
 
@@ -722,3 +947,132 @@ class TestAsyncDispatchSame(unittest.IsolatedAsyncioTestCase):
             yield exc_handler
         finally:
             loop.set_exception_handler(old_handler)
+
+
+# ---- Tests for dispatch_asyncio --------------------------------------------
+
+
+class TestDispatchAsyncio(unittest.IsolatedAsyncioTestCase):
+    """ Test dispatch to an event loop with dispatch_asyncio. """
+
+    def setUp(self):
+        self.addCleanup(set_asyncio_loop, None)
+
+        push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_exception_handler)
+
+    async def wait_for(self, condition, timeout=10.0):
+        """ Let the loop run until condition() is true. """
+        async def wait():
+            while not condition():
+                await asyncio.sleep(0.001)
+
+        await asyncio.wait_for(wait(), timeout=timeout)
+
+    def test_no_loop(self):
+        with self.assertRaises(RuntimeError):
+            dispatch_asyncio(mock.Mock(), mock.Mock())
+
+    async def test_get_asyncio_loop(self):
+        self.assertIsNone(get_asyncio_loop())
+
+        loop = asyncio.get_running_loop()
+        set_asyncio_loop(loop)
+        self.assertIs(get_asyncio_loop(), loop)
+
+        set_asyncio_loop(None)
+        self.assertIsNone(get_asyncio_loop())
+
+    def test_invalid_max_tasks(self):
+        with self.assertRaises(ValueError):
+            set_asyncio_loop(mock.Mock(), max_tasks=0)
+
+    async def test_dispatch_from_other_thread(self):
+        set_asyncio_loop(asyncio.get_running_loop())
+        threads = []
+        foo = ClassWithNumber()
+        foo.observe(
+            lambda event: threads.append(threading.current_thread()),
+            "number",
+            dispatch="asyncio",
+        )
+
+        thread = threading.Thread(target=setattr, args=(foo, "number", 1))
+        thread.start()
+        thread.join(timeout=10.0)
+        await self.wait_for(lambda: threads)
+
+        self.assertEqual(threads, [threading.current_thread()])
+
+    async def test_async_handler(self):
+        set_asyncio_loop(asyncio.get_running_loop())
+        events = []
+        foo = ClassWithNumber()
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            events.append(event)
+
+        foo.observe(handler, "number", dispatch="asyncio")
+        foo.number = 1
+        foo.number = 2
+        await self.wait_for(lambda: len(events) == 2)
+
+        self.assertEqual([event.new for event in events], [1, 2])
+
+    async def test_coalesce(self):
+        set_asyncio_loop(asyncio.get_running_loop(), coalesce=True)
+        handler = mock.Mock()
+        foo, bar = ClassWithNumber(), ClassWithNumber()
+        foo.observe(handler, "number", dispatch="asyncio")
+        bar.observe(handler, "number", dispatch="asyncio")
+
+        for number in range(1, 11):
+            foo.number = number
+        bar.number = 1
+        await self.wait_for(lambda: handler.call_count == 2)
+        await asyncio.sleep(0.01)
+
+        events = [call[0][0] for call in handler.call_args_list]
+        self.assertEqual(
+            [(event.object, event.old, event.new) for event in events],
+            [(foo, 9, 10), (bar, 0, 1)],
+        )
+
+    async def test_max_tasks(self):
+        set_asyncio_loop(asyncio.get_running_loop(), max_tasks=2)
+        running = []
+        peak = []
+        done = []
+        foo = ClassWithNumber()
+
+        async def handler(event):
+            running.append(event)
+            peak.append(len(running))
+            await asyncio.sleep(0.001)
+            running.remove(event)
+            done.append(event.new)
+
+        foo.observe(handler, "number", dispatch="asyncio")
+        for number in range(1, 11):
+            foo.number = number
+        await self.wait_for(lambda: len(done) == 10)
+
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(sorted(done), list(range(1, 11)))
+
+    async def test_async_handler_exception(self):
+        set_asyncio_loop(asyncio.get_running_loop())
+        events = []
+        push_exception_handler(events.append)
+        self.addCleanup(pop_exception_handler)
+        foo = ClassWithNumber()
+
+        async def handler(event):
+            raise ZeroDivisionError()
+
+        foo.observe(handler, "number", dispatch="asyncio")
+        foo.number = 1
+        await self.wait_for(lambda: events)
+
+        self.assertEqual(events[0].new, 1)
@@ -13,6 +13,7 @@ from unittest import mock
 import weakref
 
 from traits.api import HasTraits, Instance, Int
+from traits.observation._notifier_index import INDEX_THRESHOLD
 from traits.observation._observer_change_notifier import ObserverChangeNotifier
 from traits.observation._observer_graph import ObserverGraph
 from traits.observation.exceptions import NotifierNotFound
@@ -549,6 +550,46 @@ class TestObserverChangeNotifierRemove(unittest.TestCase):
         # then
         self.assertEqual(instance.notifiers, [])
 
+    def test_remove_from_observable_with_many_notifiers(self):
+        # Test equivalent notifiers are found when the observable's
+        # notifiers are indexed.
+        instance = DummyClass()
+        observer_handler = mock.Mock()
+        target = mock.Mock()
+        handlers = [mock.Mock() for _ in range(INDEX_THRESHOLD + 2)]
+        for handler in handlers:
+            create_notifier(
+                handler=handler,
+                observer_handler=observer_handler,
+                graph=ObserverGraph(node=None),
+                target=target,
+            ).add_to(instance)
+        first, second, *others = instance.notifiers
+
+        # when
+        create_notifier(
+            handler=handlers[-1],
+            observer_handler=observer_handler,
+            graph=ObserverGraph(node=None),
+            target=target,
+        ).remove_from(instance)
+        create_notifier(
+            handler=handlers[0],
+            observer_handler=observer_handler,
+            graph=ObserverGraph(node=None),
+            target=target,
+        ).remove_from(instance)
+
+        # then
+        self.assertEqual(instance.notifiers, [second] + others[:-1])
+        with self.assertRaises(NotifierNotFound):
+            create_notifier(
+                handler=handlers[0],
+                observer_handler=observer_handler,
+                graph=ObserverGraph(node=None),
+                target=target,
+            ).remove_from(instance)
+
 
 class TestIntegrationHasTraits(unittest.TestCase):
     """ Semi-integration tests with HasTraits notifications.
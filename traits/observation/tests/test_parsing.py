@@ -9,7 +9,10 @@
 # Thanks for using Enthought open source!
 
 import unittest
+from unittest import mock
 
+from traits.observation import parsing
+from traits.observation._generated_parser import UnexpectedInput
 from traits.observation._named_trait_observer import NamedTraitObserver
 from traits.observation._testing import create_graph
 from traits.observation.parsing import compile_str, parse
@@ -176,6 +179,30 @@ class TestParsingGeneral(unittest.TestCase):
                 with self.assertRaises(ValueError):
                     parse(expression)
 
+    def test_parse_error_message(self):
+        with self.assertRaises(ValueError) as exception_context:
+            parse("a.[b,c")
+
+        exception = exception_context.exception
+        self.assertEqual(str(exception), "Invalid expression: 'a.[b,c'")
+        # The generated parser is used to describe the error.
+        self.assertIsInstance(exception.__cause__, UnexpectedInput)
+
+    def test_generated_parser_not_used_for_valid_text(self):
+        with mock.patch.object(
+            parsing, "_parse_with_lark", side_effect=AssertionError
+        ):
+            actual = parse("a.[b,c]:+d, e.*, unused_in_other_tests")
+
+        expected = (
+            trait("a")
+            .then(trait("b", False) | trait("c", False))
+            .metadata("d")
+            | trait("e").anytrait()
+            | trait("unused_in_other_tests")
+        )
+        self.assertEqual(actual, expected)
+
     def test_deep_nesting(self):
         actual = parse("[[a:b].c]:d")
         expected = (
@@ -232,3 +259,9 @@ class TestCompileFromStr(unittest.TestCase):
             ),
         ]
         self.assertEqual(actual, expected)
+
+    def test_compile_returns_new_list(self):
+        graphs = compile_str("name")
+        graphs.append(None)
+
+        self.assertEqual(len(compile_str("name")), 1)
@@ -0,0 +1,288 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+from traits.api import Float, HasTraits, List, observe
+from traits.observation.api import (
+    pop_exception_handler,
+    push_exception_handler,
+)
+from traits.observation.rate_limiting import (
+    AsyncioTimerSource,
+    debounce,
+    get_default_timer_source,
+    ManualTimerSource,
+    merge_trait_change_events,
+    set_default_timer_source,
+    throttle,
+    ThreadTimerSource,
+)
+
+# Timeout for blocking calls, in seconds.
+SAFETY_TIMEOUT = 10.0
+
+
+class Sensor(HasTraits):
+    reading = Float()
+
+    readings = List()
+
+    @observe("reading", dispatch=throttle(0.05))
+    def _record_reading(self, event):
+        self.readings.append(event.new)
+
+
+def values(handler):
+    """ Return the (old, new) values of the events a mock handler got. """
+    return [
+        (call[0][0].old, call[0][0].new) for call in handler.call_args_list
+    ]
+
+
+class TestManualTimerSource(unittest.TestCase):
+
+    def test_calls_made_in_order(self):
+        timer_source = ManualTimerSource()
+        calls = []
+        timer_source.call_later(0.2, lambda: calls.append("second"))
+        timer_source.call_later(0.1, lambda: calls.append("first"))
+        timer_source.call_later(0.5, lambda: calls.append("later"))
+
+        timer_source.advance(0.3)
+
+        self.assertEqual(calls, ["first", "second"])
+        self.assertEqual(timer_source.monotonic(), 0.3)
+
+    def test_calls_scheduled_by_calls(self):
+        timer_source = ManualTimerSource(time=1.0)
+        times = []
+
+        def callback():
+            times.append(timer_source.monotonic())
+            timer_source.call_later(0.25, callback)
+
+        timer_source.call_later(0.25, callback)
+        timer_source.advance(1.0)
+
+        self.assertEqual(times, [1.25, 1.5, 1.75, 2.0])
+
+
+class TestThreadTimerSource(unittest.TestCase):
+
+    def test_call_later(self):
+        timer_source = ThreadTimerSource()
+        called = threading.Event()
+        threads = []
+
+        def callback():
+            threads.append(threading.current_thread())
+            called.set()
+
+        start = timer_source.monotonic()
+        timer_source.call_later(0.01, callback)
+
+        self.assertTrue(called.wait(timeout=SAFETY_TIMEOUT))
+        self.assertGreaterEqual(timer_source.monotonic() - start, 0.01)
+        self.assertNotEqual(threads, [threading.current_thread()])
+
+    def test_exception_logged(self):
+        timer_source = ThreadTimerSource()
+        called = threading.Event()
+
+        def fail():
+            raise ZeroDivisionError()
+
+        with self.assertLogs("traits", level="ERROR"):
+            timer_source.call_later(0.0, fail)
+            timer_source.call_later(0.0, called.set)
+            self.assertTrue(called.wait(timeout=SAFETY_TIMEOUT))
+
+
+class TestAsyncioTimerSource(unittest.IsolatedAsyncioTestCase):
+
+    async def test_call_later(self):
+        loop = asyncio.get_running_loop()
+        timer_source = AsyncioTimerSource(loop)
+        called = asyncio.Event()
+
+        start = timer_source.monotonic()
+        timer_source.call_later(0.01, called.set)
+
+        await asyncio.wait_for(called.wait(), timeout=SAFETY_TIMEOUT)
+        self.assertGreaterEqual(loop.time() - start, 0.01)
+
+
+class TestRateLimiting(unittest.TestCase):
+
+    def setUp(self):
+        push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_exception_handler)
+
+        self.timer_source = ManualTimerSource()
+        set_default_timer_source(self.timer_source)
+        self.addCleanup(set_default_timer_source, None)
+
+    def test_default_timer_source(self):
+        self.assertIs(get_default_timer_source(), self.timer_source)
+
+        set_default_timer_source(None)
+
+        self.assertIsInstance(get_default_timer_source(), ThreadTimerSource)
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            debounce(-1.0)
+
+    def test_debounce(self):
+        sensor = Sensor()
+        handler = mock.Mock()
+        sensor.observe(handler, "reading", dispatch=debounce(0.05))
+
+        for reading in range(1, 4):
+            sensor.reading = reading
+            self.timer_source.advance(0.03)
+        self.assertEqual(handler.call_count, 0)
+
+        # The last change was at t=0.06.
+        self.timer_source.advance(0.0199)
+        self.assertEqual(handler.call_count, 0)
+        self.timer_source.advance(0.0002)
+        self.assertEqual(values(handler), [(2.0, 3.0)])
+
+        self.timer_source.advance(1.0)
+        self.assertEqual(handler.call_count, 1)
+
+    def test_debounce_merge(self):
+        sensor = Sensor()
+        handler = mock.Mock()
+        sensor.observe(
+            handler,
+            "reading",
+            dispatch=debounce(0.05, merge=merge_trait_change_events),
+        )
+
+        for reading in range(1, 4):
+            sensor.reading = reading
+        self.timer_source.advance(0.05)
+
+        self.assertEqual(values(handler), [(0.0, 3.0)])
+
+    def test_debounce_per_object(self):
+        first, second = Sensor(), Sensor()
+        handler = mock.Mock()
+        dispatcher = debounce(0.05)
+        first.observe(handler, "reading", dispatch=dispatcher)
+        second.observe(handler, "reading", dispatch=dispatcher)
+
+        first.reading = 1.0
+        second.reading = 2.0
+        self.timer_source.advance(0.05)
+
+        objects = [call[0][0].object for call in handler.call_args_list]
+        self.assertEqual(objects, [first, second])
+
+    def test_throttle(self):
+        sensor = Sensor()
+
+        for reading in range(1, 6):
+            sensor.reading = reading
+        # The first change is dispatched immediately.
+        self.assertEqual(sensor.readings, [1.0])
+
+        self.timer_source.advance(0.05)
+        self.assertEqual(sensor.readings, [1.0, 5.0])
+
+        # A new window was opened at the end of the first one.
+        sensor.reading = 6.0
+        self.assertEqual(sensor.readings, [1.0, 5.0])
+        self.timer_source.advance(0.05)
+        self.assertEqual(sensor.readings, [1.0, 5.0, 6.0])
+
+        # Without events, the window closes.
+        self.timer_source.advance(0.05)
+        sensor.reading = 7.0
+        self.assertEqual(sensor.readings, [1.0, 5.0, 6.0, 7.0])
+
+    def test_throttle_merge(self):
+        sensor = Sensor()
+        handler = mock.Mock()
+        sensor.observe(
+            handler,
+            "reading",
+            dispatch=throttle(0.05, merge=merge_trait_change_events),
+        )
+
+        for reading in range(1, 6):
+            sensor.reading = reading
+        self.timer_source.advance(0.05)
+
+        self.assertEqual(values(handler), [(0.0, 1.0), (1.0, 5.0)])
+
+    def test_given_timer_source(self):
+        timer_source = ManualTimerSource()
+        sensor = Sensor()
+        handler = mock.Mock()
+        sensor.observe(
+            handler,
+            "reading",
+            dispatch=debounce(0.05, timer_source=timer_source),
+        )
+
+        sensor.reading = 1.0
+        self.timer_source.advance(0.05)
+        self.assertEqual(handler.call_count, 0)
+
+        timer_source.advance(0.05)
+        self.assertEqual(handler.call_count, 1)
+
+    def test_given_dispatcher(self):
+        sensor = Sensor()
+        handler = mock.Mock()
+        dispatched = []
+
+        def dispatcher(handler, event):
+            dispatched.append(event)
+            handler(event)
+
+        sensor.observe(
+            handler,
+            "reading",
+            dispatch=debounce(0.05, dispatcher=dispatcher),
+        )
+        sensor.reading = 1.0
+        self.timer_source.advance(0.05)
+
+        self.assertEqual(len(dispatched), 1)
+        self.assertEqual(handler.call_count, 1)
+
+    def test_remove_observer(self):
+        sensor = Sensor()
+        handler = mock.Mock()
+        dispatcher = debounce(0.05)
+
+        sensor.observe(handler, "reading", dispatch=dispatcher)
+        sensor.observe(handler, "reading", dispatch=dispatcher, remove=True)
+        sensor.reading = 1.0
+        self.timer_source.advance(0.05)
+
+        self.assertEqual(handler.call_count, 0)
+
+    def test_exception_in_delayed_call(self):
+        sensor = Sensor()
+        handler = mock.Mock(side_effect=ZeroDivisionError())
+        sensor.observe(handler, "reading", dispatch=debounce(0.05))
+
+        sensor.reading = 1.0
+        with self.assertRaises(ZeroDivisionError):
+            self.timer_source.advance(0.05)
@@ -17,6 +17,7 @@ from traits.observation.exception_handling import (
     push_exception_handler,
 )
 from traits.observation.exceptions import NotifierNotFound
+from traits.observation._notifier_index import _indices, INDEX_THRESHOLD
 from traits.observation._trait_event_notifier import TraitEventNotifier
 
 
@@ -426,6 +427,132 @@ class TestTraitEventNotifierAddRemove(unittest.TestCase):
         )
 
 
+class UnhashableHandler:
+    """ Callable handler that compares equal to other instances, and hence
+    can't be indexed.
+    """
+
+    __hash__ = None
+
+    def __call__(self, event):
+        pass
+
+    def __eq__(self, other):
+        return type(other) is type(self)
+
+
+class TestTraitEventNotifierIndex(unittest.TestCase):
+    """ Test adding and removing notifiers to and from observables with
+    enough notifiers to be indexed.
+    """
+
+    def setUp(self):
+        push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_exception_handler)
+
+    def add_notifiers(self, observable, count=INDEX_THRESHOLD + 1):
+        notifiers = [create_notifier() for _ in range(count)]
+        for notifier in notifiers:
+            notifier.add_to(observable)
+        return notifiers
+
+    def test_add_and_remove(self):
+        dummy = DummyObservable()
+        dummy.notifiers = [str, float]
+        notifiers = self.add_notifiers(dummy)
+
+        def handler(event):
+            pass
+
+        notifier1 = create_notifier(handler=handler)
+        notifier2 = create_notifier(handler=handler)
+
+        # when
+        notifier1.add_to(dummy)
+        notifier2.add_to(dummy)
+
+        # then
+        self.assertEqual(
+            dummy.notifiers, [str, float] + notifiers + [notifier1]
+        )
+        self.assertEqual(notifier1._ref_count, 2)
+
+        # when
+        notifier2.remove_from(dummy)
+        notifiers[0].remove_from(dummy)
+
+        # then
+        self.assertEqual(
+            dummy.notifiers, [str, float] + notifiers[1:] + [notifier1]
+        )
+
+        # when
+        notifier2.remove_from(dummy)
+
+        # then
+        self.assertEqual(dummy.notifiers, [str, float] + notifiers[1:])
+        with self.assertRaises(NotifierNotFound):
+            notifier2.remove_from(dummy)
+
+    def test_equivalent_instance_methods(self):
+        dummy = DummyObservable()
+        self.add_notifiers(dummy)
+        other = DummyObservable()
+
+        notifier1 = create_notifier(handler=other.handler)
+        notifier2 = create_notifier(handler=other.handler)
+        notifier1.add_to(dummy)
+        notifier2.add_to(dummy)
+
+        self.assertEqual(notifier1._ref_count, 2)
+        self.assertEqual(dummy.notifiers.count(notifier1), 1)
+        self.assertNotIn(notifier2, dummy.notifiers)
+
+    def test_different_targets_and_dispatchers(self):
+        dummy = DummyObservable()
+        self.add_notifiers(dummy)
+        handler = mock.Mock()
+
+        notifiers = [
+            create_notifier(handler=handler),
+            create_notifier(handler=handler, target=dummy),
+            create_notifier(handler=handler, dispatcher=mock.Mock()),
+        ]
+        for notifier in notifiers:
+            notifier.add_to(dummy)
+
+        self.assertEqual(dummy.notifiers[-3:], notifiers)
+
+    def test_unhashable_handler(self):
+        dummy = DummyObservable()
+        self.add_notifiers(dummy)
+
+        notifier1 = create_notifier(handler=UnhashableHandler())
+        notifier2 = create_notifier(handler=UnhashableHandler())
+        notifier1.add_to(dummy)
+        notifier2.add_to(dummy)
+
+        self.assertEqual(notifier1._ref_count, 2)
+        notifier2.remove_from(dummy)
+        notifier2.remove_from(dummy)
+        self.assertNotIn(notifier1, dummy.notifiers)
+
+    def test_existing_notifiers_are_indexed(self):
+        dummy = DummyObservable()
+        notifiers = self.add_notifiers(dummy, INDEX_THRESHOLD)
+        self.assertNotIn(id(dummy), _indices)
+
+        # when
+        # The equivalent notifier is found in the index, which is created
+        # at this point.
+        notifiers[0].add_to(dummy)
+
+        # then
+        self.assertIn(id(dummy), _indices)
+        self.assertEqual(notifiers[0]._ref_count, 2)
+        self.assertEqual(dummy.notifiers, notifiers)
+
+
 class TestTraitEventNotifierWeakrefTarget(unittest.TestCase):
     """ Test weakref handling for target in TraitEventNotifier."""
 
@@ -0,0 +1,90 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Time registering on_trait_change listeners for extended trait names, with
+parsed listener templates cached and cloned by ``parse_listener``, and with
+every name parsed from scratch by ``ListenerParser``, as was previously done.
+
+Times are reported in microseconds per registration, for a new instance
+each time. The "parse only" column gives the time taken to build the
+listener tree alone.
+"""
+
+import timeit
+from unittest import mock
+
+from traits import traits_listener
+from traits.api import HasTraits, Instance, Int, List
+
+# Number of iterations to perform:
+N = 5000
+
+PATTERNS = [
+    "child.value",
+    "child.[value, count]",
+    "children.value",
+    "children:[value, count]",
+    "child.child*.value",
+]
+
+
+class Node(HasTraits):
+    value = Int()
+    count = Int()
+    child = Instance("Node")
+    children = List(Instance("Node"))
+
+
+def handler():
+    pass
+
+
+def uncached_parse_listener(text, **options):
+    """ Build a listener tree by parsing the text every time. """
+    return traits_listener.ListenerParser(text, **options).listener
+
+
+def time_pattern(pattern, parse_listener):
+    """ Return the times, in microseconds, to parse a pattern and to register
+    a listener for it on a new object.
+    """
+    with mock.patch.object(traits_listener, "parse_listener", parse_listener):
+        parse_time = timeit.timeit(
+            lambda: traits_listener.parse_listener(pattern), number=N
+        )
+        register_time = timeit.timeit(
+            lambda: Node(child=Node()).on_trait_change(handler, pattern),
+            number=N,
+        )
+    return parse_time * 1e6 / N, register_time * 1e6 / N
+
+
+def report():
+    print(
+        "{:<26} {:<8} {:>16} {:>16}".format(
+            "pattern", "cached", "parse only (us)", "register (us)"
+        )
+    )
+    for pattern in PATTERNS:
+        for name, parse_listener in [
+            ("no", uncached_parse_listener),
+            ("yes", traits_listener.parse_listener),
+        ]:
+            parse_time, register_time = time_pattern(pattern, parse_listener)
+            print(
+                "{:<26} {:<8} {:>16.1f} {:>16.1f}".format(
+                    pattern, name, parse_time, register_time
+                )
+            )
+
+
+if __name__ == "__main__":
+    report()
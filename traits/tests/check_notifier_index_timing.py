@@ -0,0 +1,89 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Time adding and removing many observers of a single trait, with and without
+the keyed index of an observable's notifiers.
+
+The scenario is a model with a ``selection`` trait that is observed by each
+of a large number of views. Without the index, each addition or removal
+scans the trait's list of notifiers for an equivalent notifier, so the
+total time grows quadratically with the number of views.
+"""
+
+import sys
+import time
+
+from traits.api import HasTraits, Int, List
+from traits.observation import _notifier_index
+
+# Number of views observing the shared trait:
+N_VIEWS = 10000
+
+
+class Model(HasTraits):
+    selection = List(Int)
+
+
+class View(HasTraits):
+    updates = Int()
+
+    def _update(self, event):
+        self.updates += 1
+
+
+def time_observers(n_views):
+    """ Return the times taken to add n_views observers to a trait, to fire
+    a single change, and to remove the observers again.
+    """
+    model = Model()
+    views = [View() for _ in range(n_views)]
+
+    start = time.perf_counter()
+    for view in views:
+        model.observe(view._update, "selection")
+    added = time.perf_counter()
+    model.selection = [1]
+    fired = time.perf_counter()
+    # Remove the most recently added observers first, which is the worst
+    # case for a scan of the list of notifiers.
+    for view in reversed(views):
+        model.observe(view._update, "selection", remove=True)
+    removed = time.perf_counter()
+
+    assert all(view.updates == 1 for view in views)
+    return added - start, fired - added, removed - fired
+
+
+def report():
+    print(
+        "{:<10} {:>8} {:>10} {:>10} {:>10}".format(
+            "index", "views", "add (s)", "fire (s)", "remove (s)"
+        )
+    )
+    default_threshold = _notifier_index.INDEX_THRESHOLD
+    for name, threshold in [
+        ("enabled", default_threshold),
+        ("disabled", sys.maxsize),
+    ]:
+        _notifier_index.INDEX_THRESHOLD = threshold
+        try:
+            add_time, fire_time, remove_time = time_observers(N_VIEWS)
+        finally:
+            _notifier_index.INDEX_THRESHOLD = default_threshold
+        print(
+            "{:<10} {:>8} {:>10.3f} {:>10.3f} {:>10.3f}".format(
+                name, N_VIEWS, add_time, fire_time, remove_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    report()
@@ -0,0 +1,97 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Compare the memory use and attribute access times of HasTraits classes that
+store trait values in the instance dictionary with those of classes created
+with ``trait_slots=True``, which store them in value slots.
+
+Memory per instance is measured with tracemalloc, for instances on which
+every trait has been given a value. Get and set times are reported in
+nanoseconds per operation.
+"""
+
+import gc
+import timeit
+import tracemalloc
+
+from traits.api import Float, HasTraits, Int, Str
+
+# Number of instances to create when measuring memory use:
+N_INSTANCES = 100000
+
+# Number of iterations for the get/set timings:
+N = 1000000
+
+
+class DictRecord(HasTraits):
+    x = Float()
+    y = Float()
+    count = Int()
+    label = Str()
+
+
+class SlotRecord(HasTraits, trait_slots=True):
+    x = Float()
+    y = Float()
+    count = Int()
+    label = Str()
+
+
+def memory_per_instance(cls):
+    """ Return the number of bytes allocated per instance of *cls*.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        records = [
+            cls(x=1.5, y=2.5, count=i, label="record")
+            for i in range(N_INSTANCES)
+        ]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Don't count the list holding the records.
+    list_size = records.__sizeof__()
+    del records
+    return (after - before - list_size) / N_INSTANCES
+
+
+def access_times(cls):
+    """ Return the get and set times, in ns per operation, for a Float trait
+    of an instance of *cls*.
+    """
+    record = cls(x=1.5)
+    globals = {"record": record}
+    get_time = timeit.timeit("record.x", globals=globals, number=N)
+    set_time = timeit.timeit("record.x = 2.5", globals=globals, number=N)
+    return get_time * 1e9 / N, set_time * 1e9 / N
+
+
+def report():
+    print(
+        "{:<12} {:>14} {:>12} {:>12}".format(
+            "layout", "bytes/instance", "get (ns)", "set (ns)"
+        )
+    )
+    for name, cls in [("dict", DictRecord), ("slots", SlotRecord)]:
+        memory = memory_per_instance(cls)
+        get_time, set_time = access_times(cls)
+        print(
+            "{:<12} {:>14.1f} {:>12.1f} {:>12.1f}".format(
+                name, memory, get_time, set_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    report()
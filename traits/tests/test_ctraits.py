@@ -18,7 +18,7 @@ from traits.constants import (
 )
 from traits.ctrait import CTrait
 from traits.trait_errors import TraitError
-from traits.trait_types import Any, Int, List
+from traits.trait_types import Any, Float, Int, List
 
 
 def getter():
@@ -312,6 +312,30 @@ class TestCTrait(unittest.TestCase):
         self.assertEqual(len(foo.bar_changed), 1)
         self.assertEqual(foo.bar_changed[0], "baz")
 
+    def test_validate_items(self):
+        class Foo(HasTraits):
+            x = Float()
+
+        foo = Foo()
+        ctrait = foo.trait("x")
+        items = [1, 2.5, True]
+
+        validated = ctrait.validate_items(foo, "x", items)
+
+        self.assertEqual(validated, [1.0, 2.5, 1.0])
+        self.assertEqual([type(item) for item in validated], [float] * 3)
+        self.assertIsNot(validated, items)
+        self.assertEqual(items, [1, 2.5, True])
+        self.assertEqual(ctrait.validate_items(foo, "x", iter(())), [])
+        with self.assertRaises(TraitError):
+            ctrait.validate_items(foo, "x", [1, "two"])
+
+    def test_validate_items_without_validator(self):
+        ctrait = CTrait(0)
+        items = (1, "two")
+
+        self.assertEqual(ctrait.validate_items(None, "x", items), [1, "two"])
+
     def test_failed_attribute_access(self):
         # Double-underscore names are special-cased.
         non_dunder_names = [
@@ -385,3 +409,98 @@ class TestCTraitNotifiers(unittest.TestCase):
         self.assertEqual(len(tnotifiers), 1)
         notifier, = tnotifiers
         self.assertEqual(notifier.handler, Foo._x_changed)
+
+    def test_notifiers_called_in_order(self):
+        # Enough notifiers that the dispatch snapshot can't live on the stack.
+        calls = []
+
+        class Foo(HasTraits):
+            x = Int()
+
+        foo = Foo()
+        tnotifiers = foo.trait("x")._notifiers(True)
+        onotifiers = foo._notifiers(True)
+        for i in range(10):
+            tnotifiers.append(
+                lambda obj, name, old, new, i=i: calls.append(("t", i))
+            )
+        for i in range(5):
+            onotifiers.append(
+                lambda obj, name, old, new, i=i: calls.append(("o", i))
+            )
+
+        foo.x = 1
+
+        self.assertEqual(
+            calls,
+            [("t", i) for i in range(10)] + [("o", i) for i in range(5)],
+        )
+
+    def test_notifier_arguments(self):
+        calls = []
+
+        class Foo(HasTraits):
+            x = Any()
+
+        foo = Foo(x=[1])
+        foo.trait("x")._notifiers(True).append(
+            lambda *args: calls.append(args)
+        )
+
+        foo.x = [2]
+
+        self.assertEqual(calls, [(foo, "x", [1], [2])])
+
+    def test_notifiers_modified_during_dispatch(self):
+        # Notifiers added or removed by a notifier don't affect the
+        # notification in progress.
+        calls = []
+
+        class Foo(HasTraits):
+            x = Int()
+
+        def first(obj, name, old, new):
+            calls.append(("first", new))
+            tnotifiers.remove(second)
+            tnotifiers.append(third)
+
+        def second(obj, name, old, new):
+            calls.append(("second", new))
+
+        def third(obj, name, old, new):
+            calls.append(("third", new))
+
+        foo = Foo()
+        tnotifiers = foo.trait("x")._notifiers(True)
+        tnotifiers.extend([first, second])
+
+        foo.x = 1
+        self.assertEqual(calls, [("first", 1), ("second", 1)])
+
+        del calls[:]
+        tnotifiers.remove(first)
+        foo.x = 2
+        self.assertEqual(calls, [("third", 2)])
+
+    def test_notifier_exception_stops_dispatch(self):
+        calls = []
+
+        class Foo(HasTraits):
+            x = Int()
+
+        def failing(obj, name, old, new):
+            raise ZeroDivisionError()
+
+        foo = Foo()
+        tnotifiers = foo.trait("x")._notifiers(True)
+        for i in range(10):
+            tnotifiers.append(
+                lambda obj, name, old, new, i=i: calls.append(i)
+            )
+        tnotifiers.insert(3, failing)
+
+        with self.assertRaises(ZeroDivisionError):
+            foo.x = 1
+
+        self.assertEqual(calls, [0, 1, 2])
+        self.assertEqual(foo.x, 1)
@@ -13,7 +13,7 @@ import unittest
 
 from traits.api import (
     Any, BaseEnum, Enum, HasTraits, Int, List, Property, Set, TraitError,
-    Tuple)
+    Tuple, Union)
 from traits.testing.optional_dependencies import requires_traitsui
 
 
@@ -331,6 +331,65 @@ class EnumTestCase(unittest.TestCase):
         with self.assertRaises(TraitError):
             model.digit_sequence = [-1, 0, 2, 1]
 
+    def test_large_enum(self):
+        codes = ["CODE{:04d}".format(i) for i in range(1000)]
+
+        class Instrument(HasTraits):
+            code = Enum(codes)
+
+        instrument = Instrument()
+        for code in codes:
+            instrument.code = code
+            self.assertIs(instrument.code, code)
+        with self.assertRaises(TraitError):
+            instrument.code = "CODE1000"
+
+    def test_unhashable_members_and_values(self):
+        class Example(HasTraits):
+            value = Enum([1, [2, 3], {"a": 4}])
+
+        example = Example()
+        example.value = [2, 3]
+        self.assertEqual(example.value, [2, 3])
+        example.value = {"a": 4}
+        self.assertEqual(example.value, {"a": 4})
+        example.value = 1
+        self.assertEqual(example.value, 1)
+
+        with self.assertRaises(TraitError):
+            example.value = [2]
+        with self.assertRaises(TraitError):
+            example.value = 2
+
+    def test_value_equal_to_member_with_different_hash(self):
+        # Containment in the enumeration is decided by equality, even for
+        # values whose hash doesn't match the hash of the equal member.
+        class Red:
+            def __eq__(self, other):
+                return other == "r"
+
+            def __hash__(self):
+                return 0
+
+        class Example(HasTraits):
+            value = Enum("r", "g", "b")
+
+            compound_value = Union(None, Enum("r", "g", "b"))
+
+        red = Red()
+        example = Example()
+        example.value = red
+        self.assertIs(example.value, red)
+        example.compound_value = red
+        self.assertIs(example.compound_value, red)
+
+    def test_fast_validate_index(self):
+        trait = Enum("a", [1], 2)
+
+        kind, values, index = trait.fast_validate
+        self.assertEqual(values, ("a", [1], 2))
+        self.assertEqual(index, frozenset({"a", 2}))
+
 
 @requires_traitsui
 class TestEnumCreateEditor(unittest.TestCase):
@@ -0,0 +1,199 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Tests for the HasTraits.from_columns bulk constructor.
+"""
+
+import unittest
+
+from traits.api import (
+    Any,
+    Float,
+    HasRequiredTraits,
+    HasStrictTraits,
+    HasTraits,
+    Int,
+    List,
+    Map,
+    observe,
+    on_trait_change,
+    Range,
+    Str,
+    TraitError,
+)
+from traits.testing.optional_dependencies import numpy, requires_numpy
+
+
+class Point(HasStrictTraits):
+    x = Float()
+
+    y = Float()
+
+    label = Str()
+
+
+class Tracked(HasTraits):
+    value = Int()
+
+    changes = List()
+
+    post_init_changes = List()
+
+    inited = Any()
+
+    @observe("value")
+    def _record_change(self, event):
+        self.changes.append(event.new)
+
+    @on_trait_change("value", post_init=True)
+    def _record_post_init_change(self, new):
+        self.post_init_changes.append(new)
+
+    def traits_init(self):
+        self.inited = True
+
+
+class WithChangedHandler(HasTraits):
+    value = Int()
+
+    changes = List()
+
+    def _value_changed(self, new):
+        self.changes.append(new)
+
+
+class WithMapped(HasTraits):
+    married = Map({"yes": 1, "no": 0})
+
+
+class Required(HasRequiredTraits):
+    value = Int(required=True)
+
+
+class Compact(HasTraits, trait_slots=True):
+    x = Float()
+
+
+class Polygon(HasTraits):
+    vertices = List(Float)
+
+
+class Bounded(HasTraits):
+    low = Int()
+
+    x = Range(low="low", high=100)
+
+
+class TestFromColumns(unittest.TestCase):
+
+    def test_from_columns(self):
+        points = Point.from_columns(
+            {"x": [0, 1, 2], "y": [3.0, 4.0, 5.0], "label": ["a", "b", "c"]}
+        )
+
+        self.assertEqual(
+            [(point.x, point.y, point.label) for point in points],
+            [(0.0, 3.0, "a"), (1.0, 4.0, "b"), (2.0, 5.0, "c")],
+        )
+        self.assertIsInstance(points[0].x, float)
+        self.assertTrue(all(point.traits_inited() for point in points))
+
+    def test_missing_columns_have_defaults(self):
+        points = Point.from_columns({"x": [1.0, 2.0]})
+
+        self.assertEqual([point.y for point in points], [0.0, 0.0])
+
+    def test_no_columns(self):
+        self.assertEqual(Point.from_columns({}), [])
+
+    def test_different_lengths(self):
+        with self.assertRaises(ValueError):
+            Point.from_columns({"x": [1.0, 2.0], "y": [1.0]})
+
+    def test_invalid_value(self):
+        with self.assertRaises(TraitError):
+            Point.from_columns({"x": [1.0, "two"]})
+
+    def test_undefined_trait(self):
+        with self.assertRaises(TraitError):
+            Point.from_columns({"z": [1.0]})
+
+    def test_containers_belong_to_their_instance(self):
+        polygons = Polygon.from_columns({"vertices": [[1.0], [2.0, 3.0]]})
+        events = []
+        polygons[1].observe(events.append, "vertices:items")
+
+        polygons[1].vertices.append(4.0)
+
+        self.assertIs(polygons[0].vertices.object(), polygons[0])
+        self.assertIs(polygons[1].vertices.object(), polygons[1])
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].added, [4.0])
+
+    def test_columns_are_assigned_in_order(self):
+        with self.assertRaises(TraitError):
+            Bounded(low=5, x=3)
+        with self.assertRaises(TraitError):
+            Bounded.from_columns({"low": [0, 5], "x": [3, 3]})
+
+        objects = Bounded.from_columns({"low": [0, 5], "x": [3, 7]})
+
+        self.assertEqual(
+            [(obj.low, obj.x) for obj in objects], [(0, 3), (5, 7)]
+        )
+
+    def test_instances_are_independent(self):
+        points = Point.from_columns({"x": [1.0, 2.0]})
+
+        points[0].x = 5.0
+
+        self.assertEqual(points[1].x, 2.0)
+
+    def test_observers(self):
+        objects = Tracked.from_columns({"value": [1, 2]})
+
+        self.assertEqual([obj.changes for obj in objects], [[1], [2]])
+        self.assertEqual([obj.post_init_changes for obj in objects], [[], []])
+        self.assertTrue(all(obj.inited for obj in objects))
+
+        objects[0].value = 3
+
+        self.assertEqual(objects[0].changes, [1, 3])
+        self.assertEqual(objects[0].post_init_changes, [3])
+
+    def test_static_change_handler(self):
+        objects = WithChangedHandler.from_columns({"value": [1, 2]})
+
+        self.assertEqual([obj.changes for obj in objects], [[1], [2]])
+
+    def test_mapped_trait(self):
+        objects = WithMapped.from_columns({"married": ["yes", "no"]})
+
+        self.assertEqual([obj.married_ for obj in objects], [1, 0])
+
+    def test_custom_init(self):
+        objects = Required.from_columns({"value": [1, 2]})
+
+        self.assertEqual([obj.value for obj in objects], [1, 2])
+
+    def test_slots(self):
+        objects = Compact.from_columns({"x": [1.0, 2.0]})
+
+        self.assertEqual([obj.x for obj in objects], [1.0, 2.0])
+
+    @requires_numpy
+    def test_numpy_columns(self):
+        points = Point.from_columns(
+            {"x": numpy.arange(3), "y": numpy.linspace(0.0, 1.0, 3)}
+        )
+
+        self.assertEqual([point.x for point in points], [0.0, 1.0, 2.0])
+        self.assertEqual([point.y for point in points], [0.0, 0.5, 1.0])
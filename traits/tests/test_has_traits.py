@@ -19,9 +19,11 @@ from traits.has_traits import (
     ClassTraits,
     PrefixTraits,
     ListenerTraits,
+    ListenerPlan,
     InstanceTraits,
     HasTraits,
     observe,
+    ObserverPlan,
     ObserverTraits,
 )
 from traits.ctrait import CTrait
@@ -35,7 +37,9 @@ from traits.observation.exception_handling import (
     pop_exception_handler,
     push_exception_handler,
 )
+from traits.testing.optional_dependencies import numpy, requires_numpy
 from traits.traits import ForwardProperty, generic_trait
+from traits.trait_numeric import Array
 from traits.trait_types import Event, Float, Instance, Int, List, Map, Str
 from traits.trait_errors import TraitError
 
@@ -215,6 +219,85 @@ class TestCreateTraitsMetaDict(unittest.TestCase):
             },
         )
 
+    def test_listener_plan(self):
+        # Given
+        @on_trait_change("something")
+        def listener(self):
+            pass
+
+        @on_trait_change("other", post_init=True, dispatch="ui")
+        def post_init_listener(self):
+            pass
+
+        class_name = "MyClass"
+        bases = (object,)
+        class_dict = {
+            "my_listener": listener,
+            "my_post_init_listener": post_init_listener,
+            "my_event": Event(on_trait_change="something"),
+        }
+
+        # When
+        update_traits_class_dict(class_name, bases, class_dict)
+
+        # Then
+        listeners = class_dict[ListenerTraits]
+        self.assertEqual(
+            class_dict[ListenerPlan],
+            (
+                [
+                    (
+                        "_init_trait_method_listener",
+                        "my_listener",
+                        listeners["my_listener"],
+                    ),
+                    (
+                        "_init_trait_event_listener",
+                        "my_event",
+                        listeners["my_event"],
+                    ),
+                ],
+                [("my_post_init_listener", "other", "ui")],
+            ),
+        )
+
+    def test_observer_plan(self):
+        # Given
+        @observe(trait("value"), post_init=True, dispatch="ui")
+        @observe("name,age")
+        def handler(self, event):
+            pass
+
+        class_name = "MyClass"
+        bases = (object,)
+        class_dict = {"my_listener": handler}
+
+        # When
+        update_traits_class_dict(class_name, bases, class_dict)
+
+        # Then
+        pre_init, post_init = class_dict[ObserverPlan]
+        self.assertEqual(len(pre_init), 1)
+        name, handler_getter, dispatch, templates = pre_init[0]
+        self.assertEqual(
+            (name, handler_getter, dispatch),
+            ("my_listener", getattr, "same"),
+        )
+        self.assertEqual(
+            [template.graph for template in templates],
+            compile_str("name,age"),
+        )
+        self.assertEqual(len(post_init), 1)
+        name, handler_getter, dispatch, templates = post_init[0]
+        self.assertEqual(
+            (name, handler_getter, dispatch),
+            ("my_listener", getattr, "ui"),
+        )
+        self.assertEqual(
+            [template.graph for template in templates],
+            compile_expr(trait("value")),
+        )
+
     def test_python_property(self):
         # Given
         class_name = "MyClass"
@@ -768,6 +851,14 @@ class MappedWithDefault(HasTraits):
         return "yes"
 
 
+class WithArrays(HasTraits):
+    contiguous = Array()
+
+    strided = Array()
+
+    count = Int()
+
+
 class TestHasTraitsPickling(unittest.TestCase):
 
     def test_pickle_mapped_default_method(self):
@@ -782,6 +873,58 @@ class TestHasTraitsPickling(unittest.TestCase):
         self.assertEqual(reconstituted.married, "yes")
         self.assertEqual(reconstituted.default_calls, 1)
 
+    @requires_numpy
+    def test_pickle_arrays_out_of_band(self):
+        base = numpy.arange(2000.0)
+        model = WithArrays(
+            contiguous=base[:1000], strided=base[::2], count=3
+        )
+        buffers = []
+
+        data = pickle.dumps(model, protocol=5, buffer_callback=buffers.append)
+        reconstituted = pickle.loads(data, buffers=buffers)
+
+        self.assertEqual(len(buffers), 2)
+        self.assertLess(len(data), model.contiguous.nbytes)
+        numpy.testing.assert_array_equal(
+            reconstituted.contiguous, model.contiguous
+        )
+        numpy.testing.assert_array_equal(reconstituted.strided, model.strided)
+        self.assertEqual(reconstituted.count, 3)
+        # The arrays of the object itself are left alone.
+        self.assertIs(model.strided.base, base)
+
+    @requires_numpy
+    def test_pickle_shared_strided_array(self):
+        values = numpy.arange(10.0)[::2]
+        model = WithArrays(contiguous=values, strided=values)
+        buffers = []
+
+        data = pickle.dumps(model, protocol=5, buffer_callback=buffers.append)
+        reconstituted = pickle.loads(data, buffers=buffers)
+
+        self.assertEqual(len(buffers), 1)
+        self.assertIs(reconstituted.contiguous, reconstituted.strided)
+        numpy.testing.assert_array_equal(reconstituted.strided, values)
+
+    @requires_numpy
+    def test_pickle_arrays_zero_copy(self):
+        model = WithArrays(contiguous=numpy.arange(10.0))
+        buffers = []
+
+        data = pickle.dumps(model, protocol=5, buffer_callback=buffers.append)
+        memories = [bytearray(buffer.raw()) for buffer in buffers]
+        reconstituted = pickle.loads(data, buffers=memories)
+
+        self.assertTrue(
+            any(
+                numpy.shares_memory(
+                    reconstituted.contiguous, numpy.frombuffer(memory)
+                )
+                for memory in memories
+            )
+        )
+
 
 class Person(HasTraits):
     age = Int()
@@ -0,0 +1,298 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Tests for holding and merging trait change notifications. """
+
+import unittest
+
+from traits.api import (
+    Any,
+    Event,
+    HasTraits,
+    Instance,
+    Int,
+    List,
+    Str,
+    hold_trait_notifications,
+    observe,
+    on_trait_change,
+    push_exception_handler,
+    pop_exception_handler,
+)
+from traits.observation.api import trait
+
+
+class Point(HasTraits):
+
+    x = Int()
+
+    y = Int()
+
+    name = Str()
+
+    values = List(Int)
+
+    updated = Event()
+
+    identity = Any(comparison_mode=1)
+
+    always = Any(comparison_mode=0)
+
+
+class Container(HasTraits):
+
+    point = Instance(Point)
+
+    # Events received by the static observer.
+    events = List()
+
+    @observe(trait("point", notify=False).trait("x"))
+    def _record_point_x(self, event):
+        self.events.append((event.name, event.old, event.new))
+
+
+class Legacy(HasTraits):
+
+    x = Int()
+
+    changes = List()
+
+    @on_trait_change("x")
+    def _record_x(self, object, name, old, new):
+        self.changes.append((name, old, new))
+
+
+class TestHoldTraitNotifications(unittest.TestCase):
+
+    def setUp(self):
+        push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_exception_handler)
+
+    def record(self, obj, expression):
+        events = []
+        obj.observe(
+            lambda event: events.append((event.name, event.old, event.new)),
+            expression,
+        )
+        return events
+
+    def test_changes_are_merged(self):
+        point = Point()
+        events = self.record(point, "x")
+
+        with point.hold_trait_notifications():
+            point.x = 1
+            point.x = 2
+            point.x = 3
+            self.assertEqual(events, [])
+
+        self.assertEqual(events, [("x", 0, 3)])
+
+    def test_delivery_order_is_order_of_first_change(self):
+        point = Point()
+        events = self.record(point, "x,y,name")
+
+        with hold_trait_notifications(point):
+            point.y = 1
+            point.x = 1
+            point.y = 2
+            point.name = "a"
+
+        self.assertEqual(
+            events, [("y", 0, 2), ("x", 0, 1), ("name", "", "a")]
+        )
+
+    def test_no_net_change_is_dropped(self):
+        point = Point()
+        events = self.record(point, "x,name")
+
+        with point.hold_trait_notifications():
+            point.x = 5
+            point.x = 0
+            point.name = "abc"
+            point.name = "".join(["a", "bc"])
+            point.name = ""
+
+        self.assertEqual(events, [])
+
+    def test_comparison_mode_identity(self):
+        point = Point(identity=[1])
+        original = point.identity
+        events = self.record(point, "identity")
+
+        with point.hold_trait_notifications():
+            point.identity = [2]
+            point.identity = original
+
+        self.assertEqual(events, [])
+
+        with point.hold_trait_notifications():
+            point.identity = [1]
+
+        self.assertEqual(events, [("identity", original, [1])])
+        self.assertIsNot(events[0][2], original)
+
+    def test_comparison_mode_none(self):
+        point = Point(always=1)
+        events = self.record(point, "always")
+
+        with point.hold_trait_notifications():
+            point.always = 2
+            point.always = 1
+
+        self.assertEqual(events, [("always", 1, 1)])
+
+    def test_events_are_not_merged(self):
+        point = Point()
+        events = self.record(point, "updated")
+
+        with point.hold_trait_notifications():
+            point.updated = 1
+            point.updated = 2
+            point.updated = 2
+
+        self.assertEqual([new for _, _, new in events], [1, 2, 2])
+
+    def test_items_events_are_not_merged(self):
+        point = Point()
+        events = []
+        point.on_trait_change(
+            lambda new: events.append(new.added), "values_items"
+        )
+
+        with point.hold_trait_notifications():
+            point.values.append(1)
+            point.values.append(2)
+            self.assertEqual(events, [])
+
+        self.assertEqual(events, [[1], [2]])
+
+    def test_on_trait_change_handlers(self):
+        legacy = Legacy()
+        changes = []
+        legacy.on_trait_change(
+            lambda object, name, old, new: changes.append((name, old, new)),
+            "x",
+        )
+
+        with legacy.hold_trait_notifications():
+            legacy.x = 1
+            legacy.x = 2
+
+        self.assertEqual(changes, [("x", 0, 2)])
+        self.assertEqual(legacy.changes, [("x", 0, 2)])
+
+    def test_static_observer_on_nested_object(self):
+        container = Container(point=Point())
+        point = container.point
+
+        with hold_trait_notifications(point):
+            point.x = 1
+            point.x = 2
+
+        self.assertEqual(container.events, [("x", 0, 2)])
+
+    def test_observers_follow_merged_instance_change(self):
+        # The maintainer for the nested observer must move to the final
+        # value of the held trait.
+        container = Container(point=Point())
+        first = container.point
+        second = Point()
+        third = Point()
+
+        with hold_trait_notifications(container):
+            container.point = second
+            container.point = third
+
+        third.x = 1
+        second.x = 2
+        first.x = 3
+        self.assertEqual(container.events, [("x", 0, 1)])
+
+    def test_multiple_objects(self):
+        point1 = Point()
+        point2 = Point()
+        events1 = self.record(point1, "x")
+        events2 = self.record(point2, "x")
+
+        with hold_trait_notifications(point1, point2):
+            point1.x = 1
+            point2.x = 1
+            point1.x = 2
+
+        self.assertEqual(events1, [("x", 0, 2)])
+        self.assertEqual(events2, [("x", 0, 1)])
+
+    def test_nested_holds(self):
+        point = Point()
+        events = self.record(point, "x")
+
+        with point.hold_trait_notifications():
+            point.x = 1
+            with hold_trait_notifications(point):
+                point.x = 2
+            self.assertEqual(events, [])
+            self.assertTrue(point._trait_notifications_held())
+            point.x = 3
+
+        self.assertFalse(point._trait_notifications_held())
+        self.assertEqual(events, [("x", 0, 3)])
+
+    def test_nested_holds_on_different_objects(self):
+        point1 = Point()
+        point2 = Point()
+        events1 = self.record(point1, "x")
+        events2 = self.record(point2, "x")
+
+        with hold_trait_notifications(point1):
+            with hold_trait_notifications(point2):
+                point1.x = 1
+                point2.x = 1
+            self.assertEqual(events1, [])
+            self.assertEqual(events2, [("x", 0, 1)])
+
+        self.assertEqual(events1, [("x", 0, 1)])
+
+    def test_changes_delivered_on_exception(self):
+        point = Point()
+        events = self.record(point, "x")
+
+        with self.assertRaises(ZeroDivisionError):
+            with point.hold_trait_notifications():
+                point.x = 1
+                1 / 0
+
+        self.assertEqual(events, [("x", 0, 1)])
+        self.assertFalse(point._trait_notifications_held())
+
+    def test_notifications_disabled_while_held(self):
+        point = Point()
+        events = self.record(point, "x")
+
+        with point.hold_trait_notifications():
+            point.trait_setq(x=1)
+            point.x = 2
+
+        self.assertEqual(events, [("x", 1, 2)])
+
+    def test_default_computed_while_held(self):
+        class Lazy(HasTraits):
+            values = List()
+
+        lazy = Lazy()
+        events = []
+        lazy.on_trait_change(
+            lambda new: events.append(new.added), "values_items"
+        )
+
+        with lazy.hold_trait_notifications():
+            lazy.values.append(1)
+
+        self.assertEqual(events, [[1]])
@@ -0,0 +1,238 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Tests for the instrumentation of trait attribute access.
+"""
+
+import gc
+import unittest
+import weakref
+
+from traits import instrumentation
+from traits.api import (
+    Event,
+    HasTraits,
+    Int,
+    List,
+    Property,
+    push_exception_handler,
+    pop_exception_handler,
+    Str,
+    TraitError,
+)
+
+
+class Model(HasTraits):
+    count = Int()
+
+    name = Str()
+
+    values = List(Int)
+
+    updated = Event()
+
+    doubled = Property(observe="count")
+
+    def _get_doubled(self):
+        return 2 * self.count
+
+
+def statistics_for(owner, name):
+    """ Return the statistics of a trait, or None if there are none. """
+    for stats in instrumentation.snapshot():
+        if stats.owner is owner and stats.name == name:
+            return stats
+    return None
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_exception_handler)
+        instrumentation.reset()
+        self.addCleanup(instrumentation.reset)
+        self.addCleanup(instrumentation.disable)
+
+    def test_disabled_by_default(self):
+        model = Model()
+        model.count = 1
+
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertEqual(instrumentation.snapshot(), [])
+
+    def test_counts(self):
+        model = Model()
+        model.on_trait_change(lambda: None, "count")
+        model.observe(lambda event: None, "count")
+
+        instrumentation.enable()
+        for value in range(1, 6):
+            model.count = value
+        model.count = 5
+        model.count
+
+        stats = statistics_for(Model, "count")
+        self.assertEqual(stats.gets, 1)
+        self.assertEqual(stats.sets, 6)
+        self.assertEqual(stats.validations, 6)
+        # The "doubled" property observes "count" too.
+        self.assertEqual(stats.notifications, 15)
+        self.assertEqual(stats.set_time, 0.0)
+        self.assertEqual(stats.notify_time, 0.0)
+
+    def test_timing(self):
+        model = Model()
+        model.on_trait_change(lambda: None, "count")
+
+        instrumentation.enable(timing=True)
+        for value in range(1, 6):
+            model.count = value
+            model.count
+
+        stats = statistics_for(Model, "count")
+        self.assertEqual(stats.sets, 5)
+        self.assertGreater(stats.get_time, 0.0)
+        self.assertGreater(stats.set_time, 0.0)
+        self.assertGreater(stats.validate_time, 0.0)
+        self.assertGreater(stats.notify_time, 0.0)
+        self.assertLessEqual(stats.notify_time, stats.set_time)
+
+    def test_failed_validation_is_counted(self):
+        model = Model()
+
+        instrumentation.enable()
+        with self.assertRaises(TraitError):
+            model.count = "not an int"
+
+        stats = statistics_for(Model, "count")
+        self.assertEqual(stats.sets, 1)
+        self.assertEqual(stats.validations, 1)
+        self.assertEqual(model.count, 0)
+
+    def test_other_attributes_are_not_counted(self):
+        model = Model()
+
+        instrumentation.enable()
+        model._get_doubled
+        model.trait_names()
+
+        self.assertEqual(instrumentation.snapshot(), [])
+
+    def test_events_and_properties(self):
+        model = Model()
+        events = []
+        model.observe(events.append, "updated")
+
+        instrumentation.enable()
+        model.updated = True
+        model.doubled
+
+        stats = statistics_for(Model, "updated")
+        self.assertEqual(stats.sets, 1)
+        self.assertEqual(stats.notifications, 1)
+        stats = statistics_for(Model, "doubled")
+        self.assertEqual(stats.gets, 1)
+        self.assertEqual(len(events), 1)
+
+    def test_list_items_validation(self):
+        model = Model()
+
+        instrumentation.enable()
+        model.values.extend([1, 2, 3])
+
+        stats = statistics_for(Model, "values")
+        self.assertEqual(stats.validations, 3)
+
+    def test_instance_traits_are_combined(self):
+        observed, plain = Model(), Model()
+        observed.observe(lambda event: None, "name")
+
+        instrumentation.enable()
+        observed.name = "observed"
+        plain.name = "plain"
+
+        names = [
+            stats.name
+            for stats in instrumentation.snapshot()
+            if stats.name == "name"
+        ]
+        self.assertEqual(names, ["name"])
+        self.assertEqual(statistics_for(Model, "name").sets, 2)
+
+    def test_disable(self):
+        model = Model()
+
+        instrumentation.enable()
+        model.count = 1
+        instrumentation.disable()
+        model.count = 2
+
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertEqual(statistics_for(Model, "count").sets, 1)
+
+    def test_reset(self):
+        model = Model()
+
+        instrumentation.enable()
+        model.count = 1
+        instrumentation.reset()
+        model.name = "name"
+
+        self.assertIsNone(statistics_for(Model, "count"))
+        self.assertEqual(statistics_for(Model, "name").sets, 1)
+
+    def test_reset_during_notification(self):
+        model = Model()
+        model.observe(lambda event: instrumentation.reset(), "count")
+
+        instrumentation.enable(timing=True)
+        model.count = 1
+        model.count = 2
+
+        self.assertIsNone(statistics_for(Model, "count"))
+
+    def test_instrumented(self):
+        model = Model()
+
+        with instrumentation.instrumented():
+            self.assertTrue(instrumentation.is_enabled())
+            model.count = 1
+
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertEqual(statistics_for(Model, "count").sets, 1)
+
+    def test_instrumented_restores_previous_state(self):
+        instrumentation.enable(timing=True)
+        with instrumentation.instrumented():
+            pass
+
+        self.assertTrue(instrumentation.is_enabled())
+        model = Model()
+        model.count = 1
+        self.assertGreater(statistics_for(Model, "count").set_time, 0.0)
+
+    def test_traits_released_on_reset(self):
+        class Transient(HasTraits):
+            value = Int()
+
+        instrumentation.enable()
+        Transient().value = 1
+        instrumentation.disable()
+        trait_ref = weakref.ref(Transient.class_traits()["value"])
+        del Transient
+
+        gc.collect()
+        self.assertIsNotNone(trait_ref())
+
+        instrumentation.reset()
+        gc.collect()
+        self.assertIsNone(trait_ref())
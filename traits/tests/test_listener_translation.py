@@ -0,0 +1,329 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Tests for the translation of on_trait_change names to observers.
+"""
+
+import gc
+import unittest
+import warnings
+
+from traits.api import (
+    Dict,
+    HasTraits,
+    Instance,
+    Int,
+    List,
+    on_trait_change,
+    push_exception_handler,
+    pop_exception_handler,
+    Set,
+    Str,
+    TraitError,
+)
+from traits.observation import api as observe_api
+from traits.observation._listener_translation import (
+    ListenerTranslationError,
+    TranslatedListener,
+    translate_listener,
+)
+from traits.traits_listener import (
+    ANY_LISTENER,
+    DST_LISTENER,
+    SRC_LISTENER,
+)
+
+
+class Node(HasTraits):
+    value = Int()
+    count = Int(tag=True)
+    name = Str(tag=True)
+    child = Instance("Node")
+    other = Instance("Node")
+    children = List(Instance("Node"))
+    nodes = Dict(Str, Instance("Node"))
+    numbers = List(Int)
+    labels = Set(Str)
+
+
+class TranslatedNode(Node, translate_listeners=True):
+    pass
+
+
+def exercise(cls):
+    """ Build a small object graph of the given class and mutate it,
+    returning the root and a function applying the mutations.
+    """
+    root = cls(child=cls(child=cls()), children=[cls(), cls()])
+
+    def mutate():
+        root.value = 1
+        root.count = 2
+        root.child.value = 3
+        root.child.child.value = 4
+        old_child = root.child
+        root.child = cls(value=5, child=cls())
+        old_child.value = 6
+        root.child.child.value = 7
+        root.child.count = 8
+        root.children[0].value = 9
+        removed = root.children.pop(0)
+        removed.value = 10
+        root.children.append(cls(value=11))
+        root.children[-1].value = 12
+        root.children = [cls()]
+        root.children[0].value = 13
+        root.nodes["a"] = cls()
+        root.nodes["a"].value = 14
+        root.nodes["a"] = cls()
+        root.nodes["a"].value = 15
+        root.numbers.append(16)
+        root.numbers = [17]
+        root.labels.add("x")
+        root.name = "root"
+
+    return root, mutate
+
+
+def record(cls, pattern, n_args):
+    """ Return the calls made to a handler with the given number of
+    arguments, listening to the pattern on the result of ``exercise``.
+    """
+    calls = []
+    handlers = {
+        0: lambda: calls.append(()),
+        1: lambda new: calls.append((new,)),
+        2: lambda name, new: calls.append((name, new)),
+        3: lambda object, name, new: calls.append((object, name, new)),
+        4: lambda object, name, old, new: calls.append(
+            (object, name, old, new)
+        ),
+    }
+    root, mutate = exercise(cls)
+    root.on_trait_change(handlers[n_args], pattern)
+    mutate()
+    root.on_trait_change(handlers[n_args], pattern, remove=True)
+    calls_before_removal = len(calls)
+    mutate()
+    return calls[:calls_before_removal], calls[calls_before_removal:]
+
+
+def describe(call):
+    """ Return a comparable description of the arguments of a call, using
+    the value of nodes and the contents of items events.
+    """
+    described = []
+    for arg in call:
+        if isinstance(arg, Node):
+            arg = ("Node", arg.value)
+        elif hasattr(arg, "added"):
+            arg = (type(arg).__name__, arg.removed, arg.added)
+        elif isinstance(arg, list):
+            arg = [describe((item,))[0] for item in arg]
+        described.append(arg)
+    return tuple(described)
+
+
+class TestTranslatedListeners(unittest.TestCase):
+
+    def setUp(self):
+        push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_exception_handler)
+        observe_api.push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(observe_api.pop_exception_handler)
+
+    def assertSameCalls(self, pattern, n_args):
+        expected, expected_after = record(Node, pattern, n_args)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            actual, actual_after = record(TranslatedNode, pattern, n_args)
+
+        self.assertCountEqual(
+            [describe(call) for call in actual],
+            [describe(call) for call in expected],
+        )
+        self.assertEqual(actual_after, [])
+        self.assertEqual(expected_after, [])
+
+    def test_same_calls_as_on_trait_change(self):
+        patterns = [
+            "child.value",
+            "child:value",
+            "child.child.value",
+            "child:child.value",
+            "child.[value, count]",
+            "[child, other].value",
+            "children.value",
+            "children:value",
+            "nodes.value",
+            "child.children.value",
+            "child?.value",
+            "child.missing?",
+            "child.+tag",
+            "+tag",
+            "child.-tag",
+            "child.c+",
+            "child.numbers",
+            "numbers, labels",
+            "child.value, name",
+        ]
+        for pattern in patterns:
+            for n_args in [0, 3, 4]:
+                with self.subTest(pattern=pattern, n_args=n_args):
+                    self.assertSameCalls(pattern, n_args)
+
+    def test_same_calls_for_final_value_handlers(self):
+        patterns = [
+            "child.value",
+            "child:value",
+            "child.child.value",
+            "child:[value, count]",
+            "children:value",
+        ]
+        for pattern in patterns:
+            for n_args in [1, 2]:
+                with self.subTest(pattern=pattern, n_args=n_args):
+                    self.assertSameCalls(pattern, n_args)
+
+    def test_listener_is_translated(self):
+        node = TranslatedNode(child=TranslatedNode())
+        node.on_trait_change(lambda: None, "child.value")
+
+        wrapper, = node.__dict__["__traits_listener__"]["child.value"]
+        self.assertIsInstance(wrapper.listener, TranslatedListener)
+
+    def test_setting_is_inherited(self):
+        class Derived(TranslatedNode):
+            pass
+
+        class Untranslated(TranslatedNode, translate_listeners=False):
+            pass
+
+        handler = lambda: None  # noqa: E731
+        derived = Derived()
+        derived.on_trait_change(handler, "child.value")
+        untranslated = Untranslated()
+        untranslated.on_trait_change(handler, "child.value")
+
+        wrapper, = derived.__dict__["__traits_listener__"]["child.value"]
+        self.assertIsInstance(wrapper.listener, TranslatedListener)
+        wrapper, = untranslated.__dict__["__traits_listener__"]["child.value"]
+        self.assertNotIsInstance(wrapper.listener, TranslatedListener)
+
+    def test_decorated_method(self):
+        class Parent(HasTraits, translate_listeners=True):
+            child = Instance(Node)
+            events = List()
+
+            @on_trait_change("child.value")
+            def _record(self, object, name, old, new):
+                self.events.append((name, old, new))
+
+        parent = Parent(child=Node())
+        parent.events = []
+        parent.child.value = 1
+        parent.child = Node(value=2)
+
+        self.assertEqual(len(parent.events), 2)
+        self.assertEqual(parent.events[0], ("value", 0, 1))
+        self.assertEqual(parent.events[1][0], "child")
+
+    def test_method_handler_deleted(self):
+        class Receiver:
+            def __init__(self):
+                self.calls = 0
+
+            def handler(self):
+                self.calls += 1
+
+        node = TranslatedNode(child=TranslatedNode())
+        receiver = Receiver()
+        node.on_trait_change(receiver.handler, "child.value")
+        node.child.value = 1
+        self.assertEqual(receiver.calls, 1)
+
+        del receiver
+        gc.collect()
+
+        self.assertNotIn("__traits_listener__", node.__dict__)
+        node.child.value = 2
+        node.child = TranslatedNode()
+
+    def test_intermediate_change_for_final_value_handler(self):
+        calls = []
+        node = TranslatedNode(child=TranslatedNode(value=1))
+        node.on_trait_change(lambda new: calls.append(new), "child.value")
+
+        with self.assertRaises(TraitError):
+            node.child = None
+
+        node.child = TranslatedNode(value=2)
+        self.assertEqual(calls, [2])
+
+    def test_untranslatable_names_warn(self):
+        examples = [
+            ("child*.value", {}),
+            ("child.[value, -]", {}),
+            ("numbers[]", {}),
+            ("child.value", {"priority": True}),
+            ("child.value", {"dispatch": "new"}),
+        ]
+        for name, options in examples:
+            with self.subTest(name=name, options=options):
+                calls = []
+                node = TranslatedNode(child=TranslatedNode())
+                with self.assertWarns(RuntimeWarning):
+                    node.on_trait_change(
+                        lambda: calls.append(()), name, **options
+                    )
+
+                wrapper, = node.__dict__["__traits_listener__"][name]
+                self.assertNotIsInstance(
+                    wrapper.listener, TranslatedListener
+                )
+
+
+class TestTranslateListener(unittest.TestCase):
+
+    def translate(self, text, handler_type=ANY_LISTENER, **options):
+        values = dict(
+            wrapped_handler_ref=lambda: None,
+            dispatch="same",
+            priority=False,
+            handler_type=handler_type,
+        )
+        values.update(options)
+        return translate_listener(text, **values)
+
+    def test_graphs(self):
+        listener = self.translate("child.value", handler_type=SRC_LISTENER)
+
+        self.assertEqual(len(listener.graphs), 1)
+        self.assertEqual(listener.dst_graphs, ())
+
+    def test_dst_graphs(self):
+        listener = self.translate("child.child.value", DST_LISTENER)
+
+        self.assertEqual(len(listener.dst_graphs), 1)
+        self.assertEqual(listener.dst_paths, {"child": ("child", "value")})
+
+    def test_dst_requires_chain(self):
+        with self.assertRaises(ListenerTranslationError):
+            self.translate("child.[value, count]", DST_LISTENER)
+        with self.assertRaises(ListenerTranslationError):
+            self.translate("child.value", DST_LISTENER, dispatch="ui")
+
+        # Notifications for the first trait aren't requested.
+        self.translate("child:[value, count]", DST_LISTENER)
+
+    def test_invalid_name(self):
+        with self.assertRaises(TraitError):
+            self.translate("child.[value")
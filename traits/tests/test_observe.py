@@ -37,6 +37,7 @@ from traits.observation.api import (
     push_exception_handler,
     trait,
 )
+from traits.observation._observe import LazyNotifier
 
 
 class TestObserveDecorator(unittest.TestCase):
@@ -933,6 +934,235 @@ class TestObserveAnytrait(unittest.TestCase):
         self.assertEqual(event.added, [4])
 
 
+class TreeNode(HasTraits):
+
+    value = Int()
+
+    children = List(Instance("TreeNode"))
+
+    named = Dict(Str, Instance("TreeNode"))
+
+    members = Set(Instance("TreeNode"))
+
+
+def build_tree(depth, width):
+    """ Return a TreeNode with *depth* levels of *width* children below it.
+    """
+    node = TreeNode()
+    if depth > 0:
+        node.children = [build_tree(depth - 1, width) for _ in range(width)]
+    return node
+
+
+def describe(event):
+    """ Return a description of an event that doesn't depend on the
+    identity of the objects involved. """
+    description = [type(event).__name__]
+    for name in ["name", "old", "new", "index", "removed", "added"]:
+        value = getattr(event, name, None)
+        if isinstance(value, HasTraits):
+            value = type(value).__name__
+        elif isinstance(value, (list, dict, set)):
+            value = (type(value).__name__, len(value))
+        description.append(value)
+    return tuple(description)
+
+
+class TestHasTraitsObserveLazy(unittest.TestCase):
+    """ Test observe with lazy=True, comparing with the events delivered
+    by eagerly added observers. """
+
+    def setUp(self):
+        push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_exception_handler)
+
+    def compare_with_eager(self, expression, scenario):
+        """ Run the scenario on a tree observed lazily, and on a tree
+        observed eagerly, and check that the same events are delivered.
+
+        Parameters
+        ----------
+        expression : str or ObserverExpression
+            The expression to observe on the root of the tree.
+        scenario : callable(root)
+            Function changing the tree below the root, after the observer
+            has been added.
+        """
+        streams = []
+        for lazy in [False, True]:
+            events = []
+            root = build_tree(depth=2, width=3)
+            root.observe(events.append, expression, lazy=lazy)
+            scenario(root)
+            root.observe(events.append, expression, remove=True)
+            self.assertEqual(root._notifiers(True), [])
+            streams.append([describe(event) for event in events])
+
+        eager_events, lazy_events = streams
+        self.assertGreater(len(eager_events), 0)
+        self.assertEqual(lazy_events, eager_events)
+
+    def test_new_objects(self):
+        def scenario(root):
+            root.value = 1
+            root.children = [TreeNode(), TreeNode(value=1)]
+            root.children[0].value = 2
+            new_child = TreeNode()
+            root.children.append(new_child)
+            new_child.value = 4
+            removed = root.children.pop(0)
+            removed.value = 5
+            root.children[0].value = 6
+            root.children = [TreeNode()]
+            new_child.value = 7
+            root.children[0].value = 8
+
+        self.compare_with_eager("children:items:value", scenario)
+        self.compare_with_eager("[value, children:items:value]", scenario)
+
+    def test_existing_objects(self):
+        def scenario(root):
+            first, second, third = root.children
+            leaf = first.children[0]
+            # Change the objects leading to those changed below, so that
+            # the lazy observer hooks them up.
+            root.children.append(TreeNode())
+            for node in root.children:
+                node.value += 1
+                node.children.append(TreeNode())
+            leaf.value = 1
+            second.children[1].value = 2
+            second.children.append(TreeNode())
+            second.children[-1].value = 3
+            removed = second.children.pop(0)
+            removed.value = 4
+            first.children = [leaf, leaf]
+            leaf.value = 5
+            first.children.pop()
+            leaf.value = 6
+            second.value = 7
+            third.children[0].children = [TreeNode()]
+            third.children[0].children[0].value = 8
+            root.children = [second]
+            leaf.value = 9
+            second.children[0].value = 10
+
+        self.compare_with_eager(
+            "children:items:children:items:value", scenario)
+        self.compare_with_eager("children:items:children:items", scenario)
+        self.compare_with_eager(
+            "children:items:[value, children:items:value]", scenario)
+        self.compare_with_eager(
+            trait("children").list_items().trait("children").list_items()
+            .anytrait(),
+            scenario,
+        )
+
+    def test_existing_objects_in_dict_and_set(self):
+        def scenario(root):
+            first, second, third = root.children
+            root.children.append(TreeNode())
+            first.value = 1
+            first.named = {"a": second, "b": third}
+            first.members = {third}
+            first.named["c"] = TreeNode()
+            first.members.add(TreeNode())
+            second.value = 1
+            third.value = 2
+            first.named["c"].value = 3
+            del first.named["a"]
+            second.value = 4
+            first.members.add(second)
+            second.value = 5
+            first.members.remove(third)
+            third.value = 6
+
+        expression = (
+            "children:items:[named:items:value, members:items:value]")
+        self.compare_with_eager(expression, scenario)
+
+    def test_added_trait(self):
+        def scenario(root):
+            first = root.children[0]
+            root.children.append(TreeNode())
+            first.add_trait("extra", Int())
+            first.extra = 1
+            first.value = 2
+            first.extra = 3
+
+        expression = trait("children").list_items().trait(
+            "extra", optional=True)
+        self.compare_with_eager(expression, scenario)
+
+    def test_changes_of_objects_one_level_down(self):
+        def scenario(root):
+            root.children.append(TreeNode())
+            root.children.pop(0)
+            root.children[0] = TreeNode()
+
+        self.compare_with_eager("children:items", scenario)
+
+    def test_changes_below_unchanged_objects_not_notified(self):
+        root = build_tree(depth=2, width=3)
+        first = root.children[0]
+        leaf = first.children[0]
+        events = []
+        root.observe(
+            events.append, "children:items:children:items:value", lazy=True)
+
+        leaf.value = 1
+        self.assertEqual(events, [])
+
+        root.children.append(TreeNode())
+        first.value = 1
+        first.children.append(TreeNode())
+        leaf.value = 2
+        self.assertEqual([event.new for event in events], [2])
+
+    def test_objects_not_hooked_up_before_change(self):
+        root = build_tree(depth=4, width=3)
+        events = []
+
+        root.observe(
+            events.append, "children:items:children:items:value", lazy=True)
+
+        # Only the list of the root's children, one level down, is given
+        # lazy notifiers.
+        lazy_notifiers = root.children.notifiers[1:]
+        self.assertGreater(len(lazy_notifiers), 0)
+        for notifier in lazy_notifiers:
+            self.assertIsInstance(notifier, LazyNotifier)
+        nodes = list(root.children)
+        while nodes:
+            node = nodes.pop()
+            self.assertFalse(node._notifiers(False))
+            self.assertNotIn("children", node._instance_traits())
+            self.assertEqual(len(node.children.notifiers), 1)
+            nodes.extend(node.children)
+
+    def test_remove(self):
+        root = build_tree(depth=2, width=3)
+        first, second, _ = root.children
+        events = []
+        root.observe(
+            events.append, "children:items:children:items:value", lazy=True)
+        root.children.append(TreeNode())
+        second.value = 1
+        second.children.append(TreeNode())
+        second.children[0].value = 2
+
+        root.observe(
+            events.append, "children:items:children:items:value",
+            remove=True)
+        first.children[0].value = 3
+        second.children[0].value = 4
+
+        self.assertEqual([event.new for event in events], [2])
+        for node in [root, first, second, second.children[0]]:
+            self.assertFalse(node._notifiers(False))
+            self.assertEqual(len(node.children.notifiers), 1)
+
+
 # Integration tests for async observe decorator -------------------------------
 
 
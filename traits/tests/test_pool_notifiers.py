@@ -0,0 +1,238 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Tests for notifiers with `dispatch='pool'`.
+"""
+import concurrent.futures
+import threading
+import time
+import unittest
+
+from traits.api import (
+    get_pool_executor,
+    HasTraits,
+    Int,
+    List,
+    observe,
+    pop_exception_handler,
+    push_exception_handler,
+    set_pool_executor,
+    wait_for_pool_dispatch,
+)
+from traits.observation.api import (
+    pop_exception_handler as pop_observe_exception_handler,
+    push_exception_handler as push_observe_exception_handler,
+)
+
+# Timeout for blocking calls, in seconds.
+SAFETY_TIMEOUT = 10.0
+
+
+class CountingExecutor(concurrent.futures.ThreadPoolExecutor):
+    """ Thread pool executor counting the calls submitted to it. """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class Model(HasTraits):
+    value = Int()
+
+    doubled = Int()
+
+    threads = List()
+
+    @observe("value", dispatch="pool")
+    def _update_doubled(self, event):
+        self.threads.append(threading.current_thread())
+        self.doubled = 2 * event.new
+
+
+class TestPoolNotifiers(unittest.TestCase):
+
+    def setUp(self):
+        push_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_exception_handler)
+        push_observe_exception_handler(reraise_exceptions=True)
+        self.addCleanup(pop_observe_exception_handler)
+
+        self.executor = CountingExecutor(max_workers=4)
+        self.addCleanup(self.executor.shutdown)
+        set_pool_executor(self.executor)
+        self.addCleanup(set_pool_executor)
+        self.addCleanup(wait_for_pool_dispatch, SAFETY_TIMEOUT)
+
+    def test_get_pool_executor(self):
+        self.assertIs(get_pool_executor(), self.executor)
+
+    def test_default_executor(self):
+        set_pool_executor()
+
+        executor = get_pool_executor()
+
+        self.assertIsInstance(executor, concurrent.futures.ThreadPoolExecutor)
+        self.assertIs(get_pool_executor(), executor)
+
+    def test_observe_decorator(self):
+        model = Model()
+
+        model.value = 3
+        self.assertTrue(wait_for_pool_dispatch(SAFETY_TIMEOUT))
+
+        self.assertEqual(model.doubled, 6)
+        self.assertEqual(self.executor.submitted, 1)
+        self.assertNotEqual(model.threads, [threading.current_thread()])
+
+    def test_on_trait_change(self):
+        model = Model()
+        threads = []
+
+        def handler(new):
+            threads.append(threading.current_thread())
+
+        model.on_trait_change(handler, "doubled", dispatch="pool")
+        model.value = 3
+        self.assertTrue(wait_for_pool_dispatch(SAFETY_TIMEOUT))
+
+        # The handler for "doubled" is dispatched from the handler for
+        # "value", and is waited for as well.
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.current_thread())
+        self.assertEqual(self.executor.submitted, 2)
+
+    def test_on_trait_change_remove(self):
+        model = Model()
+        events = []
+
+        def handler(new):
+            events.append(new)
+
+        model.on_trait_change(handler, "value", dispatch="pool")
+        model.on_trait_change(handler, "value", dispatch="pool", remove=True)
+        model.value = 3
+        self.assertTrue(wait_for_pool_dispatch(SAFETY_TIMEOUT))
+
+        self.assertEqual(events, [])
+
+    def test_ordered(self):
+        set_pool_executor(self.executor, ordered=True)
+        model = Model()
+        values = []
+
+        def handler(event):
+            # Give later calls a chance to overtake this one.
+            time.sleep(0.001)
+            values.append(event.new)
+
+        model.observe(handler, "value", dispatch="pool")
+        for value in range(1, 21):
+            model.value = value
+        self.assertTrue(wait_for_pool_dispatch(SAFETY_TIMEOUT))
+
+        self.assertEqual(values, list(range(1, 21)))
+
+    def test_ordered_per_object(self):
+        set_pool_executor(self.executor, ordered=True)
+        first, second = Model(), Model()
+        blocked = threading.Event()
+        values = []
+
+        def handler(event):
+            if event.object is first:
+                blocked.wait(timeout=SAFETY_TIMEOUT)
+            values.append(event.new)
+
+        first.observe(handler, "value", dispatch="pool")
+        second.observe(handler, "value", dispatch="pool")
+        first.value = 1
+        second.value = 2
+        self.assertFalse(wait_for_pool_dispatch(timeout=0.1))
+        self.assertEqual(values, [2])
+
+        blocked.set()
+        self.assertTrue(wait_for_pool_dispatch(SAFETY_TIMEOUT))
+        self.assertEqual(values, [2, 1])
+
+    def test_wait_timeout(self):
+        model = Model()
+        blocked = threading.Event()
+        model.on_trait_change(
+            lambda: blocked.wait(timeout=SAFETY_TIMEOUT),
+            "value",
+            dispatch="pool",
+        )
+
+        model.value = 1
+        self.assertFalse(wait_for_pool_dispatch(timeout=0.1))
+
+        blocked.set()
+        self.assertTrue(wait_for_pool_dispatch(SAFETY_TIMEOUT))
+
+    def test_on_trait_change_exception(self):
+        # Exception handlers for on_trait_change are per thread: make this
+        # one the default for the worker threads.
+        push_exception_handler(reraise_exceptions=True, main=True)
+        self.addCleanup(pop_exception_handler)
+        model = Model()
+
+        def handler():
+            raise ZeroDivisionError()
+
+        model.on_trait_change(handler, "value", dispatch="pool")
+        model.value = 1
+
+        with self.assertRaises(ZeroDivisionError):
+            wait_for_pool_dispatch(SAFETY_TIMEOUT)
+        # The exception is only raised once.
+        self.assertTrue(wait_for_pool_dispatch(SAFETY_TIMEOUT))
+
+    def test_observe_exception(self):
+        model = Model()
+
+        def handler(event):
+            raise ZeroDivisionError()
+
+        model.observe(handler, "value", dispatch="pool")
+        model.value = 1
+
+        with self.assertRaises(ZeroDivisionError):
+            wait_for_pool_dispatch(SAFETY_TIMEOUT)
+
+    def test_exception_handled(self):
+        push_observe_exception_handler(lambda event: events.append(event))
+        self.addCleanup(pop_observe_exception_handler)
+        model = Model()
+        events = []
+
+        def handler(event):
+            raise ZeroDivisionError()
+
+        model.observe(handler, "value", dispatch="pool")
+        model.value = 1
+
+        self.assertTrue(wait_for_pool_dispatch(SAFETY_TIMEOUT))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].new, 1)
+
+    def test_executor_shut_down(self):
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        executor.shutdown()
+        set_pool_executor(executor, ordered=True)
+        model = Model()
+
+        with self.assertRaises(RuntimeError):
+            model.value = 1
+
+        self.assertTrue(wait_for_pool_dispatch(timeout=0.0))
@@ -60,6 +60,49 @@ class TestPrefixList(unittest.TestCase):
         with self.assertRaises(TraitError):
             a.foo = "abc"
 
+    def test_nested_prefixes(self):
+        class A(HasTraits):
+            foo = PrefixList(["a", "ab", "abc", "abd", "b"])
+
+        a = A()
+
+        a.foo = "ab"
+        self.assertEqual(a.foo, "ab")
+        a.foo = "abc"
+        self.assertEqual(a.foo, "abc")
+        a.foo = "b"
+        self.assertEqual(a.foo, "b")
+        with self.assertRaises(TraitError):
+            a.foo = "abe"
+
+    def test_repeated_value(self):
+        class A(HasTraits):
+            foo = PrefixList(["abc", "abc", "xyz"])
+
+        a = A()
+
+        a.foo = "x"
+        self.assertEqual(a.foo, "xyz")
+        a.foo = "abc"
+        self.assertEqual(a.foo, "abc")
+        with self.assertRaises(TraitError):
+            a.foo = "ab"
+
+    def test_many_values(self):
+        values = ["value{:04d}".format(i) for i in range(1000)]
+
+        class A(HasTraits):
+            foo = PrefixList(values)
+
+        a = A()
+
+        a.foo = "value0999"
+        self.assertEqual(a.foo, "value0999")
+        with self.assertRaises(TraitError):
+            a.foo = "value099"
+        with self.assertRaises(TraitError):
+            a.foo = "value1"
+
     def test_default_default(self):
         class A(HasTraits):
             foo = PrefixList(["zero", "one", "two"], default_value="zero")
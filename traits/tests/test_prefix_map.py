@@ -55,6 +55,21 @@ class TestPrefixMap(unittest.TestCase):
                 with self.assertRaises(TraitError):
                     person.married = value
 
+    def test_key_is_prefix_of_other_key(self):
+        class Example(HasTraits):
+            size = PrefixMap({"s": 1, "small": 2, "smaller": 3, "large": 4})
+
+        example = Example()
+
+        example.size = "s"
+        self.assertEqual((example.size, example.size_), ("s", 1))
+        example.size = "smalle"
+        self.assertEqual((example.size, example.size_), ("smaller", 3))
+        example.size = "l"
+        self.assertEqual((example.size, example.size_), ("large", 4))
+        with self.assertRaises(TraitError):
+            example.size = "sm"
+
     def test_no_default(self):
         mapping = {"yes": 1, "yeah": 1, "no": 0, "nah": 0}
 
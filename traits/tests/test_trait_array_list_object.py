@@ -0,0 +1,437 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import array
+import copy
+import io
+import pickle
+import sys
+import unittest
+
+from traits.api import (
+    ArrayList,
+    HasTraits,
+    List,
+    TraitArrayListObject,
+    TraitError,
+    TraitListEvent,
+    observe,
+)
+from traits.observation.api import trait
+from traits.testing.optional_dependencies import numpy, requires_numpy
+from traits.trait_array_list_object import (
+    _reconstruct_from_buffer,
+    TraitArrayList,
+)
+
+
+class Samples(HasTraits):
+
+    values = ArrayList()
+
+    counts = ArrayList("i", [1, 2, 3])
+
+    no_items = ArrayList(items=False)
+
+    events = List()
+
+    @observe("values:items")
+    def _record_values_items(self, event):
+        self.events.append((event.index, event.removed, event.added))
+
+
+class TestTraitArrayList(unittest.TestCase):
+
+    def setUp(self):
+        self.events = []
+
+    def notifier(self, trait_list, index, removed, added):
+        self.events.append((index, removed, added))
+
+    def test_init(self):
+        values = TraitArrayList("d", [1, 2, 3])
+
+        self.assertIsInstance(values, array.array)
+        self.assertEqual(values.typecode, "d")
+        self.assertEqual(values, [1.0, 2.0, 3.0])
+        self.assertEqual(values, array.array("d", [1, 2, 3]))
+        self.assertEqual(values.notifiers, [])
+
+    def test_init_invalid_item(self):
+        with self.assertRaises(TypeError):
+            TraitArrayList("i", [1.5])
+
+    def test_setitem(self):
+        values = TraitArrayList("i", [1, 2, 3], notifiers=[self.notifier])
+
+        values[1] = 5
+        values[-1] = 6
+
+        self.assertEqual(values, [1, 5, 6])
+        self.assertEqual(self.events, [(1, [2], [5]), (2, [3], [6])])
+
+    def test_setitem_slice(self):
+        values = TraitArrayList("i", [1, 2, 3], notifiers=[self.notifier])
+
+        values[1:] = [4, 5, 6]
+        values[::-2] = [7, 8]
+
+        self.assertEqual(values, [1, 8, 5, 7])
+        self.assertEqual(
+            self.events,
+            [
+                (1, [2, 3], [4, 5, 6]),
+                (slice(1, 4, 2), [4, 6], [8, 7]),
+            ],
+        )
+
+    def test_setitem_index_error(self):
+        values = TraitArrayList("i", [1], notifiers=[self.notifier])
+
+        with self.assertRaises(IndexError):
+            values[3] = 2
+
+        self.assertEqual(self.events, [])
+
+    def test_setitem_extended_slice_wrong_length(self):
+        values = TraitArrayList("i", [1, 2, 3], notifiers=[self.notifier])
+
+        with self.assertRaises(ValueError):
+            values[::2] = [4]
+
+        self.assertEqual(values, [1, 2, 3])
+        self.assertEqual(self.events, [])
+
+    def test_delitem(self):
+        values = TraitArrayList("i", [1, 2, 3, 4], notifiers=[self.notifier])
+
+        del values[0]
+        del values[::2]
+        del values[5:]
+
+        self.assertEqual(values, [3])
+        self.assertEqual(
+            self.events, [(0, [1], []), (slice(0, 3, 2), [2, 4], [])]
+        )
+
+    def test_append_extend_insert(self):
+        values = TraitArrayList("d", notifiers=[self.notifier])
+
+        values.append(1)
+        values.extend(iter([2, 3]))
+        values += (4,)
+        values.insert(-10, 0)
+
+        self.assertEqual(values, [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(
+            self.events,
+            [
+                (0, [], [1.0]),
+                (1, [], [2.0, 3.0]),
+                (3, [], [4.0]),
+                (0, [], [0.0]),
+            ],
+        )
+
+    def test_bytes_items(self):
+        values = TraitArrayList("i", b"\x01\x00\x00\x00")
+        values.extend(bytearray(b"ab"))
+        raw = TraitArrayList("B", b"ab")
+
+        # Bytes are a sequence of integers, not of machine values.
+        self.assertEqual(values, [1, 0, 0, 0, 97, 98])
+        self.assertEqual(raw, [97, 98])
+
+    def test_remove_and_pop(self):
+        values = TraitArrayList("i", [1, 2, 3, 2], notifiers=[self.notifier])
+
+        values.remove(2)
+        item = values.pop()
+
+        self.assertEqual(item, 2)
+        self.assertEqual(values, [1, 3])
+        self.assertEqual(self.events, [(1, [2], []), (2, [2], [])])
+        with self.assertRaises(ValueError):
+            values.remove(5)
+
+    def test_imul_reverse_clear(self):
+        values = TraitArrayList("i", [1, 2], notifiers=[self.notifier])
+
+        values *= 2
+        values.reverse()
+        values.clear()
+
+        self.assertEqual(values, [])
+        self.assertEqual(
+            self.events,
+            [
+                (2, [], [1, 2]),
+                (0, [1, 2, 1, 2], [2, 1, 2, 1]),
+                (0, [2, 1, 2, 1], []),
+            ],
+        )
+
+    def test_frombytes_and_fromfile(self):
+        source = array.array("i", [1, 2, 3])
+        values = TraitArrayList("i", notifiers=[self.notifier])
+
+        values.frombytes(source.tobytes())
+        values.fromfile(io.BytesIO(source[:1].tobytes()), 1)
+        values.fromlist([4])
+
+        self.assertEqual(values, [1, 2, 3, 1, 4])
+        self.assertEqual(
+            self.events,
+            [(0, [], [1, 2, 3]), (3, [], [1]), (4, [], [4])],
+        )
+
+    def test_copy_does_not_copy_notifiers(self):
+        values = TraitArrayList("i", [1, 2], notifiers=[self.notifier])
+
+        for copied in [copy.copy(values), copy.deepcopy(values)]:
+            self.assertIsInstance(copied, TraitArrayList)
+            self.assertEqual(copied, [1, 2])
+            self.assertEqual(copied.notifiers, [])
+
+    def test_pickle(self):
+        values = TraitArrayList("q", [1, 2], notifiers=[self.notifier])
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(values, protocol=protocol))
+            self.assertIsInstance(unpickled, TraitArrayList)
+            self.assertEqual(unpickled, values)
+            self.assertEqual(unpickled.notifiers, [])
+
+    def test_pickle_out_of_band(self):
+        values = TraitArrayList("d", [1.5, 2.5], notifiers=[self.notifier])
+        buffers = []
+
+        data = pickle.dumps(values, protocol=5, buffer_callback=buffers.append)
+        unpickled = pickle.loads(data, buffers=buffers)
+
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(buffers[0].raw().nbytes, 2 * values.itemsize)
+        self.assertIsInstance(unpickled, TraitArrayList)
+        self.assertEqual(unpickled, values)
+        self.assertEqual(unpickled.notifiers, [])
+
+    def test_reconstruct_other_byte_order(self):
+        values = array.array("i", [1, 256])
+        values.byteswap()
+        other = "big" if sys.byteorder == "little" else "little"
+
+        unpickled = _reconstruct_from_buffer(
+            TraitArrayList, "i", values.tobytes(), other, values.itemsize, {}
+        )
+
+        self.assertEqual(unpickled, [1, 256])
+
+    def test_reconstruct_other_item_size(self):
+        # The size of a C long differs between platforms.
+        other = "big" if sys.byteorder == "little" else "little"
+        for code in "hiq":
+            values = array.array(code, [-1, 256])
+            unpickled = _reconstruct_from_buffer(
+                TraitArrayList, "l", values.tobytes(), sys.byteorder,
+                values.itemsize, {},
+            )
+            self.assertEqual(unpickled.typecode, "l")
+            self.assertEqual(unpickled, [-1, 256])
+
+            values.byteswap()
+            unpickled = _reconstruct_from_buffer(
+                TraitArrayList, "l", values.tobytes(), other,
+                values.itemsize, {},
+            )
+            self.assertEqual(unpickled, [-1, 256])
+
+        values = array.array("H", [1, 65535])
+        unpickled = _reconstruct_from_buffer(
+            TraitArrayList, "L", values.tobytes(), sys.byteorder, 2, {}
+        )
+        self.assertEqual(unpickled, [1, 65535])
+
+    def test_reconstruct_other_character_size(self):
+        text = "a\u00e9\U0001f600"
+        data = text.encode("utf-16-be")
+
+        unpickled = _reconstruct_from_buffer(
+            TraitArrayList, "u", data, "big", 2, {}
+        )
+
+        self.assertEqual(unpickled.tounicode(), text)
+
+    @requires_numpy
+    def test_buffer_protocol(self):
+        values = TraitArrayList("d", [1, 2, 3])
+
+        view = numpy.asarray(values)
+
+        self.assertEqual(view.dtype, numpy.float64)
+        self.assertEqual(view.tolist(), [1.0, 2.0, 3.0])
+        # Writes through the view are visible in the list.
+        view[0] = 10.0
+        self.assertEqual(values[0], 10.0)
+        with self.assertRaises(BufferError):
+            values.append(4)
+
+    @requires_numpy
+    def test_init_from_numpy_array(self):
+        source = numpy.arange(4.0)
+
+        values = TraitArrayList("d", source)
+        converted = TraitArrayList("i", numpy.arange(3))
+
+        self.assertEqual(values, [0.0, 1.0, 2.0, 3.0])
+        self.assertEqual(converted, [0, 1, 2])
+        source[0] = 5.0
+        self.assertEqual(values[0], 0.0)
+
+
+class TestArrayList(unittest.TestCase):
+
+    def test_default_value(self):
+        samples = Samples()
+
+        self.assertIsInstance(samples.values, TraitArrayListObject)
+        self.assertEqual(samples.values, [])
+        self.assertEqual(samples.counts, [1, 2, 3])
+        self.assertEqual(samples.counts.typecode, "i")
+        # Each instance gets its own list.
+        self.assertIsNot(Samples().counts, samples.counts)
+
+    def test_assignment_copies(self):
+        source = [1, 2, 3]
+        samples = Samples(values=source)
+        source.append(4)
+
+        self.assertEqual(samples.values, [1.0, 2.0, 3.0])
+        samples.values = (5, 6)
+        self.assertEqual(samples.values, [5.0, 6.0])
+        samples.counts = array.array("i", [7])
+        self.assertEqual(samples.counts, [7])
+
+    def test_invalid_value(self):
+        samples = Samples()
+
+        with self.assertRaises(TraitError):
+            samples.values = "abc"
+        with self.assertRaises(TraitError):
+            samples.values = 1.0
+        with self.assertRaises(TraitError):
+            samples.counts = b"\x01\x00\x00\x00"
+        with self.assertRaises(TraitError):
+            samples.counts = bytearray(b"abc")
+        self.assertEqual(samples.counts, [1, 2, 3])
+
+    def test_invalid_item(self):
+        samples = Samples()
+
+        with self.assertRaises(TraitError) as exception_context:
+            samples.counts = [1, 2.5]
+        self.assertIn(
+            "Each element of the 'counts' trait",
+            str(exception_context.exception),
+        )
+
+        with self.assertRaises(TraitError):
+            samples.counts.append("a")
+        with self.assertRaises(TraitError):
+            samples.counts.extend(iter([3, 2 ** 70]))
+        with self.assertRaises(TraitError):
+            samples.counts[0] = None
+        self.assertEqual(samples.counts, [1, 2, 3])
+
+    def test_invalid_typecode(self):
+        with self.assertRaises(ValueError):
+            ArrayList("z")
+
+    def test_observe_items(self):
+        samples = Samples()
+
+        samples.values.append(1)
+        samples.values[0:1] = [2, 3]
+        del samples.values[0]
+
+        self.assertEqual(
+            samples.events,
+            [(0, [], [1.0]), (0, [1.0], [2.0, 3.0]), (0, [2.0], [])],
+        )
+
+    def test_observe_list_items(self):
+        samples = Samples()
+        events = []
+        samples.observe(events.append, trait("counts").list_items())
+
+        samples.counts.append(4)
+
+        self.assertEqual(len(events), 1)
+        self.assertIs(events[0].object, samples.counts)
+        self.assertEqual(events[0].added, [4])
+
+    def test_on_trait_change_items(self):
+        samples = Samples()
+        events = []
+        samples.on_trait_change(
+            lambda new: events.append(new), "counts_items"
+        )
+
+        samples.counts[0] = 5
+
+        self.assertEqual(len(events), 1)
+        self.assertIsInstance(events[0], TraitListEvent)
+        self.assertEqual(
+            (events[0].index, events[0].removed, events[0].added),
+            (0, [1], [5]),
+        )
+
+    def test_no_items(self):
+        samples = Samples()
+
+        self.assertIsNone(samples.trait("no_items_items"))
+        samples.no_items.append(1)
+        self.assertEqual(samples.no_items, [1.0])
+
+    def test_replaced_list_does_not_notify(self):
+        samples = Samples()
+        old_values = samples.values
+        samples.values = [1]
+
+        old_values.append(2)
+
+        self.assertEqual(samples.events, [])
+
+    def test_clone_traits(self):
+        samples = Samples(values=[1, 2])
+
+        clone = samples.clone_traits()
+
+        self.assertEqual(clone.values, [1.0, 2.0])
+        self.assertIsNot(clone.values, samples.values)
+        self.assertIs(clone.values.object(), clone)
+
+    def test_pickle(self):
+        samples = Samples(values=[1, 2], counts=[3])
+
+        unpickled = pickle.loads(pickle.dumps(samples))
+
+        self.assertEqual(unpickled.values, [1.0, 2.0])
+        self.assertEqual(unpickled.counts, [3])
+        unpickled.values.append(3)
+        self.assertEqual(unpickled.events, [(2, [], [3.0])])
+
+    @requires_numpy
+    def test_numpy_assignment_and_view(self):
+        samples = Samples(values=numpy.linspace(0.0, 1.0, 3))
+
+        self.assertEqual(samples.values, [0.0, 0.5, 1.0])
+        view = numpy.frombuffer(samples.values)
+        view[1] = 2.0
+        self.assertEqual(samples.values[1], 2.0)
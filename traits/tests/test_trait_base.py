@@ -12,7 +12,12 @@ import collections
 import enum
 import unittest
 
-from traits.trait_base import safe_contains
+from traits.trait_base import (
+    complete_prefix,
+    enum_index,
+    prefix_index,
+    safe_contains,
+)
 
 
 class Lights(enum.Enum):
@@ -57,3 +62,21 @@ class TestTraitBase(unittest.TestCase):
         self.assertFalse(safe_contains(1, unfriendly_container))
         self.assertTrue(safe_contains(1729, unfriendly_container))
         self.assertFalse(safe_contains(Lights.green, unfriendly_container))
+
+    def test_enum_index(self):
+        index = enum_index(("a", [1, 2], 3, {4}, (5, [6])))
+        self.assertEqual(index, frozenset({"a", 3}))
+        self.assertIsInstance(index, frozenset)
+
+    def test_complete_prefix(self):
+        index = prefix_index(["two", "three", "one", "tw", 3])
+        self.assertEqual(index, ["one", "three", "tw", "two"])
+
+        self.assertEqual(complete_prefix(index, "o"), "one")
+        self.assertEqual(complete_prefix(index, "th"), "three")
+        self.assertEqual(complete_prefix(index, "two"), "two")
+        self.assertIsNone(complete_prefix(index, "t"))
+        self.assertIsNone(complete_prefix(index, "tw"))
+        self.assertIsNone(complete_prefix(index, "four"))
+        self.assertIsNone(complete_prefix(index, "zero"))
+        self.assertIsNone(complete_prefix([], "one"))
@@ -0,0 +1,209 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Tests for the trait_columns bulk accessor.
+"""
+
+import unittest
+
+from traits.api import (
+    Bool,
+    Complex,
+    Float,
+    HasTraits,
+    Int,
+    List,
+    Property,
+    Range,
+    Str,
+    trait_columns,
+)
+from traits.testing.optional_dependencies import numpy, requires_numpy
+
+
+class Point(HasTraits):
+    x = Float()
+
+    y = Int(3)
+
+    visible = Bool()
+
+    z = Complex()
+
+    label = Str("point")
+
+    tags = List(Str)
+
+    level = Range(0, 10)
+
+    double_x = Property(observe="x")
+
+    def _get_double_x(self):
+        return 2 * self.x
+
+    def _label_changed(self, new):
+        pass
+
+
+class Other:
+    x = 7.5
+
+
+class Labelled:
+    x = "seven"
+
+
+class IntRecord(HasTraits):
+    x = Int()
+
+    b = Bool()
+
+
+class DerivedIntRecord(IntRecord):
+    pass
+
+
+class FloatRecord(HasTraits):
+    x = Float()
+
+    b = Str()
+
+
+class TestTraitColumns(unittest.TestCase):
+
+    def test_lists(self):
+        points = [Point(x=1.0, y=1), Point(x=2.0), Point()]
+
+        xs, ys = trait_columns(points, ["x", "y"], arrays=False)
+
+        self.assertEqual(xs, [1.0, 2.0, 0.0])
+        self.assertEqual(ys, [1, 3, 3])
+
+    def test_constant_default_not_stored(self):
+        point = Point()
+
+        (ys,) = trait_columns([point], ["y"], arrays=False)
+
+        self.assertEqual(ys, [3])
+        self.assertNotIn("y", point.__dict__)
+
+    def test_default_with_notifiers(self):
+        point = Point()
+
+        (labels,) = trait_columns([point], ["label"], arrays=False)
+
+        # The default value is stored, as normal attribute access would.
+        self.assertEqual(labels, ["point"])
+        self.assertEqual(point.__dict__["label"], "point")
+
+    def test_computed_default(self):
+        points = [Point(), Point()]
+
+        (tags,) = trait_columns(points, ["tags"], arrays=False)
+
+        self.assertEqual(tags, [[], []])
+        self.assertIs(tags[0], points[0].tags)
+        self.assertIsNot(tags[0], tags[1])
+
+    def test_property(self):
+        points = [Point(x=1.0), Point(x=2.0)]
+
+        (doubles,) = trait_columns(points, ["double_x"], arrays=False)
+
+        self.assertEqual(doubles, [2.0, 4.0])
+
+    def test_instance_trait(self):
+        point = Point()
+        point.add_trait("x", Property(lambda: 5.0))
+
+        (xs,) = trait_columns([point], ["x"], arrays=False)
+
+        self.assertEqual(xs, [5.0])
+        self.assertEqual(xs, [point.x])
+
+    def test_mixed_objects(self):
+        (xs,) = trait_columns([Point(x=1.0), Other()], ["x"], arrays=False)
+
+        self.assertEqual(xs, [1.0, 7.5])
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            trait_columns([Point()], ["nonexistent"], arrays=False)
+
+    @requires_numpy
+    def test_arrays(self):
+        points = [Point(x=1.5, visible=True, z=1j, level=4), Point()]
+
+        xs, ys, visible, zs, labels, levels = trait_columns(
+            points, ["x", "y", "visible", "z", "label", "level"]
+        )
+
+        self.assertEqual(xs.dtype, numpy.dtype(float))
+        self.assertEqual(ys.dtype, numpy.dtype(int))
+        self.assertEqual(visible.dtype, numpy.dtype(bool))
+        self.assertEqual(zs.dtype, numpy.dtype(complex))
+        self.assertEqual(labels.dtype, numpy.dtype(object))
+        self.assertEqual(levels.dtype, numpy.dtype(object))
+        self.assertEqual(xs.tolist(), [1.5, 0.0])
+        self.assertEqual(labels.tolist(), ["point", "point"])
+
+    @requires_numpy
+    def test_sequence_values_in_object_array(self):
+        points = [Point(tags=["a", "b"]), Point(tags=["c", "d"])]
+
+        (tags,) = trait_columns(points, ["tags"])
+
+        self.assertEqual(tags.shape, (2,))
+        self.assertEqual(tags[1], ["c", "d"])
+
+    @requires_numpy
+    def test_int_out_of_machine_range(self):
+        points = [Point(y=2**70), Point()]
+
+        (ys,) = trait_columns(points, ["y"])
+
+        self.assertEqual(ys.dtype, numpy.dtype(object))
+        self.assertEqual(ys.tolist(), [2**70, 3])
+
+    @requires_numpy
+    def test_values_not_matching_first_object(self):
+        (xs,) = trait_columns([Point(x=1.0), Labelled()], ["x"])
+
+        self.assertEqual(xs.dtype, numpy.dtype(object))
+        self.assertEqual(xs.tolist(), [1.0, "seven"])
+
+    @requires_numpy
+    def test_objects_of_other_classes(self):
+        records = [IntRecord(x=1), FloatRecord(x=1.7, b="no"), IntRecord()]
+
+        xs, bs = trait_columns(records, ["x", "b"])
+
+        self.assertEqual(xs.dtype, numpy.dtype(object))
+        self.assertEqual(xs.tolist(), [1, 1.7, 0])
+        self.assertEqual(bs.dtype, numpy.dtype(object))
+        self.assertEqual(bs.tolist(), [False, "no", False])
+
+    @requires_numpy
+    def test_objects_of_other_classes_with_matching_values(self):
+        records = [IntRecord(x=1), DerivedIntRecord(x=2, b=True)]
+
+        xs, bs = trait_columns(records, ["x", "b"])
+
+        self.assertEqual(xs.dtype, numpy.dtype(int))
+        self.assertEqual(xs.tolist(), [1, 2])
+        self.assertEqual(bs.dtype, numpy.dtype(bool))
+        self.assertEqual(bs.tolist(), [False, True])
+
+    @requires_numpy
+    def test_no_objects(self):
+        (xs,) = trait_columns([], ["x"])
+
+        self.assertEqual(xs.shape, (0,))
@@ -17,7 +17,7 @@ from unittest import mock
 from traits.api import DefaultValue, HasTraits, TraitType, ValidateTrait
 from traits.trait_dict_object import TraitDict, TraitDictEvent, TraitDictObject
 from traits.trait_errors import TraitError
-from traits.trait_types import Dict, Int, Str
+from traits.trait_types import Dict, Float, Int, Str
 
 
 def str_validator(value):
@@ -486,6 +486,35 @@ class TestTraitDictObject(unittest.TestCase):
         obj.ranges[3] = range(10, 20)
         self.assertEqual(obj.ranges, {3: range(10, 20)})
 
+    def test_bulk_validation(self):
+        class HasDict(HasTraits):
+            values = Dict(Str, Float)
+
+        obj = HasDict(values={"a": 1})
+        obj.values.update({"b": 2, "c": 3.5})
+        obj.values.update([("d", 4)])
+
+        self.assertEqual(obj.values, {"a": 1.0, "b": 2.0, "c": 3.5, "d": 4.0})
+        for value in obj.values.values():
+            self.assertIs(type(value), float)
+
+        with self.assertRaises(TraitError) as exception_context:
+            obj.values.update({"e": 5, 6: 6})
+        self.assertIn(
+            "Each key of the 'values' trait of a HasDict instance",
+            str(exception_context.exception),
+        )
+        with self.assertRaises(TraitError) as exception_context:
+            obj.values.update({"e": 5, "f": "six"})
+        self.assertIn(
+            "Each value of the 'values' trait of a HasDict instance",
+            str(exception_context.exception),
+        )
+        self.assertNotIn("e", obj.values)
+
+        with self.assertRaises(ValueError):
+            obj.values.update([("g", 7, 8)])
+
 
 class TestTraitDictEvent(unittest.TestCase):
 
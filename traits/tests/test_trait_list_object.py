@@ -15,6 +15,7 @@ import unittest.mock
 
 from traits.api import (
     DefaultValue,
+    Float,
     HasTraits,
     Int,
     List,
@@ -197,6 +198,24 @@ class TestTraitList(unittest.TestCase):
         self.assertEqual(self.removed, [1])
         self.assertEqual(self.added, [5])
 
+    def test_notifier_removing_itself(self):
+        calls = []
+
+        def remove_self(trait_list, index, removed, added):
+            calls.append("removed")
+            trait_list.notifiers.remove(remove_self)
+
+        def record(trait_list, index, removed, added):
+            calls.append("recorded")
+
+        tl = TraitList([1, 2, 3], notifiers=[remove_self, record])
+
+        tl[0] = 5
+
+        # The notifier after the removed one is still called.
+        self.assertEqual(calls, ["removed", "recorded"])
+        self.assertEqual(tl.notifiers, [record])
+
     def test_copy(self):
         tl = TraitList([1, 2, 3],
                        item_validator=int_item_validator,
@@ -1497,3 +1516,34 @@ class TestTraitListObject(unittest.TestCase):
 
         obj.ranges.append(range(10, 20))
         self.assertEqual(obj.ranges, [range(10, 20)])
+
+    def test_bulk_validation(self):
+        class HasFloats(HasTraits):
+            floats = List(Float)
+
+        obj = HasFloats(floats=[1, 2])
+        obj.floats.extend([3, 4.5])
+        obj.floats[1:3] = [5, 6]
+        obj.floats += [7]
+
+        self.assertEqual(obj.floats, [1.0, 5.0, 6.0, 4.5, 7.0])
+        for item in obj.floats:
+            self.assertIs(type(item), float)
+
+        with self.assertRaises(TraitError) as exception_context:
+            obj.floats.extend([8, "nine"])
+        self.assertIn(
+            "Each element of the 'floats' trait of a HasFloats instance",
+            str(exception_context.exception),
+        )
+        with self.assertRaises(TraitError):
+            obj.floats[0:1] = ["ten"]
+        self.assertEqual(obj.floats, [1.0, 5.0, 6.0, 4.5, 7.0])
+
+    def test_bulk_validation_with_custom_item_validator(self):
+        obj = HasLengthConstrainedLists()
+        list_object = obj.at_most_five
+        list_object.item_validator = int_item_validator
+
+        with self.assertRaises(TraitError):
+            list_object.extend([1, 2.5])
@@ -557,6 +557,26 @@ class TestTraitSetObject(unittest.TestCase):
         obj.ranges.add(range(10, 20))
         self.assertEqual(obj.ranges, {range(10, 20)})
 
+    def test_bulk_validation(self):
+        class HasSet(HasTraits):
+            values = Set(Str)
+
+        obj = HasSet(values={"a"})
+        obj.values.update(["b"], ("c", "d"))
+        obj.values |= {"e"}
+        obj.values ^= {"a", "f"}
+        obj.values.symmetric_difference_update(["b", "g"])
+
+        self.assertEqual(obj.values, {"c", "d", "e", "f", "g"})
+
+        with self.assertRaises(TraitError) as exception_context:
+            obj.values.update(["h", 9])
+        self.assertIn(
+            "Each element of the 'values' trait of a HasSet instance",
+            str(exception_context.exception),
+        )
+        self.assertNotIn("h", obj.values)
+
 
 class TestTraitSetEvent(unittest.TestCase):
 
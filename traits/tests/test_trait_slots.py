@@ -0,0 +1,294 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Tests for compact HasTraits classes, created with ``trait_slots=True``.
+"""
+
+import gc
+import pickle
+import unittest
+import weakref
+
+from traits.api import (
+    Any,
+    CTrait,
+    Event,
+    Float,
+    HasTraits,
+    Instance,
+    Int,
+    List,
+    Map,
+    Property,
+    ReadOnly,
+    Str,
+    TraitError,
+)
+from traits.constants import TraitKind
+
+
+class Point(HasTraits, trait_slots=True):
+
+    x = Float()
+
+    y = Float(2.0)
+
+    label = Str()
+
+    values = List(Int)
+
+    moved = Event()
+
+    origin = ReadOnly()
+
+    size = Property(Float, observe="x")
+
+    changes = List()
+
+    def _get_size(self):
+        return abs(self.x)
+
+    def _x_changed(self, old, new):
+        self.changes.append(("x", old, new))
+
+
+class ColorPoint(Point):
+
+    color = Str("red")
+
+
+class PlainColorPoint(Point, trait_slots=False):
+
+    color = Str("red")
+
+
+class Named(HasTraits, trait_slots=True):
+
+    name = Str()
+
+    x = Int()
+
+
+class NamedPoint(Point, Named):
+
+    z = Int()
+
+
+class Node(HasTraits, trait_slots=True):
+
+    child = Instance("Node")
+
+    payload = Any()
+
+
+class Mapped(HasTraits, trait_slots=True):
+
+    state = Map({"on": 1, "off": 0}, default_value="off")
+
+
+class TestTraitSlots(unittest.TestCase):
+
+    def test_values_not_stored_in_dict(self):
+        point = Point(x=1.0, label="a")
+        point.y = 3.0
+
+        self.assertEqual(point.x, 1.0)
+        self.assertEqual(point.y, 3.0)
+        self.assertEqual(point.label, "a")
+        self.assertNotIn("x", point.__dict__)
+        self.assertNotIn("y", point.__dict__)
+        self.assertNotIn("label", point.__dict__)
+
+    def test_slot_layout(self):
+        self.assertEqual(
+            Point.__trait_slots__, ("x", "y", "label", "values", "changes")
+        )
+        self.assertEqual(
+            ColorPoint.__trait_slots__, Point.__trait_slots__ + ("color",)
+        )
+        for index, name in enumerate(Point.__trait_slots__):
+            self.assertEqual(Point.__class_traits__[name].slot_index, index)
+
+    def test_default_values(self):
+        point = Point()
+
+        self.assertEqual(point.x, 0.0)
+        self.assertEqual(point.y, 2.0)
+        self.assertEqual(point.values, [])
+        point.values.append(1)
+        self.assertEqual(point.values, [1])
+
+    def test_validation(self):
+        point = Point()
+
+        with self.assertRaises(TraitError):
+            point.x = "not a float"
+        point.x = 5
+        self.assertIsInstance(point.x, float)
+
+    def test_delete_restores_default(self):
+        point = Point(y=5.0)
+
+        del point.y
+
+        self.assertEqual(point.y, 2.0)
+
+    def test_notifications(self):
+        point = Point()
+        events = []
+        point.observe(events.append, "x")
+
+        point.x = 1.0
+        point.x = 1.0
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual((events[0].old, events[0].new), (0.0, 1.0))
+        self.assertEqual(point.changes, [("x", 0.0, 1.0)])
+
+    def test_property_observing_slotted_trait(self):
+        point = Point()
+        events = []
+        point.observe(events.append, "size")
+
+        point.x = -3.0
+
+        self.assertEqual(point.size, 3.0)
+        self.assertEqual(len(events), 1)
+
+    def test_non_value_traits_are_not_slotted(self):
+        traits = Point.__class_traits__
+
+        self.assertEqual(traits["moved"].slot_index, -1)
+        self.assertEqual(traits["origin"].slot_index, -1)
+        self.assertEqual(traits["size"].slot_index, -1)
+
+        point = Point()
+        point.origin = 1
+        self.assertEqual(point.origin, 1)
+        with self.assertRaises(TraitError):
+            point.origin = 2
+
+    def test_instance_traits_use_slots(self):
+        point = Point()
+        changes = []
+        # Registering a handler creates an instance copy of the trait.
+        point.on_trait_change(lambda new: changes.append(new), "label")
+
+        point.label = "b"
+
+        self.assertEqual(point.label, "b")
+        self.assertNotIn("label", point.__dict__)
+        self.assertEqual(changes, ["b"])
+
+    def test_dynamic_traits_use_dict(self):
+        point = Point()
+        point.add_trait("extra", Int(3))
+
+        point.extra = 4
+
+        self.assertEqual(point.extra, 4)
+        self.assertEqual(point.__dict__["extra"], 4)
+
+    def test_instance_trait_replacing_slotted_trait(self):
+        point = Point(label="a")
+        point.add_trait("label", Property(lambda obj: "computed"))
+
+        self.assertEqual(point.label, "computed")
+
+    def test_non_trait_attributes(self):
+        point = Point()
+
+        point.some_attribute = "value"
+
+        self.assertEqual(point.some_attribute, "value")
+        self.assertEqual(point.__dict__, {"some_attribute": "value"})
+
+    def test_subclass(self):
+        point = ColorPoint(x=1.0, color="blue")
+
+        self.assertEqual(point.x, 1.0)
+        self.assertEqual(point.color, "blue")
+        self.assertNotIn("color", point.__dict__)
+        self.assertEqual(point.changes, [("x", 0.0, 1.0)])
+
+    def test_subclass_opting_out(self):
+        point = PlainColorPoint(x=1.0, color="blue")
+
+        self.assertNotIn("__trait_slots__", PlainColorPoint.__dict__)
+        self.assertEqual(point.x, 1.0)
+        self.assertEqual(point.color, "blue")
+        self.assertEqual(point.__dict__["x"], 1.0)
+        self.assertEqual(point.changes, [("x", 0.0, 1.0)])
+
+    def test_multiple_slotted_bases(self):
+        point = NamedPoint(x=1.0, name="n", z=3)
+
+        self.assertEqual(point.x, 1.0)
+        self.assertEqual(point.name, "n")
+        self.assertEqual(point.z, 3)
+        self.assertEqual(point.__dict__, {})
+
+        named = Named(x=2, name="m")
+        self.assertEqual((named.x, named.name), (2, "m"))
+
+    def test_mapped_trait(self):
+        mapped = Mapped()
+        self.assertEqual(mapped.state_, 0)
+
+        mapped.state = "on"
+
+        self.assertEqual(mapped.state, "on")
+        self.assertEqual(mapped.state_, 1)
+
+    def test_pickle(self):
+        point = ColorPoint(x=1.0, y=3.0, label="p", color="green")
+        point.values = [1, 2]
+
+        copy = pickle.loads(pickle.dumps(point))
+
+        self.assertEqual(copy.x, 1.0)
+        self.assertEqual(copy.y, 3.0)
+        self.assertEqual(copy.label, "p")
+        self.assertEqual(copy.color, "green")
+        self.assertEqual(copy.values, [1, 2])
+
+    def test_clone_traits(self):
+        point = Point(x=1.0, label="p")
+
+        clone = point.clone_traits()
+
+        self.assertEqual(clone.x, 1.0)
+        self.assertEqual(clone.label, "p")
+
+    def test_reference_cycles_are_collected(self):
+        node = Node()
+        node.child = node
+        node.payload = [node]
+        ref = weakref.ref(node)
+
+        del node
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_slot_index_of_non_value_trait(self):
+        trait = CTrait(TraitKind.event)
+
+        with self.assertRaises(TraitError):
+            trait.slot_index = 0
+        self.assertEqual(trait.slot_index, -1)
+
+    def test_slot_index_invalid(self):
+        trait = CTrait(TraitKind.trait)
+
+        with self.assertRaises(ValueError):
+            trait.slot_index = -2
+        trait.slot_index = 3
+        self.assertEqual(trait.slot_index, 3)
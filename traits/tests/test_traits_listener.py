@@ -493,3 +493,100 @@ class TestListenerParser(unittest.TestCase):
         del square, handler
         handler = listener_handler()
         self.assertEqual(handler(5), 25)
+
+
+class TestParseListener(unittest.TestCase):
+    """ Test parse_listener, which clones cached parsed templates."""
+
+    def test_same_as_listener_parser(self):
+        examples = [
+            "a.b",
+            "a:b",
+            "a.[b, c]",
+            "a.[b,c].+foo",
+            "[a, b].c*",
+            "a.b*.c",
+            "+foo",
+            "-foo",
+            "a.+",
+            "a.-",
+            "a?.b",
+            "a.b[]",
+            "items.[name, value]",
+        ]
+        for deferred in [False, True]:
+            for handler_type in [
+                traits_listener.ANY_LISTENER,
+                traits_listener.SRC_LISTENER,
+                traits_listener.DST_LISTENER,
+            ]:
+                for text in examples:
+                    options = dict(
+                        dispatch="same",
+                        priority=True,
+                        deferred=deferred,
+                        handler_type=handler_type,
+                    )
+                    with self.subTest(text=text, **options):
+                        expected = traits_listener.ListenerParser(
+                            text, **options
+                        ).listener
+                        actual = traits_listener.parse_listener(
+                            text, **options
+                        )
+                        self.assertEqual(repr(actual), repr(expected))
+
+    def test_handler_set_on_every_item(self):
+        handler = traits_listener.ListenerHandler(print)
+        ref = object()
+
+        listener = traits_listener.parse_listener(
+            "a.[b,c]*:d",
+            handler=handler,
+            wrapped_handler_ref=ref,
+            dispatch="new",
+            priority=True,
+        )
+
+        items = []
+        pending = [listener]
+        while pending:
+            current = pending.pop()
+            if current is None or current in items:
+                continue
+            items.append(current)
+            pending.extend(getattr(current, "items", []))
+            pending.append(current.next)
+
+        item_count = 0
+        for item in items:
+            if isinstance(item, traits_listener.ListenerItem):
+                item_count += 1
+                self.assertIs(item.handler, handler)
+                self.assertIs(item.wrapped_handler_ref, ref)
+                self.assertEqual(item.dispatch, "new")
+                self.assertTrue(item.priority)
+        self.assertEqual(item_count, 4)
+
+    def test_copies_are_independent(self):
+        listener1 = traits_listener.parse_listener("a.b*")
+        listener2 = traits_listener.parse_listener("a.b*")
+
+        self.assertIsNot(listener1, listener2)
+        self.assertIsNot(listener1.next, listener2.next)
+        self.assertIsNot(listener1.active, listener2.active)
+        # The cycle for "b*" is preserved within each copy.
+        self.assertIs(listener1.next.next, listener1.next)
+        self.assertIs(listener2.next.next, listener2.next)
+
+    def test_shared_listeners_preserved(self):
+        listener = traits_listener.parse_listener("[a,b].c")
+
+        first, second = listener.items
+        self.assertIs(first.next, second.next)
+        self.assertIs(listener.next, first.next)
+
+    def test_invalid_text(self):
+        for _ in range(2):
+            with self.assertRaises(TraitError):
+                traits_listener.parse_listener("a.b,")
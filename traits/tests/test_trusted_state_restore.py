@@ -0,0 +1,181 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Tests for the trusted_state_restore context manager.
+"""
+
+import pickle
+import unittest
+
+from traits.api import (
+    Any,
+    Float,
+    HasTraits,
+    Int,
+    List,
+    Map,
+    observe,
+    on_trait_change,
+    Str,
+    TraitError,
+    trusted_state_restore,
+)
+
+
+class Tracked(HasTraits):
+    value = Int()
+
+    names = List(Str)
+
+    changes = List()
+
+    listener_changes = List()
+
+    inited = Int()
+
+    @observe("value")
+    def _record_change(self, event):
+        self.changes.append(event.new)
+
+    @on_trait_change("value", post_init=True)
+    def _record_listener_change(self, new):
+        self.listener_changes.append(new)
+
+    def traits_init(self):
+        self.inited += 1
+
+
+class WithMapped(HasTraits):
+    married = Map({"yes": 1, "no": 0})
+
+
+class Compact(HasTraits, trait_slots=True):
+    x = Float()
+
+    label = Any()
+
+
+def dumps(*objects):
+    """ Pickle objects after clearing the changes they recorded. """
+    for object in objects:
+        if isinstance(object, Tracked):
+            object.changes = []
+            object.listener_changes = []
+            object.inited = 0
+    return pickle.dumps(objects)
+
+
+class TestTrustedStateRestore(unittest.TestCase):
+
+    def test_values_restored(self):
+        data = dumps(Tracked(value=3, names=["a", "b"]))
+
+        with trusted_state_restore():
+            (tracked,) = pickle.loads(data)
+
+        self.assertEqual(tracked.value, 3)
+        self.assertEqual(tracked.names, ["a", "b"])
+        self.assertEqual(tracked.changes, [])
+        self.assertEqual(tracked.listener_changes, [])
+
+    def test_values_not_validated(self):
+        tracked = Tracked()
+        tracked.__dict__["value"] = "not an int"
+        data = dumps(tracked)
+
+        with self.assertRaises(TraitError):
+            pickle.loads(data)
+        with trusted_state_restore():
+            (restored,) = pickle.loads(data)
+
+        self.assertEqual(restored.value, "not an int")
+
+    def test_initialization_deferred(self):
+        data = dumps(Tracked(value=3))
+
+        with trusted_state_restore():
+            (tracked,) = pickle.loads(data)
+            self.assertFalse(tracked.traits_inited())
+            self.assertEqual(tracked.inited, 0)
+
+        self.assertTrue(tracked.traits_inited())
+        self.assertEqual(tracked.inited, 1)
+
+    def test_notifications_after_restore(self):
+        data = dumps(Tracked(value=3))
+
+        with trusted_state_restore():
+            (tracked,) = pickle.loads(data)
+        tracked.value = 4
+
+        self.assertEqual(tracked.changes, [4])
+        self.assertEqual(tracked.listener_changes, [4])
+
+    def test_containers_bound_to_object(self):
+        data = dumps(Tracked(names=["a"]))
+
+        with trusted_state_restore():
+            (tracked,) = pickle.loads(data)
+
+        self.assertIs(tracked.names.object(), tracked)
+        with self.assertRaises(TraitError):
+            tracked.names.append(1)
+
+    def test_mapped_trait(self):
+        data = dumps(WithMapped(married="no"))
+
+        with trusted_state_restore():
+            (restored,) = pickle.loads(data)
+
+        self.assertEqual(restored.married, "no")
+        self.assertEqual(restored.married_, 0)
+
+    def test_slots(self):
+        data = dumps(Compact(x=1.5, label="a"))
+
+        with trusted_state_restore():
+            (restored,) = pickle.loads(data)
+
+        self.assertEqual(restored.x, 1.5)
+        self.assertEqual(restored.label, "a")
+
+    def test_nested(self):
+        data = dumps(Tracked(value=3))
+
+        with trusted_state_restore():
+            with trusted_state_restore():
+                (tracked,) = pickle.loads(data)
+            self.assertFalse(tracked.traits_inited())
+
+        self.assertTrue(tracked.traits_inited())
+        self.assertEqual(tracked.inited, 1)
+
+    def test_exception(self):
+        data = dumps(Tracked(value=3))
+
+        with self.assertRaises(ZeroDivisionError):
+            with trusted_state_restore():
+                (tracked,) = pickle.loads(data)
+                1 / 0
+
+        self.assertFalse(tracked.traits_inited())
+        (restored,) = pickle.loads(data)
+        self.assertTrue(restored.traits_inited())
+
+    def test_outside_context(self):
+        data = dumps(Tracked(value=3))
+
+        (tracked,) = pickle.loads(data)
+
+        self.assertTrue(tracked.traits_inited())
+        self.assertEqual(tracked.inited, 1)
+        tracked.value = 4
+        self.assertEqual(tracked.changes, [4])
@@ -11,8 +11,9 @@
 import unittest
 
 from traits.api import (
-    Bytes, DefaultValue, Float, HasTraits, Instance, Int, List, Str,
-    TraitError, TraitType, Type, Union)
+    BaseStr, Bytes, DefaultValue, Either, Enum, Float, HasTraits, Instance,
+    Int, List, Range, Str, TraitError, TraitType, Type, Union)
+from traits.constants import ValidateTrait
 
 
 class CustomClass(HasTraits):
@@ -214,3 +215,110 @@ class TestUnion(unittest.TestCase):
             has_union.trait("nested").default_value(),
             (DefaultValue.constant, ""),
         )
+
+    def test_fast_validate(self):
+        union = Union(None, Int, Str)
+
+        kind, members = union.fast_validate
+        self.assertEqual(kind, ValidateTrait.union)
+        self.assertEqual(members, tuple(union.list_ctrait_instances))
+
+    def test_no_fast_validate_for_subclass_with_validate(self):
+        class UnionAllowStr(Union):
+            def validate(self, obj, name, value):
+                if isinstance(value, str):
+                    return value
+                return super().validate(obj, name, value)
+
+        self.assertIsNone(getattr(UnionAllowStr(Int), "fast_validate", None))
+
+    def test_first_valid_member_wins(self):
+        class HasNumber(HasTraits):
+            number = Union(None, Int, Float, Str)
+
+        obj = HasNumber()
+        for value in [None, 1, 2.5, "three"]:
+            with self.subTest(value=value):
+                obj.number = value
+                self.assertIs(obj.number, value)
+
+        with self.assertRaises(TraitError):
+            obj.number = b"bytes"
+
+    def test_member_conversion(self):
+        class HasNumber(HasTraits):
+            number = Union(None, Float, Range(0, 10))
+
+        obj = HasNumber()
+        obj.number = 3
+        self.assertIs(type(obj.number), float)
+        self.assertEqual(obj.number, 3.0)
+
+    def test_members_with_python_validators(self):
+        class OddInt(TraitType):
+            def validate(self, obj, name, value):
+                if isinstance(value, int) and value % 2:
+                    return value
+                self.error(obj, name, value)
+
+        class HasUnion(HasTraits):
+            value = Union(Enum(2, 4), OddInt, BaseStr, List(Int))
+
+        obj = HasUnion()
+        for value in [2, 3, "a", [1, 2]]:
+            with self.subTest(value=value):
+                obj.value = value
+                self.assertEqual(obj.value, value)
+
+        with self.assertRaises(TraitError):
+            obj.value = 6
+        with self.assertRaises(TraitError):
+            obj.value = ["a"]
+
+    def test_python_validator_exceptions_propagate(self):
+        class BrokenType(TraitType):
+            def validate(self, obj, name, value):
+                raise ZeroDivisionError()
+
+        class HasUnion(HasTraits):
+            value = Union(Int, BrokenType)
+
+        obj = HasUnion()
+        obj.value = 3
+        with self.assertRaises(ZeroDivisionError):
+            obj.value = "a string"
+
+    def test_union_inside_compound(self):
+        class HasUnion(HasTraits):
+            value = Either(Union(Int, None), Str)
+
+            nested = Union(Union(Int, None), Either(Str, Float))
+
+        obj = HasUnion()
+        for value in [1, None, "a"]:
+            with self.subTest(value=value):
+                obj.value = value
+                self.assertEqual(obj.value, value)
+                obj.nested = value
+                self.assertEqual(obj.nested, value)
+
+        obj.nested = 2.5
+        self.assertEqual(obj.nested, 2.5)
+
+        with self.assertRaises(TraitError):
+            obj.value = 2.5
+        with self.assertRaises(TraitError):
+            obj.nested = b"bytes"
+
+    def test_validate_error_message(self):
+        class HasUnion(HasTraits):
+            value = Union(None, Int, Str)
+
+        obj = HasUnion()
+        with self.assertRaises(TraitError) as exception_context:
+            obj.value = 2.5
+
+        self.assertIn(
+            "must be None or an integer or a string",
+            str(exception_context.exception),
+        )
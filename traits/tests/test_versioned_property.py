@@ -0,0 +1,200 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Tests for cached properties with 'versioned=True' metadata.
+"""
+
+import pickle
+import unittest
+
+from traits.api import (
+    cached_property,
+    Float,
+    HasTraits,
+    Int,
+    List,
+    Property,
+    property_depends_on,
+    TraitError,
+)
+
+
+class Rectangle(HasTraits):
+    width = Float()
+
+    height = Float()
+
+    area = Property(observe="width, height", versioned=True)
+
+    computations = Int()
+
+    @cached_property
+    def _get_area(self):
+        self.computations += 1
+        return self.width * self.height
+
+
+class Square(Rectangle):
+    side = Float()
+
+
+class Scaled(Rectangle):
+    scale = Float(1.0)
+
+    area = Property(depends_on=["width", "height", "scale"], versioned=True)
+
+    @cached_property
+    def _get_area(self):
+        self.computations += 1
+        return self.width * self.height * self.scale
+
+
+class Flushable(HasTraits):
+    value = Int()
+
+    doubled = Property(versioned=True)
+
+    computations = Int()
+
+    @property_depends_on("value", flushable=True)
+    def _get_doubled(self):
+        self.computations += 1
+        return 2 * self.value
+
+
+class TestVersionedProperty(unittest.TestCase):
+
+    def test_computed_once(self):
+        rectangle = Rectangle(width=2.0, height=3.0)
+
+        self.assertEqual(rectangle.area, 6.0)
+        self.assertEqual(rectangle.area, 6.0)
+        self.assertEqual(rectangle.computations, 1)
+
+    def test_recomputed_after_assignment(self):
+        rectangle = Rectangle(width=2.0, height=3.0)
+        self.assertEqual(rectangle.area, 6.0)
+
+        rectangle.width = 4.0
+        rectangle.height = 5.0
+
+        self.assertEqual(rectangle.area, 20.0)
+        self.assertEqual(rectangle.computations, 2)
+
+    def test_recomputed_after_deletion(self):
+        rectangle = Rectangle(width=2.0, height=3.0)
+        self.assertEqual(rectangle.area, 6.0)
+
+        del rectangle.width
+
+        self.assertEqual(rectangle.area, 0.0)
+
+    def test_no_listeners(self):
+        rectangle = Rectangle()
+
+        self.assertEqual(Rectangle.__listener_traits__, {})
+        self.assertEqual(Rectangle.__observer_traits__, {})
+        self.assertIsNone(rectangle._notifiers(False))
+
+    def test_trait_versions(self):
+        rectangle = Rectangle()
+        self.assertEqual(
+            rectangle._trait_versions(("width", "height")), (0, 0)
+        )
+
+        rectangle.width = 1.0
+        (first,) = rectangle._trait_versions(("width",))
+        rectangle.width = 1.0
+        (second,) = rectangle._trait_versions(("width",))
+
+        self.assertGreater(first, 0)
+        self.assertGreater(second, first)
+        self.assertEqual(rectangle._trait_versions(("height",)), (0,))
+
+    def test_only_dependencies_versioned(self):
+        self.assertTrue(Rectangle.__class_traits__["width"].versioned)
+        self.assertTrue(Rectangle.__class_traits__["height"].versioned)
+        self.assertFalse(Rectangle.__class_traits__["computations"].versioned)
+
+    def test_subclass(self):
+        square = Square(width=2.0, height=2.0)
+        self.assertEqual(square.area, 4.0)
+
+        square.width = 3.0
+
+        self.assertEqual(square.area, 6.0)
+        self.assertEqual(square.computations, 2)
+
+    def test_subclass_override(self):
+        scaled = Scaled(width=2.0, height=3.0)
+        self.assertEqual(scaled.area, 6.0)
+
+        scaled.scale = 2.0
+
+        self.assertEqual(scaled.area, 12.0)
+        self.assertEqual(scaled.computations, 2)
+
+    def test_flushable(self):
+        flushable = Flushable(value=2)
+        self.assertEqual(flushable.doubled, 4)
+
+        flushable.doubled = None
+        self.assertEqual(flushable.doubled, 4)
+        self.assertEqual(flushable.computations, 2)
+
+        flushable.value = 3
+        self.assertEqual(flushable.doubled, 6)
+
+    def test_pickle(self):
+        rectangle = Rectangle(width=2.0, height=3.0)
+        self.assertEqual(rectangle.area, 6.0)
+
+        state = rectangle.__getstate__()
+        unpickled = pickle.loads(pickle.dumps(rectangle))
+
+        self.assertEqual(
+            set(state),
+            {"width", "height", "computations", "__traits_version__"},
+        )
+        self.assertEqual(unpickled.area, 6.0)
+
+    def test_dependency_on_extended_name(self):
+        with self.assertRaises(TraitError):
+
+            class Invalid(HasTraits):
+                values = List()
+
+                total = Property(observe="values.items", versioned=True)
+
+                @cached_property
+                def _get_total(self):
+                    return sum(self.values)
+
+    def test_dependency_on_property(self):
+        with self.assertRaises(TraitError):
+
+            class Invalid(Rectangle):
+                double_area = Property(observe="area", versioned=True)
+
+                @cached_property
+                def _get_double_area(self):
+                    return 2 * self.area
+
+    def test_not_cached(self):
+        with self.assertRaises(TraitError):
+
+            class Invalid(HasTraits):
+                value = Int()
+
+                doubled = Property(observe="value", versioned=True)
+
+                def _get_doubled(self):
+                    return 2 * self.value
@@ -0,0 +1,775 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import array
+import collections.abc
+import pickle
+import sys
+from weakref import ref
+
+from traits.observation.i_observable import IObservable
+from traits.trait_errors import TraitError
+from traits.trait_list_object import (
+    _normalize_slice_or_index,
+    _removed_items,
+    TraitListEvent,
+)
+
+#: Descriptions of the items that can be stored for each array typecode.
+_TYPECODE_INFO = {
+    "b": "an integer in the range -128 to 127",
+    "B": "an integer in the range 0 to 255",
+    "u": "a single character",
+    "w": "a single character",
+    "h": "an integer that fits in a C short",
+    "H": "a nonnegative integer that fits in a C unsigned short",
+    "i": "an integer that fits in a C int",
+    "I": "a nonnegative integer that fits in a C unsigned int",
+    "l": "an integer that fits in a C long",
+    "L": "a nonnegative integer that fits in a C unsigned long",
+    "q": "an integer that fits in a C long long",
+    "Q": "a nonnegative integer that fits in a C unsigned long long",
+    "f": "a float",
+    "d": "a float",
+}
+
+
+def _typecode_info(typecode):
+    """ Return a description of the items stored for an array typecode.
+
+    Parameters
+    ----------
+    typecode : str
+        An :mod:`array` typecode.
+
+    Returns
+    -------
+    info : str
+        A description of the values that can be stored in an array with
+        the given typecode.
+    """
+    return _TYPECODE_INFO.get(typecode, "a value of typecode %r" % typecode)
+
+
+def _reconstruct(cls, typecode, items, state):
+    """ Rebuild a TraitArrayList, or subclass, from pickled data.
+
+    Neither ``__init__`` nor the notifying list methods are used, so no
+    validation or notification takes place.
+    """
+    self = array.array.__new__(cls, typecode)
+    array.array.fromlist(self, items)
+    self.__setstate__(state)
+    return self
+
+
+def _items_from_other_platform(typecode, data, byteorder, itemsize):
+    """ Decode the items of an array pickled on a platform where the items
+    of the typecode have a different size.
+
+    Parameters
+    ----------
+    typecode : str
+        The :mod:`array` typecode of the items.
+    data : bytes-like
+        The items, in the machine format of the other platform.
+    byteorder : str
+        The byte order of the other platform, "little" or "big".
+    itemsize : int
+        The size in bytes of the items on the other platform.
+
+    Returns
+    -------
+    items : list or str
+        The items, as a string for the character typecodes.
+
+    Raises
+    ------
+    ValueError
+        If no typecode of the given size can decode the items.
+    """
+    data = memoryview(data).cast("B")
+    if typecode in "uw":
+        encoding = "utf-{}-{}".format(
+            8 * itemsize, "le" if byteorder == "little" else "be"
+        )
+        return bytes(data).decode(encoding)
+
+    codes = "bhilq" if typecode in "bhilq" else "BHILQ"
+    for code in codes:
+        if array.array(code).itemsize == itemsize:
+            break
+    else:
+        raise ValueError(
+            "cannot read items of typecode {!r} and size {}".format(
+                typecode, itemsize
+            )
+        )
+    items = array.array(code)
+    items.frombytes(data)
+    if byteorder != sys.byteorder:
+        items.byteswap()
+    return items.tolist()
+
+
+def _reconstruct_from_buffer(cls, typecode, data, byteorder, itemsize, state):
+    """ Rebuild a TraitArrayList, or subclass, from data pickled with
+    protocol 5 or later.
+
+    *data* holds the items in the machine format of a platform with the
+    given byte order and item size. When the item size differs from this
+    platform's, as for the ``"l"`` typecode between Windows and other 64-bit
+    platforms, the items are converted one by one. As for ``_reconstruct``,
+    no validation or notification takes place.
+    """
+    self = array.array.__new__(cls, typecode)
+    if itemsize == self.itemsize:
+        array.array.frombytes(self, memoryview(data).cast("B"))
+        if byteorder != sys.byteorder:
+            array.array.byteswap(self)
+    else:
+        items = _items_from_other_platform(
+            typecode, data, byteorder, itemsize
+        )
+        if isinstance(items, str):
+            array.array.fromunicode(self, items)
+        else:
+            array.array.fromlist(self, items)
+    self.__setstate__(state)
+    return self
+
+
+@IObservable.register
+class TraitArrayList(array.array):
+    """ A subclass of array.array that notifies listeners of changes.
+
+    Items are stored unboxed, using the C type given by the typecode, so a
+    TraitArrayList of numbers is several times more compact than the
+    equivalent list. The list supports the buffer protocol, so that for
+    example ``numpy.asarray`` can read its contents without copying.
+
+    Changes made through the buffer (for example by writing to a NumPy array
+    that shares memory with the list) bypass the list methods, and are
+    not notified. While a buffer is exported, operations that would resize
+    the list raise ``BufferError``.
+
+    Parameters
+    ----------
+    typecode : str
+        The :mod:`array` typecode for the items of the list, for example
+        ``"d"`` for double precision floats.
+    iterable : iterable, optional
+        Iterable providing the items for the list. An object supporting the
+        buffer protocol whose format matches *typecode* is copied directly,
+        without iterating over its items.
+    notifiers : list of callable, optional
+        A list of callables with the signature::
+
+            notifier(trait_list, index, removed, added)
+
+        If this argument is not given, the list of notifiers is initially
+        empty.
+
+    Attributes
+    ----------
+    notifiers : list of callable
+        A list of callables with the signature::
+
+            notifier(trait_list, index, removed, added)
+    """
+
+    def __new__(cls, typecode, *args, **kwargs):
+        self = super().__new__(cls, typecode)
+        self.notifiers = []
+        return self
+
+    def __init__(self, typecode, iterable=(), *, notifiers=None):
+        super().extend(self._validate_items(iterable))
+        if notifiers is not None:
+            self.notifiers = list(notifiers)
+
+    def notify(self, index, removed, added):
+        """ Call all notifiers.
+
+        This simply calls all notifiers provided by the class, if any.
+        The notifiers are expected to have the signature::
+
+            notifier(trait_list, index, removed, added)
+
+        Any return values are ignored.
+
+        Parameters
+        ----------
+        index : int or slice
+            The indices being modified by the operation.
+        removed : list
+            The items to be removed.
+        added : list
+            The items being added to the list.
+        """
+        # Iterate over a copy, so that notifiers added or removed by a
+        # notifier do not affect this round of notifications.
+        for notifier in self.notifiers.copy():
+            notifier(self, index, removed, added)
+
+    def __eq__(self, other):
+        """ Compare equal to arrays and lists with the same items. """
+        if isinstance(other, list):
+            return self.tolist() == other
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        if isinstance(other, list):
+            return self.tolist() != other
+        return super().__ne__(other)
+
+    __hash__ = None
+
+    # -- list interface -------------------------------------------------------
+
+    def __delitem__(self, key):
+        """ Delete self[key].
+
+        Parameters
+        ----------
+        key : integer or slice
+            Index of the element(s) to be deleted.
+
+        Raises
+        ------
+        IndexError
+            If key is an integer index and is out of range.
+        """
+
+        original_length = len(self)
+        removed = _removed_items(self, key, return_for_invalid_index=None)
+
+        super().__delitem__(key)
+
+        if removed:
+            removed = list(removed)
+            reversed, normalized_key = _normalize_slice_or_index(
+                key, original_length)
+            if reversed:
+                removed = removed[::-1]
+            self.notify(normalized_key, removed, [])
+
+    def __iadd__(self, value):
+        """ Implement self += value.
+
+        Parameters
+        ----------
+        value : iterable
+            The items to be added.
+
+        Returns
+        -------
+        self : TraitArrayList
+            The modified list.
+        """
+
+        self.extend(value)
+        return self
+
+    def __imul__(self, value):
+        """ Implement self *= value.
+
+        Parameters
+        ----------
+        value : integer
+            The multiplier.
+
+        Returns
+        -------
+        self : TraitArrayList
+            The modified list.
+        """
+
+        if value < 1:
+            removed = self.tolist()
+            multiplied = super().__imul__(value)
+            if removed:
+                self.notify(0, removed, [])
+        else:
+            original_length = len(self)
+            multiplied = super().__imul__(value)
+            added = self[original_length:].tolist()
+            if added:
+                self.notify(original_length, [], added)
+        return multiplied
+
+    def __setitem__(self, key, value):
+        """ Set self[key] to value.
+
+        Parameters
+        ----------
+        key : integer or slice
+            Index of the element(s) to be replaced.
+        value : any or iterable
+            Replacement value, or values if key is a slice.
+
+        Raises
+        ------
+        IndexError
+            If key is an integer index and is out of range.
+        ValueError
+            If key is an extended slice (that is, it's a slice whose step
+            is not 1 and not None) and the number of replacement elements
+            doesn't match the number of removed elements.
+        """
+
+        original_length = len(self)
+        removed = _removed_items(self, key, return_for_invalid_index=None)
+        if isinstance(key, slice):
+            value = self._validate_items(value)
+            removed = list(removed)
+            added = value.tolist()
+        else:
+            value = self._validate_items([value])[0]
+            added = [value]
+
+        super().__setitem__(key, value)
+
+        if added or removed:
+            reversed, normalized_key = _normalize_slice_or_index(
+                key, original_length)
+            if reversed:
+                added = added[::-1]
+                removed = removed[::-1]
+            self.notify(normalized_key, removed, added)
+
+    def append(self, object):
+        """ Append object to the end of the list.
+
+        Parameters
+        ----------
+        object : any
+            The object to append.
+        """
+
+        self.extend([object])
+
+    def clear(self):
+        """ Remove all items from list. """
+
+        del self[:]
+
+    def extend(self, iterable):
+        """ Extend list by appending elements from the iterable.
+
+        Parameters
+        ----------
+        iterable : iterable
+            The elements to append.
+        """
+
+        original_length = len(self)
+        added = self._validate_items(iterable)
+        super().extend(added)
+        if added:
+            self.notify(original_length, [], added.tolist())
+
+    def insert(self, index, object):
+        """ Insert object before index.
+
+        Parameters
+        ----------
+        index : integer
+            The position at which to insert.
+        object : any object
+            The object to insert.
+        """
+
+        # For insert, *any* index is valid!
+        if index < 0:
+            normalized_index = max(index + len(self), 0)
+        else:
+            normalized_index = min(index, len(self))
+        object = self._validate_items([object])[0]
+        super().insert(index, object)
+        self.notify(normalized_index, [], [object])
+
+    def pop(self, index=-1):
+        """ Remove and return item at index (default last).
+
+        Parameters
+        ----------
+        index : int, optional
+            Index at which to remove item. If not given, the
+            last item of the list is removed.
+
+        Returns
+        -------
+        item : any object
+            The removed item.
+
+        Raises
+        ------
+        IndexError
+            If list is empty or index is out of range.
+        """
+
+        # We don't need to worry about indices < -len(self) or >= len(self):
+        # for those, the pop call will raise anyway.
+        normalized_index = index + len(self) if index < 0 else index
+        item = super().pop(index)
+        self.notify(normalized_index, [item], [])
+        return item
+
+    def remove(self, value):
+        """ Remove first occurrence of value.
+
+        Parameters
+        ----------
+        value : any object
+            Value to be removed.
+
+        Raises
+        ------
+        ValueError
+            If the value is not present.
+        """
+
+        index = self.index(value)
+        removed = [self[index]]
+        super().__delitem__(index)
+        self.notify(index, removed, [])
+
+    def reverse(self):
+        """ Reverse the items in the list in place. """
+        removed = self.tolist()
+        super().reverse()
+        if removed:
+            self.notify(0, removed, self.tolist())
+
+    def byteswap(self):
+        """ Byteswap all items of the list in place. """
+        removed = self.tolist()
+        super().byteswap()
+        if removed:
+            self.notify(0, removed, self.tolist())
+
+    def frombytes(self, buffer):
+        """ Append items from a bytes-like object of machine values.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            The machine values to append, as if read from a file with
+            ``tofile``.
+        """
+
+        original_length = len(self)
+        super().frombytes(buffer)
+        if len(self) > original_length:
+            self.notify(
+                original_length, [], self[original_length:].tolist())
+
+    def fromfile(self, f, n):
+        """ Append n items read from the binary file object f.
+
+        Parameters
+        ----------
+        f : file object
+            The binary file to read from.
+        n : int
+            The number of items to read.
+
+        Raises
+        ------
+        EOFError
+            If fewer than n items are available. The items that were
+            available are still appended.
+        """
+
+        original_length = len(self)
+        try:
+            super().fromfile(f, n)
+        finally:
+            if len(self) > original_length:
+                self.notify(
+                    original_length, [], self[original_length:].tolist())
+
+    def fromlist(self, list):
+        """ Append items from the list.
+
+        Parameters
+        ----------
+        list : list
+            The items to append.
+        """
+
+        if not isinstance(list, type([])):
+            raise TypeError("arg must be list")
+        self.extend(list)
+
+    def fromunicode(self, s):
+        """ Append the characters of a string to a character array.
+
+        Parameters
+        ----------
+        s : str
+            The characters to append.
+        """
+
+        original_length = len(self)
+        super().fromunicode(s)
+        if len(self) > original_length:
+            self.notify(
+                original_length, [], self[original_length:].tolist())
+
+    # -- pickle and copy support ----------------------------------------------
+
+    def __copy__(self):
+        """ Perform a shallow copy operation.
+
+        Notifiers are transient and should not be copied.
+        """
+        return type(self)(self.typecode, self)
+
+    def __deepcopy__(self, memo):
+        """ Perform a deepcopy operation.
+
+        Notifiers are transient and should not be copied. The items are
+        numbers or characters, so a copy of the list is a deep copy.
+        """
+        return self.__copy__()
+
+    def __reduce_ex__(self, protocol):
+        """ Support pickling.
+
+        Under protocol 5 or later, the items are pickled as a PickleBuffer
+        of the array's memory, which can be passed out-of-band, along with
+        the byte order and item size of the platform, so that they can be
+        converted when unpickled on a platform of different endianness or
+        C type sizes. Otherwise they are pickled as a list.
+        """
+        if protocol >= 5:
+            return (
+                _reconstruct_from_buffer,
+                (
+                    type(self),
+                    self.typecode,
+                    pickle.PickleBuffer(self),
+                    sys.byteorder,
+                    self.itemsize,
+                    self.__getstate__(),
+                ),
+            )
+        return (
+            _reconstruct,
+            (type(self), self.typecode, self.tolist(), self.__getstate__()),
+        )
+
+    def __getstate__(self):
+        """ Get the state of the object for serialization.
+
+        Notifiers are transient and should not be serialized.
+        """
+        result = self.__dict__.copy()
+        result.pop("notifiers", None)
+        return result
+
+    def __setstate__(self, state):
+        """ Restore the state of the object after serialization.
+
+        Notifiers are transient and are restored to the empty list.
+        """
+        state["notifiers"] = []
+        self.__dict__.update(state)
+
+    # -- Implement IObservable ------------------------------------------------
+
+    def _notifiers(self, force_create):
+        """ Return a list of callables where each callable is a notifier.
+        The list is expected to be mutated for contributing or removing
+        notifiers from the object.
+
+        Parameters
+        ----------
+        force_create: boolean
+            It is added for compatibility with CTrait. Not used here.
+        """
+        return self.notifiers
+
+    # -- private methods ------------------------------------------------------
+
+    def _validate_items(self, iterable):
+        """
+        Convert items that are being added to the list.
+
+        Parameters
+        ----------
+        iterable : iterable
+            The items to be converted.
+
+        Returns
+        -------
+        items : array.array
+            A new array, with the same typecode as this list, holding the
+            converted items.
+
+        Raises
+        ------
+        TypeError, OverflowError, ValueError
+            If an item can't be stored in an array with the typecode of
+            this list.
+        """
+        if isinstance(iterable, (bytes, bytearray)):
+            # The array constructor reads these as machine values, rather
+            # than as a sequence of integers like other buffers.
+            iterable = memoryview(iterable)
+        if not isinstance(iterable, (array.array, list, tuple)):
+            try:
+                view = memoryview(iterable)
+            except TypeError:
+                pass
+            else:
+                # Copy buffers of matching machine values directly.
+                with view:
+                    if (
+                        view.ndim == 1
+                        and view.format == self.typecode
+                        and view.c_contiguous
+                    ):
+                        items = array.array(self.typecode)
+                        with view.cast("B") as data:
+                            items.frombytes(data)
+                        return items
+        return array.array(self.typecode, iterable)
+
+
+class TraitArrayListObject(TraitArrayList):
+    """ A specialization of TraitArrayList with a notifier that fires the
+    ``<name>_items`` event of the object that the list belongs to.
+
+    Parameters
+    ----------
+    trait : ArrayList
+        The trait that the list has been assigned to.
+    object : HasTraits
+        The object this list belongs to. Can also be None in cases where the
+        list has been disconnected from its HasTraits parent.
+    name : str
+        The name of the trait on the object.
+    value : iterable
+        The initial value of the list.
+
+    Attributes
+    ----------
+    trait : ArrayList
+        The trait that the list has been assigned to.
+    object : callable
+        A callable that when called with no arguments returns the HasTraits
+        object that this list belongs to, or None if there is no such object.
+    name : str
+        The name of the trait on the object.
+    """
+
+    def __new__(cls, trait, object, name, value):
+        return super().__new__(cls, trait.typecode)
+
+    def __init__(self, trait, object, name, value):
+
+        self.trait = trait
+        self.object = (lambda: None) if object is None else ref(object)
+        self.name = name
+        self.name_items = None
+        if trait.has_items:
+            self.name_items = name + "_items"
+
+        super().__init__(trait.typecode, value, notifiers=[self.notifier])
+
+    def notifier(self, trait_list, index, removed, added):
+        """ Converts and consolidates the parameters to a TraitListEvent and
+        then fires the event.
+
+        Parameters
+        ----------
+        trait_list : TraitArrayList
+            The list
+        index : int or slice
+            Index or slice that was modified
+        removed : list
+            Values that were removed
+        added : list
+            Values that were added
+        """
+        if self.trait is None or self.name_items is None:
+            return
+
+        object = self.object()
+        if object is None:
+            return
+
+        if getattr(object, self.name) is not self:
+            # The list has been replaced by another value of the trait.
+            return
+
+        event = TraitListEvent(index=index, removed=removed, added=added)
+        items_event = self.trait.items_event()
+        object.trait_items_event(self.name_items, event, items_event)
+
+    # -- pickle and copy support ----------------------------------------------
+
+    def __copy__(self):
+        """ Perform a shallow copy operation.
+
+        Notifiers are transient and should not be copied.
+        """
+        return TraitArrayListObject(self.trait, None, self.name, self)
+
+    def __getstate__(self):
+        """ Get the state of the object for serialization.
+
+        Notifiers are transient and should not be serialized.
+        """
+        result = super().__getstate__()
+        result.pop("object", None)
+        result.pop("trait", None)
+
+        return result
+
+    def __setstate__(self, state):
+        """ Restore the state of the object after serialization.
+
+        Notifiers are transient and are restored to the empty list.
+        """
+        state.setdefault("name", "")
+        state["notifiers"] = [self.notifier]
+        state["object"] = lambda: None
+        state["trait"] = None
+
+        self.__dict__.update(state)
+
+    # -- private methods ------------------------------------------------------
+
+    def _validate_items(self, iterable):
+        """
+        Convert items that are being added to the list, raising TraitError
+        for items that can't be stored.
+        """
+        if not isinstance(iterable, collections.abc.Sized):
+            # Hold on to the items, so that a failing one can be reported.
+            iterable = list(iterable)
+        try:
+            return super()._validate_items(iterable)
+        except (TypeError, OverflowError, ValueError):
+            for item in iterable:
+                try:
+                    array.array(self.typecode, [item])
+                except (TypeError, OverflowError, ValueError):
+                    break
+            else:
+                raise
+        excp = TraitError(
+            self.object(), self.name, _typecode_info(self.typecode), item)
+        excp.set_prefix("Each element of the")
+        raise excp
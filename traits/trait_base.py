@@ -11,6 +11,7 @@
 """ Defines common, low-level capabilities needed by the Traits package.
 """
 
+import bisect
 import enum
 import os
 import sys
@@ -187,6 +188,56 @@ def safe_contains(value, container):
         return False
 
 
+def enum_index(values):
+    """ Return a frozenset of the hashable items of *values*.
+
+    The index is used by the fast validator for enumerations to avoid a
+    linear scan of the values. A value that isn't found in the index is
+    still checked against the full sequence of values, so unhashable items
+    (and values that are equal to an item but hash differently) are handled
+    correctly.
+    """
+    index = set()
+    for value in values:
+        try:
+            index.add(value)
+        except TypeError:
+            pass
+    return frozenset(index)
+
+
+def prefix_index(keys):
+    """ Return a sorted list of the string keys in *keys*, for use with
+    :func:`complete_prefix`.
+    """
+    return sorted(key for key in keys if isinstance(key, str))
+
+
+def complete_prefix(index, value):
+    """ Find the unique key that starts with a given string.
+
+    Parameters
+    ----------
+    index : list of str
+        Sorted list of keys, as returned by :func:`prefix_index`.
+    value : str
+        The prefix to complete.
+
+    Returns
+    -------
+    key : str or None
+        The unique key in *index* that starts with *value*, or None if
+        there's no such key or there's more than one.
+    """
+    # The keys starting with value form a contiguous run in the sorted
+    # index, beginning at the insertion point of value.
+    i = bisect.bisect_left(index, value)
+    if i < len(index) and index[i].startswith(value):
+        if i + 1 == len(index) or not index[i + 1].startswith(value):
+            return index[i]
+    return None
+
+
 def class_of(object):
     """ Returns a string containing the class name of an object with the
     correct indefinite article ('a' or 'an') preceding it (e.g., 'an Image',
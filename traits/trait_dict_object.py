@@ -135,8 +135,7 @@ class TraitDict(dict):
             value = {}
 
         items = value.items() if hasattr(value, 'keys') else value
-        value = {self.key_validator(key): self.value_validator(value)
-                 for key, value in items}
+        value = dict(self._validate_items(items))
 
         super().__init__(value)
 
@@ -151,7 +150,9 @@ class TraitDict(dict):
         Any return values are ignored.
         """
 
-        for notifier in self.notifiers:
+        # Iterate over a copy, so that notifiers added or removed by a
+        # notifier do not affect this round of notifications.
+        for notifier in self.notifiers.copy():
             notifier(self, removed, added, changed)
 
     # -- dict interface -------------------------------------------------------
@@ -214,10 +215,7 @@ class TraitDict(dict):
 
             items = other.items() if hasattr(other, 'keys') else other
 
-            for key, value in items:
-                validated_key = self.key_validator(key)
-                validated_value = self.value_validator(value)
-
+            for validated_key, validated_value in self._validate_items(items):
                 if validated_key in self:
                     changed[validated_key] = self[validated_key]
                 else:
@@ -257,10 +255,7 @@ class TraitDict(dict):
 
         items = other.items() if hasattr(other, 'keys') else other
 
-        for key, value in items:
-            validated_key = self.key_validator(key)
-            validated_value = self.value_validator(value)
-
+        for validated_key, validated_value in self._validate_items(items):
             if validated_key in self:
                 changed[validated_key] = self[validated_key]
             else:
@@ -398,6 +393,26 @@ class TraitDict(dict):
         """
         return self.notifiers
 
+    # -- private methods ------------------------------------------------------
+
+    def _validate_items(self, items):
+        """ Validate key-value pairs that are being added to the dict.
+
+        Parameters
+        ----------
+        items : iterable of (key, value) pairs
+            The items to be validated.
+
+        Returns
+        -------
+        validated_items : list of (key, value) tuples
+            A new list of the validated items.
+        """
+        return [
+            (self.key_validator(key), self.value_validator(value))
+            for key, value in items
+        ]
+
 
 class TraitDictObject(TraitDict):
     """ A subclass of TraitDict that fires trait events when mutated.
@@ -523,6 +538,55 @@ class TraitDictObject(TraitDict):
             excep.set_prefix("Each value of the")
             raise excep
 
+    def _validate_items(self, items):
+        """ Validate key-value pairs based on the Dict's key_trait and
+        value_trait, validating all of the keys and all of the values at once.
+
+        Parameters
+        ----------
+        items : iterable of (key, value) pairs
+            The items to validate.
+
+        Returns
+        -------
+        validated_items : list of (key, value) tuples
+            The validated items.
+
+        Raises
+        ------
+        TraitError
+            If the validation fails.
+        """
+        # Validating in bulk is only equivalent to calling the key and value
+        # validators for each item if those are the default validators.
+        # (During unpickling, for example, they aren't.)
+        if (self.key_validator != self._key_validator
+                or self.value_validator != self._value_validator):
+            return super()._validate_items(items)
+
+        trait = getattr(self, 'trait', None)
+        object = getattr(self, 'object', lambda: None)()
+
+        # Deserialized TraitDictObjects without 'trait' and 'object' set
+        # will not validate its items
+        if trait is None or object is None:
+            return [(key, value) for key, value in items]
+
+        items = list(items)
+        try:
+            keys = trait.key_trait.validate_items(
+                object, self.name, [key for key, _ in items])
+        except TraitError as excep:
+            excep.set_prefix("Each key of the")
+            raise excep
+        try:
+            values = trait.value_trait.validate_items(
+                object, self.name, [value for _, value in items])
+        except TraitError as excep:
+            excep.set_prefix("Each value of the")
+            raise excep
+        return list(zip(keys, values))
+
     def notifier(self, trait_dict, removed, added, changed):
         """ Fire the TraitDictEvent with the provided parameters.
 
@@ -26,6 +26,7 @@ from .trait_base import (
     SequenceTypes,
     TypeTypes,
     class_of,
+    enum_index,
 )
 from .trait_base import RangeTypes  # noqa: F401, used by TraitsUI
 from .trait_errors import TraitError
@@ -494,7 +495,9 @@ class TraitEnum(TraitHandler):
         if (len(values) == 1) and (type(values[0]) in SequenceTypes):
             values = values[0]
         self.values = tuple(values)
-        self.fast_validate = (ValidateTrait.enum, self.values)
+        self.fast_validate = (
+            ValidateTrait.enum, self.values, enum_index(self.values)
+        )
 
     def validate(self, object, name, value):
         if value in self.values:
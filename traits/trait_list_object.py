@@ -210,7 +210,7 @@ class TraitList(list):
     def __init__(self, iterable=(), *, item_validator=None, notifiers=None):
         if item_validator is not None:
             self.item_validator = item_validator
-        super().__init__(self.item_validator(item) for item in iterable)
+        super().__init__(self._validate_items(iterable))
         if notifiers is not None:
             self.notifiers = list(notifiers)
 
@@ -233,7 +233,9 @@ class TraitList(list):
         added : list
             The items being added to the list.
         """
-        for notifier in self.notifiers:
+        # Iterate over a copy, so that notifiers added or removed by a
+        # notifier do not affect this round of notifications.
+        for notifier in self.notifiers.copy():
             notifier(self, index, removed, added)
 
     # -- list interface -------------------------------------------------------
@@ -279,7 +281,7 @@ class TraitList(list):
         """
 
         original_length = len(self)
-        added = [self.item_validator(item) for item in value]
+        added = self._validate_items(value)
         extended = super().__iadd__(added)
         if added:
             self.notify(original_length, [], added)
@@ -335,7 +337,7 @@ class TraitList(list):
         original_length = len(self)
         removed = _removed_items(self, key, return_for_invalid_index=None)
         if isinstance(key, slice):
-            value = [self.item_validator(item) for item in value]
+            value = self._validate_items(value)
             added = value
         else:
             value = self.item_validator(value)
@@ -382,7 +384,7 @@ class TraitList(list):
         """
 
         original_length = len(self)
-        added = [self.item_validator(item) for item in iterable]
+        added = self._validate_items(iterable)
         super().extend(added)
         if added:
             self.notify(original_length, [], added)
@@ -537,6 +539,24 @@ class TraitList(list):
         """
         return self.notifiers
 
+    # -- private methods ------------------------------------------------------
+
+    def _validate_items(self, iterable):
+        """
+        Validate items that are being added to the list.
+
+        Parameters
+        ----------
+        iterable : iterable
+            The items to be validated.
+
+        Returns
+        -------
+        items : list
+            A new list of the validated items.
+        """
+        return [self.item_validator(item) for item in iterable]
+
 
 class TraitListObject(TraitList):
     """ A specialization of TraitList with a default validator and notifier
@@ -869,6 +889,27 @@ class TraitListObject(TraitList):
             excp.set_prefix("Each element of the")
             raise
 
+    def _validate_items(self, iterable):
+        """
+        Validate items that are being added to the list, all at once.
+        """
+        # Validating in bulk is only equivalent to calling item_validator
+        # for each item if the latter is the default validator. (During
+        # unpickling, for example, it isn't.)
+        if self.item_validator != self._item_validator:
+            return super()._validate_items(iterable)
+
+        object = self.object()
+        if object is None:
+            return list(iterable)
+
+        try:
+            return self.trait.item_trait.validate_items(
+                object, self.name, iterable)
+        except TraitError as excp:
+            excp.set_prefix("Each element of the")
+            raise
+
     def _validate_length(self, new_length):
         """
         Validate the new length for a proposed operation.
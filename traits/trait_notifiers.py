@@ -11,7 +11,10 @@
 """ Classes that implement and support the Traits change notification mechanism
 """
 
+import collections
+import concurrent.futures
 import contextlib
+import itertools
 import logging
 import threading
 from threading import local as thread_local
@@ -22,7 +25,8 @@ import weakref
 import sys
 
 from .constants import ComparisonMode, TraitKind
-from .trait_base import Uninitialized
+from .observation import exception_handling as observer_exception_handling
+from .trait_base import Undefined, Uninitialized
 from .trait_errors import TraitNotificationError
 
 # Global Data
@@ -58,6 +62,206 @@ def ui_dispatch(handler, *args, **kw):
         ui_handler(handler, *args, **kw)
 
 
+class _PoolDispatcher(object):
+    """ Runs notification handlers on a ``concurrent.futures`` executor,
+    keeping count of the handler calls that haven't finished yet.
+
+    When *ordered* is true, the calls submitted with the same key are run
+    one after the other, in the order in which they were submitted. Calls
+    with different keys may still run concurrently.
+    """
+
+    def __init__(self):
+        self.executor = None
+        self.ordered = False
+        self._default_executor = None
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._queues = {}
+        self._exceptions = []
+
+    def set_executor(self, executor, ordered):
+        with self._condition:
+            self.executor = executor
+            self.ordered = ordered
+
+    def get_executor(self):
+        with self._condition:
+            if self.executor is not None:
+                return self.executor
+            if self._default_executor is None:
+                self._default_executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix="traits-pool-dispatch"
+                )
+            return self._default_executor
+
+    def submit(self, key, function, *args):
+        """ Submit a call of *function* with *args* to the executor. """
+        with self._condition:
+            executor = self.get_executor()
+            self._pending += 1
+            if not self.ordered:
+                call = (self._run, function, args)
+            elif key in self._queues:
+                # A call with the same key is queued or running: the queue
+                # is run by the task submitted for that call.
+                self._queues[key].append((function, args))
+                return
+            else:
+                self._queues[key] = collections.deque([(function, args)])
+                call = (self._run_queue, key)
+
+        try:
+            executor.submit(*call)
+        except Exception:
+            # E.g. the executor has been shut down: drop the calls that
+            # would have been run by the task.
+            with self._condition:
+                if call[0] == self._run_queue:
+                    count = len(self._queues.pop(key))
+                else:
+                    count = 1
+                self._finished(count)
+            raise
+
+    def wait(self, timeout=None):
+        """ Wait until all calls submitted have finished. """
+        with self._condition:
+            finished = self._condition.wait_for(
+                lambda: self._pending == 0, timeout
+            )
+            exceptions, self._exceptions = self._exceptions, []
+        if exceptions:
+            raise exceptions[0]
+        return finished
+
+    def _run(self, function, args):
+        try:
+            function(*args)
+        except Exception as exception:
+            # Exceptions that got through the exception handlers are raised
+            # again when waiting for the calls to finish.
+            with self._condition:
+                self._exceptions.append(exception)
+        finally:
+            with self._condition:
+                self._finished(1)
+
+    def _run_queue(self, key):
+        with self._condition:
+            queue = self._queues[key]
+        while True:
+            # The call is only removed from the queue once it has run, so
+            # that calls with the same key submitted meanwhile are queued.
+            function, args = queue[0]
+            self._run(function, args)
+            with self._condition:
+                queue.popleft()
+                if not queue:
+                    del self._queues[key]
+                    return
+
+    def _finished(self, count):
+        self._pending -= count
+        if self._pending == 0:
+            self._condition.notify_all()
+
+
+# The dispatcher used for notifications with dispatch='pool'.
+_pool_dispatcher = _PoolDispatcher()
+
+
+def get_pool_executor():
+    """ Return the executor running the notification handlers dispatched
+    with ``dispatch="pool"``.
+
+    If no executor has been set with ``set_pool_executor``, this is a
+    ``concurrent.futures.ThreadPoolExecutor`` created on first use.
+
+    Returns
+    -------
+    executor : concurrent.futures.Executor
+    """
+    return _pool_dispatcher.get_executor()
+
+
+def set_pool_executor(executor=None, ordered=False):
+    """ Set the executor running the notification handlers dispatched with
+    ``dispatch="pool"``.
+
+    The handlers are called with the arguments they would be called with on
+    the thread making the change, so the executor should run them in the
+    same process, as a ``ThreadPoolExecutor`` does. Handler calls already
+    submitted are not affected.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor or None, optional
+        The executor to submit handler calls to, or None to use a default
+        ``ThreadPoolExecutor``.
+    ordered : bool, optional
+        If true, the calls of a handler for changes on the same object are
+        run one at a time, in the order in which the changes happened. By
+        default, they may run concurrently and in any order.
+    """
+    _pool_dispatcher.set_executor(executor, ordered)
+
+
+def wait_for_pool_dispatch(timeout=None):
+    """ Wait until all the notification handlers dispatched with
+    ``dispatch="pool"`` have finished, including those dispatched by the
+    handlers while waiting.
+
+    This must not be called from a handler dispatched to the pool, since it
+    would wait for itself.
+
+    Parameters
+    ----------
+    timeout : float or None, optional
+        The maximum time to wait, in seconds, or None to wait for as long
+        as it takes.
+
+    Returns
+    -------
+    finished : bool
+        False if the timeout expired before all the handlers finished.
+
+    Raises
+    ------
+    Exception
+        The first exception re-raised by the exception handlers for the
+        handlers that finished since the last wait, if any. Note that the
+        exception handlers for ``on_trait_change`` are set per thread, see
+        ``push_exception_handler``.
+    """
+    return _pool_dispatcher.wait(timeout)
+
+
+def pool_dispatch(handler, event):
+    """ Dispatch an ``observe`` event handler to the pool executor.
+
+    Parameters
+    ----------
+    handler : callable(event)
+        The handler to call.
+    event : object
+        The event object to be given to handler.
+    """
+    _pool_dispatcher.submit(
+        (id(event.object), handler), _call_observer_handler, handler, event
+    )
+
+
+def _call_observer_handler(handler, event):
+    """ Call an ``observe`` handler, handling its exceptions the way the
+    observer notifiers do.
+    """
+    try:
+        handler(event)
+    except Exception:
+        observer_exception_handling.handle_exception(event)
+
+
 class NotificationExceptionHandlerState(object):
     def __init__(self, handler, reraise_exceptions, locked):
         self.handler = handler
@@ -299,6 +503,133 @@ def change_event_tracers(pre_tracer, post_tracer):
         set_change_event_tracers(old_pre_tracer, old_post_tracer)
 
 
+class _HeldNotifications(object):
+    """ Queue of trait change notifications held back by
+    ``hold_trait_notifications``.
+
+    While notifications are held for an object, each change of one of its
+    traits is handed over to ``add`` (through the object's
+    ``_trait_notification_held`` method) instead of being sent to the change
+    handlers. Successive changes of the same trait are merged into a single
+    pending change that keeps the first old value and the last new value.
+    Event firings, including the ``_items`` events of collection traits, are
+    never merged: each firing is delivered in order.
+
+    Holds are counted per object, so that they can be nested. The pending
+    changes of an object are delivered, in the order in which the traits
+    first changed, when its last hold is released. Changes whose old and new
+    values are the same according to the trait's ``comparison_mode`` are
+    dropped at that point.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # Mapping from id(object) to the number of active holds.
+        self._hold_counts = {}
+        # Mapping from a key to a pending [object, name, old, new] change.
+        # Dictionaries preserve insertion order, which is the delivery order.
+        self._pending = {}
+        # Source of unique keys for changes which must not be merged.
+        self._unique_keys = itertools.count()
+
+    def hold(self, objects):
+        """ Start holding notifications for each of the given objects.
+        """
+        with self._lock:
+            for object in objects:
+                count = self._hold_counts.get(id(object), 0)
+                if count == 0:
+                    object._trait_hold_notify(True)
+                self._hold_counts[id(object)] = count + 1
+
+    def release(self, objects):
+        """ Release one hold on each of the given objects, and deliver the
+        pending changes of objects which are no longer held.
+        """
+        released = set()
+        with self._lock:
+            for object in objects:
+                count = self._hold_counts[id(object)] - 1
+                if count == 0:
+                    del self._hold_counts[id(object)]
+                    object._trait_hold_notify(False)
+                    released.add(id(object))
+                else:
+                    self._hold_counts[id(object)] = count
+
+            changes = []
+            for key, change in list(self._pending.items()):
+                if id(change[0]) in released:
+                    del self._pending[key]
+                    changes.append(change)
+
+        for object, name, old, new in changes:
+            if _net_change(object, name, old, new):
+                object.trait_property_changed(name, old, new)
+
+    def add(self, object, name, old, new):
+        """ Queue a change of trait *name* of a held object.
+        """
+        trait = object._trait(name, 0)
+        with self._lock:
+            if (old is Undefined or trait is None
+                    or trait.type == TraitKind.event.name):
+                key = next(self._unique_keys)
+            else:
+                key = (id(object), name)
+
+            change = self._pending.get(key)
+            if change is None:
+                self._pending[key] = [object, name, old, new]
+            else:
+                if change[2] is Uninitialized:
+                    # The trait was first read while held: its real starting
+                    # value is the default computed at that time.
+                    change[2] = old
+                change[3] = new
+
+
+def _net_change(object, name, old, new):
+    """ Return true if a merged change of a held trait should be delivered.
+
+    Parameters
+    ----------
+    object : HasTraits
+        The object on which the trait changed.
+    name : str
+        The name of the trait changed.
+    old : any
+        The value of the trait before the first held change.
+    new : any
+        The value of the trait after the last held change.
+
+    Returns
+    -------
+    changed : bool
+        False if *old* and *new* are the same according to the comparison
+        mode of the trait, else True.
+    """
+    trait = object._trait(name, 0)
+    if (old is Undefined or trait is None
+            or trait.type == TraitKind.event.name):
+        return True
+
+    comparison_mode = trait.comparison_mode
+    if comparison_mode == ComparisonMode.none:
+        return True
+    if old is new:
+        return False
+    if comparison_mode == ComparisonMode.identity:
+        return True
+    try:
+        return bool(old != new)
+    except Exception:
+        return True
+
+
+held_notifications = _HeldNotifications()
+
+
 class AbstractStaticChangeNotifyWrapper(object):
     """
     Concrete implementation must define the 'argument_transforms' class
@@ -635,6 +966,30 @@ class NewTraitChangeNotifyWrapper(TraitChangeNotifyWrapper):
         Thread(target=handler, args=args).start()
 
 
+class PoolTraitChangeNotifyWrapper(TraitChangeNotifyWrapper):
+    """ Dynamic change notify wrapper, dispatching to the pool executor.
+
+    This class is in charge to dispatch trait change events to dynamic
+    listener, typically created using the `on_trait_change` method and the
+    `dispatch` parameter set to 'pool'. See `set_pool_executor`.
+    """
+
+    def _dispatch_change_event(self, object, trait_name, old, new, handler):
+        """ Prepare and dispatch a trait change event to a listener. """
+
+        # The event is traced and its exceptions handled in the worker.
+        dispatch_change_event = super()._dispatch_change_event
+        _pool_dispatcher.submit(
+            (id(object), handler),
+            dispatch_change_event,
+            object,
+            trait_name,
+            old,
+            new,
+            handler,
+        )
+
+
 def _change_accepted(object, name, old, new):
     """ Return true if notifications should be emitted for the change.
 
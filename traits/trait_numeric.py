@@ -12,10 +12,20 @@
 """
 
 from .constants import ComparisonMode, DefaultValue
+from .ctraits import _trait_columns
 from .trait_base import SequenceTypes
 from .trait_errors import TraitError
 from .trait_type import TraitType
-from .trait_types import Str, Any, Int as TInt, Float as TFloat
+from .trait_types import (
+    Any,
+    BaseBool,
+    BaseComplex,
+    BaseFloat,
+    BaseInt,
+    Float as TFloat,
+    Int as TInt,
+    Str,
+)
 
 
 # Deferred imports from numpy:
@@ -42,6 +52,123 @@ def dtype2trait(dtype):
         return Any
 
 
+def trait2dtype(trait):
+    """ Get the numpy dtype corresponding to a trait, the reverse of
+    dtype2trait.
+
+    Parameters
+    ----------
+    trait : CTrait or None
+        The trait.
+
+    Returns
+    -------
+    dtype : numpy.dtype
+        The dtype for the values of the trait: a floating-point, integer,
+        boolean or complex dtype for the traits of these types, or the object
+        dtype for any other trait, or if *trait* is None.
+    """
+
+    import numpy
+
+    trait_type = None if trait is None else trait.trait_type
+    if isinstance(trait_type, BaseBool):
+        return numpy.dtype(bool)
+
+    elif isinstance(trait_type, BaseInt):
+        return numpy.dtype(int)
+
+    elif isinstance(trait_type, BaseFloat):
+        return numpy.dtype(float)
+
+    elif isinstance(trait_type, BaseComplex):
+        return numpy.dtype(complex)
+
+    else:
+        return numpy.dtype(object)
+
+
+#: The Python type of the values of the traits given each kind of dtype by
+#: ``trait2dtype``.
+_dtype_value_types = {"b": bool, "i": int, "f": float, "c": complex}
+
+
+def trait_columns(objects, names, arrays=True):
+    """ Get the values of traits of many objects, with one column of values
+    per trait.
+
+    The values are read by a single call into the C extension, rather than
+    by a ``getattr`` per object and trait. The traits of the objects whose
+    values weren't set yet and have a constant default value give that
+    default value without it being stored in the objects.
+
+    For example::
+
+        xs, ys = trait_columns(points, ["x", "y"])
+
+    Parameters
+    ----------
+    objects : sequence
+        The objects, normally HasTraits instances of the same class.
+    names : list of str
+        The names of the traits to get the values of.
+    arrays : bool, optional
+        If True (the default), return numpy arrays, with the dtypes given by
+        ``trait2dtype`` for the traits of the first object. If the objects
+        aren't all of the class of the first object, that dtype is only used
+        for a column whose values are all of the matching Python type. A
+        column whose values don't fit the dtype, such as integers too large
+        for a machine integer, gets an object array instead. If False,
+        return lists, without importing numpy.
+
+    Returns
+    -------
+    columns : list
+        The column of values of each trait, in the order of *names*.
+
+    Raises
+    ------
+    AttributeError
+        If an object doesn't have one of the traits.
+    """
+    names = tuple(names)
+    columns = _trait_columns(objects, names)
+    if not arrays:
+        return columns
+
+    import numpy
+
+    first = objects[0] if len(objects) > 0 else None
+    first_class = type(first)
+    same_class = all(type(obj) is first_class for obj in objects)
+    arrays = []
+    for name, column in zip(names, columns):
+        trait = None
+        if first is not None and hasattr(first, "trait"):
+            trait = first.trait(name)
+        dtype = trait2dtype(trait)
+        if dtype != object and not same_class:
+            # The values of other classes may be of another type, which
+            # the dtype would silently convert.
+            value_type = _dtype_value_types[dtype.kind]
+            if not all(type(value) is value_type for value in column):
+                dtype = numpy.dtype(object)
+        array = None
+        if dtype != object:
+            try:
+                array = numpy.array(column, dtype=dtype)
+            except (OverflowError, TypeError, ValueError):
+                pass
+        if array is None:
+            # Assign the items one by one, so that values which are
+            # sequences aren't turned into extra dimensions.
+            array = numpy.empty(len(column), dtype=object)
+            for index, value in enumerate(column):
+                array[index] = value
+        arrays.append(array)
+    return arrays
+
+
 class AbstractArray(TraitType):
     """ Abstract base class for defining numpy-based arrays.
     """
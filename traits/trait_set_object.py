@@ -102,7 +102,7 @@ class TraitSet(set):
     def __init__(self, value=(), *, item_validator=None, notifiers=None):
         if item_validator is not None:
             self.item_validator = item_validator
-        super().__init__(self.item_validator(item) for item in value)
+        super().__init__(self._validate_items(value))
         if notifiers is not None:
             self.notifiers = notifiers
 
@@ -125,7 +125,9 @@ class TraitSet(set):
         added : set
             The new items that have been added to the set.
         """
-        for notifier in self.notifiers:
+        # Iterate over a copy, so that notifiers added or removed by a
+        # notifier do not affect this round of notifications.
+        for notifier in self.notifiers.copy():
             notifier(self, removed, added)
 
     # -- set interface -------------------------------------------------------
@@ -173,8 +175,7 @@ class TraitSet(set):
         # so that super().__ior__ raises the appropriate error message
         # for all other iterables.
         if isinstance(value, (set, frozenset)):
-            value = {self.item_validator(item)
-                     for item in value}
+            value = set(self._validate_items(value))
 
         retval = super().__ior__(value)
 
@@ -233,8 +234,7 @@ class TraitSet(set):
             values = set(value)
             removed = self.intersection(values)
             raw_added = values.difference(removed)
-            validated_added = {self.item_validator(item) for item in
-                               raw_added}
+            validated_added = set(self._validate_items(raw_added))
             added = validated_added.difference(self)
             value = added | removed
 
@@ -369,7 +369,7 @@ class TraitSet(set):
         values = set(value)
         removed = self.intersection(values)
         raw_result = values.difference(removed)
-        validated_result = {self.item_validator(item) for item in raw_result}
+        validated_result = set(self._validate_items(raw_result))
         added = validated_result.difference(self)
 
         super().symmetric_difference_update(removed | added)
@@ -385,8 +385,9 @@ class TraitSet(set):
             The other iterables.
         """
 
-        validated_values = {self.item_validator(item)
-                            for item in chain.from_iterable(args)}
+        validated_values = set(
+            self._validate_items(chain.from_iterable(args))
+        )
         added = validated_values.difference(self)
         super().update(added)
 
@@ -441,6 +442,23 @@ class TraitSet(set):
         """
         return self.notifiers
 
+    # -- private methods ------------------------------------------------------
+
+    def _validate_items(self, iterable):
+        """ Validate items that are being added to the set.
+
+        Parameters
+        ----------
+        iterable : iterable
+            The items to be validated.
+
+        Returns
+        -------
+        items : list
+            A new list of the validated items.
+        """
+        return [self.item_validator(item) for item in iterable]
+
 
 class TraitSetObject(TraitSet):
     """ A specialization of TraitSet with a default validator and notifier
@@ -522,6 +540,44 @@ class TraitSetObject(TraitSet):
             excp.set_prefix("Each element of the")
             raise excp
 
+    def _validate_items(self, iterable):
+        """ Validates the values by calling the inner trait's validate_items
+        method, which validates all of the values at once.
+
+        Parameters
+        ----------
+        iterable : iterable
+            The values to be validated.
+
+        Returns
+        -------
+        items : list
+            A new list of the validated values.
+
+        Raises
+        ------
+        TraitError
+            On validation failure for the inner trait.
+        """
+        # Validating in bulk is only equivalent to calling item_validator
+        # for each item if the latter is the default validator. (During
+        # unpickling, for example, it isn't.)
+        if self.item_validator != self._validator:
+            return super()._validate_items(iterable)
+
+        object_ref = getattr(self, 'object', None)
+        trait = getattr(self, 'trait', None)
+
+        if object_ref is None or trait is None:
+            return list(iterable)
+
+        try:
+            return trait.item_trait.validate_items(
+                object_ref(), self.name, iterable)
+        except TraitError as excp:
+            excp.set_prefix("Each element of the")
+            raise excp
+
     def notifier(self, trait_set, removed, added):
         """ Converts and consolidates the parameters to a TraitSetEvent and
         then fires the event.
@@ -11,6 +11,7 @@
 """ Core Trait definitions.
 """
 
+import array
 import collections.abc
 import datetime
 from importlib import import_module
@@ -30,6 +31,9 @@ from .trait_base import (
     get_module_name,
     HandleWeakRef,
     class_of,
+    complete_prefix,
+    enum_index,
+    prefix_index,
     RangeTypes,
     safe_contains,
     SequenceTypes,
@@ -37,6 +41,7 @@ from .trait_base import (
     Undefined,
     xgetattr,
 )
+from .trait_array_list_object import TraitArrayListObject, _typecode_info
 from .trait_converters import trait_from, trait_cast
 from .trait_dict_object import TraitDictEvent, TraitDictObject
 from .trait_errors import TraitError
@@ -145,6 +150,15 @@ def _validate_int(value):
         return int(operator.index(value))
 
 
+def _is_buffer(value):
+    """ Return True if *value* supports the buffer protocol. """
+    try:
+        memoryview(value).release()
+    except TypeError:
+        return False
+    return True
+
+
 # Trait Types
 
 class Any(TraitType):
@@ -2100,7 +2114,9 @@ class BaseEnum(TraitType):
             else:
                 default_value = self.values[0]
 
-            self.init_fast_validate(ValidateTrait.enum, self.values)
+            self.init_fast_validate(
+                ValidateTrait.enum, self.values, enum_index(self.values)
+            )
 
             super().__init__(default_value, **metadata)
 
@@ -2702,6 +2718,95 @@ class CList(List):
         )
 
 
+class ArrayList(TraitType):
+    """ A trait type for a list of numbers, stored in an array.array.
+
+    The items are stored unboxed, using the C type given by the *typecode*,
+    and the list supports the buffer protocol, so that for example
+    ``numpy.asarray`` can read its contents without copying. In-place
+    changes to the list fire the ``<name>_items`` event with a
+    :class:`~.TraitListEvent`, as for :class:`List`, and can be observed
+    with the ``items`` observer.
+
+    Any iterable of suitable numbers can be assigned to the trait, including
+    lists, tuples, arrays and NumPy arrays; the value is copied into a new
+    :class:`~.TraitArrayListObject`. Byte strings are not accepted, since
+    their contents are ambiguous.
+
+    Parameters
+    ----------
+    typecode : str
+        The :mod:`array` typecode of the items, for example ``"d"`` for
+        double precision floats (the default) or ``"q"`` for 64-bit integers.
+    value : iterable
+        Default value for the list.
+    items : bool
+        Whether there is a corresponding `<name>_items` trait.
+    **metadata
+        Trait metadata for the trait.
+
+    Attributes
+    ----------
+    typecode : str
+        The :mod:`array` typecode of the items.
+    has_items : bool
+        Whether there is a corresponding `<name>_items` trait.
+    """
+
+    default_value_type = DefaultValue.callable
+    _items_event = None
+
+    def __init__(self, typecode="d", value=None, items=True, **metadata):
+        metadata.setdefault("copy", "deep")
+
+        if value is None:
+            value = []
+
+        # Raises ValueError for an invalid typecode.
+        self._default_items = array.array(typecode, value)
+        self.typecode = typecode
+        self.has_items = items
+
+        super().__init__(self._get_default_value, **metadata)
+
+    def validate(self, object, name, value):
+        """ Validates that the value is a valid list of numbers.
+
+        .. note::
+
+            `object` can be None when validating a default value (see e.g.
+            :meth:`~traits.trait_handlers.TraitType.clone`)
+
+        """
+        if isinstance(value, (bytes, bytearray)):
+            # Reject byte strings rather than reading them as machine values.
+            self.error(object, name, value)
+        if isinstance(value, (list, tuple, array.array)) or _is_buffer(value):
+            return TraitArrayListObject(self, object, name, value)
+
+        self.error(object, name, value)
+
+    def info(self):
+        """ Returns a description of the trait.
+        """
+        return "a list of items which are %s" % _typecode_info(self.typecode)
+
+    def items_event(self):
+        cls = self.__class__
+        if cls._items_event is None:
+            cls._items_event = Event(
+                TraitListEvent, is_base=False
+            ).as_ctrait()
+
+        return cls._items_event
+
+    # -- Private Methods ------------------------------------------------------
+
+    def _get_default_value(self, object):
+        # The value is converted to a TraitArrayListObject on validation.
+        return self._default_items
+
+
 class PrefixList(TraitType):
     r"""Ensures that a value assigned to the attribute is a member of a list of
      specified string values, or is a unique prefix of one of those values.
@@ -2760,6 +2865,8 @@ class PrefixList(TraitType):
         # to be validated is one of the elements of 'values' (rather than
         # a strict prefix).
         self._values_as_set = frozenset(values)
+        # Sorted values, for completing prefixes without scanning 'values'.
+        self._prefix_index = prefix_index(values)
 
         if default_value is not None:
             default_value = self._complete_value(default_value)
@@ -2794,9 +2901,9 @@ class PrefixList(TraitType):
         if value in self._values_as_set:
             return value
 
-        matches = [key for key in self.values if key.startswith(value)]
-        if len(matches) == 1:
-            return matches[0]
+        completion = complete_prefix(self._prefix_index, value)
+        if completion is not None:
+            return completion
 
         raise ValueError(
             f"{value!r} is neither a member nor a unique prefix of a member "
@@ -3238,6 +3345,8 @@ class PrefixMap(TraitType):
         # xref: enthought/traits#1577
         # xref: enthought/mayavi#1094
         self._map = {value: value for value in map}
+        # Sorted keys, for completing prefixes without scanning the map.
+        self._prefix_index = prefix_index(map)
 
         if default_value is not None:
             default_value = self._complete_value(default_value)
@@ -3272,9 +3381,9 @@ class PrefixMap(TraitType):
         if value in self.map:
             return value
 
-        matches = [key for key in self.map if key.startswith(value)]
-        if len(matches) == 1:
-            return matches[0]
+        completion = complete_prefix(self._prefix_index, value)
+        if completion is not None:
+            return completion
 
         raise ValueError(
             f"{value!r} is neither a member nor a unique prefix of a member "
@@ -4156,6 +4265,13 @@ class Union(TraitType):
                 "'default'."
             )
 
+        # Validate in C, trying the member traits in turn, unless a subclass
+        # has provided its own validation.
+        if type(self).validate is Union.validate:
+            self.fast_validate = (
+                ValidateTrait.union, tuple(self.list_ctrait_instances)
+            )
+
         if 'default_value' in metadata:
             default_value = metadata.pop("default_value")
         else:
@@ -413,6 +413,17 @@ class CList(_List[_S, _T]):
     ...
 
 
+class ArrayList(_TraitType[_Sequence[_Any], _ListType[_Any]]):
+    def __init__(
+        self,
+        typecode: str = ...,
+        value: _Sequence[_Any] = ...,
+        items: bool = ...,
+        **metadata: _Any
+    ) -> None:
+        ...
+
+
 class PrefixList(BaseStr):
     def __init__(
         self,
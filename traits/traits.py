@@ -536,6 +536,11 @@ def Property(
     For details of the extended trait name syntax, refer to the
     observe() method of the HasTraits class.
 
+    A cached property depending on simple traits of its class only can be
+    given ``versioned=True`` metadata. Instead of observing the traits, the
+    property then recomputes its value when it is read after one of the
+    traits was assigned. Such a property doesn't fire change notifications.
+
     Parameters
     ----------
     fget : function
@@ -608,10 +613,13 @@ def Property(
     if getattr(fget, "cached_property", False):
         metadata.setdefault("cached", True)
 
+    versioned = metadata.pop("versioned", False)
+
     trait = CTrait(TraitKind.property)
     trait.__dict__ = metadata.copy()
     trait.property_fields = (fget, fset, fvalidate)
     trait.handler = handler
+    trait.versioned = versioned
 
     return trait
 
@@ -12,6 +12,7 @@
     patterns.
 """
 
+from functools import lru_cache
 import re
 import string
 import weakref
@@ -70,6 +71,9 @@ name_pat = re.compile(r"([a-zA-Z_]\w*)\s*(.*)")
 # Characters valid in a traits name:
 name_chars = string.ascii_letters + string.digits + "_"
 
+# Maximum number of parsed listener templates to cache:
+_LISTENER_TEMPLATE_CACHE_MAXSIZE = 256
+
 
 # Utility functions
 
@@ -147,6 +151,35 @@ class ListenerBase:
         """
         raise NotImplementedError
 
+    def clone(
+        self, *, handler, wrapped_handler_ref, dispatch, priority, memo=None
+    ):
+        """ Return a copy of this listener, and of the listeners reachable
+        from it, for a different handler.
+
+        Parameters
+        ----------
+        handler : ListenerHandler
+            Zero-argument callable that returns the actual handler when called
+            (or Undefined if that handler is no longer available).
+        wrapped_handler_ref : weakref.ref
+            Weak reference to a ListenerNotifyWrapper wrapping the actual
+            handler.
+        dispatch : str
+            The dispatch mechanism to use when invoking the handler.
+        priority : bool
+            True if the handler goes at the beginning of the notification
+            handlers list, else False.
+        memo : dict, optional
+            Mapping from the ids of listeners already copied to their copies,
+            used to preserve shared listeners and cycles.
+
+        Returns
+        -------
+        listener : ListenerBase
+        """
+        raise NotImplementedError
+
     def register(self, new):
         """ Registers new listeners.
         """
@@ -328,6 +361,62 @@ class ListenerItem(ListenerBase):
         """
         self.next = next
 
+    def clone(
+        self, *, handler, wrapped_handler_ref, dispatch, priority, memo=None
+    ):
+        """ Return a copy of this listener, and of the listeners reachable
+        from it, for a different handler.
+
+        Parameters
+        ----------
+        handler : ListenerHandler
+            Zero-argument callable that returns the actual handler when called
+            (or Undefined if that handler is no longer available).
+        wrapped_handler_ref : weakref.ref
+            Weak reference to a ListenerNotifyWrapper wrapping the actual
+            handler.
+        dispatch : str
+            The dispatch mechanism to use when invoking the handler.
+        priority : bool
+            True if the handler goes at the beginning of the notification
+            handlers list, else False.
+        memo : dict, optional
+            Mapping from the ids of listeners already copied to their copies,
+            used to preserve shared listeners and cycles.
+
+        Returns
+        -------
+        listener : ListenerItem
+        """
+        if memo is None:
+            memo = {}
+        elif id(self) in memo:
+            return memo[id(self)]
+
+        clone = memo[id(self)] = self.__class__(
+            name=self.name,
+            metadata_name=self.metadata_name,
+            metadata_defined=self.metadata_defined,
+            handler=handler,
+            wrapped_handler_ref=wrapped_handler_ref,
+            dispatch=dispatch,
+            priority=priority,
+            type=self.type,
+            notify=self.notify,
+            deferred=self.deferred,
+            is_anytrait=self.is_anytrait,
+            is_list_handler=self.is_list_handler,
+        )
+        if self.next is not None:
+            clone.next = self.next.clone(
+                handler=handler,
+                wrapped_handler_ref=wrapped_handler_ref,
+                dispatch=dispatch,
+                priority=priority,
+                memo=memo,
+            )
+        return clone
+
     def register(self, new):
         """ Registers new listeners.
         """
@@ -927,6 +1016,59 @@ class ListenerGroup(ListenerBase):
             item.set_next(next)
         self.next = next if self.items else None
 
+    def clone(
+        self, *, handler, wrapped_handler_ref, dispatch, priority, memo=None
+    ):
+        """ Return a copy of this listener, and of the listeners reachable
+        from it, for a different handler.
+
+        Parameters
+        ----------
+        handler : ListenerHandler
+            Zero-argument callable that returns the actual handler when called
+            (or Undefined if that handler is no longer available).
+        wrapped_handler_ref : weakref.ref
+            Weak reference to a ListenerNotifyWrapper wrapping the actual
+            handler.
+        dispatch : str
+            The dispatch mechanism to use when invoking the handler.
+        priority : bool
+            True if the handler goes at the beginning of the notification
+            handlers list, else False.
+        memo : dict, optional
+            Mapping from the ids of listeners already copied to their copies,
+            used to preserve shared listeners and cycles.
+
+        Returns
+        -------
+        listener : ListenerGroup
+        """
+        if memo is None:
+            memo = {}
+        elif id(self) in memo:
+            return memo[id(self)]
+
+        clone = memo[id(self)] = self.__class__(items=[])
+        clone.items = [
+            item.clone(
+                handler=handler,
+                wrapped_handler_ref=wrapped_handler_ref,
+                dispatch=dispatch,
+                priority=priority,
+                memo=memo,
+            )
+            for item in self.items
+        ]
+        if self.next is not None:
+            clone.next = self.next.clone(
+                handler=handler,
+                wrapped_handler_ref=wrapped_handler_ref,
+                dispatch=dispatch,
+                priority=priority,
+                memo=memo,
+            )
+        return clone
+
     def register(self, new):
         """ Registers new listeners.
         """
@@ -1235,6 +1377,71 @@ class ListenerParser:
         )
 
 
+def parse_listener(
+    text,
+    *,
+    handler=None,
+    wrapped_handler_ref=None,
+    dispatch="",
+    priority=False,
+    deferred=False,
+    handler_type=ANY_LISTENER,
+):
+    """ Return the listener described by an extended trait name.
+
+    This has the same effect as ``ListenerParser(text, ...).listener``, but
+    the text is only parsed the first time it is seen with given values of
+    *deferred* and *handler_type*: the result is cached as a template, and
+    later calls return a copy of the template for the given handler.
+
+    Parameters
+    ----------
+    text : str
+        The extended trait name to be parsed.
+    handler : ListenerHandler, optional
+        Zero-argument callable that returns the actual handler when called (or
+        Undefined if that handler is no longer available).
+    wrapped_handler_ref : weakref.ref, optional
+        Weak reference to a ListenerNotifyWrapper wrapping the actual handler.
+    dispatch : str, optional
+        The dispatch mechanism to use when invoking the handler.
+    priority : bool, optional
+        True if the handler goes at the beginning of the notification handlers
+        list, else False.
+    deferred : bool, optional
+        Should registering listeners for items reachable from this listener
+        item be deferred until the associated trait is first read or set?
+    handler_type : int, optional
+        The type of handler being used; one of {ANY_LISTENER, SRC_LISTENER,
+        DST_LISTENER}.
+
+    Returns
+    -------
+    listener : ListenerBase
+
+    Raises
+    ------
+    TraitError
+        If the text is not a valid extended trait name.
+    """
+    return _listener_template(text, deferred, handler_type).clone(
+        handler=handler,
+        wrapped_handler_ref=wrapped_handler_ref,
+        dispatch=dispatch,
+        priority=priority,
+    )
+
+
+@lru_cache(maxsize=_LISTENER_TEMPLATE_CACHE_MAXSIZE)
+def _listener_template(text, deferred, handler_type):
+    """ Return the parsed listener for an extended trait name, without a
+    handler. The result is shared, and must only be used for cloning.
+    """
+    return ListenerParser(
+        text, deferred=deferred, handler_type=handler_type
+    ).listener
+
+
 class ListenerNotifyWrapper(TraitChangeNotifyWrapper):
 
     # -- TraitChangeNotifyWrapper Method Overrides ----------------------------
@@ -8,6 +8,8 @@
 #
 # Thanks for using Enthought open source!
 
+import asyncio
+import concurrent.futures
 import threading
 
 
@@ -62,3 +64,106 @@ def wait_for_condition(condition, obj, trait, timeout=None):
                 raise RuntimeError("Timed out waiting for condition.")
     finally:
         obj.on_trait_change(handler, trait, remove=True)
+
+
+def future_for_trait(obj, trait, condition):
+    """
+    Return a future that completes once the given condition is true,
+    re-evaluating it when the observed traits change.
+
+    Unlike ``wait_for_condition``, this doesn't block the calling thread,
+    so it scales to many simultaneous waits. The condition is evaluated with
+    ``obj`` as its single argument, on entering this function and then in
+    the thread making each change to the traits observed. The observer is
+    removed as soon as the future is done, whether because the condition was
+    satisfied or because the future was cancelled, so waiting for a result
+    with a timeout and cancelling on timeout leaves nothing behind::
+
+        future = future_for_trait(job, "status", lambda job: job.finished)
+        try:
+            future.result(timeout=10.0)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+
+    Parameters
+    ----------
+    obj : HasTraits
+        The object to observe.
+    trait : str or ObserverExpression
+        The traits to observe on *obj*, as accepted by ``HasTraits.observe``.
+    condition : callable(obj)
+        Function returning whether the condition is satisfied.
+
+    Returns
+    -------
+    future : concurrent.futures.Future
+        Future whose result is None once the condition is satisfied. If the
+        condition raises, the future's exception is set instead.
+    """
+    future = concurrent.futures.Future()
+
+    def handler(event):
+        if not future.done():
+            _check_condition(future, condition, obj)
+
+    obj.observe(handler, trait)
+    future.add_done_callback(
+        lambda future: obj.observe(handler, trait, remove=True)
+    )
+    _check_condition(future, condition, obj)
+    return future
+
+
+async def wait_for_trait(obj, trait, condition, timeout=None):
+    """
+    Wait asynchronously until the given condition is true, re-evaluating it
+    when the observed traits change.
+
+    The waiting is driven by change notifications, not by polling, and the
+    changes can be made from any thread. The condition is evaluated with
+    ``obj`` as its single argument, on entering this function and then in
+    the thread making each change to the traits observed. See
+    ``future_for_trait``.
+
+    Parameters
+    ----------
+    obj : HasTraits
+        The object to observe.
+    trait : str or ObserverExpression
+        The traits to observe on *obj*, as accepted by ``HasTraits.observe``.
+    condition : callable(obj)
+        Function returning whether the condition is satisfied.
+    timeout : float or None, optional
+        The maximum time to wait, in seconds. The default, None, means no
+        timeout.
+
+    Raises
+    ------
+    asyncio.TimeoutError
+        If the condition isn't satisfied within the timeout.
+    """
+    future = asyncio.wrap_future(future_for_trait(obj, trait, condition))
+    # On timeout or cancellation, the wrapped future is cancelled too, and
+    # its observer removed.
+    await asyncio.wait_for(future, timeout)
+
+
+def _check_condition(future, condition, obj):
+    """ Complete the future if the condition is satisfied. """
+    try:
+        satisfied = condition(obj)
+    except Exception as exception:
+        _complete(future.set_exception, exception)
+    else:
+        if satisfied:
+            _complete(future.set_result, None)
+
+
+def _complete(setter, value):
+    """ Complete a future that may have been completed, or cancelled, by
+    another thread in the meantime.
+    """
+    try:
+        setter(value)
+    except concurrent.futures.InvalidStateError:
+        pass
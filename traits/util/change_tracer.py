@@ -0,0 +1,369 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Trace trait change notifications into a bounded ring buffer.
+
+Unlike the recorders of ``traits.util.event_tracer``, which format a
+message for every change as it happens, the tracer defined here stores a
+small fixed-size record for each notification handler call, and only
+formats the records when they are dumped. Once the buffer is full, the
+oldest records are overwritten, so tracing can be left running for a long
+time. Both the handlers registered with ``on_trait_change`` and those
+registered with ``observe`` are traced.
+
+The records can be exported to the trace event format used by Chrome's
+``about:tracing`` and by Perfetto (https://ui.perfetto.dev), to inspect
+cascades of notifications in a timeline::
+
+    >>> from traits.util.change_tracer import trace_changes
+    >>> with trace_changes() as tracer:
+    ...     my_model.some_trait = True
+    >>> tracer.save_trace_events("changes.json")
+
+"""
+from collections import namedtuple
+from contextlib import contextmanager
+import json
+import os
+import threading
+import time
+
+from traits import trait_notifiers
+from traits.observation import _event_tracers
+
+#: Default number of records kept by a tracer.
+DEFAULT_CAPACITY = 65536
+
+#: Notification engine of handlers registered with ``on_trait_change``.
+ON_TRAIT_CHANGE = "on_trait_change"
+
+#: Notification engine of handlers registered with ``observe``.
+OBSERVE = "observe"
+
+#: A call to a notification handler.
+#:
+#: *start* is the time at which the call started, and *duration* the time
+#: it took, both in nanoseconds; *start* is only meaningful relative to the
+#: start of other calls. *engine* is either ON_TRAIT_CHANGE or OBSERVE.
+#: *thread* is the identifier of the thread that made the call, and *depth*
+#: the number of handler calls the call was nested in. *owner* is the class
+#: of the object that changed, *name* the name of the trait that changed,
+#: or None for changes to the items of a container, and *handler* the
+#: handler called, or the function of a handler method. *exception* is the
+#: class of the exception raised by the handler, or None.
+ChangeTraceRecord = namedtuple(
+    "ChangeTraceRecord",
+    [
+        "start",
+        "duration",
+        "engine",
+        "thread",
+        "depth",
+        "owner",
+        "name",
+        "handler",
+        "exception",
+    ],
+)
+
+
+class ChangeTraceBuffer(object):
+    """ A ring buffer of trace records.
+
+    Once the buffer holds *capacity* records, adding a record overwrites
+    the oldest one.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of records kept.
+
+    Attributes
+    ----------
+    capacity : int
+        The maximum number of records kept.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError(
+                "capacity must be positive, got {!r}".format(capacity)
+            )
+        self.capacity = capacity
+        self._records = [None] * capacity
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    @property
+    def dropped(self):
+        """ The number of records that have been overwritten. """
+        return max(self._count - self.capacity, 0)
+
+    def append(self, record):
+        """ Add a record, overwriting the oldest record if the buffer is
+        full.
+
+        Parameters
+        ----------
+        record : tuple
+            The fields of a ChangeTraceRecord.
+        """
+        with self._lock:
+            self._records[self._count % self.capacity] = record
+            self._count += 1
+
+    def clear(self):
+        """ Discard all records. """
+        with self._lock:
+            self._records = [None] * self.capacity
+            self._count = 0
+
+    def records(self):
+        """ Return the records, from the oldest to the most recent.
+
+        Returns
+        -------
+        records : list of ChangeTraceRecord
+        """
+        with self._lock:
+            count = self._count
+            first = max(count - self.capacity, 0)
+            records = [
+                self._records[index % self.capacity]
+                for index in range(first, count)
+            ]
+        return [ChangeTraceRecord._make(record) for record in records]
+
+
+class ChangeTracer(object):
+    """ A tracer of calls to trait change notification handlers.
+
+    The ``pre_change`` and ``post_change`` methods are the tracers to give
+    to ``traits.trait_notifiers.set_change_event_tracers``, and the
+    ``pre_event`` and ``post_event`` methods those to give to
+    ``traits.observation._event_tracers.set_event_tracers``. The
+    ``trace_changes`` context manager installs all of them.
+
+    A record is added when a handler call returns, so calls still in
+    progress when the records are dumped are not included.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of records kept.
+
+    Attributes
+    ----------
+    buffer : ChangeTraceBuffer
+        The buffer holding the records.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.buffer = ChangeTraceBuffer(capacity)
+        self._local = threading.local()
+
+    # -- Tracers -------------------------------------------------------------
+
+    def pre_change(self, obj, name, old, new, handler):
+        """ Tracer called before an ``on_trait_change`` handler. """
+        self._starts().append(time.perf_counter_ns())
+
+    def post_change(self, obj, name, old, new, handler, exception=None):
+        """ Tracer called after an ``on_trait_change`` handler. """
+        self._record(ON_TRAIT_CHANGE, type(obj), name, handler, exception)
+
+    def pre_event(self, event, handler):
+        """ Tracer called before an ``observe`` handler. """
+        self._starts().append(time.perf_counter_ns())
+
+    def post_event(self, event, handler, exception=None):
+        """ Tracer called after an ``observe`` handler. """
+        self._record(
+            OBSERVE,
+            type(event.object),
+            getattr(event, "name", None),
+            handler,
+            exception,
+        )
+
+    # -- Dumping -------------------------------------------------------------
+
+    def records(self):
+        """ Return the records of the handler calls, in the order in which
+        the calls returned.
+
+        Returns
+        -------
+        records : list of ChangeTraceRecord
+        """
+        return self.buffer.records()
+
+    def trace_events(self):
+        """ Return the records in the Chrome trace event format.
+
+        Each handler call is a complete ("X") event, named after the
+        handler, with the trait that changed in its arguments.
+
+        Returns
+        -------
+        trace : dict
+            The JSON-serializable trace.
+        """
+        pid = os.getpid()
+        events = []
+        for record in self.records():
+            args = {
+                "object": _qualified_name(record.owner),
+                "trait": record.name,
+            }
+            if record.exception is not None:
+                args["exception"] = _qualified_name(record.exception)
+            events.append(
+                {
+                    "name": _qualified_name(record.handler),
+                    "cat": record.engine,
+                    "ph": "X",
+                    "ts": record.start / 1e3,
+                    "dur": record.duration / 1e3,
+                    "pid": pid,
+                    "tid": record.thread,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ns"}
+
+    def save_trace_events(self, filename):
+        """ Save the records to a file in the Chrome trace event format.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file to write.
+        """
+        with open(filename, "w", encoding="utf-8") as fh:
+            json.dump(self.trace_events(), fh)
+
+    def format(self):
+        """ Return a plain text description of the records, with one line
+        per handler call, ordered by start time and indented by depth.
+
+        Returns
+        -------
+        text : str
+        """
+        records = sorted(self.records(), key=lambda record: record.start)
+        if not records:
+            return ""
+        origin = records[0].start
+        lines = []
+        for record in records:
+            if record.exception is None:
+                exception = ""
+            else:
+                exception = " [EXCEPTION: {}]".format(
+                    _qualified_name(record.exception)
+                )
+            if record.name is None:
+                changed = record.owner.__name__
+            else:
+                changed = "{}.{}".format(record.owner.__name__, record.name)
+            lines.append(
+                "{:12.3f} us {:>12.3f} us {}{} -> {} ({}){}\n".format(
+                    (record.start - origin) / 1e3,
+                    record.duration / 1e3,
+                    "  " * record.depth,
+                    changed,
+                    _qualified_name(record.handler),
+                    record.engine,
+                    exception,
+                )
+            )
+        return "".join(lines)
+
+    # -- Private methods -----------------------------------------------------
+
+    def _starts(self):
+        """ Return the start times of the handler calls in progress in the
+        current thread.
+        """
+        try:
+            return self._local.starts
+        except AttributeError:
+            starts = self._local.starts = []
+            return starts
+
+    def _record(self, engine, owner, name, handler, exception):
+        """ Record the end of the current handler call. """
+        end = time.perf_counter_ns()
+        starts = self._starts()
+        # The tracers may have been installed while a handler was running.
+        if not starts:
+            return
+        start = starts.pop()
+        self.buffer.append(
+            (
+                start,
+                end - start,
+                engine,
+                threading.get_ident(),
+                len(starts),
+                owner,
+                name,
+                getattr(handler, "__func__", handler),
+                None if exception is None else type(exception),
+            )
+        )
+
+
+def _qualified_name(obj):
+    """ Return the qualified name of a class or function, falling back to
+    its repr.
+    """
+    qualname = getattr(obj, "__qualname__", None)
+    if qualname is None:
+        return repr(obj)
+    module = getattr(obj, "__module__", None)
+    return qualname if module is None else "{}.{}".format(module, qualname)
+
+
+@contextmanager
+def trace_changes(capacity=DEFAULT_CAPACITY):
+    """ Context manager tracing the calls to trait change notification
+    handlers, for both ``on_trait_change`` and ``observe``.
+
+    The tracers installed previously are restored on exit.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of records kept.
+
+    Yields
+    ------
+    tracer : ChangeTracer
+        The tracer, whose records can be dumped during or after the block.
+    """
+    tracer = ChangeTracer(capacity)
+    old_change_tracers = trait_notifiers.get_change_event_tracers()
+    old_event_tracers = _event_tracers.get_event_tracers()
+    trait_notifiers.set_change_event_tracers(
+        pre_tracer=tracer.pre_change, post_tracer=tracer.post_change
+    )
+    _event_tracers.set_event_tracers(
+        pre_tracer=tracer.pre_event, post_tracer=tracer.post_event
+    )
+    try:
+        yield tracer
+    finally:
+        trait_notifiers.set_change_event_tracers(*old_change_tracers)
+        _event_tracers.set_event_tracers(*old_event_tracers)
@@ -8,6 +8,7 @@
 #
 # Thanks for using Enthought open source!
 
+import asyncio
 import random
 import threading
 import time
@@ -15,7 +16,19 @@ import unittest
 
 from traits.api import Enum, HasStrictTraits
 
-from traits.util.async_trait_wait import wait_for_condition
+from traits.util.async_trait_wait import (
+    future_for_trait,
+    wait_for_condition,
+    wait_for_trait,
+)
+
+# Timeout for blocking calls, in seconds.
+SAFETY_TIMEOUT = 10.0
+
+
+def observer_count(obj, name):
+    """ Return the number of notifiers of a trait of an object. """
+    return len(obj._trait(name, 2)._notifiers(True))
 
 
 class TrafficLights(HasStrictTraits):
@@ -82,3 +95,125 @@ class TestAsyncTraitWait(unittest.TestCase):
 
         # assertSucceeds!
         t.join()
+
+
+class TestFutureForTrait(unittest.TestCase):
+    def test_condition_already_satisfied(self):
+        lights = TrafficLights(colour="Red")
+
+        future = future_for_trait(
+            lights, "colour", lambda l: l.colour == "Red"
+        )
+
+        self.assertTrue(future.done())
+        self.assertIsNone(future.result())
+        self.assertEqual(observer_count(lights, "colour"), 0)
+
+    def test_condition_satisfied_by_other_thread(self):
+        lights = TrafficLights(colour="Green")
+
+        future = future_for_trait(
+            lights, "colour", lambda l: l.colour == "Red"
+        )
+        self.assertFalse(future.done())
+        t = threading.Thread(target=lights.make_random_changes, args=(2,))
+        t.start()
+
+        future.result(timeout=SAFETY_TIMEOUT)
+        self.assertEqual(lights.colour, "Red")
+        t.join()
+        self.assertEqual(observer_count(lights, "colour"), 0)
+
+    def test_cancel_removes_observer(self):
+        lights = TrafficLights(colour="Green")
+        evaluations = []
+
+        def condition(lights):
+            evaluations.append(lights.colour)
+            return False
+
+        future = future_for_trait(lights, "colour", condition)
+        self.assertEqual(observer_count(lights, "colour"), 1)
+        future.cancel()
+        lights.colour = "Amber"
+
+        self.assertTrue(future.cancelled())
+        self.assertEqual(evaluations, ["Green"])
+        self.assertEqual(observer_count(lights, "colour"), 0)
+
+    def test_condition_raises(self):
+        lights = TrafficLights(colour="Green")
+
+        def condition(lights):
+            if lights.colour == "Amber":
+                raise ZeroDivisionError()
+            return False
+
+        future = future_for_trait(lights, "colour", condition)
+        lights.colour = "Amber"
+
+        with self.assertRaises(ZeroDivisionError):
+            future.result(timeout=SAFETY_TIMEOUT)
+        self.assertEqual(observer_count(lights, "colour"), 0)
+
+
+class TestWaitForTrait(unittest.IsolatedAsyncioTestCase):
+    async def test_condition_satisfied_by_other_thread(self):
+        lights = TrafficLights(colour="Green")
+        t = threading.Thread(target=lights.make_random_changes, args=(2,))
+        t.start()
+
+        await wait_for_trait(
+            lights, "colour", lambda l: l.colour == "Red",
+            timeout=SAFETY_TIMEOUT,
+        )
+
+        self.assertEqual(lights.colour, "Red")
+        t.join()
+
+    async def test_timeout(self):
+        lights = TrafficLights(colour="Green")
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await wait_for_trait(
+                lights, "colour", lambda l: l.colour == "Red", timeout=0.01
+            )
+
+        self.assertEqual(observer_count(lights, "colour"), 0)
+
+    async def test_many_waits(self):
+        lights = TrafficLights(colour="Green")
+        colours = ["Amber", "Red", "RedAndAmber"]
+        waits = [
+            asyncio.ensure_future(
+                wait_for_trait(
+                    lights,
+                    "colour",
+                    lambda l, colour=colours[i % 3]: l.colour == colour,
+                    timeout=SAFETY_TIMEOUT,
+                )
+            )
+            for i in range(1000)
+        ]
+        await asyncio.sleep(0)
+        self.assertEqual(observer_count(lights, "colour"), 1000)
+
+        for colour in colours:
+            lights.colour = colour
+            await asyncio.sleep(0)
+        await asyncio.gather(*waits)
+
+        self.assertEqual(observer_count(lights, "colour"), 0)
+
+    async def test_cancelled(self):
+        lights = TrafficLights(colour="Green")
+        wait = asyncio.ensure_future(
+            wait_for_trait(lights, "colour", lambda l: l.colour == "Red")
+        )
+        await asyncio.sleep(0)
+
+        wait.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await wait
+
+        self.assertEqual(observer_count(lights, "colour"), 0)
@@ -0,0 +1,248 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Tests for the ring buffer change tracer. """
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from traits.api import (
+    HasTraits,
+    Instance,
+    Int,
+    List,
+    observe,
+    on_trait_change,
+    push_exception_handler,
+    pop_exception_handler,
+)
+from traits.observation import _event_tracers
+from traits.observation.api import (
+    pop_exception_handler as pop_observe_exception_handler,
+    push_exception_handler as push_observe_exception_handler,
+)
+from traits.trait_notifiers import get_change_event_tracers
+from traits.util.change_tracer import (
+    ChangeTraceBuffer,
+    ChangeTracer,
+    OBSERVE,
+    ON_TRAIT_CHANGE,
+    trace_changes,
+)
+
+
+class Child(HasTraits):
+    value = Int()
+
+    values = List(Int)
+
+
+class Parent(HasTraits):
+    child = Instance(Child)
+
+    total = Int()
+
+    count = Int()
+
+    @observe("child:value")
+    def _update_total(self, event):
+        self.total = event.new
+
+    @on_trait_change("total")
+    def _update_count(self):
+        self.count += 1
+
+
+class TestChangeTraceBuffer(unittest.TestCase):
+
+    def test_records_in_order(self):
+        buffer = ChangeTraceBuffer(capacity=4)
+        for i in range(3):
+            buffer.append((i,) * 9)
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.dropped, 0)
+        self.assertEqual([record.start for record in buffer.records()],
+                         [0, 1, 2])
+
+    def test_oldest_records_overwritten(self):
+        buffer = ChangeTraceBuffer(capacity=4)
+        for i in range(10):
+            buffer.append((i,) * 9)
+
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(buffer.dropped, 6)
+        self.assertEqual([record.start for record in buffer.records()],
+                         [6, 7, 8, 9])
+
+    def test_clear(self):
+        buffer = ChangeTraceBuffer(capacity=4)
+        for i in range(10):
+            buffer.append((i,) * 9)
+
+        buffer.clear()
+
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.dropped, 0)
+        self.assertEqual(buffer.records(), [])
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            ChangeTraceBuffer(capacity=0)
+
+
+class TestChangeTracer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_cascade_across_engines(self):
+        parent = Parent(child=Child())
+
+        with trace_changes() as tracer:
+            parent.child.value = 5
+
+        records = sorted(tracer.records(), key=lambda record: record.start)
+        self.assertEqual(
+            [
+                (record.engine, record.owner, record.name, record.depth)
+                for record in records
+            ],
+            [
+                (OBSERVE, Child, "value", 0),
+                (ON_TRAIT_CHANGE, Parent, "total", 1),
+            ],
+        )
+        self.assertIs(records[0].handler, Parent._update_total)
+        self.assertIs(records[1].handler, Parent._update_count)
+        self.assertEqual(records[1].thread, threading.get_ident())
+        outer, inner = records
+        self.assertLessEqual(outer.start, inner.start)
+        self.assertGreaterEqual(
+            outer.start + outer.duration, inner.start + inner.duration
+        )
+        self.assertEqual(parent.count, 1)
+
+    def test_observer_maintenance_traced(self):
+        parent = Parent(child=Child())
+
+        with trace_changes() as tracer:
+            parent.child = Child()
+
+        handlers = [record.handler.__name__ for record in tracer.records()]
+        self.assertIn("observer_change_handler", handlers)
+
+    def test_container_events(self):
+        child = Child()
+        child.observe(lambda event: None, "values:items")
+        # Create the default list before tracing.
+        child.values
+
+        with trace_changes() as tracer:
+            child.values.append(1)
+
+        record, = tracer.records()
+        self.assertEqual(record.engine, OBSERVE)
+        self.assertIsNone(record.name)
+        self.assertIn("->", tracer.format())
+
+    def test_exceptions_recorded(self):
+        def fail(event):
+            raise ZeroDivisionError()
+
+        child = Child()
+        child.observe(fail, "value")
+        child.on_trait_change(lambda: 1 / 0, "value")
+
+        push_exception_handler(lambda *args: None)
+        self.addCleanup(pop_exception_handler)
+        push_observe_exception_handler(lambda event: None)
+        self.addCleanup(pop_observe_exception_handler)
+        with trace_changes() as tracer:
+            child.value = 1
+
+        self.assertEqual(
+            [record.exception for record in tracer.records()],
+            [ZeroDivisionError, ZeroDivisionError],
+        )
+        self.assertIn("EXCEPTION: builtins.ZeroDivisionError",
+                      tracer.format())
+
+    def test_bounded_records(self):
+        parent = Parent(child=Child())
+
+        with trace_changes(capacity=3) as tracer:
+            for value in range(1, 11):
+                parent.child.value = value
+
+        self.assertEqual(len(tracer.records()), 3)
+        self.assertEqual(tracer.buffer.dropped, 17)
+
+    def test_trace_events(self):
+        parent = Parent(child=Child())
+        filename = os.path.join(self.directory, "trace.json")
+
+        with trace_changes() as tracer:
+            parent.child.value = 5
+        tracer.save_trace_events(filename)
+
+        with open(filename, "r", encoding="utf-8") as fh:
+            trace = json.load(fh)
+        events = sorted(trace["traceEvents"], key=lambda event: event["ts"])
+        self.assertEqual(len(events), 2)
+        self.assertEqual(
+            [event["cat"] for event in events], [OBSERVE, ON_TRAIT_CHANGE]
+        )
+        self.assertEqual(
+            events[0]["name"],
+            "traits.util.tests.test_change_tracer.Parent._update_total",
+        )
+        self.assertEqual(events[1]["args"]["trait"], "total")
+        for event in events:
+            self.assertEqual(event["ph"], "X")
+            self.assertEqual(event["pid"], os.getpid())
+            self.assertGreaterEqual(event["dur"], 0)
+
+    def test_format(self):
+        parent = Parent(child=Child())
+
+        with trace_changes() as tracer:
+            parent.child.value = 5
+
+        lines = tracer.format().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("Child.value -> ", lines[0])
+        self.assertIn("  Parent.total -> ", lines[1])
+        self.assertEqual(ChangeTracer().format(), "")
+
+    def test_tracers_restored(self):
+        change_tracers = get_change_event_tracers()
+        event_tracers = _event_tracers.get_event_tracers()
+
+        with trace_changes():
+            self.assertNotEqual(get_change_event_tracers(), change_tracers)
+            self.assertNotEqual(
+                _event_tracers.get_event_tracers(), event_tracers
+            )
+
+        self.assertEqual(get_change_event_tracers(), change_tracers)
+        self.assertEqual(_event_tracers.get_event_tracers(), event_tracers)
+
+    def test_post_tracer_without_pre_tracer(self):
+        tracer = ChangeTracer()
+
+        tracer.post_change(Child(), "value", 0, 1, lambda: None)
+
+        self.assertEqual(tracer.records(), [])
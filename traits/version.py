@@ -0,0 +1,22 @@
+# (C) Copyright 2005-2026 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+"""
+Version information for this Traits distribution.
+
+This file is autogenerated by the Traits setup.py script.
+"""
+
+#: The full version of the package, including a development suffix
+#: for unreleased versions of the package.
+version = "7.1.0"
+
+#: The Git revision from which this release was made.
+git_revision = "1bbc296f971a652a40c3f64e2617b38b149ac944"